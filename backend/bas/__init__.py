@@ -6,18 +6,18 @@ Provides BAS lifecycle management:
 - Sign-off persistence
 - Change log / audit trail
 - PDF data generation
-- GST calculation (stub - Phase 1)
+- GST calculation (vectorized BAS field aggregation)
 
 Module Structure:
 - models.py: SQLAlchemy database models
 - service.py: Business logic layer
-- bas_calculator.py: GST/BAS calculation engine (stub)
+- bas_calculator.py: GST/BAS calculation engine
 - bas_schema.py: Schema definitions & Pydantic models
 """
 
 from .models import BASStatementDB, BASChangeLogDB, BASStatus, BASActionType, BASEntityType
 from .service import BASStatementService, BASChangeLogService
-from .bas_calculator import BASCalculator, BASFields, GSTCode
+from .bas_calculator import BASCalculator, BASFields, BASPeriod, GSTCode, TransactionColumns, load_period_columns
 
 __all__ = [
     # Database models
@@ -29,8 +29,11 @@ __all__ = [
     # Services
     "BASStatementService",
     "BASChangeLogService",
-    # Calculator (stub)
+    # Calculator
     "BASCalculator",
     "BASFields",
+    "BASPeriod",
     "GSTCode",
+    "TransactionColumns",
+    "load_period_columns",
 ]
@@ -2,18 +2,29 @@
 BAS Calculator - GST/BAS Calculation Engine
 
 This module provides calculation logic for Business Activity Statements (BAS).
-Currently a placeholder - calculation logic will be implemented in future phases.
 
-Responsibilities (Future):
+Responsibilities:
 - GST calculation from transactions
-- BAS field aggregation (G1, G2, G3, etc.)
+- BAS field aggregation (G1, G2, G3, G10, G11, 1A, 1B)
+- Transaction validation and reconciliation against expected figures
+
+Future:
 - PAYG instalment calculation
 - Fuel tax credits
 - Wine equalisation tax
 - Luxury car tax adjustments
 
+Calculation:
+- Transactions are held as columns (integer cents, GST code index, period
+  index) and summed per (period, GST code, direction) with vectorized
+  group-by sums, so many clients' periods are computed in one pass
+- Sums stay exact in integer cents; amounts are converted to Decimal and
+  rounded through round_currency only at the boundary
+- Amounts are GST-inclusive; positive amounts are sales, negative amounts
+  are purchases. 1A and 1B are 1/11 of the GST-inclusive taxable totals
+
 Integration Points:
-- Transaction Engine: Source data for GST calculations
+- Transaction Engine: Source data for GST calculations (transactions table)
 - Workpapers: Context for period calculations
 - LodgeIT: Export-ready BAS data
 
@@ -25,12 +36,16 @@ Australian GST Overview:
 """
 
 import logging
-from typing import Dict, Any, List, Optional
-from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from datetime import date
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,27 +104,200 @@ class BASFields:
     total_payable: Decimal = Decimal("0.00")
 
 
+# ==================== TRANSACTION COLUMNS ====================
+
+# Column order of GST codes in aggregation arrays
+CODE_ORDER: Tuple[GSTCode, ...] = tuple(GSTCode)
+CODE_INDEX: Dict[GSTCode, int] = {code: i for i, code in enumerate(CODE_ORDER)}
+
+# Calculator codes plus the bookkeeper ledger's gst_code_bookkeeper values
+GST_CODE_ALIASES: Dict[str, GSTCode] = {
+    **{code.value: code for code in GSTCode},
+    "GST_FREE": GSTCode.GST_FREE,
+    "INPUT_TAXED": GSTCode.INPUT_TAXED,
+    "OUT_OF_SCOPE": GSTCode.NO_GST,
+    "PRIVATE": GSTCode.NO_GST,
+}
+
+# Direction axis of aggregation arrays
+SALE, PURCHASE = 0, 1
+
+# Gross totals computed per period (the last two carry 1A / 1B GST)
+GROSS_FIELDS = (
+    "g1_total_sales",
+    "g2_export_sales",
+    "g3_gst_free_sales",
+    "g10_capital_purchases",
+    "g11_non_capital_purchases",
+    "taxable_sales",
+    "taxable_purchases",
+)
+
+
+# Gross fields each GST code contributes to, as (sales, purchases).
+# Sales: every reported code counts towards G1, exports to G2, GST-free to
+# G3. Purchases: capital codes to G10, the rest to G11. The taxable totals
+# (GST and CAP) carry the GST reported at 1A / 1B.
+FIELD_CONTRIBUTIONS: Dict[GSTCode, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    GSTCode.GST: (("g1_total_sales", "taxable_sales"), ("g11_non_capital_purchases", "taxable_purchases")),
+    GSTCode.GST_FREE: (("g1_total_sales", "g3_gst_free_sales"), ("g11_non_capital_purchases",)),
+    GSTCode.INPUT_TAXED: (("g1_total_sales",), ("g11_non_capital_purchases",)),
+    GSTCode.NO_GST: ((), ()),
+    GSTCode.EXPORT: (("g1_total_sales", "g2_export_sales"), ("g11_non_capital_purchases",)),
+    GSTCode.CAP: (("g1_total_sales", "taxable_sales"), ("g10_capital_purchases", "taxable_purchases")),
+    GSTCode.CAP_FREE: (("g1_total_sales", "g3_gst_free_sales"), ("g10_capital_purchases",)),
+}
+
+
+def build_field_map() -> np.ndarray:
+    """(direction, GST code, GROSS_FIELDS) 0/1 matrix from FIELD_CONTRIBUTIONS."""
+    field_map = np.zeros((2, len(CODE_ORDER), len(GROSS_FIELDS)), dtype=np.int64)
+    for code, (sale_fields, purchase_fields) in FIELD_CONTRIBUTIONS.items():
+        for name in sale_fields:
+            field_map[SALE, CODE_INDEX[code], GROSS_FIELDS.index(name)] = 1
+        for name in purchase_fields:
+            field_map[PURCHASE, CODE_INDEX[code], GROSS_FIELDS.index(name)] = 1
+    return field_map
+
+
+def normalise_gst_code(value: Any) -> Optional[GSTCode]:
+    """Map a calculator or bookkeeper GST code to GSTCode (None if unknown)."""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    return GST_CODE_ALIASES.get(str(value).strip().upper())
+
+
+def to_cents(amount: Decimal) -> Optional[int]:
+    """Exact integer cents for an amount, or None if it has sub-cent precision."""
+    cents = amount.scaleb(2)
+    if cents != cents.to_integral_value():
+        return None
+    return int(cents)
+
+
+@dataclass
+class BASPeriod:
+    """A client's BAS period (inclusive dates)."""
+    client_id: str
+    period_from: date
+    period_to: date
+
+
+@dataclass
+class TransactionColumns:
+    """
+    Columnar view of transactions for one or more BAS periods.
+    
+    Rows are held as int64 cents with a GST code index and the position
+    of their period. Uncoded rows are dropped (see validate_transactions).
+    Rows with sub-cent amounts cannot be summed exactly as integers and
+    are kept in `sub_cent` as (period_index, code_index, amount) for a
+    Decimal pass.
+    """
+    period_count: int
+    period_index: np.ndarray
+    code_index: np.ndarray
+    amount_cents: np.ndarray
+    sub_cent: List[Tuple[int, int, Decimal]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.amount_cents) + len(self.sub_cent)
+    
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Tuple[int, Any, Any]],
+        period_count: int
+    ) -> "TransactionColumns":
+        """Build columns from (period_index, amount, gst_code) rows."""
+        period_index = []
+        code_index = []
+        amount_cents = []
+        sub_cent = []
+        
+        for position, amount, gst_code in rows:
+            code = normalise_gst_code(gst_code)
+            if code is None or amount is None:
+                continue
+            amount = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+            cents = to_cents(amount)
+            if cents is None:
+                sub_cent.append((position, CODE_INDEX[code], amount))
+                continue
+            period_index.append(position)
+            code_index.append(CODE_INDEX[code])
+            amount_cents.append(cents)
+        
+        return cls(
+            period_count=period_count,
+            period_index=np.asarray(period_index, dtype=np.int64),
+            code_index=np.asarray(code_index, dtype=np.int64),
+            amount_cents=np.asarray(amount_cents, dtype=np.int64),
+            sub_cent=sub_cent,
+        )
+
+
+async def load_period_columns(db: AsyncSession, periods: List[BASPeriod]) -> TransactionColumns:
+    """
+    Load every period's bookkeeper transactions in one query.
+    
+    Reads the transactions table (excluding EXCLUDED rows), joined to the
+    requested (client_id, period_from, period_to) list.
+    """
+    if not periods:
+        return TransactionColumns.from_rows([], 0)
+    
+    query = text("""
+        SELECT p.idx - 1 AS period_index, t.amount, t.gst_code_bookkeeper
+        FROM unnest(
+            CAST(:client_ids AS text[]),
+            CAST(:period_froms AS date[]),
+            CAST(:period_tos AS date[])
+        ) WITH ORDINALITY AS p(client_id, period_from, period_to, idx)
+        JOIN transactions t
+            ON t.client_id = p.client_id
+            AND t.date BETWEEN p.period_from AND p.period_to
+        WHERE t.status_bookkeeper <> 'EXCLUDED'
+    """)
+    
+    result = await db.execute(query, {
+        "client_ids": [p.client_id for p in periods],
+        "period_froms": [p.period_from for p in periods],
+        "period_tos": [p.period_to for p in periods],
+    })
+    
+    return TransactionColumns.from_rows(
+        [(row.period_index, row.amount, row.gst_code_bookkeeper) for row in result.fetchall()],
+        len(periods)
+    )
+
+
 # ==================== BAS CALCULATOR ====================
 
 class BASCalculator:
     """
     BAS Calculator - Engine for GST/BAS calculations.
     
-    This is a placeholder class for Phase 0 scaffolding.
-    Actual calculation logic will be implemented in future phases.
-    
-    Usage (Future):
+    Usage:
         calculator = BASCalculator()
-        transactions = get_transactions_for_period(client_id, period_from, period_to)
-        bas_fields = calculator.calculate(transactions)
+        bas_fields = calculator.calculate(transactions, period_from, period_to)
+        
+        # Many clients' quarters in one pass
+        periods = [BASPeriod(client_id, q_from, q_to) for client_id in client_ids]
+        columns = await load_period_columns(db, periods)
+        results = calculator.calculate_columns(columns)
     """
     
     GST_RATE = Decimal("0.10")  # Australian GST rate (10%)
     
+    # (direction, GST code, GROSS_FIELDS) contribution matrix
+    FIELD_MAP = build_field_map()
+    
     def __init__(self):
         """Initialize BAS calculator."""
         self._initialized = True
-        logger.info("BAS Calculator initialized (stub)")
     
     def calculate(
         self,
@@ -120,20 +308,96 @@ class BASCalculator:
         """
         Calculate BAS fields from transactions.
         
+        Transactions dated outside the period, EXCLUDED transactions and
+        transactions without a recognised GST code are left out.
+        
         Args:
-            transactions: List of transaction dicts with GST codes
+            transactions: List of transaction dicts with amount and
+                gst_code (or gst_code_bookkeeper)
             period_from: BAS period start date
             period_to: BAS period end date
             
         Returns:
             BASFields with calculated values
-            
-        Raises:
-            NotImplementedError: Calculation not implemented yet (Phase 0)
         """
-        raise NotImplementedError(
-            "BAS calculation not implemented yet. "
-            "This is Phase 0 scaffolding - calculation logic will be added in future phases."
+        rows = []
+        for txn in transactions:
+            if txn.get("status_bookkeeper") == "EXCLUDED":
+                continue
+            txn_date = _parse_date(txn.get("date"))
+            if txn_date is not None and not (period_from <= txn_date <= period_to):
+                continue
+            rows.append((0, txn.get("amount"), txn.get("gst_code", txn.get("gst_code_bookkeeper"))))
+        
+        return self.calculate_columns(TransactionColumns.from_rows(rows, 1))[0]
+    
+    def calculate_columns(self, columns: TransactionColumns) -> List[BASFields]:
+        """
+        Calculate BAS fields for every period in a column set.
+        
+        Returns:
+            BASFields per period, in period order
+        """
+        gross_cents = self._gross_cents(columns)
+        
+        # Sub-cent rows are mapped through the same field table in Decimal
+        extra: Dict[int, List[Decimal]] = {}
+        for position, code_index, amount in columns.sub_cent:
+            direction = SALE if amount > 0 else PURCHASE
+            totals = extra.setdefault(position, [Decimal("0")] * len(GROSS_FIELDS))
+            for i, weight in enumerate(self.FIELD_MAP[direction, code_index]):
+                if weight:
+                    totals[i] += abs(amount)
+        
+        results = []
+        for position in range(columns.period_count):
+            gross = [Decimal(int(cents)).scaleb(-2) for cents in gross_cents[position]]
+            if position in extra:
+                gross = [value + adjustment for value, adjustment in zip(gross, extra[position])]
+            results.append(self._to_fields(*gross))
+        return results
+    
+    def _gross_cents(self, columns: TransactionColumns) -> np.ndarray:
+        """Exact (period x GROSS_FIELDS) gross totals in cents."""
+        totals = np.zeros((columns.period_count, 2, len(CODE_ORDER)), dtype=np.int64)
+        if len(columns.amount_cents):
+            direction = (columns.amount_cents < 0).astype(np.int64)
+            np.add.at(
+                totals,
+                (columns.period_index, direction, columns.code_index),
+                np.abs(columns.amount_cents)
+            )
+        
+        return (
+            totals[:, SALE, :] @ self.FIELD_MAP[SALE]
+            + totals[:, PURCHASE, :] @ self.FIELD_MAP[PURCHASE]
+        )
+    
+    def _to_fields(
+        self,
+        g1: Decimal,
+        g2: Decimal,
+        g3: Decimal,
+        g10: Decimal,
+        g11: Decimal,
+        taxable_sales: Decimal,
+        taxable_purchases: Decimal
+    ) -> BASFields:
+        """Round gross totals and derive GST at the Decimal boundary."""
+        gst_on_sales = extract_gst(taxable_sales, self.GST_RATE)
+        gst_on_purchases = extract_gst(taxable_purchases, self.GST_RATE)
+        net_gst = gst_on_sales - gst_on_purchases
+        
+        return BASFields(
+            g1_total_sales=round_currency(g1),
+            g2_export_sales=round_currency(g2),
+            g3_gst_free_sales=round_currency(g3),
+            g10_capital_purchases=round_currency(g10),
+            g11_non_capital_purchases=round_currency(g11),
+            gst_on_sales_1a=gst_on_sales,
+            gst_on_purchases_1b=gst_on_purchases,
+            net_gst=net_gst,
+            total_payable=net_gst,
         )
     
     def calculate_gst(
@@ -152,14 +416,13 @@ class BASCalculator:
             
         Returns:
             GST amount (0 if GST-free or input-taxed)
-            
-        Raises:
-            NotImplementedError: Calculation not implemented yet (Phase 0)
         """
-        raise NotImplementedError(
-            "GST calculation not implemented yet. "
-            "This is Phase 0 scaffolding."
-        )
+        if normalise_gst_code(gst_code) not in (GSTCode.GST, GSTCode.CAP):
+            return Decimal("0.00")
+        
+        if is_inclusive:
+            return extract_gst(amount, self.GST_RATE)
+        return round_currency(amount * self.GST_RATE)
     
     def validate_transactions(
         self,
@@ -179,19 +442,57 @@ class BASCalculator:
             
         Returns:
             Validation result dict with errors if any
-            
-        Raises:
-            NotImplementedError: Validation not implemented yet (Phase 0)
         """
-        raise NotImplementedError(
-            "Transaction validation not implemented yet. "
-            "This is Phase 0 scaffolding."
-        )
+        errors = []
+        warnings = []
+        dates = []
+        
+        for position, txn in enumerate(transactions):
+            ref = {"index": position, "transaction_id": txn.get("id")}
+            
+            amount = txn.get("amount")
+            if amount is None:
+                errors.append({**ref, "field": "amount", "error": "Amount is required"})
+            else:
+                try:
+                    value = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+                    if not value.is_finite():
+                        raise InvalidOperation
+                    if to_cents(value) is None:
+                        warnings.append({**ref, "field": "amount", "warning": "Amount has sub-cent precision"})
+                except (InvalidOperation, ValueError):
+                    errors.append({**ref, "field": "amount", "error": f"Invalid amount: {amount}"})
+            
+            gst_code = txn.get("gst_code", txn.get("gst_code_bookkeeper"))
+            if gst_code is None:
+                errors.append({**ref, "field": "gst_code", "error": "GST code is required"})
+            elif normalise_gst_code(gst_code) is None:
+                errors.append({**ref, "field": "gst_code", "error": f"Invalid GST code: {gst_code}"})
+            
+            raw_date = txn.get("date")
+            txn_date = _parse_date(raw_date)
+            if raw_date is None:
+                errors.append({**ref, "field": "date", "error": "Date is required"})
+            elif txn_date is None:
+                errors.append({**ref, "field": "date", "error": f"Invalid date: {raw_date}"})
+            else:
+                dates.append(txn_date)
+        
+        return {
+            "valid": not errors,
+            "transaction_count": len(transactions),
+            "error_count": len(errors),
+            "errors": errors,
+            "warnings": warnings,
+            "date_from": min(dates).isoformat() if dates else None,
+            "date_to": max(dates).isoformat() if dates else None,
+        }
     
     def reconcile(
         self,
         calculated: BASFields,
-        expected: BASFields
+        expected: BASFields,
+        tolerance: Decimal = Decimal("0.00")
     ) -> Dict[str, Any]:
         """
         Reconcile calculated BAS with expected values.
@@ -199,17 +500,30 @@ class BASCalculator:
         Args:
             calculated: BAS fields from calculation
             expected: Expected BAS fields (from accounting system)
+            tolerance: Largest absolute variance treated as a match
             
         Returns:
             Reconciliation report with variances
-            
-        Raises:
-            NotImplementedError: Reconciliation not implemented yet (Phase 0)
         """
-        raise NotImplementedError(
-            "BAS reconciliation not implemented yet. "
-            "This is Phase 0 scaffolding."
-        )
+        report = {}
+        for bas_field in fields(BASFields):
+            calc_value = getattr(calculated, bas_field.name)
+            expected_value = getattr(expected, bas_field.name)
+            variance = calc_value - expected_value
+            report[bas_field.name] = {
+                "calculated": str(calc_value),
+                "expected": str(expected_value),
+                "variance": str(variance),
+                "matched": abs(variance) <= tolerance,
+            }
+        
+        variances = [name for name, entry in report.items() if not entry["matched"]]
+        return {
+            "reconciled": not variances,
+            "variance_count": len(variances),
+            "variances": variances,
+            "fields": report,
+        }
     
     def generate_report(
         self,
@@ -221,24 +535,57 @@ class BASCalculator:
         
         Args:
             bas_fields: Calculated BAS fields
-            format: Output format (json, pdf_data, ato_xml)
+            format: Output format - "json" (ATO labels, Decimal strings) or
+                "summary" (BASStatementService.save_bas summary dict)
             
         Returns:
             Formatted BAS report
             
         Raises:
-            NotImplementedError: Report generation not implemented yet (Phase 0)
+            ValueError: Unsupported format
         """
-        raise NotImplementedError(
-            "BAS report generation not implemented yet. "
-            "This is Phase 0 scaffolding."
-        )
+        if format == "json":
+            return {
+                "gst": {
+                    "G1": str(bas_fields.g1_total_sales),
+                    "G2": str(bas_fields.g2_export_sales),
+                    "G3": str(bas_fields.g3_gst_free_sales),
+                    "G10": str(bas_fields.g10_capital_purchases),
+                    "G11": str(bas_fields.g11_non_capital_purchases),
+                    "1A": str(bas_fields.gst_on_sales_1a),
+                    "1B": str(bas_fields.gst_on_purchases_1b),
+                },
+                "payg": {
+                    "W1": str(bas_fields.w1_total_wages),
+                    "W2": str(bas_fields.w2_withheld_wages),
+                    "T1": str(bas_fields.t1_instalment_income),
+                    "T2": str(bas_fields.t2_instalment_amount),
+                },
+                "net_gst": str(bas_fields.net_gst),
+                "total_payable": str(bas_fields.total_payable),
+            }
+        
+        if format == "summary":
+            return {
+                "g1_total_income": float(bas_fields.g1_total_sales),
+                "gst_on_income_1a": float(bas_fields.gst_on_sales_1a),
+                "gst_on_expenses_1b": float(bas_fields.gst_on_purchases_1b),
+                "net_gst": float(bas_fields.net_gst),
+                "g2_export_sales": float(bas_fields.g2_export_sales),
+                "g3_gst_free_sales": float(bas_fields.g3_gst_free_sales),
+                "g10_capital_purchases": float(bas_fields.g10_capital_purchases),
+                "g11_non_capital_purchases": float(bas_fields.g11_non_capital_purchases),
+                "payg_instalment": float(bas_fields.t2_instalment_amount),
+                "total_payable": float(bas_fields.total_payable),
+            }
+        
+        raise ValueError(f"Unsupported BAS report format: {format}")
 
 
 # ==================== UTILITY FUNCTIONS ====================
 
 def round_currency(amount: Decimal) -> Decimal:
-    """Round to 2 decimal places using banker's rounding."""
+    """Round to 2 decimal places (half up)."""
     return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
@@ -275,15 +622,13 @@ def add_gst(net_amount: Decimal, gst_rate: Decimal = Decimal("0.10")) -> Decimal
     return round_currency(net_amount * (1 + gst_rate))
 
 
-# ==================== PLACEHOLDER NOTE ====================
-#
-# This module is part of Phase 0 scaffolding.
-# No BAS calculations are performed yet.
-#
-# Future Phases:
-# - Phase 1: Basic GST calculation from transactions
-# - Phase 2: Full BAS field aggregation
-# - Phase 3: PAYG integration
-# - Phase 4: ATO export format (SBR)
-#
-# ==================== END PLACEHOLDER ====================
+def _parse_date(value: Any) -> Optional[date]:
+    """Parse a date or ISO date string (None if missing or invalid)."""
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
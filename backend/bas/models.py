@@ -3,6 +3,7 @@ BAS Backend - Database Models
 
 Models for:
 - BASStatement: BAS snapshots at completion
+- BASPeriodRollup: Latest version per client/period (maintained rollup)
 - BASChangeLog: Audit trail for BAS actions
 - BASWorkflowStep: Multi-step sign-off workflow tracking
 """
@@ -14,7 +15,7 @@ from enum import Enum as PyEnum
 from typing import Optional, Dict, Any
 
 from sqlalchemy import (
-    Column, String, Text, Date, DateTime, Numeric, Integer, JSON, ForeignKey, Boolean
+    Column, String, Text, Date, DateTime, Numeric, Integer, JSON, ForeignKey, Boolean, Index
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
@@ -186,6 +187,51 @@ class BASStatementDB(Base):
         }
 
 
+# ==================== BAS PERIOD ROLLUP TABLE ====================
+
+class BASPeriodRollupDB(Base):
+    """
+    BAS Period Rollup Table - One row per client/period.
+    
+    Tracks the latest version of each period (and the latest non-draft
+    version) with its headline amounts, so history and comparison reads
+    are single indexed lookups however many amended versions exist.
+    Refreshed by BASStatementService on save and sign-off.
+    """
+    __tablename__ = 'bas_period_rollups'
+    
+    client_id = Column(String(36), primary_key=True)
+    period_from = Column(Date, primary_key=True)
+    period_to = Column(Date, primary_key=True)
+    
+    # Version counts
+    statement_count = Column(Integer, nullable=False, default=0)
+    submitted_count = Column(Integer, nullable=False, default=0)
+    
+    # Latest version (any status)
+    latest_statement_id = Column(PGUUID(as_uuid=True), nullable=False)
+    latest_version = Column(Integer, nullable=False)
+    latest_status = Column(String(20), nullable=False)
+    latest_net_gst = Column(Numeric(14, 2), default=0)
+    latest_payg_instalment = Column(Numeric(14, 2), default=0)
+    latest_total_payable = Column(Numeric(14, 2), default=0)
+    
+    # Latest non-draft version (NULL until one exists)
+    submitted_statement_id = Column(PGUUID(as_uuid=True), nullable=True)
+    submitted_version = Column(Integer, nullable=True)
+    submitted_status = Column(String(20), nullable=True)
+    submitted_net_gst = Column(Numeric(14, 2), nullable=True)
+    submitted_payg_instalment = Column(Numeric(14, 2), nullable=True)
+    submitted_total_payable = Column(Numeric(14, 2), nullable=True)
+    
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
+    
+    __table_args__ = (
+        Index('idx_bas_period_rollups_client_period_to', 'client_id', 'period_to'),
+        {'extend_existing': True},
+    )
+
+
 # ==================== BAS CHANGE LOG TABLE ====================
 
 class BASChangeLogDB(Base):
@@ -3,6 +3,7 @@ BAS Backend - Service Layer
 
 Provides business logic for:
 - Saving BAS snapshots
+- Maintaining per-client/period rollups (latest version per period)
 - Retrieving BAS history (with grouping)
 - Change log persistence
 - PDF generation (data endpoint)
@@ -17,10 +18,11 @@ import logging
 import json
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text, and_, or_, desc, func
+from sqlalchemy import select, text, and_, or_, desc, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from .models import (
-    BASStatementDB, BASChangeLogDB, BASWorkflowStepDB,
+    BASStatementDB, BASPeriodRollupDB, BASChangeLogDB, BASWorkflowStepDB,
     BASStatus, BASActionType, BASEntityType,
     WorkflowStepType, WorkflowStepStatus
 )
@@ -37,6 +39,81 @@ WORKFLOW_STEPS = [
 ]
 
 
+# ==================== PERIOD ROLLUPS ====================
+
+async def refresh_period_rollup(
+    db: AsyncSession,
+    client_id: str,
+    period_from: date,
+    period_to: date
+) -> None:
+    """
+    Recompute one client/period rollup row from its versions (no commit).
+    
+    Reads only the period's version headers (indexed by client/period)
+    and upserts the row, so callers can refresh inside their own
+    transaction after a save or sign-off.
+    
+    Refreshes of the same period are serialised with a transaction-scoped
+    advisory lock taken before the versions are read, so concurrent saves
+    cannot overwrite the rollup with a stale set of versions.
+    """
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock(hashtext(:period_key))"),
+        {"period_key": f"bas_rollup:{client_id}:{period_from.isoformat()}:{period_to.isoformat()}"}
+    )
+    
+    result = await db.execute(
+        select(
+            BASStatementDB.id,
+            BASStatementDB.version,
+            BASStatementDB.status,
+            BASStatementDB.net_gst,
+            BASStatementDB.payg_instalment,
+            BASStatementDB.total_payable
+        )
+        .where(and_(
+            BASStatementDB.client_id == client_id,
+            BASStatementDB.period_from == period_from,
+            BASStatementDB.period_to == period_to
+        ))
+        .order_by(desc(BASStatementDB.version))
+    )
+    versions = result.all()
+    if not versions:
+        return
+    
+    latest = versions[0]
+    submitted = next((v for v in versions if v.status != BASStatus.DRAFT.value), None)
+    
+    values = {
+        "statement_count": len(versions),
+        "submitted_count": sum(1 for v in versions if v.status != BASStatus.DRAFT.value),
+        "latest_statement_id": latest.id,
+        "latest_version": latest.version,
+        "latest_status": latest.status,
+        "latest_net_gst": latest.net_gst,
+        "latest_payg_instalment": latest.payg_instalment,
+        "latest_total_payable": latest.total_payable,
+        "submitted_statement_id": submitted.id if submitted else None,
+        "submitted_version": submitted.version if submitted else None,
+        "submitted_status": submitted.status if submitted else None,
+        "submitted_net_gst": submitted.net_gst if submitted else None,
+        "submitted_payg_instalment": submitted.payg_instalment if submitted else None,
+        "submitted_total_payable": submitted.total_payable if submitted else None,
+        "updated_at": datetime.now(timezone.utc),
+    }
+    
+    await db.execute(
+        pg_insert(BASPeriodRollupDB)
+        .values(client_id=client_id, period_from=period_from, period_to=period_to, **values)
+        .on_conflict_do_update(
+            index_elements=["client_id", "period_from", "period_to"],
+            set_=values
+        )
+    )
+
+
 # ==================== BAS STATEMENT SERVICE ====================
 
 class BASStatementService:
@@ -108,6 +185,8 @@ class BASStatementService:
         )
         
         self.db.add(bas)
+        await self.db.flush()
+        await refresh_period_rollup(self.db, client_id, period_from, period_to)
         await self.db.commit()
         await self.db.refresh(bas)
         
@@ -200,6 +279,8 @@ class BASStatementService:
         if review_notes:
             bas.review_notes = review_notes
         
+        await self.db.flush()
+        await refresh_period_rollup(self.db, bas.client_id, bas.period_from, bas.period_to)
         await self.db.commit()
         await self.db.refresh(bas)
         
@@ -746,36 +827,44 @@ class BASHistoryService:
         client_id: str,
         group_by: str = "quarter",  # quarter, month, year
         year: Optional[int] = None,
-        include_drafts: bool = False
+        include_drafts: bool = False,
+        include_versions: bool = False
     ) -> Dict[str, Any]:
         """
         Get BAS history grouped by period with summaries.
-        """
-        query = select(BASStatementDB).where(BASStatementDB.client_id == client_id)
         
-        if not include_drafts:
-            query = query.where(BASStatementDB.status != BASStatus.DRAFT.value)
+        Reads the period rollups joined to each period's latest statement
+        (the latest non-draft statement unless include_drafts), so every
+        period contributes its latest version to the summaries. Each
+        group lists those latest statements; include_versions also loads
+        every version.
+        """
+        rollup = BASPeriodRollupDB
+        if include_drafts:
+            statement_id = rollup.latest_statement_id
+            count_column = rollup.statement_count
+        else:
+            statement_id = rollup.submitted_statement_id
+            count_column = rollup.submitted_count
         
+        query = (
+            select(BASStatementDB, count_column)
+            .join(rollup, BASStatementDB.id == statement_id)
+            .where(rollup.client_id == client_id)
+        )
         if year:
-            query = query.where(
-                func.extract('year', BASStatementDB.period_to) == year
-            )
-        
-        query = query.order_by(desc(BASStatementDB.period_to), desc(BASStatementDB.version))
+            query = query.where(rollup.period_to.between(date(year, 1, 1), date(year, 12, 31)))
+        query = query.order_by(desc(rollup.period_to), desc(rollup.period_from))
         
         result = await self.db.execute(query)
-        statements = result.scalars().all()
+        rows = result.all()
+        
+        versions = await self._load_versions(client_id, year, include_drafts) if include_versions else None
         
         # Group by period
         grouped = {}
-        for stmt in statements:
-            if group_by == "quarter":
-                quarter = (stmt.period_to.month - 1) // 3 + 1
-                key = f"{stmt.period_to.year}-Q{quarter}"
-            elif group_by == "month":
-                key = f"{stmt.period_to.year}-{stmt.period_to.month:02d}"
-            else:  # year
-                key = str(stmt.period_to.year)
+        for stmt, statement_count in rows:
+            key = self._period_key(stmt.period_to, group_by)
             
             if key not in grouped:
                 grouped[key] = {
@@ -790,16 +879,18 @@ class BASHistoryService:
                     }
                 }
             
-            grouped[key]["statements"].append(stmt.to_dict())
-            
-            # Only count latest version in summary
-            if stmt.version > grouped[key]["summary"]["latest_version"]:
-                grouped[key]["summary"]["total_gst_payable"] = float(stmt.net_gst or 0)
-                grouped[key]["summary"]["total_payg"] = float(stmt.payg_instalment or 0)
-                grouped[key]["summary"]["total_payable"] = float(stmt.total_payable or 0)
-                grouped[key]["summary"]["latest_version"] = stmt.version
+            group = grouped[key]
+            if versions is None:
+                group["statements"].append(stmt.to_dict())
+            else:
+                group["statements"].extend(versions.get((stmt.period_from, stmt.period_to), []))
             
-            grouped[key]["summary"]["statement_count"] += 1
+            # Latest version of each period counts in the summary
+            group["summary"]["total_gst_payable"] += float(stmt.net_gst or 0)
+            group["summary"]["total_payg"] += float(stmt.payg_instalment or 0)
+            group["summary"]["total_payable"] += float(stmt.total_payable or 0)
+            group["summary"]["latest_version"] = max(group["summary"]["latest_version"], stmt.version)
+            group["summary"]["statement_count"] += statement_count
         
         # Convert to list sorted by period
         periods = sorted(grouped.values(), key=lambda x: x["period_key"], reverse=True)
@@ -807,7 +898,7 @@ class BASHistoryService:
         # Calculate overall summary
         overall_summary = {
             "total_periods": len(periods),
-            "total_statements": len(statements),
+            "total_statements": sum(p["summary"]["statement_count"] for p in periods),
             "total_gst_payable": sum(p["summary"]["total_gst_payable"] for p in periods),
             "total_payg": sum(p["summary"]["total_payg"] for p in periods),
             "total_payable": sum(p["summary"]["total_payable"] for p in periods)
@@ -821,6 +912,38 @@ class BASHistoryService:
             "summary": overall_summary
         }
     
+    @staticmethod
+    def _period_key(period_to: date, group_by: str) -> str:
+        if group_by == "quarter":
+            quarter = (period_to.month - 1) // 3 + 1
+            return f"{period_to.year}-Q{quarter}"
+        if group_by == "month":
+            return f"{period_to.year}-{period_to.month:02d}"
+        return str(period_to.year)
+    
+    async def _load_versions(
+        self,
+        client_id: str,
+        year: Optional[int],
+        include_drafts: bool
+    ) -> Dict[tuple, List[Dict[str, Any]]]:
+        """All versions per (period_from, period_to), newest first."""
+        query = select(BASStatementDB).where(BASStatementDB.client_id == client_id)
+        
+        if not include_drafts:
+            query = query.where(BASStatementDB.status != BASStatus.DRAFT.value)
+        
+        if year:
+            query = query.where(BASStatementDB.period_to.between(date(year, 1, 1), date(year, 12, 31)))
+        
+        query = query.order_by(desc(BASStatementDB.period_to), desc(BASStatementDB.version))
+        
+        result = await self.db.execute(query)
+        versions: Dict[tuple, List[Dict[str, Any]]] = {}
+        for stmt in result.scalars().all():
+            versions.setdefault((stmt.period_from, stmt.period_to), []).append(stmt.to_dict())
+        return versions
+    
     async def get_period_comparison(
         self,
         client_id: str,
@@ -830,25 +953,11 @@ class BASHistoryService:
     ) -> Dict[str, Any]:
         """
         Compare BAS for a period with another period.
+        
+        Both periods' latest versions come from one rollup lookup.
         """
         from dateutil.relativedelta import relativedelta
         
-        # Get current period BAS
-        current_result = await self.db.execute(
-            select(BASStatementDB)
-            .where(and_(
-                BASStatementDB.client_id == client_id,
-                BASStatementDB.period_from == period_from,
-                BASStatementDB.period_to == period_to
-            ))
-            .order_by(desc(BASStatementDB.version))
-            .limit(1)
-        )
-        current = current_result.scalar_one_or_none()
-        
-        if not current:
-            return {"error": "No BAS found for the specified period"}
-        
         # Determine comparison period using relativedelta for proper date arithmetic
         if compare_with == "previous":
             # Get previous quarter (3 months back)
@@ -858,18 +967,24 @@ class BASHistoryService:
             comp_from = period_from - relativedelta(years=1)
             comp_to = period_to - relativedelta(years=1)
         
-        # Get comparison period BAS
-        comp_result = await self.db.execute(
+        # Latest BAS for the current and comparison periods
+        result = await self.db.execute(
             select(BASStatementDB)
+            .join(BASPeriodRollupDB, BASStatementDB.id == BASPeriodRollupDB.latest_statement_id)
             .where(and_(
-                BASStatementDB.client_id == client_id,
-                BASStatementDB.period_from == comp_from,
-                BASStatementDB.period_to == comp_to
+                BASPeriodRollupDB.client_id == client_id,
+                tuple_(BASPeriodRollupDB.period_from, BASPeriodRollupDB.period_to).in_(
+                    [(period_from, period_to), (comp_from, comp_to)]
+                )
             ))
-            .order_by(desc(BASStatementDB.version))
-            .limit(1)
         )
-        comparison = comp_result.scalar_one_or_none()
+        latest = {(stmt.period_from, stmt.period_to): stmt for stmt in result.scalars().all()}
+        current = latest.get((period_from, period_to))
+        
+        if not current:
+            return {"error": "No BAS found for the specified period"}
+        
+        comparison = latest.get((comp_from, comp_to))
         
         # Calculate variances
         def calc_variance(current_val, comp_val):
@@ -909,4 +1024,3 @@ class BASHistoryService:
                 "total_payable": calc_variance(current.total_payable, comp_data.total_payable if comp_data else 0)
             }
         }
-
@@ -16,6 +16,7 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from services.search import CLIENT_PROFILES_SEARCH
 from utils.encryption import (
     encrypt_tfn, decrypt_tfn, mask_tfn, get_tfn_last_four,
     is_encryption_configured, log_tfn_access
@@ -430,7 +431,8 @@ class ClientProfileService:
         Search client profiles.
         
         Args:
-            query_str: Search term (matches name, code, ABN)
+            query_str: Search term (full-text on names, substring on code
+                and ABN); results are ranked by relevance
             entity_type: Filter by entity type
             client_status: Filter by status
             assigned_to: Filter by assigned staff
@@ -443,14 +445,13 @@ class ClientProfileService:
         conditions = []
         params = {"limit": limit, "offset": offset}
         
+        order_by = "display_name ASC"
         if query_str:
-            conditions.append("""
-                (display_name ILIKE :query 
-                 OR legal_name ILIKE :query 
-                 OR client_code ILIKE :query 
-                 OR abn ILIKE :query)
-            """)
-            params["query"] = f"%{query_str}%"
+            search = CLIENT_PROFILES_SEARCH.build(query_str)
+            if search:
+                conditions.append(search.condition)
+                params.update(search.params)
+                order_by = f"{search.rank} DESC, display_name ASC"
         
         if entity_type:
             conditions.append("entity_type = :entity_type")
@@ -474,7 +475,7 @@ class ClientProfileService:
         query = text(f"""
             SELECT * FROM public.client_profiles 
             WHERE {where_clause}
-            ORDER BY display_name ASC
+            ORDER BY {order_by}
             LIMIT :limit OFFSET :offset
         """)
         
@@ -563,8 +564,9 @@ class ClientProfileService:
         else:
             data["tfn"] = mask_tfn(data.get("tfn_last_four", "")) if data.get("tfn_last_four") else None
         
-        # Remove encrypted field from response
+        # Remove encrypted field and search index column from response
         data.pop("tfn_encrypted", None)
+        data.pop("search_vector", None)
         
         # Convert UUIDs to strings
         for key in ["id", "person_id", "crm_client_id", "assigned_partner_id", 
@@ -17,10 +17,10 @@ from enum import Enum as PyEnum
 
 from sqlalchemy import (
     Column, String, Text, Float, Boolean, Date, DateTime,
-    ForeignKey, Index, Enum as SQLEnum, JSON, Numeric
+    ForeignKey, Index, Enum as SQLEnum, JSON, Numeric, Computed
 )
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, TSVECTOR
 
 from database.connection import Base
 
@@ -168,19 +168,33 @@ class BookkeeperTransactionDB(Base):
     locked_by_role = Column(String(50), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=utc_now, index=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, index=True)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
     
+    # Full-text search (services/search.py); deferred so list queries don't load it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(payee_raw, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description_raw, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(notes_bookkeeper, '')), 'C') || "
+            "setweight(to_tsvector('simple', coalesce(notes_client, '')), 'C')",
+            persisted=True
+        )
+    ))
+    
     # Relationships
     history = relationship("TransactionHistoryDB", back_populates="transaction", cascade="all, delete-orphan")
     attachments = relationship("TransactionAttachmentDB", back_populates="transaction", cascade="all, delete-orphan")
     workpaper_links = relationship("TransactionWorkpaperLinkDB", back_populates="transaction", cascade="all, delete-orphan")
     
     __table_args__ = (
-        Index('ix_bk_transactions_client_date', 'client_id', 'date'),
+        # Covers the bookkeeper list keyset: (date, created_at, id) per client
+        Index('ix_bk_transactions_client_date', 'client_id', 'date', 'created_at', 'id'),
         Index('ix_bk_transactions_client_status', 'client_id', 'status_bookkeeper'),
         Index('ix_bk_transactions_client_category', 'client_id', 'category_bookkeeper'),
         Index('ix_bk_transactions_date_range', 'date', 'client_id'),
+        Index('ix_bk_transactions_search', 'search_vector', postgresql_using='gin'),
     )
 
 
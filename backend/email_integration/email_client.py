@@ -6,22 +6,48 @@ Implements the EmailClient interface with full Resend SDK integration.
 
 Resend API Reference:
 - Endpoint: POST https://api.resend.com/emails
+- Batch endpoint: POST https://api.resend.com/emails/batch (up to 100 emails)
 - Auth: Bearer token in Authorization header
 - Response: { id: "message_id" }
+
+Async path:
+- send_email_async / send_batch_async use a shared httpx.AsyncClient so
+  sending never blocks the event loop
+- Batch sends use the batch endpoint, with chunks sent concurrently up to
+  EMAIL_MAX_CONCURRENCY requests at a time
+- Request starts are paced to EMAIL_RATE_LIMIT_PER_SECOND; 429 responses
+  pause the client for Retry-After and are retried
 """
 
 import os
+import time
+import base64
+import asyncio
 import logging
 import uuid
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 
+import httpx
 import resend
 
 logger = logging.getLogger(__name__)
 
+# Configuration
+RESEND_API_URL = os.environ.get('RESEND_API_URL', 'https://api.resend.com')
+EMAIL_MAX_CONCURRENCY = int(os.environ.get('EMAIL_MAX_CONCURRENCY', '4'))
+EMAIL_RATE_LIMIT_PER_SECOND = float(os.environ.get('EMAIL_RATE_LIMIT_PER_SECOND', '2'))
+EMAIL_MAX_RETRIES = int(os.environ.get('EMAIL_MAX_RETRIES', '3'))
+EMAIL_TIMEOUT_SECONDS = float(os.environ.get('EMAIL_TIMEOUT_SECONDS', '30'))
+
+# Resend accepts at most 100 emails per batch request
+RESEND_BATCH_LIMIT = 100
+
+# Retry-After fallback when a 429 carries no header
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
 
 class EmailProvider(str, Enum):
     """Supported email providers"""
@@ -78,6 +104,34 @@ class EmailMessage:
     template_id: Optional[str] = None
 
 
+class RateLimiter:
+    """
+    Async request pacer.
+    
+    Spaces request starts at least 1 / rate_per_second apart and lets a
+    429 response push the next start out by the provider's Retry-After.
+    A rate of 0 or less disables pacing.
+    """
+    
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for the next request slot."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """Delay every request start by at least seconds from now."""
+        self._next_start = max(self._next_start, time.monotonic() + seconds)
+
+
 class EmailClient:
     """
     Email Client - Resend Provider Implementation.
@@ -87,6 +141,7 @@ class EmailClient:
     - Error handling and logging
     - Attachment support
     - Metadata tracking
+    - Non-blocking async sending with concurrent, rate-limited batches
     
     Usage:
         client = EmailClient()
@@ -95,13 +150,20 @@ class EmailClient:
             subject="Hello",
             body="<p>Welcome!</p>"
         ))
+        
+        # From async code
+        result = await client.send_email_async(message)
+        results = await client.send_batch_async(messages)
     """
     
     def __init__(
         self,
         api_key: Optional[str] = None,
         from_address: Optional[str] = None,
-        provider: str = "resend"
+        provider: str = "resend",
+        max_concurrency: int = EMAIL_MAX_CONCURRENCY,
+        rate_limit_per_second: float = EMAIL_RATE_LIMIT_PER_SECOND,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize email client.
@@ -110,11 +172,19 @@ class EmailClient:
             api_key: Resend API key (from EMAIL_API_KEY env var)
             from_address: Default sender address (from EMAIL_FROM_ADDRESS env var)
             provider: Email provider name (from EMAIL_PROVIDER env var)
+            max_concurrency: Max in-flight async requests (EMAIL_MAX_CONCURRENCY)
+            rate_limit_per_second: Max async request starts per second (EMAIL_RATE_LIMIT_PER_SECOND)
+            http_client: Optional httpx.AsyncClient (created lazily if not provided)
         """
         self.api_key = api_key or os.environ.get('EMAIL_API_KEY', '')
         self.from_address = from_address or os.environ.get('EMAIL_FROM_ADDRESS', '')
         self.provider = provider or os.environ.get('EMAIL_PROVIDER', 'resend')
         
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = RateLimiter(rate_limit_per_second)
+        self._http_client = http_client
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        
         self._initialized = False
         
         # Initialize Resend if configured
@@ -133,6 +203,62 @@ class EmailClient:
         """Check if client is ready to send emails."""
         return self._initialized and self.is_configured()
     
+    def _not_ready_result(self) -> EmailResult:
+        return EmailResult(
+            success=False,
+            error="Email client not configured. Check EMAIL_API_KEY and EMAIL_FROM_ADDRESS.",
+            status=EmailStatus.FAILED
+        )
+    
+    def _build_params(self, message: EmailMessage, internal_id: str) -> Dict[str, Any]:
+        """Build Resend send params for a message."""
+        # Prepare sender address
+        sender = message.from_address or self.from_address
+        
+        # Build Resend params
+        params: Dict[str, Any] = {
+            "from": sender,
+            "to": [message.to] if isinstance(message.to, str) else message.to,
+            "subject": message.subject,
+        }
+        
+        # Add body (HTML or text)
+        if message.html:
+            params["html"] = message.body
+        else:
+            params["text"] = message.body
+        
+        # Optional fields
+        if message.reply_to:
+            params["reply_to"] = [message.reply_to]
+        
+        if message.cc:
+            params["cc"] = message.cc
+        
+        if message.bcc:
+            params["bcc"] = message.bcc
+        
+        # Attachments
+        if message.attachments:
+            params["attachments"] = [
+                {
+                    "filename": att.filename,
+                    "content": att.content,
+                    "content_type": att.content_type
+                }
+                for att in message.attachments
+            ]
+        
+        # Headers/tags for tracking
+        if message.metadata:
+            params["headers"] = {
+                "X-FDC-Message-ID": internal_id,
+                "X-FDC-Client-ID": message.client_id or "",
+                "X-FDC-Message-Type": message.message_type or "custom"
+            }
+        
+        return params
+    
     def send_email(self, message: EmailMessage) -> EmailResult:
         """
         Send an email via Resend.
@@ -144,60 +270,13 @@ class EmailClient:
             EmailResult with send status
         """
         if not self.is_ready():
-            return EmailResult(
-                success=False,
-                error="Email client not configured. Check EMAIL_API_KEY and EMAIL_FROM_ADDRESS.",
-                status=EmailStatus.FAILED
-            )
+            return self._not_ready_result()
         
         # Generate internal message ID
         internal_id = str(uuid.uuid4())
         
-        # Prepare sender address
-        sender = message.from_address or self.from_address
-        
         try:
-            # Build Resend params
-            params: Dict[str, Any] = {
-                "from": sender,
-                "to": [message.to] if isinstance(message.to, str) else message.to,
-                "subject": message.subject,
-            }
-            
-            # Add body (HTML or text)
-            if message.html:
-                params["html"] = message.body
-            else:
-                params["text"] = message.body
-            
-            # Optional fields
-            if message.reply_to:
-                params["reply_to"] = [message.reply_to]
-            
-            if message.cc:
-                params["cc"] = message.cc
-            
-            if message.bcc:
-                params["bcc"] = message.bcc
-            
-            # Attachments
-            if message.attachments:
-                params["attachments"] = [
-                    {
-                        "filename": att.filename,
-                        "content": att.content,
-                        "content_type": att.content_type
-                    }
-                    for att in message.attachments
-                ]
-            
-            # Headers/tags for tracking
-            if message.metadata:
-                params["headers"] = {
-                    "X-FDC-Message-ID": internal_id,
-                    "X-FDC-Client-ID": message.client_id or "",
-                    "X-FDC-Message-Type": message.message_type or "custom"
-                }
+            params = self._build_params(message, internal_id)
             
             # Send via Resend SDK
             logger.info(f"Sending email to {message.to} via Resend")
@@ -243,18 +322,279 @@ class EmailClient:
         """
         Send multiple emails.
         
+        Messages without attachments go through the Resend batch API in
+        chunks of up to 100; messages with attachments (unsupported by the
+        batch API) are sent individually. Blocking - use send_batch_async
+        from async code.
+        
         Args:
             messages: List of EmailMessage to send
             
         Returns:
             List of EmailResult for each message
         """
+        if not self.is_ready():
+            return [self._not_ready_result() for _ in messages]
+        
+        results: List[Optional[EmailResult]] = [None] * len(messages)
+        single, chunks = self._plan_batch(messages)
+        
+        for position in single:
+            results[position] = self.send_email(messages[position])
+        
+        for chunk in chunks:
+            internal_ids = [str(uuid.uuid4()) for _ in chunk]
+            batch_key = f"batch-{uuid.uuid4()}"
+            try:
+                params = [
+                    self._build_params(messages[position], internal_id)
+                    for position, internal_id in zip(chunk, internal_ids)
+                ]
+                logger.info(f"Sending batch of {len(chunk)} emails via Resend")
+                response = resend.Batch.send(params, {"idempotency_key": batch_key})
+                chunk_results = self._batch_results(internal_ids, response)
+            except Exception as e:
+                error_msg = f"Resend API error: {str(e)}"
+                logger.error(error_msg)
+                chunk_results = self._failed_results(internal_ids, error_msg)
+            for position, result in zip(chunk, chunk_results):
+                results[position] = result
+        
+        return results
+    
+    # ==================== ASYNC SENDING ====================
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared async HTTP client for the Resend API (created lazily)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                base_url=RESEND_API_URL,
+                timeout=EMAIL_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=self.max_concurrency)
+            )
+        return self._http_client
+    
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Limit on in-flight async requests (created on first use)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def aclose(self):
+        """Close the async HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
+    async def send_email_async(self, message: EmailMessage) -> EmailResult:
+        """
+        Send an email via Resend without blocking the event loop.
+        
+        Args:
+            message: EmailMessage to send
+            
+        Returns:
+            EmailResult with send status
+        """
+        if not self.is_ready():
+            return self._not_ready_result()
+        
+        internal_id = str(uuid.uuid4())
+        
+        try:
+            params = self._encode_attachments(self._build_params(message, internal_id))
+            logger.info(f"Sending email to {message.to} via Resend")
+            ok, body = await self._post("/emails", params, idempotency_key=internal_id)
+        except Exception as e:
+            error_msg = f"Unexpected error sending email: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            return EmailResult(
+                success=False,
+                message_id=internal_id,
+                error=error_msg,
+                status=EmailStatus.FAILED
+            )
+        
+        if not ok:
+            logger.error(body)
+            return EmailResult(
+                success=False,
+                message_id=internal_id,
+                error=body,
+                status=EmailStatus.FAILED
+            )
+        
+        provider_msg_id = body.get("id")
+        logger.info(f"Email sent successfully: {provider_msg_id}")
+        return EmailResult(
+            success=True,
+            message_id=internal_id,
+            provider_message_id=provider_msg_id,
+            status=EmailStatus.SENT,
+            provider_response=body
+        )
+    
+    async def send_batch_async(self, messages: List[EmailMessage]) -> List[EmailResult]:
+        """
+        Send multiple emails concurrently without blocking the event loop.
+        
+        Messages without attachments are grouped into Resend batch API
+        requests of up to 100; the rest are sent individually. Requests run
+        concurrently, limited by max_concurrency and paced by the rate limiter.
+        
+        Args:
+            messages: List of EmailMessage to send
+            
+        Returns:
+            List of EmailResult for each message, in input order
+        """
+        if not self.is_ready():
+            return [self._not_ready_result() for _ in messages]
+        
+        results: List[Optional[EmailResult]] = [None] * len(messages)
+        single, chunks = self._plan_batch(messages)
+        
+        async def send_single(position: int):
+            results[position] = await self.send_email_async(messages[position])
+        
+        async def send_chunk(chunk: List[int]):
+            internal_ids = [str(uuid.uuid4()) for _ in chunk]
+            batch_key = f"batch-{uuid.uuid4()}"
+            try:
+                params = [
+                    self._build_params(messages[position], internal_id)
+                    for position, internal_id in zip(chunk, internal_ids)
+                ]
+                logger.info(f"Sending batch of {len(chunk)} emails via Resend")
+                ok, body = await self._post("/emails/batch", params, idempotency_key=batch_key)
+                if ok:
+                    chunk_results = self._batch_results(internal_ids, body)
+                else:
+                    logger.error(body)
+                    chunk_results = self._failed_results(internal_ids, body)
+            except Exception as e:
+                error_msg = f"Unexpected error sending email batch: {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                chunk_results = self._failed_results(internal_ids, error_msg)
+            for position, result in zip(chunk, chunk_results):
+                results[position] = result
+        
+        await asyncio.gather(
+            *(send_single(position) for position in single),
+            *(send_chunk(chunk) for chunk in chunks)
+        )
+        return results
+    
+    async def _post(self, path: str, payload: Any, idempotency_key: str) -> Tuple[bool, Any]:
+        """
+        POST to the Resend API under the concurrency and rate limits.
+        
+        429 and 5xx responses are retried up to EMAIL_MAX_RETRIES times;
+        a 429 pauses every request for the provider's Retry-After. Every
+        attempt carries the same Idempotency-Key, so a retry after a 5xx
+        whose send actually went through is not delivered twice.
+        
+        Args:
+            path: API path (/emails or /emails/batch)
+            payload: JSON request body
+            idempotency_key: Key identifying this message or batch chunk
+        
+        Returns:
+            (True, response JSON) on success, (False, error message) otherwise
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Idempotency-Key": idempotency_key,
+        }
+        attempt = 0
+        
+        while True:
+            async with self.semaphore:
+                await self.rate_limiter.acquire()
+                response = await self.http_client.post(path, json=payload, headers=headers)
+            
+            if response.status_code < 300:
+                return True, response.json()
+            
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt >= EMAIL_MAX_RETRIES:
+                return False, f"Resend API error ({response.status_code}): {self._error_message(response)}"
+            
+            attempt += 1
+            if response.status_code == 429:
+                retry_after = self._retry_after(response)
+                logger.warning(f"Resend rate limit hit, retrying in {retry_after:.1f}s")
+                self.rate_limiter.pause(retry_after)
+            else:
+                await asyncio.sleep(min(2 ** attempt, 30))
+    
+    @staticmethod
+    def _plan_batch(messages: List[EmailMessage]) -> Tuple[List[int], List[List[int]]]:
+        """Split message positions into individual sends and batch API chunks."""
+        single = [i for i, message in enumerate(messages) if message.attachments]
+        batchable = [i for i, message in enumerate(messages) if not message.attachments]
+        chunks = [
+            batchable[start:start + RESEND_BATCH_LIMIT]
+            for start in range(0, len(batchable), RESEND_BATCH_LIMIT)
+        ]
+        return single, chunks
+    
+    @staticmethod
+    def _batch_results(internal_ids: List[str], response: Any) -> List[EmailResult]:
+        """Map a batch API response ({ data: [{ id }] }) to per-message results."""
+        data = response.get("data", []) if isinstance(response, dict) else []
         results = []
-        for message in messages:
-            result = self.send_email(message)
-            results.append(result)
+        for i, internal_id in enumerate(internal_ids):
+            item = data[i] if i < len(data) and isinstance(data[i], dict) else {}
+            provider_msg_id = item.get("id")
+            if provider_msg_id:
+                results.append(EmailResult(
+                    success=True,
+                    message_id=internal_id,
+                    provider_message_id=provider_msg_id,
+                    status=EmailStatus.SENT,
+                    provider_response=item
+                ))
+            else:
+                results.append(EmailResult(
+                    success=False,
+                    message_id=internal_id,
+                    error="Resend API error: no message id returned for batch item",
+                    status=EmailStatus.FAILED
+                ))
         return results
     
+    @staticmethod
+    def _failed_results(internal_ids: List[str], error: str) -> List[EmailResult]:
+        return [
+            EmailResult(success=False, message_id=internal_id, error=error, status=EmailStatus.FAILED)
+            for internal_id in internal_ids
+        ]
+    
+    @staticmethod
+    def _encode_attachments(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Base64-encode attachment content for the JSON API."""
+        for attachment in params.get("attachments", []):
+            if isinstance(attachment["content"], (bytes, bytearray)):
+                attachment["content"] = base64.b64encode(attachment["content"]).decode("ascii")
+        return params
+    
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        try:
+            return max(0.0, float(response.headers.get("retry-after", DEFAULT_RETRY_AFTER_SECONDS)))
+        except ValueError:
+            return DEFAULT_RETRY_AFTER_SECONDS
+    
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        try:
+            return response.json().get("message") or response.text
+        except ValueError:
+            return response.text
+    
     def validate_email_address(self, email: str) -> bool:
         """
         Validate an email address format.
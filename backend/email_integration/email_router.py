@@ -54,6 +54,12 @@ def get_email_client() -> EmailClient:
     return _email_client
 
 
+async def close_email_client():
+    """Close the shared client's async HTTP connections."""
+    if _email_client is not None:
+        await _email_client.aclose()
+
+
 # ==================== REQUEST/RESPONSE MODELS ====================
 
 class SendEmailRequest(BaseModel):
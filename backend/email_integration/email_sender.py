@@ -11,7 +11,7 @@ This module provides business logic for sending emails:
 
 import logging
 import uuid
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -138,7 +138,7 @@ class EmailSender:
         )
         
         # Send email
-        result = self.client.send_email(message)
+        result = await self.client.send_email_async(message)
         
         # Log to database if available
         if self.db:
@@ -210,6 +210,27 @@ class EmailSender:
             message_type=EmailMessageType.NOTIFICATION
         )
     
+    async def send_batch(self, messages: List[EmailMessage]) -> List[EmailResult]:
+        """
+        Send many prepared messages concurrently with logging.
+        
+        Uses the client's rate-limited batch path and logs every result
+        with a single database round trip.
+        
+        Args:
+            messages: List of EmailMessage to send
+            
+        Returns:
+            List of EmailResult for each message, in input order
+        """
+        results = await self.client.send_batch_async(messages)
+        
+        # Log to database if available
+        if self.db:
+            await self._log_emails(list(zip(messages, results)))
+        
+        return results
+    
     def render_template(
         self,
         template_id: str,
@@ -415,6 +436,12 @@ class EmailSender:
     
     async def _log_email(self, message: EmailMessage, result: EmailResult) -> None:
         """Log email to database."""
+        await self._log_emails([(message, result)])
+    
+    async def _log_emails(self, sent: List[Tuple[EmailMessage, EmailResult]]) -> None:
+        """Log emails to database in one executemany round trip."""
+        if not sent:
+            return
         try:
             query = text("""
                 INSERT INTO email_logs (
@@ -431,28 +458,32 @@ class EmailSender:
             """)
             
             import json
-            await self.db.execute(query, {
-                "message_id": result.message_id,
-                "provider_message_id": result.provider_message_id,
-                "to_address": message.to,
-                "from_address": message.from_address or self.client.from_address,
-                "reply_to": message.reply_to,
-                "cc": ",".join(message.cc) if message.cc else None,
-                "bcc": ",".join(message.bcc) if message.bcc else None,
-                "subject": message.subject,
-                "body_html": message.body,
-                "provider": self.client.provider,
-                "status": result.status.value,
-                "error_message": result.error,
-                "client_id": message.client_id,
-                "job_id": message.job_id,
-                "message_type": message.message_type,
-                "template_id": message.template_id,
-                "metadata": json.dumps(message.metadata) if message.metadata else None,
-                "sent_at": datetime.now(timezone.utc) if result.success else None
-            })
+            now = datetime.now(timezone.utc)
+            await self.db.execute(query, [
+                {
+                    "message_id": result.message_id,
+                    "provider_message_id": result.provider_message_id,
+                    "to_address": message.to,
+                    "from_address": message.from_address or self.client.from_address,
+                    "reply_to": message.reply_to,
+                    "cc": ",".join(message.cc) if message.cc else None,
+                    "bcc": ",".join(message.bcc) if message.bcc else None,
+                    "subject": message.subject,
+                    "body_html": message.body,
+                    "provider": self.client.provider,
+                    "status": result.status.value,
+                    "error_message": result.error,
+                    "client_id": message.client_id,
+                    "job_id": message.job_id,
+                    "message_type": message.message_type,
+                    "template_id": message.template_id,
+                    "metadata": json.dumps(message.metadata) if message.metadata else None,
+                    "sent_at": now if result.success else None
+                }
+                for message, result in sent
+            ])
             await self.db.commit()
-            logger.info(f"Email logged to database: {result.message_id}")
+            logger.info(f"Logged {len(sent)} email(s) to database")
         except Exception as e:
             logger.error(f"Failed to log email to database: {e}")
             # Don't fail the send if logging fails
@@ -29,6 +29,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.connection import get_db
 from middleware.auth import get_current_user_required, AuthUser
+from services.search import INGESTED_TRANSACTIONS_SEARCH
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +150,8 @@ class BookkeepingReadyService:
         transaction_type: Optional[str] = None,
         category_code: Optional[str] = None,
         min_amount: Optional[float] = None,
-        max_amount: Optional[float] = None
+        max_amount: Optional[float] = None,
+        search: Optional[str] = None
     ) -> tuple[List[Dict[str, Any]], int]:
         """
         Get bookkeeping-ready transactions for a client.
@@ -164,6 +166,8 @@ class BookkeepingReadyService:
             category_code: Filter by category code
             min_amount: Filter by minimum amount (absolute value)
             max_amount: Filter by maximum amount (absolute value)
+            search: Full-text search (vendor, description, notes, category,
+                receipt number); results are ranked by relevance
             
         Returns:
             Tuple of (transactions, total_count)
@@ -201,6 +205,14 @@ class BookkeepingReadyService:
             conditions.append("ABS(amount) <= :max_amount")
             params["max_amount"] = max_amount
         
+        order_by = "transaction_date DESC, ingested_at DESC"
+        if search:
+            clause = INGESTED_TRANSACTIONS_SEARCH.build(search)
+            if clause:
+                conditions.append(clause.condition)
+                params.update(clause.params)
+                order_by = f"{clause.rank} DESC, {order_by}"
+        
         where_clause = " AND ".join(conditions)
         
         # Get total count
@@ -227,7 +239,7 @@ class BookkeepingReadyService:
                 attachments, audit, status, ingested_at, metadata
             FROM public.ingested_transactions
             WHERE {where_clause}
-            ORDER BY transaction_date DESC, ingested_at DESC
+            ORDER BY {order_by}
             LIMIT :limit OFFSET :offset
         """)
         
@@ -387,6 +399,7 @@ async def get_bookkeeping_ready_transactions(
     category_code: Optional[str] = Query(None, description="Filter by category code"),
     min_amount: Optional[float] = Query(None, description="Filter by minimum amount (absolute)"),
     max_amount: Optional[float] = Query(None, description="Filter by maximum amount (absolute)"),
+    search: Optional[str] = Query(None, description='Search vendor, description, notes, category, receipt number ("phrase", prefix*)'),
     current_user: AuthUser = Depends(get_current_user_required),
     db: AsyncSession = Depends(get_db)
 ):
@@ -407,6 +420,8 @@ async def get_bookkeeping_ready_transactions(
     - Transaction type (INCOME, EXPENSE, TRANSFER)
     - Category code
     - Amount range (min_amount, max_amount - absolute values)
+    - Search (vendor, description, notes, category, receipt number),
+      ranked by relevance; bare words match as prefixes, "quoted phrases" exactly
     
     **Pagination:**
     - page: 1-based page number
@@ -425,7 +440,8 @@ async def get_bookkeeping_ready_transactions(
         transaction_type=transaction_type,
         category_code=category_code,
         min_amount=min_amount,
-        max_amount=max_amount
+        max_amount=max_amount,
+        search=search
     )
     
     has_more = (page * page_size) < total_count
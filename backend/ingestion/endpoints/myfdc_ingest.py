@@ -123,6 +123,8 @@ class MyFDCIngestionResponse(BaseModel):
     total_count: int = Field(..., description="Total transactions submitted")
     ingested_count: int = Field(..., description="Successfully ingested count")
     error_count: int = Field(..., description="Failed transaction count")
+    inserted_count: int = Field(0, description="Transactions stored for the first time")
+    updated_count: int = Field(0, description="Previously ingested transactions that were updated")
     transactions: List[IngestionTransactionResult] = Field(..., description="Individual results")
     errors: Optional[List[IngestionErrorDetail]] = Field(None, description="Error details")
     normalisation_queued: bool = Field(..., description="Whether normalisation was queued")
@@ -187,6 +189,8 @@ async def ingest_myfdc_transactions(
             total_count=result.total_count,
             ingested_count=result.ingested_count,
             error_count=result.error_count,
+            inserted_count=result.inserted_count,
+            updated_count=result.updated_count,
             transactions=[
                 IngestionTransactionResult(
                     id=t.id,
@@ -16,7 +16,8 @@ import re
 import uuid
 from datetime import datetime, timezone, date
 from decimal import Decimal, InvalidOperation
-from typing import List, Dict, Any, Optional, Tuple
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -38,6 +39,21 @@ COLUMN_MAPPINGS = {
     "category": ["category", "type", "transaction_type", "code"],
 }
 
+# Rows returned in the parse preview
+PREVIEW_ROWS = 20
+
+# Rows read from disk and imported per chunk
+IMPORT_CHUNK_SIZE = 1000
+
+# Columns written by the bulk (COPY) import, in record order
+TRANSACTION_COPY_COLUMNS = [
+    "id", "client_id", "date", "amount", "payee_raw", "description_raw",
+    "source", "category_client", "status_bookkeeper", "created_at", "updated_at",
+]
+
+# Per-row errors kept on the batch record
+MAX_STORED_ERRORS = 100
+
 # Common bank export formats (ANZ, CBA, Westpac patterns)
 BANK_FORMATS = {
     "anz": {
@@ -213,73 +229,98 @@ class ParseService:
         return parse_result
     
     async def _parse_csv(self, file_path: str) -> Dict[str, Any]:
-        """Parse CSV file"""
-        rows = []
-        columns = []
-        
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            # Try to detect delimiter
-            sample = f.read(4096)
-            f.seek(0)
-            
-            try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
-            except csv.Error:
-                dialect = csv.excel
-            
-            reader = csv.DictReader(f, dialect=dialect)
-            columns = reader.fieldnames or []
-            
-            for i, row in enumerate(reader):
-                rows.append(row)
+        """Parse CSV file in a single streaming pass"""
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            columns, rows = self._csv_rows(f)
+            return self._summarise_rows(columns, rows)
+    
+    async def _parse_excel(self, file_path: str) -> Dict[str, Any]:
+        """Parse Excel file in a single streaming pass"""
+        wb = self._load_workbook(file_path)
+        try:
+            columns, rows = self._excel_rows(wb)
+            return self._summarise_rows(columns, rows)
+        finally:
+            wb.close()
+    
+    def iter_rows(self, file_path: str, file_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream data rows (as dicts keyed by column) from an uploaded file.
         
-        # Generate mapping suggestions
-        suggestions = self._suggest_mappings(columns)
+        Rows are read lazily, so memory stays flat regardless of file size.
+        The file is closed when the generator is exhausted or closed.
+        """
+        if file_type == 'csv':
+            with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                _, rows = self._csv_rows(f)
+                yield from rows
+        elif file_type in ['xlsx', 'xls']:
+            wb = self._load_workbook(file_path)
+            try:
+                _, rows = self._excel_rows(wb)
+                yield from rows
+            finally:
+                wb.close()
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
+    
+    def _csv_rows(self, f) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """Return CSV columns and a lazy row iterator for an open file"""
+        # Try to detect delimiter
+        sample = f.read(4096)
+        f.seek(0)
         
-        # Detect bank format
-        detected_format = self._detect_bank_format(columns)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
+        except csv.Error:
+            dialect = csv.excel
         
-        return {
-            "columns": columns,
-            "preview": rows[:20],
-            "row_count": len(rows),
-            "mapping_suggestions": suggestions,
-            "detected_format": detected_format,
-            "all_rows": rows,  # Keep for import
-        }
+        reader = csv.DictReader(f, dialect=dialect)
+        columns = reader.fieldnames or []
+        return columns, iter(reader)
     
-    async def _parse_excel(self, file_path: str) -> Dict[str, Any]:
-        """Parse Excel file"""
+    def _load_workbook(self, file_path: str):
+        """Open a workbook in read-only (streaming) mode"""
         try:
             import openpyxl
         except ImportError:
             raise ValueError("Excel support requires openpyxl. Install with: pip install openpyxl")
         
-        wb = openpyxl.load_workbook(file_path, read_only=True)
-        sheet = wb.active
-        
-        rows = []
-        columns = []
-        
-        for i, row in enumerate(sheet.iter_rows(values_only=True)):
-            if i == 0:
-                columns = [str(c) if c else f"Column_{j}" for j, c in enumerate(row)]
-            else:
-                row_dict = {columns[j]: cell for j, cell in enumerate(row) if j < len(columns)}
-                rows.append(row_dict)
-        
-        wb.close()
+        return openpyxl.load_workbook(file_path, read_only=True)
+    
+    def _excel_rows(self, wb) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """Return Excel columns (from the header row) and a lazy row iterator"""
+        sheet_rows = wb.active.iter_rows(values_only=True)
+        header = next(sheet_rows, None) or ()
+        columns = [str(c) if c else f"Column_{j}" for j, c in enumerate(header)]
+        
+        rows = (
+            {columns[j]: cell for j, cell in enumerate(row) if j < len(columns)}
+            for row in sheet_rows
+        )
+        return columns, rows
+    
+    def _summarise_rows(
+        self,
+        columns: List[str],
+        rows: Iterator[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build preview, row count and mapping suggestions in one pass over rows"""
+        preview = list(islice(rows, PREVIEW_ROWS))
+        row_count = len(preview) + sum(1 for _ in rows)
         
+        # Generate mapping suggestions
         suggestions = self._suggest_mappings(columns)
+        
+        # Detect bank format
         detected_format = self._detect_bank_format(columns)
         
         return {
             "columns": columns,
-            "preview": rows[:20],
-            "row_count": len(rows),
+            "preview": preview,
+            "row_count": row_count,
             "mapping_suggestions": suggestions,
             "detected_format": detected_format,
-            "all_rows": rows,
         }
     
     def _suggest_mappings(self, columns: List[str]) -> Dict[str, str]:
@@ -357,60 +398,37 @@ class ImportService:
         batch.column_mapping = column_mapping
         await self.db.commit()
         
-        # Re-parse file to get all rows
+        # Re-stream the file from disk in chunks rather than holding every row
         parse_service = ParseService(self.db)
-        if batch.file_type == 'csv':
-            parse_result = await parse_service._parse_csv(batch.file_path)
-        else:
-            parse_result = await parse_service._parse_excel(batch.file_path)
-        
-        all_rows = parse_result.get("all_rows", [])
+        rows = parse_service.iter_rows(batch.file_path, batch.file_type)
         
         # Import stats
-        imported_count = 0
-        skipped_count = 0
+        stats = {"imported": 0, "skipped": 0, "errors": 0}
         errors = []
+        row_num = 2  # Start at 2 (header is row 1)
         
-        for row_num, row in enumerate(all_rows, start=2):  # Start at 2 (header is row 1)
-            try:
-                # Extract values using mapping
-                txn_data = self._extract_transaction_data(row, column_mapping, row_num)
-                
-                if not txn_data:
-                    errors.append({"row": row_num, "error": "Failed to extract required fields"})
-                    continue
-                
-                # Check for duplicates
-                if skip_duplicates:
-                    is_dup, existing_id = await self._check_duplicate(
-                        batch.client_id,
-                        batch.job_id,
-                        txn_data["date"],
-                        txn_data["amount"],
-                        txn_data.get("description", "")
-                    )
-                    
-                    if is_dup:
-                        skipped_count += 1
-                        continue
-                
-                # Insert transaction
-                await self._insert_transaction(
-                    batch_id=batch_id,
-                    client_id=batch.client_id,
-                    txn_data=txn_data
+        try:
+            while True:
+                chunk = list(islice(rows, IMPORT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                await self._import_chunk(
+                    batch, batch_id, chunk, row_num, column_mapping, skip_duplicates, stats, errors
                 )
-                imported_count += 1
-                
-            except Exception as e:
-                errors.append({"row": row_num, "error": str(e)})
+                row_num += len(chunk)
+        finally:
+            rows.close()
+        
+        imported_count = stats["imported"]
+        skipped_count = stats["skipped"]
+        error_count = stats["errors"]
         
         # Update batch with results
-        batch.status = ImportBatchStatus.COMPLETED.value if not errors else ImportBatchStatus.COMPLETED.value
+        batch.status = ImportBatchStatus.COMPLETED.value
         batch.imported_count = imported_count
         batch.skipped_count = skipped_count
-        batch.error_count = len(errors)
-        batch.errors = errors[:100]  # Limit stored errors
+        batch.error_count = error_count
+        batch.errors = errors  # Limited to MAX_STORED_ERRORS
         
         # Create audit log
         audit = ImportAuditLogDB(
@@ -421,24 +439,102 @@ class ImportService:
             details={
                 "imported_count": imported_count,
                 "skipped_count": skipped_count,
-                "error_count": len(errors),
+                "error_count": error_count,
             }
         )
         self.db.add(audit)
         
         await self.db.commit()
         
-        logger.info(f"Import completed: {imported_count} imported, {skipped_count} skipped, {len(errors)} errors")
+        logger.info(f"Import completed: {imported_count} imported, {skipped_count} skipped, {error_count} errors")
         
         return {
             "success": True,
             "batch_id": batch_id,
             "imported_count": imported_count,
             "skipped_duplicates": skipped_count,
-            "error_count": len(errors),
+            "error_count": error_count,
             "errors": errors[:20],  # Return first 20 errors
         }
     
+    async def _import_chunk(
+        self,
+        batch: ImportBatchDB,
+        batch_id: str,
+        chunk: List[Dict[str, Any]],
+        first_row_num: int,
+        column_mapping: Dict[str, str],
+        skip_duplicates: bool,
+        stats: Dict[str, int],
+        errors: List[Dict[str, Any]]
+    ):
+        """
+        Import one chunk of streamed rows, updating stats and errors in place.
+        
+        Duplicates for the whole chunk are found with a single query and the
+        surviving rows are written with one COPY, so a chunk costs two round
+        trips instead of two per row.
+        """
+        
+        def record_error(row_num: int, message: str):
+            stats["errors"] += 1
+            if len(errors) < MAX_STORED_ERRORS:
+                errors.append({"row": row_num, "error": message})
+        
+        # Extract values using mapping
+        extracted = []
+        for row_num, row in enumerate(chunk, start=first_row_num):
+            try:
+                txn_data = self._extract_transaction_data(row, column_mapping, row_num)
+            except Exception as e:
+                record_error(row_num, str(e))
+                continue
+            
+            if not txn_data:
+                record_error(row_num, "Failed to extract required fields")
+                continue
+            
+            extracted.append((row_num, txn_data))
+        
+        # Check for duplicates against existing transactions and within the chunk
+        if skip_duplicates and extracted:
+            keys = [self._duplicate_key(txn_data) for _, txn_data in extracted]
+            seen = await self._find_duplicate_keys(batch.client_id, keys)
+            
+            survivors = []
+            for key, item in zip(keys, extracted):
+                if key in seen:
+                    stats["skipped"] += 1
+                    continue
+                seen.add(key)
+                survivors.append(item)
+            extracted = survivors
+        
+        if not extracted:
+            return
+        
+        # Insert transactions
+        try:
+            async with self.db.begin_nested():
+                await self._copy_transactions(batch.client_id, [txn_data for _, txn_data in extracted])
+            stats["imported"] += len(extracted)
+            return
+        except Exception as e:
+            logger.warning(f"Bulk insert failed for rows {extracted[0][0]}-{extracted[-1][0]}, retrying per row: {e}")
+        
+        # Fall back to row-by-row inserts so failures are reported per row
+        for row_num, txn_data in extracted:
+            try:
+                async with self.db.begin_nested():
+                    await self._insert_transaction(
+                        batch_id=batch_id,
+                        client_id=batch.client_id,
+                        txn_data=txn_data
+                    )
+                stats["imported"] += 1
+            except Exception as e:
+                record_error(row_num, str(e))
+    
     def _extract_transaction_data(
         self,
         row: Dict[str, Any],
@@ -489,10 +585,11 @@ class ImportService:
     
     def _parse_date(self, value: Any) -> Optional[date]:
         """Parse date from various formats"""
-        if isinstance(value, date):
-            return value
+        # datetime subclasses date; check it first so Excel cells become plain dates
         if isinstance(value, datetime):
             return value.date()
+        if isinstance(value, date):
+            return value
         
         if not value:
             return None
@@ -535,42 +632,81 @@ class ImportService:
         except InvalidOperation:
             return None
     
-    async def _check_duplicate(
-        self,
-        client_id: str,
-        job_id: Optional[str],
-        txn_date: date,
-        amount: Decimal,
-        description: str
-    ) -> Tuple[bool, Optional[str]]:
+    def _duplicate_key(self, txn_data: Dict[str, Any]) -> Tuple[date, Decimal, str]:
         """
-        Check if transaction is a duplicate.
+        Key used for duplicate detection.
         
         Duplicate rule: same client_id + date + amount + normalized description
+        (client_id is implied, as every import runs for a single client)
+        """
+        norm_desc = re.sub(r'\s+', ' ', txn_data.get("description", "").lower().strip())
+        return txn_data["date"], txn_data["amount"], norm_desc
+    
+    async def _find_duplicate_keys(
+        self,
+        client_id: str,
+        keys: List[Tuple[date, Decimal, str]]
+    ) -> set:
         """
-        # Normalize description
-        norm_desc = re.sub(r'\s+', ' ', description.lower().strip())
+        Return the subset of duplicate keys that already exist for a client.
         
-        query = text("""
-            SELECT id FROM transactions
-            WHERE client_id = :client_id
-              AND date = :date
-              AND amount = :amount
-              AND LOWER(TRIM(REGEXP_REPLACE(COALESCE(description_raw, ''), '\s+', ' ', 'g'))) = :description
-            LIMIT 1
+        All keys are checked in one query by joining the unnested key arrays
+        against transactions on (client_id, date).
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return set()
+        
+        query = text(r"""
+            SELECT DISTINCT k.date, k.amount, k.description
+            FROM unnest(
+                CAST(:dates AS date[]),
+                CAST(:amounts AS numeric[]),
+                CAST(:descriptions AS text[])
+            ) AS k(date, amount, description)
+            JOIN transactions t
+              ON t.client_id = :client_id
+             AND t.date = k.date
+             AND t.amount = k.amount
+             AND LOWER(TRIM(REGEXP_REPLACE(COALESCE(t.description_raw, ''), '\s+', ' ', 'g'))) = k.description
         """)
         
         result = await self.db.execute(query, {
             "client_id": client_id,
-            "date": txn_date,
-            "amount": float(amount),
-            "description": norm_desc
+            "dates": [key[0] for key in unique_keys],
+            "amounts": [key[1] for key in unique_keys],
+            "descriptions": [key[2] for key in unique_keys],
         })
         
-        row = result.fetchone()
-        if row:
-            return True, row[0]
-        return False, None
+        return {(row[0], Decimal(row[1]), row[2]) for row in result.fetchall()}
+    
+    async def _copy_transactions(self, client_id: str, txn_rows: List[Dict[str, Any]]):
+        """Bulk insert new transactions with COPY over the session's connection"""
+        now = datetime.now(timezone.utc)
+        records = [
+            (
+                str(uuid.uuid4()),
+                client_id,
+                txn_data["date"],
+                txn_data["amount"],
+                txn_data.get("payee", ""),
+                txn_data.get("description", ""),
+                'BANK',
+                txn_data.get("category", ""),
+                'NEW',
+                now,
+                now,
+            )
+            for txn_data in txn_rows
+        ]
+        
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            'transactions',
+            records=records,
+            columns=TRANSACTION_COPY_COLUMNS,
+        )
     
     async def _insert_transaction(
         self,
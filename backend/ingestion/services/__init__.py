@@ -4,6 +4,7 @@ Ingestion Services Module
 
 from .ingestion_service import IngestionService, IngestionBatchResult, IngestionAuditEvent
 from .normalisation_service import NormalisationService, NormalisationResult, Agent8MappingClient
+from .mapping_cache import MappingCache, PostgresMappingCacheStore
 
 __all__ = [
     "IngestionService", 
@@ -11,5 +12,7 @@ __all__ = [
     "IngestionAuditEvent",
     "NormalisationService",
     "NormalisationResult",
-    "Agent8MappingClient"
+    "Agent8MappingClient",
+    "MappingCache",
+    "PostgresMappingCacheStore"
 ]
@@ -8,6 +8,7 @@ Handles the core ingestion logic:
 - Audit trail management
 """
 
+import json
 import uuid
 import logging
 from datetime import datetime, timezone
@@ -30,6 +31,28 @@ from ingestion.factories.myfdc_transformer import MyFDCTransformer
 logger = logging.getLogger(__name__)
 
 
+# Transactions upserted per INSERT ... ON CONFLICT statement
+UPSERT_CHUNK_SIZE = 500
+
+# Columns written on insert (created_at/updated_at are set by the database)
+UPSERT_INSERT_COLUMNS = [
+    "id", "source", "source_transaction_id", "client_id",
+    "ingested_at", "transaction_date", "transaction_type",
+    "amount", "currency", "gst_included", "gst_amount",
+    "description", "notes", "category_raw", "category_normalised", "category_code",
+    "business_percentage", "vendor", "receipt_number",
+    "attachments", "status", "error_message", "audit",
+    "raw_payload", "metadata", "bookkeeping_transaction_id",
+]
+
+# Columns refreshed when the source transaction already exists
+UPSERT_UPDATE_COLUMNS = [
+    "transaction_date", "transaction_type", "amount", "gst_included", "gst_amount",
+    "description", "notes", "category_raw", "business_percentage", "vendor",
+    "receipt_number", "error_message",
+]
+
+
 @dataclass
 class IngestionBatchResult:
     """Result of a batch ingestion operation."""
@@ -41,6 +64,8 @@ class IngestionBatchResult:
     error_count: int
     transactions: List[IngestTransactionResponse]
     errors: List[Dict[str, Any]]
+    inserted_count: int = 0
+    updated_count: int = 0
 
 
 class IngestionAuditEvent:
@@ -122,21 +147,37 @@ class IngestionService:
         # Transform all payloads
         transformer_results = MyFDCTransformer.transform_batch(payloads, client_id, actor)
         
-        # Store all transactions
+        # Store all transactions, one multi-row upsert per chunk
         transactions_response = []
         errors = []
         ingested_count = 0
         error_count = 0
+        inserted_count = 0
+        updated_count = 0
         
-        for transaction, error in transformer_results:
-            try:
-                # Store the transaction
-                await self._store_transaction(transaction)
+        for chunk in self._upsert_chunks(transformer_results):
+            stored, chunk_errors = await self._store_chunk([transaction for transaction, _ in chunk])
+            
+            for transaction, error in chunk:
+                source_txn_id = transaction.source_transaction_id
+                if source_txn_id in chunk_errors:
+                    error_count += 1
+                    errors.append({
+                        "source_transaction_id": source_txn_id,
+                        "error": chunk_errors[source_txn_id]
+                    })
+                    continue
+                
+                stored_id, inserted = stored[source_txn_id]
+                if inserted:
+                    inserted_count += 1
+                else:
+                    updated_count += 1
                 
                 transactions_response.append(IngestTransactionResponse(
-                    id=transaction.id,
+                    id=stored_id,
                     source=transaction.source.value if hasattr(transaction.source, 'value') else str(transaction.source),
-                    source_transaction_id=transaction.source_transaction_id,
+                    source_transaction_id=source_txn_id,
                     status=transaction.status.value if hasattr(transaction.status, 'value') else str(transaction.status),
                     ingested_at=transaction.ingested_at
                 ))
@@ -144,19 +185,11 @@ class IngestionService:
                 if transaction.status == IngestionStatus.ERROR:
                     error_count += 1
                     errors.append({
-                        "source_transaction_id": transaction.source_transaction_id,
+                        "source_transaction_id": source_txn_id,
                         "error": error or transaction.error_message
                     })
                 else:
                     ingested_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to store transaction: {e}")
-                error_count += 1
-                errors.append({
-                    "source_transaction_id": transaction.source_transaction_id if transaction else "unknown",
-                    "error": str(e)
-                })
         
         # Commit the batch
         try:
@@ -187,6 +220,8 @@ class IngestionService:
             {
                 "total": len(payloads),
                 "ingested": ingested_count,
+                "inserted": inserted_count,
+                "updated": updated_count,
                 "errors": error_count
             }
         )
@@ -199,134 +234,166 @@ class IngestionService:
             ingested_count=ingested_count,
             error_count=error_count,
             transactions=transactions_response,
-            errors=errors if errors else []
+            errors=errors if errors else [],
+            inserted_count=inserted_count,
+            updated_count=updated_count
         )
     
+    def _upsert_chunks(
+        self,
+        transformer_results: List[Tuple[IngestedTransaction, Optional[str]]]
+    ) -> List[List[Tuple[IngestedTransaction, Optional[str]]]]:
+        """
+        Split transformer results into upsert chunks.
+        
+        A statement cannot insert and then update the same row, so a
+        source transaction repeated within a batch starts a new chunk;
+        the later copy then updates the earlier one, as it would row by row.
+        """
+        chunks = []
+        chunk = []
+        chunk_keys = set()
+        
+        for transaction, error in transformer_results:
+            key = self._upsert_key(transaction)
+            if len(chunk) >= UPSERT_CHUNK_SIZE or key in chunk_keys:
+                chunks.append(chunk)
+                chunk = []
+                chunk_keys = set()
+            chunk.append((transaction, error))
+            chunk_keys.add(key)
+        
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
+    def _upsert_key(self, transaction: IngestedTransaction) -> Tuple[str, str, str]:
+        """Conflict key of the unique (source, source_transaction_id, client_id) index."""
+        source = transaction.source.value if hasattr(transaction.source, 'value') else str(transaction.source)
+        return source, transaction.source_transaction_id, str(transaction.client_id)
+    
+    async def _store_chunk(
+        self,
+        transactions: List[IngestedTransaction]
+    ) -> Tuple[Dict[str, Tuple[str, bool]], Dict[str, str]]:
+        """
+        Upsert a chunk, falling back to row-by-row if the bulk statement fails.
+        
+        Returns:
+            (stored, errors) where stored maps source_transaction_id to
+            (stored id, inserted) and errors maps source_transaction_id to
+            the error for rows that could not be stored
+        """
+        try:
+            async with self.db.begin_nested():
+                return await self._upsert_transactions(transactions), {}
+        except Exception as e:
+            logger.warning(f"Bulk upsert of {len(transactions)} transactions failed, retrying per row: {e}")
+        
+        stored = {}
+        errors = {}
+        for transaction in transactions:
+            try:
+                async with self.db.begin_nested():
+                    stored.update(await self._upsert_transactions([transaction]))
+            except Exception as e:
+                logger.error(f"Failed to store transaction: {e}")
+                errors[transaction.source_transaction_id] = str(e)
+        return stored, errors
+    
     async def _store_transaction(self, transaction: IngestedTransaction) -> str:
         """Store a single transaction in the database."""
-        import json
-        import uuid as uuid_module
+        stored = await self._upsert_transactions([transaction])
+        stored_id, _ = stored[transaction.source_transaction_id]
+        return stored_id
+    
+    async def _upsert_transactions(
+        self,
+        transactions: List[IngestedTransaction]
+    ) -> Dict[str, Tuple[str, bool]]:
+        """
+        Insert or update transactions with one multi-row INSERT ... ON CONFLICT.
         
-        # Convert audit entries to JSON-serializable format
-        audit_json = json.dumps([entry.to_dict() for entry in transaction.audit])
+        Existing rows get the refreshable fields updated and the new audit
+        entries appended to their audit trail; their id, status and
+        normalisation results are left untouched.
+        
+        Returns:
+            Map of source_transaction_id to (stored id, True if inserted)
+        """
+        if not transactions:
+            return {}
         
-        # Convert attachments to JSON-serializable format
-        attachments_json = json.dumps([att.to_dict() for att in transaction.attachments])
+        params = {}
+        values_sql = []
+        for i, transaction in enumerate(transactions):
+            row = self._upsert_params(transaction)
+            values_sql.append(
+                "(" + ", ".join(f":{column}_{i}" for column in UPSERT_INSERT_COLUMNS) + ", NOW(), NOW())"
+            )
+            for column in UPSERT_INSERT_COLUMNS:
+                params[f"{column}_{i}"] = row[column]
         
-        # Serialize raw_payload and metadata
-        raw_payload_json = json.dumps(transaction.raw_payload) if transaction.raw_payload else None
-        metadata_json = json.dumps(transaction.metadata) if transaction.metadata else None
+        separator = ",\n                "
+        update_sql = separator.join(
+            f"{column} = EXCLUDED.{column}" for column in UPSERT_UPDATE_COLUMNS
+        )
         
-        # Convert string UUIDs to UUID objects for asyncpg
-        txn_uuid = uuid_module.UUID(transaction.id) if isinstance(transaction.id, str) else transaction.id
-        client_uuid = uuid_module.UUID(transaction.client_id) if isinstance(transaction.client_id, str) else transaction.client_id
-        
-        # Simple INSERT without ON CONFLICT for now (asyncpg issues with complex queries)
-        # Check if exists first
-        check_query = text("""
-            SELECT id FROM public.ingested_transactions 
-            WHERE source = :source AND source_transaction_id = :source_txn_id AND client_id = :client_id
+        query = text(f"""
+            INSERT INTO public.ingested_transactions (
+                {", ".join(UPSERT_INSERT_COLUMNS)},
+                created_at, updated_at
+            ) VALUES
+                {separator.join(values_sql)}
+            ON CONFLICT (source, source_transaction_id, client_id) DO UPDATE SET
+                {update_sql},
+                audit = public.ingested_transactions.audit || EXCLUDED.audit,
+                updated_at = NOW()
+            RETURNING id, source_transaction_id, (xmax = 0) AS inserted
         """)
-        existing = await self.db.execute(check_query, {
+        
+        result = await self.db.execute(query, params)
+        
+        return {
+            row[1]: (str(row[0]), bool(row[2]))
+            for row in result.fetchall()
+        }
+    
+    def _upsert_params(self, transaction: IngestedTransaction) -> Dict[str, Any]:
+        """Bind parameters for one transaction, keyed by UPSERT_INSERT_COLUMNS."""
+        # Convert string UUIDs to UUID objects for asyncpg
+        txn_uuid = uuid.UUID(transaction.id) if isinstance(transaction.id, str) else transaction.id
+        client_uuid = uuid.UUID(transaction.client_id) if isinstance(transaction.client_id, str) else transaction.client_id
+        
+        return {
+            'id': str(txn_uuid),
             'source': transaction.source.value if hasattr(transaction.source, 'value') else str(transaction.source),
-            'source_txn_id': transaction.source_transaction_id,
-            'client_id': str(client_uuid)
-        })
-        existing_row = existing.fetchone()
-        
-        if existing_row:
-            # Update existing
-            update_query = text("""
-                UPDATE public.ingested_transactions SET
-                    transaction_date = :transaction_date,
-                    transaction_type = :transaction_type,
-                    amount = :amount,
-                    gst_included = :gst_included,
-                    gst_amount = :gst_amount,
-                    description = :description,
-                    notes = :notes,
-                    category_raw = :category_raw,
-                    business_percentage = :business_percentage,
-                    vendor = :vendor,
-                    receipt_number = :receipt_number,
-                    error_message = :error_message,
-                    updated_at = NOW()
-                WHERE id = :existing_id
-                RETURNING id
-            """)
-            result = await self.db.execute(update_query, {
-                'existing_id': str(existing_row[0]),
-                'transaction_date': transaction.transaction_date,
-                'transaction_type': transaction.transaction_type.value if hasattr(transaction.transaction_type, 'value') else str(transaction.transaction_type),
-                'amount': float(transaction.amount),
-                'gst_included': transaction.gst_included,
-                'gst_amount': float(transaction.gst_amount) if transaction.gst_amount else None,
-                'description': transaction.description,
-                'notes': transaction.notes,
-                'category_raw': transaction.category_raw,
-                'business_percentage': transaction.business_percentage,
-                'vendor': transaction.vendor,
-                'receipt_number': transaction.receipt_number,
-                'error_message': transaction.error_message,
-            })
-            row = result.fetchone()
-            return str(row[0]) if row else str(existing_row[0])
-        else:
-            # Insert new
-            insert_query = text("""
-                INSERT INTO public.ingested_transactions (
-                    id, source, source_transaction_id, client_id,
-                    ingested_at, transaction_date, transaction_type,
-                    amount, currency, gst_included, gst_amount,
-                    description, notes, category_raw, category_normalised, category_code,
-                    business_percentage, vendor, receipt_number,
-                    attachments, status, error_message, audit,
-                    raw_payload, metadata, bookkeeping_transaction_id,
-                    created_at, updated_at
-                ) VALUES (
-                    :id, :source, :source_transaction_id, :client_id,
-                    :ingested_at, :transaction_date, :transaction_type,
-                    :amount, :currency, :gst_included, :gst_amount,
-                    :description, :notes, :category_raw, :category_normalised, :category_code,
-                    :business_percentage, :vendor, :receipt_number,
-                    :attachments, :status, :error_message, :audit,
-                    :raw_payload, :metadata, :bookkeeping_transaction_id,
-                    NOW(), NOW()
-                )
-                RETURNING id
-            """)
-            
-            result = await self.db.execute(insert_query, {
-                'id': str(txn_uuid),
-                'source': transaction.source.value if hasattr(transaction.source, 'value') else str(transaction.source),
-                'source_transaction_id': transaction.source_transaction_id,
-                'client_id': str(client_uuid),
-                'ingested_at': transaction.ingested_at,
-                'transaction_date': transaction.transaction_date,
-                'transaction_type': transaction.transaction_type.value if hasattr(transaction.transaction_type, 'value') else str(transaction.transaction_type),
-                'amount': float(transaction.amount),
-                'currency': transaction.currency,
-                'gst_included': transaction.gst_included,
-                'gst_amount': float(transaction.gst_amount) if transaction.gst_amount else None,
-                'description': transaction.description,
-                'notes': transaction.notes,
-                'category_raw': transaction.category_raw,
-                'category_normalised': transaction.category_normalised,
-                'category_code': transaction.category_code,
-                'business_percentage': transaction.business_percentage,
-                'vendor': transaction.vendor,
-                'receipt_number': transaction.receipt_number,
-                'attachments': attachments_json,
-                'status': transaction.status.value if hasattr(transaction.status, 'value') else str(transaction.status),
-                'error_message': transaction.error_message,
-                'audit': audit_json,
-                'raw_payload': raw_payload_json,
-                'metadata': metadata_json,
-                'bookkeeping_transaction_id': transaction.bookkeeping_transaction_id,
-            })
-            
-            row = result.fetchone()
-            return str(row[0]) if row else transaction.id
+            'source_transaction_id': transaction.source_transaction_id,
+            'client_id': str(client_uuid),
+            'ingested_at': transaction.ingested_at,
+            'transaction_date': transaction.transaction_date,
+            'transaction_type': transaction.transaction_type.value if hasattr(transaction.transaction_type, 'value') else str(transaction.transaction_type),
+            'amount': float(transaction.amount),
+            'currency': transaction.currency,
+            'gst_included': transaction.gst_included,
+            'gst_amount': float(transaction.gst_amount) if transaction.gst_amount else None,
+            'description': transaction.description,
+            'notes': transaction.notes,
+            'category_raw': transaction.category_raw,
+            'category_normalised': transaction.category_normalised,
+            'category_code': transaction.category_code,
+            'business_percentage': transaction.business_percentage,
+            'vendor': transaction.vendor,
+            'receipt_number': transaction.receipt_number,
+            # Convert attachments and audit entries to JSON-serializable format
+            'attachments': json.dumps([att.to_dict() for att in transaction.attachments]),
+            'status': transaction.status.value if hasattr(transaction.status, 'value') else str(transaction.status),
+            'error_message': transaction.error_message,
+            'audit': json.dumps([entry.to_dict() for entry in transaction.audit]),
+            'raw_payload': json.dumps(transaction.raw_payload) if transaction.raw_payload else None,
+            'metadata': json.dumps(transaction.metadata) if transaction.metadata else None,
+            'bookkeeping_transaction_id': transaction.bookkeeping_transaction_id,
+        }
     
     async def _queue_normalisation(
         self,
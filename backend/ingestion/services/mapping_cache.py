@@ -0,0 +1,186 @@
+"""
+Category Mapping Cache (A3-INGEST-03)
+
+Caches category mapping results so repeated raw categories
+("Groceries", "Fuel", "Toys") are not re-mapped for every transaction:
+- In-process tier: LRU with a TTL per entry
+- Optional shared tier: Postgres table (category_mapping_cache) so every
+  worker process benefits from mappings fetched by the others
+
+Values are JSON-serialisable dicts (MappingResult fields).
+"""
+
+import json
+import re
+import time
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+def mapping_cache_key(raw_category: Optional[str], transaction_type: Optional[str]) -> Optional[str]:
+    """
+    Cache key from the normalised raw category and transaction type.
+
+    Returns None for a blank category: its mapping depends on the
+    description and amount, so it is neither shared nor cached.
+    """
+    category = re.sub(r'\s+', ' ', (raw_category or '').lower().strip())
+    if not category:
+        return None
+    return f"{(transaction_type or '').upper()}|{category}"
+
+
+class PostgresMappingCacheStore:
+    """
+    Shared cache tier backed by public.category_mapping_cache.
+
+    Uses its own short-lived sessions so cache reads and writes never
+    join (or roll back with) the caller's transaction.
+    """
+
+    def __init__(self, db_session_factory):
+        self.db_session_factory = db_session_factory
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Tuple[Dict[str, Any], datetime]]:
+        """Fetch unexpired entries as {key: (value, expires_at)}."""
+        if not keys:
+            return {}
+
+        query = text("""
+            SELECT cache_key, result, expires_at
+            FROM public.category_mapping_cache
+            WHERE cache_key = ANY(:keys) AND expires_at > NOW()
+        """)
+
+        async with self.db_session_factory() as db:
+            result = await db.execute(query, {"keys": keys})
+            rows = result.fetchall()
+
+        return {
+            row[0]: (row[1] if isinstance(row[1], dict) else json.loads(row[1]), row[2])
+            for row in rows
+        }
+
+    async def set_many(self, entries: Dict[str, Dict[str, Any]], ttl_seconds: int):
+        """Upsert entries with a shared expiry."""
+        if not entries:
+            return
+
+        query = text("""
+            INSERT INTO public.category_mapping_cache (cache_key, result, expires_at, updated_at)
+            SELECT k.cache_key, CAST(k.result AS jsonb), :expires_at, NOW()
+            FROM unnest(CAST(:keys AS text[]), CAST(:results AS text[])) AS k(cache_key, result)
+            ON CONFLICT (cache_key) DO UPDATE SET
+                result = EXCLUDED.result,
+                expires_at = EXCLUDED.expires_at,
+                updated_at = NOW()
+        """)
+
+        async with self.db_session_factory() as db:
+            await db.execute(query, {
+                "keys": list(entries),
+                "results": [json.dumps(value) for value in entries.values()],
+                "expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds),
+            })
+            await db.commit()
+
+
+class MappingCache:
+    """
+    Two-tier TTL + LRU cache for category mapping results.
+
+    The in-process tier holds at most max_entries keys, evicting the
+    least recently used. Entries expire ttl_seconds after they were
+    stored. Failures in the shared tier are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_seconds: int = 3600,
+        store: Optional[PostgresMappingCacheStore] = None
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_local(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: Dict[str, Any], ttl_seconds: float):
+        self._entries[key] = (value, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up many keys, consulting the shared tier once for local misses."""
+        unique_keys = list(dict.fromkeys(keys))
+        found = {}
+        missing = []
+        for key in unique_keys:
+            value = self._get_local(key)
+            if value is not None:
+                found[key] = value
+            else:
+                missing.append(key)
+
+        if missing and self.store is not None:
+            try:
+                shared = await self.store.get_many(missing)
+            except Exception as e:
+                logger.warning(f"Shared mapping cache lookup failed: {e}")
+                shared = {}
+            now = datetime.now(timezone.utc)
+            for key, (value, expires_at) in shared.items():
+                self._set_local(key, value, min(self.ttl_seconds, (expires_at - now).total_seconds()))
+                found[key] = value
+
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single key."""
+        return (await self.get_many([key])).get(key)
+
+    async def set_many(self, entries: Dict[str, Dict[str, Any]]):
+        """Store entries in both tiers."""
+        if not entries:
+            return
+        for key, value in entries.items():
+            self._set_local(key, value, self.ttl_seconds)
+
+        if self.store is not None:
+            try:
+                await self.store.set_many(entries, self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Shared mapping cache write failed: {e}")
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        """Store a single entry."""
+        await self.set_many({key: value})
+
+    def clear(self):
+        """Drop all in-process entries."""
+        self._entries.clear()
@@ -8,20 +8,39 @@ Handles the normalisation of ingested transactions:
 - Manages audit trail and status transitions
 """
 
+import os
 import json
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict
 from enum import Enum
 
 import httpx
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ingestion.services.mapping_cache import MappingCache, mapping_cache_key
+
 logger = logging.getLogger(__name__)
 
 
+# Process-wide mapping cache shared by every NormalisationService
+default_mapping_cache = MappingCache(
+    max_entries=int(os.environ.get("NORMALISATION_MAPPING_CACHE_SIZE", "2048")),
+    ttl_seconds=int(os.environ.get("NORMALISATION_MAPPING_CACHE_TTL", "3600"))
+)
+
+# Preliminary mapping sources whose result depends on the description,
+# not just the raw category, and so must not be cached by category
+DESCRIPTION_DEPENDENT_SOURCES = {
+    "preliminary_description",
+    "preliminary_default",
+    "preliminary_uncategorised",
+}
+
+
 class NormalisationStatus(str, Enum):
     """Normalisation queue status."""
     PENDING = "PENDING"
@@ -62,19 +81,32 @@ class Agent8MappingClient:
     This client provides the interface for Core to call it.
     """
     
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[MappingCache] = None
+    ):
         """
         Initialize the mapping client.
         
         Args:
             base_url: Agent 8 mapping service URL
             timeout: Request timeout in seconds
+            http_client: Shared keep-alive client (owned by the caller);
+                a short-lived client is opened per call when not provided
+            cache: Mapping cache keyed on raw category and transaction type
+                (None = no caching)
         
         Note: When base_url is not provided, the service will return 
         a standard "PENDING_CATEGORISATION" status instead of fake mappings.
         """
         self.base_url = base_url
         self.timeout = timeout
+        self.http_client = http_client
+        self.cache = cache
+        self._batch_supported = True
         # Standard categories for fallback (not mock - these are real categories)
         self._standard_categories = self._load_standard_categories()
     
@@ -156,17 +188,188 @@ class Agent8MappingClient:
         Returns:
             MappingResult with normalised category and code
         """
+        key = mapping_cache_key(raw_category, transaction_type)
+        if self.cache is not None and key is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return MappingResult(**cached)
+        
         # If Agent 8 service is available, call it
         if self.base_url:
-            return await self._call_agent8(
+            result = await self._call_agent8(
                 raw_category, description, amount, transaction_type, metadata
             )
+        else:
+            # Without Agent 8, use keyword-based preliminary categorisation
+            # This returns real categories but marks them as needing review
+            result = await self._preliminary_categorisation(
+                raw_category, description, amount, transaction_type
+            )
+        
+        if self.cache is not None and key is not None and self._is_cacheable(result):
+            await self.cache.set(key, asdict(result))
+        
+        return result
+    
+    async def map_categories(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: int = 1
+    ) -> List[Union[MappingResult, BaseException]]:
+        """
+        Map many transactions, deduplicating by raw category and type.
+        
+        Transactions with a blank category are mapped one by one from
+        their description and amount, and never cached. Cached categories are answered from the cache. With Agent 8, the
+        remaining distinct categories are sent in one batch request; if
+        the batch endpoint is unavailable they fall back to one call per
+        distinct category, at most max_concurrency in flight.
+        
+        Args:
+            requests: map_category keyword arguments per transaction
+                (raw_category, description, amount, transaction_type)
+            max_concurrency: Single-category calls in flight on fallback
+            
+        Returns:
+            One MappingResult per request, in order; an exception raised
+            while mapping is returned in its place (like asyncio.gather
+            with return_exceptions=True)
+        """
+        keys = [
+            mapping_cache_key(request.get('raw_category'), request.get('transaction_type'))
+            for request in requests
+        ]
+        cached_keys = [key for key in keys if key is not None]
+        cached = await self.cache.get_many(cached_keys) if self.cache is not None and cached_keys else {}
+        
+        results: List[Union[MappingResult, BaseException, None]] = [None] * len(requests)
+        groups: Dict[str, List[int]] = {}
+        uncategorised: List[List[int]] = []
+        for i, key in enumerate(keys):
+            if key is None:
+                uncategorised.append([i])
+            elif key in cached:
+                results[i] = MappingResult(**cached[key])
+            else:
+                groups.setdefault(key, []).append(i)
+        
+        if not groups and not uncategorised:
+            return results
+        
+        if self.base_url:
+            work = list(groups.values()) + uncategorised
+            batch_results = await self._call_agent8_batch(
+                [requests[indexes[0]] for indexes in work]
+            )
+            if batch_results is not None:
+                for indexes, result in zip(work, batch_results):
+                    for i in indexes:
+                        results[i] = result
+                if self.cache is not None:
+                    await self.cache.set_many({
+                        key: asdict(result)
+                        for key, result in zip(groups, batch_results)
+                        if self._is_cacheable(result)
+                    })
+                return results
+            
+            # Batch endpoint unavailable: one call per distinct category
+            # (and per uncategorised transaction)
+        else:
+            # Preliminary mapping can depend on the description, so each
+            # transaction is mapped (cacheable categories still hit the cache)
+            work = [[i] for indexes in groups.values() for i in indexes] + uncategorised
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
         
-        # Without Agent 8, use keyword-based preliminary categorisation
-        # This returns real categories but marks them as needing review
-        return await self._preliminary_categorisation(
-            raw_category, description, amount, transaction_type
+        async def map_one(request: Dict[str, Any]) -> MappingResult:
+            async with semaphore:
+                return await self.map_category(**request)
+        
+        outcomes = await asyncio.gather(
+            *(map_one(requests[indexes[0]]) for indexes in work),
+            return_exceptions=True
         )
+        for indexes, outcome in zip(work, outcomes):
+            for i in indexes:
+                results[i] = outcome
+        
+        return results
+    
+    def _is_cacheable(self, result: MappingResult) -> bool:
+        """Only successful, category-determined mappings are cached."""
+        if not result.success:
+            return False
+        source = (result.raw_response or {}).get("source")
+        return source not in DESCRIPTION_DEPENDENT_SOURCES
+    
+    async def _post(self, path: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST to Agent 8 over the shared client, or a short-lived one."""
+        if self.http_client is not None:
+            return await self.http_client.post(
+                f"{self.base_url}{path}",
+                json=payload,
+                timeout=self.timeout
+            )
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            return await client.post(f"{self.base_url}{path}", json=payload)
+    
+    async def _call_agent8_batch(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> Optional[List[MappingResult]]:
+        """
+        Map many categories with one call to Agent 8's batch endpoint.
+        
+        Returns:
+            MappingResults in request order, or None if the batch endpoint
+            is unavailable (callers then fall back to single calls)
+        """
+        if not self._batch_supported:
+            return None
+        
+        try:
+            response = await self._post("/api/mapping/categories", {
+                "items": [
+                    {
+                        "raw_category": request.get("raw_category"),
+                        "description": request.get("description"),
+                        "amount": request.get("amount"),
+                        "transaction_type": request.get("transaction_type"),
+                        "metadata": request.get("metadata")
+                    }
+                    for request in requests
+                ]
+            })
+        except Exception as e:
+            logger.warning(f"Agent 8 batch mapping call failed: {e}")
+            return None
+        
+        if response.status_code in (404, 405):
+            logger.info("Agent 8 batch mapping endpoint not available, using single calls")
+            self._batch_supported = False
+            return None
+        if response.status_code != 200:
+            logger.warning(f"Agent 8 batch mapping returned {response.status_code}: {response.text}")
+            return None
+        
+        items = response.json().get("results") or []
+        if len(items) != len(requests):
+            logger.warning(f"Agent 8 batch mapping returned {len(items)} results for {len(requests)} items")
+            return None
+        
+        return [
+            MappingResult(success=False, error=data["error"])
+            if data.get("error") else
+            MappingResult(
+                success=True,
+                category_normalised=data.get("category_normalised"),
+                category_code=data.get("category_code"),
+                confidence=data.get("confidence", 1.0),
+                raw_response=data
+            )
+            for data in items
+        ]
     
     async def _call_agent8(
         self,
@@ -178,33 +381,29 @@ class Agent8MappingClient:
     ) -> MappingResult:
         """Call Agent 8's mapping service."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/mapping/category",
-                    json={
-                        "raw_category": raw_category,
-                        "description": description,
-                        "amount": amount,
-                        "transaction_type": transaction_type,
-                        "metadata": metadata
-                    }
+            response = await self._post("/api/mapping/category", {
+                "raw_category": raw_category,
+                "description": description,
+                "amount": amount,
+                "transaction_type": transaction_type,
+                "metadata": metadata
+            })
+            
+            if response.status_code == 200:
+                data = response.json()
+                return MappingResult(
+                    success=True,
+                    category_normalised=data.get("category_normalised"),
+                    category_code=data.get("category_code"),
+                    confidence=data.get("confidence", 1.0),
+                    raw_response=data
+                )
+            else:
+                return MappingResult(
+                    success=False,
+                    error=f"Agent 8 returned {response.status_code}: {response.text}"
                 )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return MappingResult(
-                        success=True,
-                        category_normalised=data.get("category_normalised"),
-                        category_code=data.get("category_code"),
-                        confidence=data.get("confidence", 1.0),
-                        raw_response=data
-                    )
-                else:
-                    return MappingResult(
-                        success=False,
-                        error=f"Agent 8 returned {response.status_code}: {response.text}"
-                    )
-                    
         except Exception as e:
             logger.error(f"Agent 8 mapping call failed: {e}")
             # Return error - no silent fallback
@@ -317,9 +516,31 @@ class NormalisationService:
     - Record audit trail
     """
     
-    def __init__(self, db: AsyncSession, agent8_url: Optional[str] = None):
+    def __init__(
+        self,
+        db: AsyncSession,
+        agent8_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrent_mappings: int = 1,
+        mapping_cache: Optional[MappingCache] = None
+    ):
+        """
+        Initialize the service.
+        
+        Args:
+            db: Database session
+            agent8_url: URL of Agent 8's mapping service (None = preliminary mapping)
+            http_client: Shared keep-alive client for Agent 8 calls
+            max_concurrent_mappings: map_category calls in flight per queue item
+            mapping_cache: Category mapping cache (default: process-wide cache)
+        """
         self.db = db
-        self.mapping_client = Agent8MappingClient(base_url=agent8_url)
+        self.mapping_client = Agent8MappingClient(
+            base_url=agent8_url,
+            http_client=http_client,
+            cache=mapping_cache if mapping_cache is not None else default_mapping_cache
+        )
+        self.max_concurrent_mappings = max(1, max_concurrent_mappings)
     
     async def process_queue(self, batch_size: int = 10) -> List[NormalisationResult]:
         """
@@ -403,38 +624,80 @@ class NormalisationService:
         return items
     
     async def _process_queue_item(self, item: Dict[str, Any]) -> NormalisationResult:
-        """Process a single queue item."""
+        """
+        Process a single queue item.
+        
+        Transactions are loaded with one query, mapped with one deduplicated
+        map_categories call (cache first, then Agent 8) and written back with
+        one UPDATE for mappings and one for errors.
+        """
         queue_id = item['id']
         transaction_ids = item['transaction_ids']
         
         # Mark as processing
         await self._update_queue_status(queue_id, NormalisationStatus.PROCESSING)
         
+        transactions = await self._load_transactions(transaction_ids)
+        
+        # Map every transaction that still needs normalising in one call
+        to_map = [
+            transactions[txn_id] for txn_id in dict.fromkeys(transaction_ids)
+            if txn_id in transactions
+            and transactions[txn_id]['status'] not in ('NORMALISED', 'READY_FOR_BOOKKEEPING')
+        ]
+        mapping_results = await self.mapping_client.map_categories(
+            [
+                {
+                    "raw_category": transaction['category_raw'],
+                    "description": transaction['description'],
+                    "amount": transaction['amount'],
+                    "transaction_type": transaction['transaction_type']
+                }
+                for transaction in to_map
+            ],
+            max_concurrency=self.max_concurrent_mappings
+        ) if to_map else []
+        outcomes = {
+            transaction['id']: result
+            for transaction, result in zip(to_map, mapping_results)
+        }
+        
+        mappings = []
+        mapping_errors = []
+        for transaction in to_map:
+            outcome = outcomes[transaction['id']]
+            if isinstance(outcome, MappingResult) and outcome.success:
+                mappings.append((transaction, outcome))
+            elif isinstance(outcome, MappingResult):
+                mapping_errors.append((transaction['id'], outcome.error or "Mapping failed"))
+        
+        await self._update_transaction_mappings(mappings)
+        await self._update_transaction_errors(mapping_errors)
+        
         succeeded = 0
         failed = 0
         errors = []
         
         for txn_id in transaction_ids:
-            try:
-                transaction = await self._load_transaction(txn_id)
-                if not transaction:
-                    logger.warning(f"Transaction not found: {txn_id}")
-                    failed += 1
-                    errors.append({"transaction_id": txn_id, "error": "Not found"})
-                    continue
-                
-                success = await self._normalise_transaction(transaction)
-                
-                if success:
-                    succeeded += 1
-                else:
-                    failed += 1
-                    errors.append({"transaction_id": txn_id, "error": "Normalisation failed"})
-                    
-            except Exception as e:
-                logger.error(f"Error normalising transaction {txn_id}: {e}")
+            if txn_id not in transactions:
+                logger.warning(f"Transaction not found: {txn_id}")
+                failed += 1
+                errors.append({"transaction_id": txn_id, "error": "Not found"})
+                continue
+            
+            outcome = outcomes.get(txn_id)
+            if outcome is None:
+                logger.info(f"Transaction {txn_id} already normalised, skipping")
+                succeeded += 1
+            elif isinstance(outcome, BaseException):
+                logger.error(f"Error normalising transaction {txn_id}: {outcome}")
+                failed += 1
+                errors.append({"transaction_id": txn_id, "error": str(outcome)})
+            elif outcome.success:
+                succeeded += 1
+            else:
                 failed += 1
-                errors.append({"transaction_id": txn_id, "error": str(e)})
+                errors.append({"transaction_id": txn_id, "error": "Normalisation failed"})
         
         # Update queue status
         if failed == 0:
@@ -455,6 +718,28 @@ class NormalisationService:
             errors=errors
         )
     
+    async def _load_transactions(self, transaction_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load many transactions in one query, keyed by id."""
+        if not transaction_ids:
+            return {}
+        
+        query = text("""
+            SELECT 
+                id, source, source_transaction_id, client_id,
+                transaction_date, transaction_type, amount,
+                description, category_raw, status, audit
+            FROM public.ingested_transactions
+            WHERE id = ANY(CAST(:ids AS uuid[]))
+        """)
+        
+        result = await self.db.execute(query, {"ids": list(dict.fromkeys(transaction_ids))})
+        
+        transactions = {}
+        for row in result.fetchall():
+            transaction = self._row_to_transaction(row)
+            transactions[transaction['id']] = transaction
+        return transactions
+    
     async def _load_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
         """Load a transaction from the database."""
         query = text("""
@@ -472,6 +757,10 @@ class NormalisationService:
         if not row:
             return None
         
+        return self._row_to_transaction(row)
+    
+    def _row_to_transaction(self, row) -> Dict[str, Any]:
+        """Map an ingested_transactions row to a transaction dict."""
         return {
             "id": str(row[0]),
             "source": row[1],
@@ -537,21 +826,10 @@ class NormalisationService:
     ):
         """Update transaction with mapping results."""
         
-        # Create audit entry
-        audit_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "action": "normalised",
-            "actor": "normalisation_service",
-            "details": {
-                "category_normalised": category_normalised,
-                "category_code": category_code,
-                "confidence": confidence,
-                "mapper": "preliminary"  # Pending Agent 8 integration
-            }
-        }
-        
         # Append to existing audit
-        new_audit = existing_audit + [audit_entry]
+        new_audit = existing_audit + [
+            self._mapping_audit_entry(category_normalised, category_code, confidence)
+        ]
         
         query = text("""
             UPDATE public.ingested_transactions
@@ -570,6 +848,65 @@ class NormalisationService:
             "audit": json.dumps(new_audit)
         })
     
+    async def _update_transaction_mappings(
+        self,
+        mappings: List[Tuple[Dict[str, Any], MappingResult]]
+    ):
+        """Update many transactions with their mapping results in one statement."""
+        if not mappings:
+            return
+        
+        audits = [
+            json.dumps(transaction['audit'] + [
+                self._mapping_audit_entry(
+                    result.category_normalised, result.category_code, result.confidence
+                )
+            ])
+            for transaction, result in mappings
+        ]
+        
+        query = text("""
+            UPDATE public.ingested_transactions AS t
+            SET category_normalised = m.category_normalised,
+                category_code = m.category_code,
+                status = 'READY_FOR_BOOKKEEPING',
+                audit = CAST(m.audit AS jsonb),
+                updated_at = NOW()
+            FROM unnest(
+                CAST(:ids AS uuid[]),
+                CAST(:categories AS text[]),
+                CAST(:codes AS text[]),
+                CAST(:audits AS text[])
+            ) AS m(id, category_normalised, category_code, audit)
+            WHERE t.id = m.id
+        """)
+        
+        await self.db.execute(query, {
+            "ids": [transaction['id'] for transaction, _ in mappings],
+            "categories": [result.category_normalised for _, result in mappings],
+            "codes": [result.category_code for _, result in mappings],
+            "audits": audits
+        })
+    
+    def _mapping_audit_entry(
+        self,
+        category_normalised: str,
+        category_code: str,
+        confidence: float
+    ) -> Dict[str, Any]:
+        """Audit entry recorded when a transaction is normalised."""
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "action": "normalised",
+            "actor": "normalisation_service",
+            "details": {
+                "category_normalised": category_normalised,
+                "category_code": category_code,
+                "confidence": confidence,
+                "mapper": "preliminary"  # Pending Agent 8 integration
+            }
+        }
+    
     async def _update_transaction_error(self, transaction_id: str, error_message: str):
         """Update transaction with error status."""
         query = text("""
@@ -585,6 +922,28 @@ class NormalisationService:
             "error_message": error_message
         })
     
+    async def _update_transaction_errors(self, failures: List[Tuple[str, str]]):
+        """Update many transactions with error status in one statement."""
+        if not failures:
+            return
+        
+        query = text("""
+            UPDATE public.ingested_transactions AS t
+            SET status = 'ERROR',
+                error_message = f.error_message,
+                updated_at = NOW()
+            FROM unnest(
+                CAST(:ids AS uuid[]),
+                CAST(:error_messages AS text[])
+            ) AS f(id, error_message)
+            WHERE t.id = f.id
+        """)
+        
+        await self.db.execute(query, {
+            "ids": [txn_id for txn_id, _ in failures],
+            "error_messages": [error for _, error in failures]
+        })
+    
     async def _update_queue_status(self, queue_id: str, status: NormalisationStatus):
         """Update queue item status."""
         query = text("""
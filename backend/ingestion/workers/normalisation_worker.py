@@ -10,6 +10,9 @@ Usage:
 
 Features:
 - Batch processing
+- Concurrent queue items, each on its own database session
+- Bounded parallel Agent 8 calls over a shared keep-alive client
+- Immediate re-poll while the queue is backed up
 - Retry logic (3 attempts)
 - Error isolation (failures don't crash queue)
 - Audit logging
@@ -18,8 +21,9 @@ Features:
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, List
 
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -42,7 +46,10 @@ class NormalisationWorker:
         db_session_factory,
         agent8_url: Optional[str] = None,
         batch_size: int = 10,
-        poll_interval: int = 5
+        poll_interval: int = 5,
+        max_concurrent_items: int = 1,
+        max_concurrent_mappings: int = 1,
+        mapping_cache=None
     ):
         """
         Initialize the worker.
@@ -51,13 +58,20 @@ class NormalisationWorker:
             db_session_factory: SQLAlchemy async session factory
             agent8_url: URL of Agent 8's mapping service (None = use mock)
             batch_size: Number of queue items to process per batch
-            poll_interval: Seconds between polls when running continuously
+            poll_interval: Seconds between polls when the queue is drained
+            max_concurrent_items: Queue items processed at the same time
+            max_concurrent_mappings: Agent 8 calls in flight per queue item
+            mapping_cache: Category mapping cache (default: process-wide cache)
         """
         self.db_session_factory = db_session_factory
         self.agent8_url = agent8_url
         self.batch_size = batch_size
         self.poll_interval = poll_interval
+        self.max_concurrent_items = max(1, max_concurrent_items)
+        self.max_concurrent_mappings = max(1, max_concurrent_mappings)
+        self.mapping_cache = mapping_cache
         self._running = False
+        self._http_client: Optional[httpx.AsyncClient] = None
     
     async def process_once(self) -> dict:
         """
@@ -66,49 +80,123 @@ class NormalisationWorker:
         Returns:
             Processing statistics
         """
+        if self._http_client is not None or not self.agent8_url:
+            return await self._process_batch(self._http_client)
+        
+        # One-shot run: keep a client open for the duration of this batch
+        async with self._create_http_client() as http_client:
+            return await self._process_batch(http_client)
+    
+    async def _process_batch(self, http_client: Optional[httpx.AsyncClient]) -> dict:
+        """Process up to batch_size queue items across the concurrent lanes."""
         from ingestion.services.normalisation_service import NormalisationService
         
-        async with self.db_session_factory() as db:
-            service = NormalisationService(db, agent8_url=self.agent8_url)
-            
-            results = await service.process_queue(batch_size=self.batch_size)
+        lanes = min(self.max_concurrent_items, self.batch_size)
+        results = []
+        
+        if lanes <= 1:
+            async with self.db_session_factory() as db:
+                service = NormalisationService(
+                    db,
+                    agent8_url=self.agent8_url,
+                    http_client=http_client,
+                    max_concurrent_mappings=self.max_concurrent_mappings,
+                    mapping_cache=self.mapping_cache
+                )
+                results = await service.process_queue(batch_size=self.batch_size)
+        else:
+            # Each lane claims one item at a time (FOR UPDATE SKIP LOCKED) on
+            # its own session, so lanes never pick up the same queue item
+            remaining = self.batch_size
             
-            total_processed = sum(r.transactions_processed for r in results)
-            total_succeeded = sum(r.transactions_succeeded for r in results)
-            total_failed = sum(r.transactions_failed for r in results)
+            async def lane() -> List:
+                nonlocal remaining
+                lane_results = []
+                async with self.db_session_factory() as db:
+                    service = NormalisationService(
+                        db,
+                        agent8_url=self.agent8_url,
+                        http_client=http_client,
+                        max_concurrent_mappings=self.max_concurrent_mappings,
+                        mapping_cache=self.mapping_cache
+                    )
+                    while remaining > 0:
+                        remaining -= 1
+                        item_results = await service.process_queue(batch_size=1)
+                        if not item_results:
+                            break
+                        lane_results.extend(item_results)
+                return lane_results
             
-            return {
-                "queue_items_processed": len(results),
-                "transactions_processed": total_processed,
-                "transactions_succeeded": total_succeeded,
-                "transactions_failed": total_failed,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+            for lane_results in await asyncio.gather(*(lane() for _ in range(lanes))):
+                results.extend(lane_results)
+        
+        total_processed = sum(r.transactions_processed for r in results)
+        total_succeeded = sum(r.transactions_succeeded for r in results)
+        total_failed = sum(r.transactions_failed for r in results)
+        
+        return {
+            "queue_items_processed": len(results),
+            "transactions_processed": total_processed,
+            "transactions_succeeded": total_succeeded,
+            "transactions_failed": total_failed,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the keep-alive client shared by all Agent 8 calls."""
+        connections = self.max_concurrent_items * self.max_concurrent_mappings
+        return httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=connections,
+                max_keepalive_connections=connections
+            )
+        )
     
     async def run_continuous(self):
         """
         Run the worker continuously, polling for new items.
         
+        When a poll returns a full batch the queue is likely backed up, so
+        the next batch is fetched immediately instead of sleeping.
+        
         Use Ctrl+C to stop.
         """
         self._running = True
-        logger.info(f"Starting normalisation worker (batch_size={self.batch_size}, poll_interval={self.poll_interval}s)")
+        logger.info(
+            f"Starting normalisation worker (batch_size={self.batch_size}, "
+            f"poll_interval={self.poll_interval}s, "
+            f"concurrent_items={self.max_concurrent_items}, "
+            f"concurrent_mappings={self.max_concurrent_mappings})"
+        )
         
-        while self._running:
-            try:
-                stats = await self.process_once()
-                
-                if stats["queue_items_processed"] > 0:
-                    logger.info(
-                        f"Processed {stats['queue_items_processed']} queue items: "
-                        f"{stats['transactions_succeeded']} succeeded, "
-                        f"{stats['transactions_failed']} failed"
-                    )
+        if self.agent8_url:
+            self._http_client = self._create_http_client()
+        
+        try:
+            while self._running:
+                batch_full = False
+                try:
+                    stats = await self.process_once()
+                    
+                    if stats["queue_items_processed"] > 0:
+                        logger.info(
+                            f"Processed {stats['queue_items_processed']} queue items: "
+                            f"{stats['transactions_succeeded']} succeeded, "
+                            f"{stats['transactions_failed']} failed"
+                        )
+                    batch_full = stats["queue_items_processed"] >= self.batch_size
+                    
+                except Exception as e:
+                    logger.error(f"Worker error: {e}")
                 
-            except Exception as e:
-                logger.error(f"Worker error: {e}")
-            
-            await asyncio.sleep(self.poll_interval)
+                if not batch_full:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            if self._http_client is not None:
+                await self._http_client.aclose()
+                self._http_client = None
     
     def stop(self):
         """Stop the continuous worker."""
@@ -125,15 +213,23 @@ async def run_worker():
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
     
     from database.connection import engine, AsyncSessionLocal
+    from ingestion.services.mapping_cache import PostgresMappingCacheStore
+    from ingestion.services.normalisation_service import default_mapping_cache
     
     # Get Agent 8 URL from environment
     agent8_url = os.environ.get("AGENT8_MAPPING_URL")
     
+    # Share mappings with other worker processes through Postgres
+    if os.environ.get("NORMALISATION_MAPPING_CACHE_SHARED", "false").lower() == "true":
+        default_mapping_cache.store = PostgresMappingCacheStore(AsyncSessionLocal)
+    
     worker = NormalisationWorker(
         db_session_factory=AsyncSessionLocal,
         agent8_url=agent8_url,
         batch_size=10,
-        poll_interval=5
+        poll_interval=5,
+        max_concurrent_items=int(os.environ.get("NORMALISATION_CONCURRENT_ITEMS", "4")),
+        max_concurrent_mappings=int(os.environ.get("NORMALISATION_CONCURRENT_MAPPINGS", "8"))
     )
     
     try:
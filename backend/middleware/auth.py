@@ -3,6 +3,7 @@ Authentication Middleware and Dependencies
 
 Provides:
 - get_current_user: Extract and validate user from JWT token
+  (decoded tokens and roles are served from process-wide caches)
 - requires_role: Decorator for role-based access control
 - RoleChecker: Dependency for role validation
 """
@@ -17,10 +18,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from services.auth import (
-    decode_token,
+    decode_token_cached,
+    resolve_user_role,
     AuthUser,
     AuthService,
-    AuthRoleStorage,
     UserRole
 )
 
@@ -44,7 +45,7 @@ async def get_current_user(
         return None
     
     token = credentials.credentials
-    token_data = decode_token(token)
+    token_data = decode_token_cached(token)
     
     if not token_data:
         return None
@@ -53,8 +54,7 @@ async def get_current_user(
         return None
     
     # Get role from storage (in case it changed)
-    role_storage = AuthRoleStorage()
-    role = role_storage.get_user_role(token_data.user_id, token_data.email)
+    role = resolve_user_role(token_data.user_id, token_data.email)
     
     return AuthUser(
         id=token_data.user_id,
@@ -79,7 +79,7 @@ async def get_current_user_required(
         )
     
     token = credentials.credentials
-    token_data = decode_token(token)
+    token_data = decode_token_cached(token)
     
     if not token_data:
         raise HTTPException(
@@ -96,8 +96,7 @@ async def get_current_user_required(
         )
     
     # Get role from storage
-    role_storage = AuthRoleStorage()
-    role = role_storage.get_user_role(token_data.user_id, token_data.email)
+    role = resolve_user_role(token_data.user_id, token_data.email)
     
     return AuthUser(
         id=token_data.user_id,
@@ -132,7 +131,7 @@ class RoleChecker:
             )
         
         token = credentials.credentials
-        token_data = decode_token(token)
+        token_data = decode_token_cached(token)
         
         if not token_data:
             raise HTTPException(
@@ -148,8 +147,7 @@ class RoleChecker:
             )
         
         # Get current role
-        role_storage = AuthRoleStorage()
-        role = role_storage.get_user_role(token_data.user_id, token_data.email)
+        role = resolve_user_role(token_data.user_id, token_data.email)
         
         if role not in self.allowed_roles:
             raise HTTPException(
@@ -242,13 +240,12 @@ async def get_optional_user(
         return None
     
     token = credentials.credentials
-    token_data = decode_token(token)
+    token_data = decode_token_cached(token)
     
     if not token_data or token_data.token_type != "access":
         return None
     
-    role_storage = AuthRoleStorage()
-    role = role_storage.get_user_role(token_data.user_id, token_data.email)
+    role = resolve_user_role(token_data.user_id, token_data.email)
     
     return AuthUser(
         id=token_data.user_id,
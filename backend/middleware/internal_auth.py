@@ -265,9 +265,9 @@ class InternalOrUserAuth:
         token = auth_header[7:]  # Remove "Bearer " prefix
         
         try:
-            from middleware.auth import decode_token, AuthRoleStorage
+            from middleware.auth import decode_token_cached, resolve_user_role
             
-            token_data = decode_token(token)
+            token_data = decode_token_cached(token)
             
             if not token_data:
                 raise HTTPException(
@@ -282,8 +282,7 @@ class InternalOrUserAuth:
                 )
             
             # Get role from storage
-            role_storage = AuthRoleStorage()
-            role = role_storage.get_user_role(token_data.user_id, token_data.email)
+            role = resolve_user_role(token_data.user_id, token_data.email)
             
             # Check role if specified
             if self.allowed_roles and role not in self.allowed_roles:
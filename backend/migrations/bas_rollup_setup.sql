@@ -0,0 +1,106 @@
+-- ============================================================================
+-- BAS Period Rollups - Database Migration
+-- ============================================================================
+--
+-- This migration creates:
+-- 1. bas_period_rollups table - latest version per client/period
+-- 2. Backfill from existing bas_statements
+--
+-- BASStatementService refreshes a period's row whenever a BAS is saved or
+-- signed off; BASHistoryService reads history and comparisons from it.
+-- Re-running this migration rebuilds every row from bas_statements.
+-- ============================================================================
+
+-- ============================================================================
+-- SECTION A: CREATE BAS_PERIOD_ROLLUPS TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS bas_period_rollups (
+    client_id VARCHAR(36) NOT NULL,
+    period_from DATE NOT NULL,
+    period_to DATE NOT NULL,
+    
+    -- Version counts
+    statement_count INTEGER NOT NULL DEFAULT 0,
+    submitted_count INTEGER NOT NULL DEFAULT 0,
+    
+    -- Latest version (any status)
+    latest_statement_id UUID NOT NULL,
+    latest_version INTEGER NOT NULL,
+    latest_status VARCHAR(20) NOT NULL,
+    latest_net_gst NUMERIC(14, 2) DEFAULT 0,
+    latest_payg_instalment NUMERIC(14, 2) DEFAULT 0,
+    latest_total_payable NUMERIC(14, 2) DEFAULT 0,
+    
+    -- Latest non-draft version
+    submitted_statement_id UUID,
+    submitted_version INTEGER,
+    submitted_status VARCHAR(20),
+    submitted_net_gst NUMERIC(14, 2),
+    submitted_payg_instalment NUMERIC(14, 2),
+    submitted_total_payable NUMERIC(14, 2),
+    
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    
+    PRIMARY KEY (client_id, period_from, period_to)
+);
+
+CREATE INDEX IF NOT EXISTS idx_bas_period_rollups_client_period_to ON bas_period_rollups(client_id, period_to);
+
+COMMENT ON TABLE bas_period_rollups IS 'Latest BAS version per client/period, refreshed on save and sign-off';
+
+
+-- ============================================================================
+-- SECTION B: BACKFILL
+-- ============================================================================
+
+INSERT INTO bas_period_rollups (
+    client_id, period_from, period_to, statement_count, submitted_count,
+    latest_statement_id, latest_version, latest_status,
+    latest_net_gst, latest_payg_instalment, latest_total_payable,
+    submitted_statement_id, submitted_version, submitted_status,
+    submitted_net_gst, submitted_payg_instalment, submitted_total_payable,
+    updated_at
+)
+SELECT
+    counts.client_id, counts.period_from, counts.period_to,
+    counts.statement_count, counts.submitted_count,
+    latest.id, latest.version, latest.status,
+    latest.net_gst, latest.payg_instalment, latest.total_payable,
+    submitted.id, submitted.version, submitted.status,
+    submitted.net_gst, submitted.payg_instalment, submitted.total_payable,
+    NOW()
+FROM (
+    SELECT client_id, period_from, period_to,
+           COUNT(*) AS statement_count,
+           COUNT(*) FILTER (WHERE status <> 'draft') AS submitted_count
+    FROM bas_statements
+    GROUP BY client_id, period_from, period_to
+) counts
+JOIN (
+    SELECT DISTINCT ON (client_id, period_from, period_to) *
+    FROM bas_statements
+    ORDER BY client_id, period_from, period_to, version DESC
+) latest USING (client_id, period_from, period_to)
+LEFT JOIN (
+    SELECT DISTINCT ON (client_id, period_from, period_to) *
+    FROM bas_statements
+    WHERE status <> 'draft'
+    ORDER BY client_id, period_from, period_to, version DESC
+) submitted USING (client_id, period_from, period_to)
+ON CONFLICT (client_id, period_from, period_to) DO UPDATE SET
+    statement_count = EXCLUDED.statement_count,
+    submitted_count = EXCLUDED.submitted_count,
+    latest_statement_id = EXCLUDED.latest_statement_id,
+    latest_version = EXCLUDED.latest_version,
+    latest_status = EXCLUDED.latest_status,
+    latest_net_gst = EXCLUDED.latest_net_gst,
+    latest_payg_instalment = EXCLUDED.latest_payg_instalment,
+    latest_total_payable = EXCLUDED.latest_total_payable,
+    submitted_statement_id = EXCLUDED.submitted_statement_id,
+    submitted_version = EXCLUDED.submitted_version,
+    submitted_status = EXCLUDED.submitted_status,
+    submitted_net_gst = EXCLUDED.submitted_net_gst,
+    submitted_payg_instalment = EXCLUDED.submitted_payg_instalment,
+    submitted_total_payable = EXCLUDED.submitted_total_payable,
+    updated_at = NOW();
@@ -2,7 +2,8 @@
 Database Migration: Create Normalisation Queue Table
 Ticket: A3-INGEST-03
 
-Creates the queue table for normalisation processing.
+Creates the queue table for normalisation processing, and the shared
+category mapping cache used by normalisation workers.
 """
 
 import asyncio
@@ -39,6 +40,17 @@ SQL_STATEMENTS = [
     "CREATE INDEX IF NOT EXISTS idx_normalisation_queue_status ON public.normalisation_queue(status)",
     "CREATE INDEX IF NOT EXISTS idx_normalisation_queue_created_at ON public.normalisation_queue(created_at)",
     "CREATE INDEX IF NOT EXISTS idx_normalisation_queue_batch_id ON public.normalisation_queue(batch_id)",
+    
+    # Shared category mapping cache (keyed on transaction type + normalised raw category)
+    """
+    CREATE TABLE IF NOT EXISTS public.category_mapping_cache (
+        cache_key TEXT PRIMARY KEY,
+        result JSONB NOT NULL,
+        expires_at TIMESTAMPTZ NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_category_mapping_cache_expires_at ON public.category_mapping_cache(expires_at)",
 ]
 
 
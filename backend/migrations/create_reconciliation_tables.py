@@ -91,11 +91,30 @@ SQL_STATEMENTS = [
     )
     """,
     
+    # Incremental reconciliation watermarks (one per client/source/target)
+    """
+    CREATE TABLE IF NOT EXISTS public.reconciliation_watermarks (
+        client_id UUID NOT NULL REFERENCES public.client_profiles(id),
+        source_type VARCHAR(20) NOT NULL,
+        target_type VARCHAR(20) NOT NULL,
+        
+        -- Latest ingested_transactions.updated_at seen by a run
+        source_watermark TIMESTAMPTZ,
+        -- Latest workpaper_transactions.created_at seen by a run
+        target_watermark TIMESTAMPTZ,
+        
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        
+        PRIMARY KEY (client_id, source_type, target_type)
+    )
+    """,
+    
     # Indexes for reconciliation_matches
     "CREATE INDEX IF NOT EXISTS idx_recon_matches_client ON public.reconciliation_matches(client_id)",
     "CREATE INDEX IF NOT EXISTS idx_recon_matches_source_txn ON public.reconciliation_matches(source_transaction_id)",
     "CREATE INDEX IF NOT EXISTS idx_recon_matches_status ON public.reconciliation_matches(match_status)",
     "CREATE INDEX IF NOT EXISTS idx_recon_matches_source_type ON public.reconciliation_matches(source_type)",
+    "CREATE INDEX IF NOT EXISTS idx_recon_matches_source_latest ON public.reconciliation_matches(source_transaction_id, created_at DESC)",
     
     # Indexes for audit log
     "CREATE INDEX IF NOT EXISTS idx_recon_audit_client ON public.reconciliation_audit_log(client_id)",
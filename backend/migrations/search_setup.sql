@@ -0,0 +1,77 @@
+-- ============================================================================
+-- Full-Text Search - Database Migration
+-- ============================================================================
+--
+-- This migration creates the indexes behind services/search.py:
+-- 1. pg_trgm extension
+-- 2. transactions.search_vector (payee, description, notes) + GIN index
+-- 3. ingested_transactions.search_vector + GIN, receipt_number trigram GIN
+-- 4. client_profiles.search_vector + GIN, client_code/abn trigram GIN
+--
+-- search_vector columns are GENERATED ... STORED, so they stay current on
+-- every insert/update with no triggers. Weights: A = names/payees/vendors,
+-- B = descriptions and codes, C = notes and categories.
+--
+-- Adding a stored generated column rewrites the table; run in a maintenance
+-- window. The GIN indexes are built CONCURRENTLY, so run this file outside
+-- a transaction block.
+-- ============================================================================
+
+-- ============================================================================
+-- SECTION A: EXTENSIONS
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================================
+-- SECTION B: BOOKKEEPER TRANSACTIONS
+-- ============================================================================
+
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(payee_raw, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description_raw, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(notes_bookkeeper, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(notes_client, '')), 'C')
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bk_transactions_search
+    ON transactions USING GIN (search_vector);
+
+-- ============================================================================
+-- SECTION C: INGESTED TRANSACTIONS (BOOKKEEPING-READY API)
+-- ============================================================================
+
+ALTER TABLE public.ingested_transactions ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(vendor, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(category_normalised, '') || ' ' || coalesce(category_raw, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(notes, '')), 'C')
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ingested_transactions_search
+    ON public.ingested_transactions USING GIN (search_vector);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ingested_transactions_receipt_trgm
+    ON public.ingested_transactions USING GIN (receipt_number gin_trgm_ops);
+
+-- ============================================================================
+-- SECTION D: CLIENT PROFILES
+-- ============================================================================
+
+ALTER TABLE public.client_profiles ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(display_name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(legal_name, '') || ' ' || coalesce(trading_name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(client_code, '')), 'B')
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_client_profiles_search
+    ON public.client_profiles USING GIN (search_vector);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_client_profiles_client_code_trgm
+    ON public.client_profiles USING GIN (client_code gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_client_profiles_abn_trgm
+    ON public.client_profiles USING GIN (abn gin_trgm_ops);
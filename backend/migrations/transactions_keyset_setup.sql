@@ -0,0 +1,37 @@
+-- ============================================================================
+-- Transactions Keyset Pagination - Database Migration
+-- ============================================================================
+--
+-- This migration:
+-- 1. Backfills NULL transactions.created_at and makes it NOT NULL
+-- 2. Rebuilds ix_bk_transactions_client_date on (client_id, date, created_at, id)
+--
+-- TransactionRepository.list_transactions pages with a row-value comparison
+-- on (date, created_at, id); the widened index serves that predicate and the
+-- ORDER BY directly, so every page reads only `limit` rows. NULL created_at
+-- values would fall outside a row-value comparison, hence the backfill.
+--
+-- Run outside a transaction block (CREATE INDEX CONCURRENTLY).
+-- ============================================================================
+
+-- ============================================================================
+-- SECTION A: CREATED_AT NOT NULL
+-- ============================================================================
+
+UPDATE transactions SET created_at = COALESCE(updated_at, NOW()) WHERE created_at IS NULL;
+
+ALTER TABLE transactions ALTER COLUMN created_at SET NOT NULL;
+
+-- ============================================================================
+-- SECTION B: KEYSET INDEX
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bk_transactions_client_date_keyset
+    ON transactions (client_id, date, created_at, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_bk_transactions_client_date;
+
+ALTER INDEX ix_bk_transactions_client_date_keyset RENAME TO ix_bk_transactions_client_date;
+
+COMMENT ON INDEX ix_bk_transactions_client_date IS
+    'Bookkeeper transaction list keyset: (date, created_at, id) per client';
@@ -0,0 +1,21 @@
+-- ============================================================================
+-- Webhook Delivery Queue - Database Migration
+-- ============================================================================
+--
+-- This migration creates idx_webhook_queue_pending_due on
+-- webhook_delivery_queue (webhook_id, next_retry_at) for pending rows.
+--
+-- WebhookService._claim_deliveries takes the oldest due rows of each active
+-- webhook (LATERAL ... ORDER BY next_retry_at LIMIT :per_url), so the per-URL
+-- cap applies before the batch limit. This index serves each per-webhook
+-- scan directly, however large one subscriber's backlog grows.
+--
+-- Run outside a transaction block (CREATE INDEX CONCURRENTLY).
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_webhook_queue_pending_due
+    ON public.webhook_delivery_queue (webhook_id, next_retry_at)
+    WHERE status = 'pending';
+
+COMMENT ON INDEX idx_webhook_queue_pending_due IS
+    'Webhook delivery claims: due pending rows per webhook, oldest first';
@@ -7,6 +7,7 @@ Provides transaction matching and reconciliation capabilities:
 - Auto-matching for high confidence
 - Suggested matches for review
 - Audit trail for all operations
+- Parallel multi-client batch runs
 """
 
 from reconciliation.source_registry import (
@@ -22,9 +23,12 @@ from reconciliation.matching_rules.myfdc_rules import (
     MyFDCMatchingRules,
     MatchCandidate,
     MatchResult,
+    TargetIndex,
+    TargetColumns,
     myfdc_rules
 )
 from reconciliation.services.reconciliation_service import ReconciliationService
+from reconciliation.services.batch_scheduler import ReconciliationBatchScheduler, ReconciliationBatchItem
 from reconciliation.endpoints.reconciliation_api import router as reconciliation_router
 
 __all__ = [
@@ -40,9 +44,13 @@ __all__ = [
     'MyFDCMatchingRules',
     'MatchCandidate',
     'MatchResult',
+    'TargetIndex',
+    'TargetColumns',
     'myfdc_rules',
     # Service
     'ReconciliationService',
+    'ReconciliationBatchScheduler',
+    'ReconciliationBatchItem',
     # Router
     'reconciliation_router'
 ]
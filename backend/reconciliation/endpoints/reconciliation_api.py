@@ -3,6 +3,7 @@ Reconciliation API Endpoints (A3-RECON-01)
 
 REST API for the reconciliation engine:
 - POST /api/reconciliation/match - Run reconciliation for a client
+- POST /api/reconciliation/match/batch - Run reconciliation for many clients (streamed)
 - GET /api/reconciliation/candidates/{client_id} - Get match candidates
 - GET /api/reconciliation/matches/{client_id} - Get matches for a client
 - GET /api/reconciliation/match/{match_id} - Get a single match
@@ -13,15 +14,17 @@ REST API for the reconciliation engine:
 - GET /api/reconciliation/status - Module status
 """
 
+import json
 import logging
 from typing import Optional, List
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.connection import get_db
+from database.connection import get_db, AsyncSessionLocal
 from reconciliation.source_registry import (
     ReconciliationSource,
     TargetType,
@@ -29,6 +32,7 @@ from reconciliation.source_registry import (
     source_registry
 )
 from reconciliation.services.reconciliation_service import ReconciliationService
+from reconciliation.services.batch_scheduler import ReconciliationBatchScheduler
 from utils.validation_errors import validate_required_uuid, validate_client_id, raise_invalid_parameter
 
 logger = logging.getLogger(__name__)
@@ -45,6 +49,17 @@ class RunReconciliationRequest(BaseModel):
     target_type: str = Field(default="BANK", description="Target type (BANK, RECEIPT, INVOICE, MANUAL)")
     transaction_ids: Optional[List[str]] = Field(default=None, description="Specific transaction IDs to reconcile")
     auto_match: bool = Field(default=True, description="Auto-match high confidence matches")
+    incremental: bool = Field(default=False, description="Only rescore transactions new or changed since the last run")
+
+
+class BatchReconciliationRequest(BaseModel):
+    """Request to run reconciliation for many clients."""
+    client_ids: List[str] = Field(..., min_length=1, description="Core client IDs")
+    source_type: str = Field(default="MYFDC", description="Source type (MYFDC, OCR, BANK_FEED, MANUAL)")
+    target_type: str = Field(default="BANK", description="Target type (BANK, RECEIPT, INVOICE, MANUAL)")
+    auto_match: bool = Field(default=True, description="Auto-match high confidence matches")
+    incremental: bool = Field(default=False, description="Only rescore transactions new or changed since the last run")
+    max_concurrent_clients: int = Field(default=8, ge=1, le=64, description="Clients processed at the same time")
 
 
 class ConfirmMatchRequest(BaseModel):
@@ -94,6 +109,8 @@ class ReconciliationRunResponse(BaseModel):
     suggested: int
     no_match: int
     matches: List[dict]
+    reused: int = 0
+    incremental: bool = False
 
 
 class ReconciliationStatsResponse(BaseModel):
@@ -204,6 +221,9 @@ async def run_reconciliation(
     4. Create suggested matches for review
     5. Record no-match for transactions without candidates
     
+    With incremental=true, only transactions new or changed since the
+    client's last run are rescored; prior suggestions are reused.
+    
     Requires internal API key authentication.
     """
     try:
@@ -231,7 +251,8 @@ async def run_reconciliation(
             source_type=source_type,
             target_type=target_type,
             transaction_ids=request.transaction_ids,
-            auto_match=request.auto_match
+            auto_match=request.auto_match,
+            incremental=request.incremental
         )
         
         return ReconciliationRunResponse(
@@ -242,7 +263,9 @@ async def run_reconciliation(
             auto_matched=result.auto_matched,
             suggested=result.suggested,
             no_match=result.no_match,
-            matches=result.matches
+            matches=result.matches,
+            reused=result.reused,
+            incremental=result.incremental
         )
         
     except HTTPException:
@@ -254,6 +277,57 @@ async def run_reconciliation(
         raise HTTPException(status_code=500, detail="Reconciliation run failed")
 
 
+@router.post("/match/batch", summary="Run reconciliation for many clients")
+async def run_batch_reconciliation(
+    request: BatchReconciliationRequest,
+    _auth: bool = Depends(verify_internal_auth)
+):
+    """
+    Run reconciliation for many clients in parallel.
+    
+    Each client's data is fetched on its own database session and the
+    scoring runs in a process pool. Results are streamed back as
+    newline-delimited JSON, one line per client, as each client finishes.
+    
+    Requires internal API key authentication.
+    """
+    try:
+        source_type = ReconciliationSource(request.source_type)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Invalid source_type. Valid values: {[s.value for s in ReconciliationSource]}"
+        )
+    
+    try:
+        target_type = TargetType(request.target_type)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid target_type. Valid values: {[t.value for t in TargetType]}"
+        )
+    
+    for client_id in request.client_ids:
+        validate_client_id(client_id, required=True)
+    
+    scheduler = ReconciliationBatchScheduler(
+        AsyncSessionLocal,
+        max_concurrent_clients=request.max_concurrent_clients
+    )
+    
+    async def stream_results():
+        async for item in scheduler.run(
+            request.client_ids,
+            source_type=source_type,
+            target_type=target_type,
+            auto_match=request.auto_match,
+            incremental=request.incremental
+        ):
+            yield json.dumps(item.to_dict(), default=str) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.post("/candidates/{client_id}", summary="Find match candidates")
 async def find_candidates(
     client_id: str,
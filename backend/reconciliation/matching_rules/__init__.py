@@ -2,6 +2,16 @@
 Matching Rules Module
 """
 
-from .myfdc_rules import MyFDCMatchingRules, myfdc_rules, MatchCandidate, MatchResult
+from .myfdc_rules import MyFDCMatchingRules, myfdc_rules, MatchCandidate, MatchResult, TargetIndex, TargetColumns
+from .similarity import (
+    DescriptionIndex,
+    SequenceMatcherSimilarity,
+    TrigramSimilarity,
+    get_similarity_backend
+)
 
-__all__ = ["MyFDCMatchingRules", "myfdc_rules", "MatchCandidate", "MatchResult"]
+__all__ = [
+    "MyFDCMatchingRules", "myfdc_rules", "MatchCandidate", "MatchResult",
+    "TargetIndex", "TargetColumns",
+    "DescriptionIndex", "SequenceMatcherSimilarity", "TrigramSimilarity", "get_similarity_backend"
+]
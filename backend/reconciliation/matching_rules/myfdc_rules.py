@@ -17,21 +17,42 @@ Confidence Scoring:
 - High (>0.85): Auto-match
 - Medium (0.60-0.85): Suggested match
 - Low (<0.60): No match
+
+Candidate Generation:
+- Targets are indexed by amount band and date window (TargetIndex)
+- Only pairs that could still reach the suggest threshold are fully scored
+
+Batch Scoring:
+- Targets are converted once to columnar NumPy arrays (TargetColumns)
+- One source is scored against all candidates as array operations
+- Description similarity only runs on pairs that survive the other scores,
+  through a pluggable backend (see similarity.py)
 """
 
+import os
 import re
+from bisect import bisect_left, bisect_right
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 
+import numpy as np
+
 from reconciliation.source_registry import (
     ReconciliationSource, 
     TargetType, 
     MatchType,
     source_registry
 )
+from reconciliation.matching_rules.similarity import (
+    DescriptionIndex,
+    SequenceMatcherSimilarity,
+    get_similarity_backend,
+    normalise_source_description,
+    normalise_target_description
+)
 
 
 @dataclass
@@ -85,6 +106,55 @@ class MatchResult:
         }
 
 
+@dataclass
+class TargetIndex:
+    """
+    Blocking index over a client's target transactions.
+    
+    Built once per reconciliation run. Targets are bucketed by absolute
+    amount (sorted, for band lookups) and by transaction date (sorted
+    ordinals, for window lookups). Targets whose fields cannot be indexed
+    are always handed to full scoring so results stay identical to a
+    full scan.
+    """
+    targets: List[Dict[str, Any]]
+    amounts: List[Decimal]
+    amount_positions: List[int]
+    zero_amount_positions: List[int]
+    date_ordinals: List[int]
+    date_positions: List[int]
+    undated_positions: List[int]
+    unindexed_positions: List[int]
+    
+    def __len__(self) -> int:
+        return len(self.targets)
+
+
+@dataclass
+class TargetColumns:
+    """
+    Columnar view of a client's target transactions for batch scoring.
+    
+    Built once per reconciliation run. Amounts are held as integer cents
+    so tolerance checks stay exact. Rows that cannot be represented
+    exactly (fractional cents, unparseable dates, non-string categories)
+    are flagged in `vectorizable` and scored with the scalar rules.
+    """
+    targets: List[Dict[str, Any]]
+    amount_cents: np.ndarray
+    date_ordinals: np.ndarray
+    has_date: np.ndarray
+    category_codes: np.ndarray
+    category_prefixes: np.ndarray
+    gst_included: np.ndarray
+    has_attachments: np.ndarray
+    vectorizable: np.ndarray
+    descriptions: DescriptionIndex
+    
+    def __len__(self) -> int:
+        return len(self.targets)
+
+
 class MyFDCMatchingRules:
     """
     Matching rules engine for MyFDC transactions.
@@ -105,9 +175,22 @@ class MyFDCMatchingRules:
     AMOUNT_TOLERANCE_PERCENT = 0.01  # 1% tolerance
     DATE_TOLERANCE_DAYS = 3
     
-    def __init__(self):
+    # Step scores: (max percent difference, score) beyond the tolerance
+    AMOUNT_SCORE_STEPS = ((0.05, 0.8), (0.10, 0.6), (0.20, 0.3))
+    # Step scores: (max days apart, score)
+    DATE_SCORE_STEPS = ((0, 1.0), (1, 0.9), (DATE_TOLERANCE_DAYS, 0.7), (7, 0.4), (14, 0.2))
+    DATE_NEUTRAL_SCORE = 0.5
+    
+    # Safety margin so float rounding never drops a reachable pair
+    BLOCKING_EPSILON = 1e-9
+    
+    # Largest amount (in cents) scored with integer arrays without overflow
+    MAX_VECTOR_CENTS = 2 ** 52
+    
+    def __init__(self, description_similarity: Optional[SequenceMatcherSimilarity] = None):
         self.source = ReconciliationSource.MYFDC
         self.config = source_registry.get_config(self.source)
+        self.description_similarity = description_similarity or SequenceMatcherSimilarity()
     
     def find_matches(
         self,
@@ -132,18 +215,125 @@ class MyFDCMatchingRules:
             score, breakdown = self._score_match(source_transaction, target)
             
             if score >= self.config.suggest_match_threshold:
-                match_type = self._determine_match_type(breakdown)
-                
-                candidates.append(MatchCandidate(
-                    target_id=str(target.get('id', '')),
-                    target_type=target_type,
-                    target_reference=target.get('reference'),
-                    confidence_score=score,
-                    match_type=match_type,
-                    scoring_breakdown=breakdown,
-                    target_data=target
-                ))
+                candidates.append(self._make_candidate(target, target_type, score, breakdown))
         
+        return self._to_match_result(source_transaction, candidates)
+    
+    def find_matches_batch(
+        self,
+        source_transaction: Dict[str, Any],
+        target_columns: TargetColumns,
+        target_type: TargetType,
+        positions: Optional[List[int]] = None
+    ) -> MatchResult:
+        """
+        Find matches for a MyFDC transaction using columnar batch scoring.
+        
+        Produces the same MatchResult as find_matches over the same targets.
+        
+        Args:
+            source_transaction: The MyFDC transaction to match
+            target_columns: Columns built by build_target_columns()
+            target_type: Type of targets being matched against
+            positions: Optional target positions to score (e.g. from
+                candidate_positions()); all targets when omitted
+            
+        Returns:
+            MatchResult with candidates and best match
+        """
+        if positions is None:
+            positions = range(len(target_columns))
+        positions = np.asarray(positions, dtype=np.int64)
+        
+        components = self._score_components_batch(source_transaction, target_columns, positions)
+        source_description = source_transaction.get('description', '')
+        if components is None or (source_description and not isinstance(source_description, str)):
+            targets = [target_columns.targets[position] for position in positions]
+            return self.find_matches(source_transaction, targets, target_type)
+        
+        amount, date_score, category, gst, attachment = components
+        threshold = self.config.suggest_match_threshold
+        
+        # Weighted prefix before description, summed in _score_match order
+        partial = (
+            amount * self.WEIGHT_AMOUNT +
+            date_score * self.WEIGHT_DATE +
+            category * self.WEIGHT_CATEGORY
+        )
+        upper_bound = (
+            partial +
+            1.0 * self.WEIGHT_DESCRIPTION +
+            gst * self.WEIGHT_GST +
+            attachment * self.WEIGHT_ATTACHMENT
+        )
+        vectorizable = target_columns.vectorizable[positions]
+        to_score = ~vectorizable | (upper_bound >= threshold - self.BLOCKING_EPSILON)
+        
+        # Description similarity only for survivors, in one backend call
+        survivors = np.flatnonzero(to_score & vectorizable)
+        description_scores = dict(zip(
+            survivors.tolist(),
+            self.description_similarity.score_many(
+                normalise_source_description(source_transaction),
+                target_columns.descriptions,
+                positions[survivors].tolist()
+            )
+        ))
+        
+        candidates = []
+        
+        for offset in np.flatnonzero(to_score):
+            target = target_columns.targets[positions[offset]]
+            
+            if not vectorizable[offset]:
+                score, breakdown = self._score_match(source_transaction, target)
+            else:
+                description_score = description_scores[offset]
+                score = (
+                    float(partial[offset]) +
+                    description_score * self.WEIGHT_DESCRIPTION +
+                    float(gst[offset]) * self.WEIGHT_GST +
+                    float(attachment[offset]) * self.WEIGHT_ATTACHMENT
+                )
+                breakdown = {
+                    'amount': float(amount[offset]),
+                    'date': float(date_score[offset]),
+                    'category': float(category[offset]),
+                    'description': description_score,
+                    'gst': float(gst[offset]),
+                    'attachment': float(attachment[offset]),
+                    'total': round(score, 4)
+                }
+            
+            if score >= threshold:
+                candidates.append(self._make_candidate(target, target_type, score, breakdown))
+        
+        return self._to_match_result(source_transaction, candidates)
+    
+    def _make_candidate(
+        self,
+        target: Dict[str, Any],
+        target_type: TargetType,
+        score: float,
+        breakdown: Dict[str, float]
+    ) -> MatchCandidate:
+        """Build a MatchCandidate from a scored target."""
+        return MatchCandidate(
+            target_id=str(target.get('id', '')),
+            target_type=target_type,
+            target_reference=target.get('reference'),
+            confidence_score=score,
+            match_type=self._determine_match_type(breakdown),
+            scoring_breakdown=breakdown,
+            target_data=target
+        )
+    
+    def _to_match_result(
+        self,
+        source_transaction: Dict[str, Any],
+        candidates: List[MatchCandidate]
+    ) -> MatchResult:
+        """Rank candidates and decide auto/suggested status."""
         # Sort by confidence score
         candidates.sort(key=lambda c: c.confidence_score, reverse=True)
         
@@ -168,6 +358,324 @@ class MyFDCMatchingRules:
             suggested_match=suggested_match
         )
     
+    def build_target_index(self, target_transactions: List[Dict[str, Any]]) -> TargetIndex:
+        """
+        Index target transactions by amount and date for candidate generation.
+        
+        Args:
+            target_transactions: All targets considered in a reconciliation run
+            
+        Returns:
+            TargetIndex to pass to candidate_targets()
+        """
+        amount_entries = []
+        zero_amount_positions = []
+        date_entries = []
+        undated_positions = []
+        unindexed = set()
+        
+        for position, target in enumerate(target_transactions):
+            amount = self._parse_amount(target)
+            if amount is None:
+                unindexed.add(position)
+            elif amount == 0:
+                zero_amount_positions.append(position)
+            else:
+                amount_entries.append((amount, position))
+            
+            raw_date = target.get('date') or target.get('transaction_date')
+            if not raw_date:
+                undated_positions.append(position)
+                continue
+            parsed_date = self._parse_date(raw_date)
+            if parsed_date is None:
+                unindexed.add(position)
+            else:
+                date_entries.append((parsed_date.toordinal(), position))
+        
+        amount_entries.sort()
+        date_entries.sort()
+        
+        return TargetIndex(
+            targets=target_transactions,
+            amounts=[amount for amount, _ in amount_entries],
+            amount_positions=[position for _, position in amount_entries],
+            zero_amount_positions=zero_amount_positions,
+            date_ordinals=[ordinal for ordinal, _ in date_entries],
+            date_positions=[position for _, position in date_entries],
+            undated_positions=undated_positions,
+            unindexed_positions=sorted(unindexed)
+        )
+    
+    def candidate_targets(
+        self,
+        source_transaction: Dict[str, Any],
+        target_index: TargetIndex
+    ) -> List[Dict[str, Any]]:
+        """
+        Select the targets that could reach the suggest threshold for a source.
+        
+        See candidate_positions() for how candidates are chosen.
+        
+        Args:
+            source_transaction: The MyFDC transaction to match
+            target_index: Index built by build_target_index()
+            
+        Returns:
+            Subset of the indexed targets worth fully scoring
+        """
+        return [
+            target_index.targets[position]
+            for position in self.candidate_positions(source_transaction, target_index)
+        ]
+    
+    def candidate_positions(
+        self,
+        source_transaction: Dict[str, Any],
+        target_index: TargetIndex
+    ) -> List[int]:
+        """
+        Select positions of the targets that could reach the suggest threshold.
+        
+        A pair outside the amount band scores 0 on amount, so it can only
+        reach the threshold through the date score. Every pair that could
+        reach suggest_match_threshold is therefore either in the amount
+        band or in the date window derived from the scoring weights.
+        Positions are returned in their original order, so find_matches
+        produces the same result as scoring the full target list.
+        
+        Args:
+            source_transaction: The MyFDC transaction to match
+            target_index: Index built by build_target_index()
+            
+        Returns:
+            Sorted positions into target_index.targets
+        """
+        # Score still needed from amount + date once every other
+        # component contributes its maximum
+        required = (
+            self.config.suggest_match_threshold
+            - self.WEIGHT_CATEGORY
+            - self.WEIGHT_DESCRIPTION
+            - self.WEIGHT_GST
+            - self.WEIGHT_ATTACHMENT
+            - self.BLOCKING_EPSILON
+        )
+        if required <= 0:
+            return list(range(len(target_index)))
+        
+        source_amount = self._parse_amount(source_transaction)
+        source_date = None
+        raw_source_date = source_transaction.get('transaction_date')
+        if raw_source_date:
+            source_date = self._parse_date(raw_source_date)
+        
+        # Without a clean source date every dated target scores neutral
+        neutral_date_reaches = self.DATE_NEUTRAL_SCORE * self.WEIGHT_DATE >= required
+        if source_amount is None or (source_date is None and neutral_date_reaches):
+            return list(range(len(target_index)))
+        
+        positions = set(target_index.unindexed_positions)
+        
+        # Amount band: any target with a non-zero amount score
+        if source_amount == 0:
+            positions.update(target_index.zero_amount_positions)
+        else:
+            max_percent = max(percent for percent, _ in self.AMOUNT_SCORE_STEPS)
+            band = source_amount * (Decimal(str(max_percent)) + Decimal(str(self.BLOCKING_EPSILON)))
+            low = bisect_left(target_index.amounts, source_amount - band)
+            high = bisect_right(target_index.amounts, source_amount + band)
+            positions.update(target_index.amount_positions[low:high])
+        
+        # Date window: targets whose date score alone reaches the threshold
+        if neutral_date_reaches:
+            positions.update(target_index.undated_positions)
+        
+        if source_date is not None:
+            window_days = [
+                max_days for max_days, score in self.DATE_SCORE_STEPS
+                if score * self.WEIGHT_DATE >= required
+            ]
+            if window_days:
+                ordinal = source_date.toordinal()
+                low = bisect_left(target_index.date_ordinals, ordinal - max(window_days))
+                high = bisect_right(target_index.date_ordinals, ordinal + max(window_days))
+                positions.update(target_index.date_positions[low:high])
+        
+        return sorted(positions)
+    
+    def build_target_columns(self, target_transactions: List[Dict[str, Any]]) -> TargetColumns:
+        """
+        Convert target transactions to columnar arrays for batch scoring.
+        
+        Args:
+            target_transactions: All targets considered in a reconciliation run
+            
+        Returns:
+            TargetColumns to pass to find_matches_batch()
+        """
+        count = len(target_transactions)
+        amount_cents = np.zeros(count, dtype=np.int64)
+        date_ordinals = np.zeros(count, dtype=np.int64)
+        has_date = np.zeros(count, dtype=bool)
+        gst_included = np.empty(count, dtype=object)
+        has_attachments = np.zeros(count, dtype=bool)
+        vectorizable = np.ones(count, dtype=bool)
+        category_codes = []
+        descriptions = []
+        
+        for position, target in enumerate(target_transactions):
+            cents = self._parse_amount_cents(target)
+            if cents is None:
+                vectorizable[position] = False
+            else:
+                amount_cents[position] = cents
+            
+            raw_date = target.get('date') or target.get('transaction_date')
+            if raw_date:
+                parsed_date = self._parse_date(raw_date)
+                if parsed_date is None:
+                    vectorizable[position] = False
+                else:
+                    date_ordinals[position] = parsed_date.toordinal()
+                    has_date[position] = True
+            
+            code = target.get('category_code', '') or target.get('category', '')
+            if code and not isinstance(code, str):
+                vectorizable[position] = False
+                code = ''
+            category_codes.append(code or '')
+            
+            gst_included[position] = target.get('gst_included', True)
+            has_attachments[position] = bool(target.get('attachments', []) or [])
+            
+            description = target.get('description', '') or target.get('memo', '')
+            if description and not isinstance(description, str):
+                vectorizable[position] = False
+                description = ''
+            descriptions.append(normalise_target_description({'description': description}))
+        
+        return TargetColumns(
+            targets=target_transactions,
+            amount_cents=amount_cents,
+            date_ordinals=date_ordinals,
+            has_date=has_date,
+            category_codes=np.array(category_codes, dtype=str),
+            category_prefixes=np.array([code[:2] for code in category_codes], dtype=str),
+            gst_included=gst_included,
+            has_attachments=has_attachments,
+            vectorizable=vectorizable,
+            descriptions=self.description_similarity.build_index(descriptions)
+        )
+    
+    def _score_components_batch(
+        self,
+        source: Dict[str, Any],
+        columns: TargetColumns,
+        positions: np.ndarray
+    ) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Score amount, date, category, GST and attachment for many targets.
+        
+        Mirrors the scalar _score_* step functions. Returns None when the
+        source itself cannot be scored exactly with arrays.
+        """
+        source_cents = self._parse_amount_cents(source)
+        source_code = source.get('category_code', '')
+        if source_cents is None or (source_code and not isinstance(source_code, str)):
+            return None
+        
+        # Amount
+        target_cents = columns.amount_cents[positions]
+        if source_cents == 0:
+            amount = np.where(target_cents == 0, 1.0, 0.0)
+        else:
+            diff = np.abs(target_cents - source_cents)
+            tolerance_num, tolerance_den = Decimal(str(self.AMOUNT_TOLERANCE_PERCENT)).as_integer_ratio()
+            percent_diff = diff / source_cents
+            amount = np.select(
+                [target_cents == 0, diff == 0, diff * tolerance_den <= source_cents * tolerance_num] +
+                [percent_diff <= max_percent for max_percent, _ in self.AMOUNT_SCORE_STEPS],
+                [0.0, 1.0, 0.95] + [score for _, score in self.AMOUNT_SCORE_STEPS],
+                default=0.0
+            )
+        
+        # Date
+        raw_source_date = source.get('transaction_date')
+        if not raw_source_date:
+            source_date = None
+        else:
+            source_date = self._parse_date(raw_source_date)
+            if source_date is None and not isinstance(raw_source_date, str):
+                return None
+        
+        if source_date is None:
+            date_score = np.full(len(positions), self.DATE_NEUTRAL_SCORE)
+        else:
+            days_apart = np.abs(columns.date_ordinals[positions] - source_date.toordinal())
+            date_score = np.select(
+                [~columns.has_date[positions]] +
+                [days_apart <= max_days for max_days, _ in self.DATE_SCORE_STEPS],
+                [self.DATE_NEUTRAL_SCORE] + [score for _, score in self.DATE_SCORE_STEPS],
+                default=0.0
+            )
+        
+        # Category
+        if not source_code:
+            category = np.full(len(positions), 0.5)
+        else:
+            target_codes = columns.category_codes[positions]
+            category = np.select(
+                [target_codes == '', target_codes == source_code,
+                 columns.category_prefixes[positions] == source_code[:2]],
+                [0.5, 1.0, 0.7],
+                default=0.3
+            )
+        
+        # GST
+        source_gst = source.get('gst_included', True)
+        same_gst = np.asarray(columns.gst_included[positions] == source_gst, dtype=bool)
+        gst = np.where(same_gst, 1.0, 0.5)
+        
+        # Attachments
+        source_attachments = bool(source.get('attachments', []) or [])
+        target_attachments = columns.has_attachments[positions]
+        attachment = np.where(
+            target_attachments & source_attachments, 1.0,
+            np.where(target_attachments | source_attachments, 0.7, 0.5)
+        )
+        
+        return amount, date_score, category, gst, attachment
+    
+    def _parse_amount(self, transaction: Dict[str, Any]) -> Optional[Decimal]:
+        """Parse an absolute amount the same way _score_amount does."""
+        try:
+            amount = abs(Decimal(str(transaction.get('amount', 0))))
+        except (ArithmeticError, ValueError, TypeError):
+            return None
+        return amount if amount.is_finite() else None
+    
+    def _parse_amount_cents(self, transaction: Dict[str, Any]) -> Optional[int]:
+        """Parse an absolute amount as integer cents, None if not exact."""
+        amount = self._parse_amount(transaction)
+        if amount is None:
+            return None
+        cents = amount.scaleb(2)
+        if cents != cents.to_integral_value() or cents >= self.MAX_VECTOR_CENTS:
+            return None
+        return int(cents)
+    
+    def _parse_date(self, value: Any) -> Optional[date]:
+        """Parse a date the same way _score_date does, None if not indexable."""
+        if type(value) is date:
+            return value
+        if isinstance(value, str):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                return None
+        return None
+    
     def _score_match(
         self,
         source: Dict[str, Any],
@@ -244,12 +752,9 @@ class MyFDCMatchingRules:
             
             # Proportional scoring for larger differences
             percent_diff = float(diff / source_amount)
-            if percent_diff <= 0.05:  # 5%
-                return 0.8
-            elif percent_diff <= 0.10:  # 10%
-                return 0.6
-            elif percent_diff <= 0.20:  # 20%
-                return 0.3
+            for max_percent, score in self.AMOUNT_SCORE_STEPS:
+                if percent_diff <= max_percent:
+                    return score
             
             return 0.0
             
@@ -263,7 +768,7 @@ class MyFDCMatchingRules:
             target_date = target.get('date') or target.get('transaction_date')
             
             if not source_date or not target_date:
-                return 0.5  # Neutral score if date missing
+                return self.DATE_NEUTRAL_SCORE  # Neutral score if date missing
             
             # Parse dates if strings
             if isinstance(source_date, str):
@@ -278,19 +783,14 @@ class MyFDCMatchingRules:
             # Within tolerance
             diff = abs((source_date - target_date).days)
             
-            if diff <= 1:
-                return 0.9
-            elif diff <= self.DATE_TOLERANCE_DAYS:
-                return 0.7
-            elif diff <= 7:
-                return 0.4
-            elif diff <= 14:
-                return 0.2
+            for max_days, score in self.DATE_SCORE_STEPS:
+                if diff <= max_days:
+                    return score
             
             return 0.0
             
         except (ValueError, TypeError):
-            return 0.5
+            return self.DATE_NEUTRAL_SCORE
     
     def _score_category(self, source: Dict, target: Dict) -> float:
         """Score category matching."""
@@ -312,8 +812,8 @@ class MyFDCMatchingRules:
     
     def _score_description(self, source: Dict, target: Dict) -> float:
         """Score description similarity using fuzzy matching."""
-        source_desc = (source.get('description', '') or '').lower().strip()
-        target_desc = (target.get('description', '') or target.get('memo', '') or '').lower().strip()
+        source_desc = normalise_source_description(source)
+        target_desc = normalise_target_description(target)
         
         if not source_desc or not target_desc:
             return 0.5  # Neutral score
@@ -370,5 +870,10 @@ class MyFDCMatchingRules:
         return MatchType.FUZZY
 
 
-# Instantiate rules engine
-myfdc_rules = MyFDCMatchingRules()
+# Instantiate rules engine (description backend: sequence_matcher or trigram)
+myfdc_rules = MyFDCMatchingRules(
+    description_similarity=get_similarity_backend(
+        os.environ.get('RECONCILIATION_DESCRIPTION_SIMILARITY', SequenceMatcherSimilarity.name),
+        top_k=int(os.environ.get('RECONCILIATION_SIMILARITY_TOP_K', '5'))
+    )
+)
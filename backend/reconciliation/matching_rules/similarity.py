@@ -0,0 +1,151 @@
+"""
+Description Similarity Backends (A3-RECON-01)
+
+Pluggable scorers for the description component of MyFDC matching.
+
+Backends:
+- SequenceMatcherSimilarity: exact difflib ratio (default)
+- TrigramSimilarity: character-trigram set overlap for ranking, with an
+  optional exact SequenceMatcher pass on the top-k pairs per source
+
+Target descriptions are normalised and indexed once per reconciliation
+run (DescriptionIndex), so the same memo is not lowercased, stripped
+and re-analysed for every source transaction.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Dict, Any, List, Optional, FrozenSet, Sequence
+
+
+# Score used when either side has no description
+NEUTRAL_SCORE = 0.5
+
+
+def normalise_source_description(transaction: Dict[str, Any]) -> str:
+    """Normalise a source transaction description the way scoring expects."""
+    return (transaction.get('description', '') or '').lower().strip()
+
+
+def normalise_target_description(transaction: Dict[str, Any]) -> str:
+    """Normalise a target description, falling back to its memo."""
+    return (transaction.get('description', '') or transaction.get('memo', '') or '').lower().strip()
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of a normalised description (space padded)."""
+    padded = f" {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass
+class DescriptionIndex:
+    """
+    Per-run cache of normalised target descriptions.
+
+    SequenceMatchers are created lazily per target with the target as
+    the second sequence, so difflib's analysis of each target memo is
+    reused across every source it is compared with.
+    """
+    descriptions: List[str]
+    trigram_sets: Optional[List[FrozenSet[str]]] = None
+    matchers: Dict[int, SequenceMatcher] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.descriptions)
+
+    def exact_ratio(self, source_description: str, position: int) -> float:
+        """SequenceMatcher(None, source, target).ratio() using the cached target."""
+        matcher = self.matchers.get(position)
+        if matcher is None:
+            matcher = SequenceMatcher(None, '', self.descriptions[position])
+            self.matchers[position] = matcher
+        matcher.set_seq1(source_description)
+        return matcher.ratio()
+
+
+class SequenceMatcherSimilarity:
+    """Exact difflib similarity; identical to the scalar matching rules."""
+
+    name = "sequence_matcher"
+
+    def build_index(self, descriptions: List[str]) -> DescriptionIndex:
+        """Index normalised target descriptions for one reconciliation run."""
+        return DescriptionIndex(descriptions=descriptions)
+
+    def score_many(
+        self,
+        source_description: str,
+        index: DescriptionIndex,
+        positions: Sequence[int]
+    ) -> List[float]:
+        """Score a normalised source description against indexed targets."""
+        if not source_description:
+            return [NEUTRAL_SCORE] * len(positions)
+
+        return [
+            index.exact_ratio(source_description, position)
+            if index.descriptions[position] else NEUTRAL_SCORE
+            for position in positions
+        ]
+
+
+class TrigramSimilarity(SequenceMatcherSimilarity):
+    """
+    Approximate similarity from character-trigram overlap (Dice coefficient).
+
+    The overlap ranks targets for a source; when top_k is set, the best
+    top_k pairs are rescored exactly with SequenceMatcher so the leading
+    candidates keep exact description scores.
+    """
+
+    name = "trigram"
+
+    def __init__(self, top_k: Optional[int] = 5):
+        self.top_k = top_k
+
+    def build_index(self, descriptions: List[str]) -> DescriptionIndex:
+        """Index normalised target descriptions and their trigram sets."""
+        return DescriptionIndex(
+            descriptions=descriptions,
+            trigram_sets=[trigrams(text) if text else frozenset() for text in descriptions]
+        )
+
+    def score_many(
+        self,
+        source_description: str,
+        index: DescriptionIndex,
+        positions: Sequence[int]
+    ) -> List[float]:
+        """Score by trigram overlap, then rescore the top_k pairs exactly."""
+        if not source_description:
+            return [NEUTRAL_SCORE] * len(positions)
+
+        source_grams = trigrams(source_description)
+        scores = []
+        ranked = []
+
+        for offset, position in enumerate(positions):
+            if not index.descriptions[position]:
+                scores.append(NEUTRAL_SCORE)
+                continue
+            target_grams = index.trigram_sets[position]
+            overlap = 2 * len(source_grams & target_grams) / (len(source_grams) + len(target_grams))
+            scores.append(overlap)
+            ranked.append((overlap, offset))
+
+        if self.top_k:
+            for _, offset in heapq.nlargest(self.top_k, ranked, key=lambda item: item[0]):
+                scores[offset] = index.exact_ratio(source_description, positions[offset])
+
+        return scores
+
+
+def get_similarity_backend(name: str, top_k: Optional[int] = 5) -> SequenceMatcherSimilarity:
+    """Get a description similarity backend by name."""
+    if name == TrigramSimilarity.name:
+        return TrigramSimilarity(top_k=top_k)
+    if name == SequenceMatcherSimilarity.name:
+        return SequenceMatcherSimilarity()
+    raise ValueError(f"Unknown description similarity backend: {name}")
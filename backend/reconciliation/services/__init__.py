@@ -1,4 +1,5 @@
 """Reconciliation Services"""
 from reconciliation.services.reconciliation_service import ReconciliationService
+from reconciliation.services.batch_scheduler import ReconciliationBatchScheduler, ReconciliationBatchItem
 
-__all__ = ['ReconciliationService']
+__all__ = ['ReconciliationService', 'ReconciliationBatchScheduler', 'ReconciliationBatchItem']
@@ -0,0 +1,138 @@
+"""
+Reconciliation Batch Scheduler (A3-RECON-01)
+
+Runs reconciliation for many clients at once:
+- Each client's data is fetched concurrently on its own database session
+- CPU-bound MyFDCMatchingRules scoring runs in a ProcessPoolExecutor
+- Per-client results are streamed back as soon as each client finishes
+
+Intended for end-of-quarter runs across hundreds of educators.
+"""
+
+import os
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, AsyncIterator
+
+from reconciliation.source_registry import ReconciliationSource, TargetType
+from reconciliation.services.reconciliation_service import (
+    ReconciliationService,
+    ReconciliationRunResult
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconciliationBatchItem:
+    """Outcome of one client's reconciliation within a batch."""
+    client_id: str
+    success: bool
+    result: Optional[ReconciliationRunResult] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "client_id": self.client_id,
+            "success": self.success,
+            "result": asdict(self.result) if self.result else None,
+            "error": self.error
+        }
+
+
+class ReconciliationBatchScheduler:
+    """
+    Parallel multi-client reconciliation scheduler.
+
+    Database work stays on the event loop (one session per client,
+    bounded by max_concurrent_clients); scoring is shipped to a process
+    pool so it never blocks other requests and uses every core.
+    """
+
+    def __init__(
+        self,
+        db_session_factory,
+        max_concurrent_clients: int = 8,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            db_session_factory: SQLAlchemy async session factory
+            max_concurrent_clients: Clients fetched/persisted at the same time
+            max_workers: Scoring processes (default: one per CPU)
+            executor: Optional executor to use instead of a private process pool
+        """
+        self.db_session_factory = db_session_factory
+        self.max_concurrent_clients = max(1, max_concurrent_clients)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor
+
+    async def run(
+        self,
+        client_ids: List[str],
+        source_type: ReconciliationSource = ReconciliationSource.MYFDC,
+        target_type: TargetType = TargetType.BANK,
+        auto_match: bool = True,
+        incremental: bool = False
+    ) -> AsyncIterator[ReconciliationBatchItem]:
+        """
+        Reconcile many clients, yielding each client's outcome as it completes.
+
+        A failure for one client is reported in its item and does not stop
+        the batch.
+
+        Args:
+            client_ids: Core client IDs to reconcile (duplicates are ignored)
+            source_type: Type of source transactions to reconcile
+            target_type: Type of targets to match against
+            auto_match: Whether to auto-match high confidence matches
+            incremental: Only rescore new or changed transactions
+
+        Yields:
+            ReconciliationBatchItem per client, in completion order
+        """
+        client_ids = list(dict.fromkeys(client_ids))
+        if not client_ids:
+            return
+
+        owns_executor = self.executor is None
+        executor = self.executor or ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(client_ids))
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrent_clients)
+
+        async def reconcile_client(client_id: str) -> ReconciliationBatchItem:
+            async with semaphore:
+                try:
+                    async with self.db_session_factory() as db:
+                        service = ReconciliationService(db)
+                        result = await service.run_reconciliation(
+                            client_id=client_id,
+                            source_type=source_type,
+                            target_type=target_type,
+                            auto_match=auto_match,
+                            incremental=incremental,
+                            executor=executor
+                        )
+                    return ReconciliationBatchItem(client_id=client_id, success=True, result=result)
+                except Exception as e:
+                    logger.error(f"Batch reconciliation failed for client {client_id}: {e}")
+                    return ReconciliationBatchItem(client_id=client_id, success=False, error=str(e))
+
+        tasks = [asyncio.create_task(reconcile_client(client_id)) for client_id in client_ids]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            if owns_executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(f"Batch reconciliation finished for {len(client_ids)} clients")
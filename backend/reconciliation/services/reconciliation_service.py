@@ -12,10 +12,14 @@ The reconciliation engine recognizes MyFDC as a valid source
 for matching against bank feeds and other financial data.
 """
 
+import os
 import uuid
 import json
+import hashlib
+import asyncio
 import logging
-from datetime import datetime, timezone
+from concurrent.futures import Executor
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
@@ -39,6 +43,28 @@ from reconciliation.matching_rules.myfdc_rules import (
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT when persisting a reconciliation run
+DEFAULT_STORE_CHUNK_SIZE = int(os.environ.get('RECONCILIATION_STORE_CHUNK_SIZE', '500'))
+
+# Columns written for every reconciliation_matches row
+MATCH_INSERT_COLUMNS = (
+    "id", "client_id", "source_transaction_id", "source_type",
+    "target_transaction_id", "target_type", "target_reference",
+    "match_status", "confidence_score", "match_type",
+    "scoring_breakdown", "auto_matched"
+)
+
+# PostgreSQL caps a single statement at 32767 bind parameters
+MAX_BIND_PARAMS = 32767
+
+# Target fields the matching rules score on; a prior result for a target
+# is only reused while these are unchanged (workpaper_transactions has no
+# updated_at to compare against the watermark)
+TARGET_FINGERPRINT_FIELDS = (
+    "date", "amount", "description", "category_code",
+    "gst_amount", "gst_included", "reference"
+)
+
 
 @dataclass
 class ReconciliationRunResult:
@@ -51,6 +77,24 @@ class ReconciliationRunResult:
     suggested: int
     no_match: int
     matches: List[Dict[str, Any]]
+    reused: int = 0
+    incremental: bool = False
+
+
+@dataclass
+class ReconciliationWatermark:
+    """
+    Per-client high-water marks for incremental reconciliation.
+    
+    source_watermark tracks the latest ingested_transactions.updated_at
+    and target_watermark the latest workpaper_transactions.created_at
+    seen by a completed run.
+    """
+    client_id: str
+    source_type: str
+    target_type: str
+    source_watermark: Optional[datetime]
+    target_watermark: Optional[datetime]
 
 
 class ReconciliationAuditEvent:
@@ -82,6 +126,131 @@ def log_reconciliation_event(
     logger.info(f"Reconciliation event: {event_type}", extra=log_entry)
 
 
+def score_reconciliation(
+    rules: MyFDCMatchingRules,
+    source_transactions: List[Dict[str, Any]],
+    all_targets: List[Dict[str, Any]],
+    target_type: TargetType,
+    watermark: Optional[ReconciliationWatermark] = None,
+    prior_results: Optional[Dict[str, Dict[str, Any]]] = None,
+    overlap: timedelta = timedelta(0)
+) -> List[Optional[MatchResult]]:
+    """
+    Score a client's source transactions against its open targets.
+    
+    This is the CPU-bound stage of a reconciliation run. It touches no
+    database or event loop state and only takes picklable arguments, so
+    it can run in a ProcessPoolExecutor.
+    
+    Targets are indexed for candidate generation and converted to
+    columns for batch scoring once. With a watermark, unchanged sources
+    whose prior result is still valid are only scored against targets
+    created since the watermark.
+    
+    Returns:
+        One entry per source: its MatchResult, or None when the prior
+        result should be kept
+    """
+    prior_results = prior_results or {}
+    
+    target_index = rules.build_target_index(all_targets)
+    target_columns = rules.build_target_columns(all_targets)
+    
+    if watermark:
+        new_targets = [
+            target for target in all_targets
+            if _is_after(target.get('created_at'), watermark.target_watermark, overlap)
+        ]
+        new_target_index = rules.build_target_index(new_targets)
+        new_target_columns = rules.build_target_columns(new_targets)
+        target_fingerprints = {target['id']: _target_fingerprint(target) for target in all_targets}
+    
+    results = []
+    
+    for source_txn in source_transactions:
+        prior = prior_results.get(source_txn['id'])
+        
+        if watermark and _can_reuse_prior(source_txn, prior, watermark, target_fingerprints):
+            # Unchanged source: only new targets can improve on the prior result
+            result = rules.find_matches_batch(
+                source_txn,
+                new_target_columns,
+                target_type,
+                rules.candidate_positions(source_txn, new_target_index)
+            )
+            results.append(result if _beats_prior(result, prior) else None)
+            continue
+        
+        # Only score targets that could reach the suggest threshold
+        # (MYFDC rules are used for every source type for now)
+        results.append(rules.find_matches_batch(
+            source_txn,
+            target_columns,
+            target_type,
+            rules.candidate_positions(source_txn, target_index)
+        ))
+    
+    return results
+
+
+def _can_reuse_prior(
+    source_txn: Dict[str, Any],
+    prior: Optional[Dict[str, Any]],
+    watermark: ReconciliationWatermark,
+    target_fingerprints: Dict[str, str]
+) -> bool:
+    """
+    Check whether a source's prior result is still valid.
+    
+    The source must be unchanged since the watermark and its prior
+    result must be a SUGGESTED match to a still-open, unchanged target
+    (same fingerprint as when it was scored) or a NO_MATCH without a
+    target.
+    """
+    if not prior:
+        return False
+    
+    if _is_after(source_txn.get('updated_at'), watermark.source_watermark):
+        return False
+    
+    if prior['match_status'] == MatchStatus.SUGGESTED.value:
+        fingerprint = target_fingerprints.get(prior['target_transaction_id'])
+        return fingerprint is not None and fingerprint == prior.get('target_fingerprint')
+    
+    return (
+        prior['match_status'] == MatchStatus.NO_MATCH.value and
+        prior['target_transaction_id'] is None
+    )
+
+
+def _target_fingerprint(target: Dict[str, Any]) -> str:
+    """Hash of a target's scored fields, stored with the matches made against it."""
+    values = [str(target.get(field)) for field in TARGET_FINGERPRINT_FIELDS]
+    return hashlib.sha256(json.dumps(values).encode('utf-8')).hexdigest()
+
+
+def _beats_prior(result: MatchResult, prior: Dict[str, Any]) -> bool:
+    """Check whether scoring against new targets improves on a prior result."""
+    if not result.best_match:
+        return False
+    
+    if prior['match_status'] == MatchStatus.NO_MATCH.value:
+        return True
+    
+    return result.best_match.confidence_score > prior['confidence_score']
+
+
+def _is_after(
+    value: Optional[datetime],
+    watermark: Optional[datetime],
+    overlap: timedelta = timedelta(0)
+) -> bool:
+    """Check whether a timestamp is past a watermark (missing values count as new)."""
+    if value is None or watermark is None:
+        return True
+    return value > watermark - overlap
+
+
 class ReconciliationService:
     """
     Service for reconciling transactions from various sources.
@@ -90,9 +259,17 @@ class ReconciliationService:
     to verify expenses and income.
     """
     
-    def __init__(self, db: AsyncSession):
+    # Targets created this close to the watermark are rescored anyway, to
+    # cover rows committed out of timestamp order
+    INCREMENTAL_OVERLAP = timedelta(minutes=5)
+    
+    def __init__(self, db: AsyncSession, store_chunk_size: Optional[int] = None):
         self.db = db
         self.myfdc_rules = myfdc_rules
+        self.store_chunk_size = max(1, min(
+            store_chunk_size or DEFAULT_STORE_CHUNK_SIZE,
+            MAX_BIND_PARAMS // len(MATCH_INSERT_COLUMNS)
+        ))
     
     async def find_candidates(
         self,
@@ -163,17 +340,30 @@ class ReconciliationService:
         source_type: ReconciliationSource = ReconciliationSource.MYFDC,
         target_type: TargetType = TargetType.BANK,
         transaction_ids: Optional[List[str]] = None,
-        auto_match: bool = True
+        auto_match: bool = True,
+        incremental: bool = False,
+        executor: Optional[Executor] = None
     ) -> ReconciliationRunResult:
         """
         Run reconciliation for a client's transactions.
         
+        In incremental mode, sources changed since the client's watermark
+        are scored against all open targets, while unchanged sources are
+        only scored against targets created since the watermark. An
+        unchanged source keeps its prior SUGGESTED or NO_MATCH result
+        unless a new target beats it; a suggestion whose target's scored
+        fields have changed is rescored. Without a watermark the run falls
+        back to a full rescore.
+        
         Args:
             client_id: Core client ID
             source_type: Type of source transactions to reconcile
             target_type: Type of targets to match against
             transaction_ids: Optional list of specific transaction IDs
             auto_match: Whether to auto-match high confidence matches
+            incremental: Only rescore new or changed transactions
+            executor: Optional executor (e.g. a ProcessPoolExecutor) to run
+                the CPU-bound scoring stage off the event loop
             
         Returns:
             ReconciliationRunResult with match statistics
@@ -188,7 +378,8 @@ class ReconciliationService:
                 "run_id": run_id,
                 "source_type": source_type.value,
                 "target_type": target_type.value,
-                "auto_match": auto_match
+                "auto_match": auto_match,
+                "incremental": incremental
             }
         )
         
@@ -201,27 +392,65 @@ class ReconciliationService:
         
         # Get target transactions
         all_targets = await self._get_all_target_transactions(client_id, target_type)
+        target_fingerprints = {target['id']: _target_fingerprint(target) for target in all_targets}
+        
+        # Incremental mode: load the watermark and each source's prior result
+        watermark = None
+        prior_results = {}
+        if incremental:
+            watermark = await self._get_watermark(client_id, source_type, target_type)
+        if watermark:
+            prior_results = await self._get_prior_results(
+                client_id,
+                source_type,
+                target_type,
+                [txn['id'] for txn in source_transactions]
+            )
+        
+        # Score all sources (CPU-bound; optionally off the event loop)
+        scoring_args = (
+            self.myfdc_rules,
+            source_transactions,
+            all_targets,
+            target_type,
+            watermark,
+            prior_results,
+            self.INCREMENTAL_OVERLAP
+        )
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(executor, score_reconciliation, *scoring_args)
+        else:
+            results = score_reconciliation(*scoring_args)
         
         # Process each transaction
         matches = []
+        match_rows = []
         auto_matched_count = 0
         suggested_count = 0
         no_match_count = 0
-        
-        for source_txn in source_transactions:
-            # Find candidates
-            if source_type == ReconciliationSource.MYFDC:
-                result = self.myfdc_rules.find_matches(
-                    source_txn,
-                    all_targets,
-                    target_type
-                )
-            else:
-                result = self.myfdc_rules.find_matches(
-                    source_txn,
-                    all_targets,
-                    target_type
-                )
+        reused_count = 0
+        
+        for source_txn, result in zip(source_transactions, results):
+            if result is None:
+                # Unchanged source whose prior result still stands
+                prior = prior_results[source_txn['id']]
+                reused_count += 1
+                if prior['match_status'] == MatchStatus.SUGGESTED.value:
+                    suggested_count += 1
+                else:
+                    no_match_count += 1
+                
+                matches.append({
+                    "match_id": prior['id'],
+                    "source_transaction_id": source_txn['id'],
+                    "target_id": prior['target_transaction_id'],
+                    "confidence_score": prior['confidence_score'],
+                    "status": prior['match_status'],
+                    "auto_matched": False,
+                    "reused": True
+                })
+                continue
             
             # Determine status
             if result.auto_matched and auto_match:
@@ -234,16 +463,19 @@ class ReconciliationService:
                 status = MatchStatus.NO_MATCH
                 no_match_count += 1
             
-            # Store match result
+            # Collect match result for bulk insert
             if result.best_match:
-                match_id = await self._store_match(
+                match_row = self._build_match_row(
                     client_id,
                     source_txn,
                     result.best_match,
                     source_type,
                     status,
-                    result.auto_matched and auto_match
+                    result.auto_matched and auto_match,
+                    target_fingerprints.get(result.best_match.target_id)
                 )
+                match_rows.append(match_row)
+                match_id = match_row["id"]
                 
                 matches.append({
                     "match_id": match_id,
@@ -254,13 +486,16 @@ class ReconciliationService:
                     "auto_matched": result.auto_matched and auto_match
                 })
             else:
-                # Store no-match record
-                match_id = await self._store_no_match(
+                # Collect no-match record
+                match_row = self._build_no_match_row(
                     client_id,
                     source_txn,
                     source_type,
+                    target_type,
                     result.candidates
                 )
+                match_rows.append(match_row)
+                match_id = match_row["id"]
                 
                 matches.append({
                     "match_id": match_id,
@@ -271,8 +506,19 @@ class ReconciliationService:
                     "auto_matched": False
                 })
         
-        # Commit all matches
+        # Write all matches in chunked multi-row inserts, advance the
+        # watermark for whole-client runs, then commit
         try:
+            await self._store_match_rows(match_rows)
+            if transaction_ids is None:
+                await self._advance_watermark(
+                    client_id,
+                    source_type,
+                    target_type,
+                    source_transactions,
+                    all_targets,
+                    watermark
+                )
             await self.db.commit()
         except Exception as e:
             logger.error(f"Failed to commit reconciliation run: {e}")
@@ -288,7 +534,9 @@ class ReconciliationService:
                 "total": len(source_transactions),
                 "auto_matched": auto_matched_count,
                 "suggested": suggested_count,
-                "no_match": no_match_count
+                "no_match": no_match_count,
+                "reused": reused_count,
+                "incremental": watermark is not None
             }
         )
         
@@ -304,7 +552,9 @@ class ReconciliationService:
                 "total_transactions": len(source_transactions),
                 "auto_matched": auto_matched_count,
                 "suggested": suggested_count,
-                "no_match": no_match_count
+                "no_match": no_match_count,
+                "reused": reused_count,
+                "incremental": watermark is not None
             }
         )
         
@@ -316,7 +566,9 @@ class ReconciliationService:
             auto_matched=auto_matched_count,
             suggested=suggested_count,
             no_match=no_match_count,
-            matches=matches
+            matches=matches,
+            reused=reused_count,
+            incremental=watermark is not None
         )
     
     async def confirm_match(
@@ -659,7 +911,7 @@ class ReconciliationService:
                 it.transaction_date, it.transaction_type, it.amount,
                 it.gst_included, it.gst_amount, it.description, it.category_code,
                 it.category_raw, it.category_normalised, it.vendor, it.receipt_number,
-                it.attachments, it.status
+                it.attachments, it.status, it.updated_at
             FROM public.ingested_transactions it
             LEFT JOIN public.reconciliation_matches rm 
                 ON rm.source_transaction_id = it.id 
@@ -700,7 +952,8 @@ class ReconciliationService:
                 "vendor": row[13],
                 "receipt_number": row[14],
                 "attachments": row[15] if row[15] else [],
-                "status": row[16]
+                "status": row[16],
+                "updated_at": row[17]
             })
         
         return transactions
@@ -791,7 +1044,7 @@ class ReconciliationService:
                 wt.date as date, wt.amount, wt.description,
                 wt.category as category_code, NULL as memo,
                 wt.gst_amount, true as gst_included, NULL as attachments,
-                wt.reference as reference
+                wt.reference as reference, wt.created_at
             FROM public.workpaper_transactions wt
             LEFT JOIN public.reconciliation_matches rm 
                 ON rm.target_transaction_id = CAST(wt.id AS TEXT)
@@ -827,83 +1080,173 @@ class ReconciliationService:
                 "gst_amount": str(row[7]) if row[7] else None,
                 "gst_included": row[8],
                 "attachments": row[9] if row[9] else [],
-                "reference": row[10]
+                "reference": row[10],
+                "created_at": row[11]
             })
         
         return transactions
     
-    async def _store_match(
+    async def _get_watermark(
         self,
         client_id: str,
-        source_txn: Dict[str, Any],
-        match: MatchCandidate,
         source_type: ReconciliationSource,
-        status: MatchStatus,
-        auto_matched: bool
-    ) -> str:
-        """Store a reconciliation match in the database."""
-        match_id = str(uuid.uuid4())
+        target_type: TargetType
+    ) -> Optional[ReconciliationWatermark]:
+        """Get the incremental reconciliation watermark for a client."""
+        query = text("""
+            SELECT source_watermark, target_watermark
+            FROM public.reconciliation_watermarks
+            WHERE client_id = :client_id
+            AND source_type = :source_type
+            AND target_type = :target_type
+        """)
+        
+        result = await self.db.execute(query, {
+            "client_id": client_id,
+            "source_type": source_type.value,
+            "target_type": target_type.value
+        })
+        row = result.fetchone()
+        
+        if not row:
+            return None
+        
+        return ReconciliationWatermark(
+            client_id=client_id,
+            source_type=source_type.value,
+            target_type=target_type.value,
+            source_watermark=row[0],
+            target_watermark=row[1]
+        )
+    
+    async def _advance_watermark(
+        self,
+        client_id: str,
+        source_type: ReconciliationSource,
+        target_type: TargetType,
+        source_transactions: List[Dict[str, Any]],
+        targets: List[Dict[str, Any]],
+        watermark: Optional[ReconciliationWatermark]
+    ):
+        """Move the client's watermark to the latest transactions seen by this run."""
+        source_marks = [txn['updated_at'] for txn in source_transactions if txn.get('updated_at')]
+        target_marks = [target['created_at'] for target in targets if target.get('created_at')]
+        if watermark:
+            source_marks += [watermark.source_watermark] if watermark.source_watermark else []
+            target_marks += [watermark.target_watermark] if watermark.target_watermark else []
         
         query = text("""
-            INSERT INTO public.reconciliation_matches (
-                id, client_id, source_transaction_id, source_type,
-                target_transaction_id, target_type, target_reference,
-                match_status, confidence_score, match_type,
-                scoring_breakdown, auto_matched, user_confirmed,
-                created_at, updated_at
+            INSERT INTO public.reconciliation_watermarks (
+                client_id, source_type, target_type,
+                source_watermark, target_watermark, updated_at
             ) VALUES (
-                :id, :client_id, :source_txn_id, :source_type,
-                :target_txn_id, :target_type, :target_reference,
-                :status, :confidence_score, :match_type,
-                :scoring_breakdown, :auto_matched, false,
-                NOW(), NOW()
+                :client_id, :source_type, :target_type,
+                :source_watermark, :target_watermark, NOW()
             )
-            RETURNING id
+            ON CONFLICT (client_id, source_type, target_type) DO UPDATE SET
+                source_watermark = EXCLUDED.source_watermark,
+                target_watermark = EXCLUDED.target_watermark,
+                updated_at = NOW()
+        """)
+        
+        await self.db.execute(query, {
+            "client_id": client_id,
+            "source_type": source_type.value,
+            "target_type": target_type.value,
+            "source_watermark": max(source_marks) if source_marks else None,
+            "target_watermark": max(target_marks) if target_marks else None
+        })
+    
+    async def _get_prior_results(
+        self,
+        client_id: str,
+        source_type: ReconciliationSource,
+        target_type: TargetType,
+        source_transaction_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get the latest reconciliation_matches row for each source transaction."""
+        if not source_transaction_ids:
+            return {}
+        
+        query = text("""
+            SELECT DISTINCT ON (source_transaction_id)
+                id, source_transaction_id, target_transaction_id,
+                match_status, confidence_score,
+                scoring_breakdown->>'target_fingerprint'
+            FROM public.reconciliation_matches
+            WHERE client_id = :client_id
+            AND source_type = :source_type
+            AND target_type = :target_type
+            AND source_transaction_id = ANY(:source_transaction_ids)
+            ORDER BY source_transaction_id, created_at DESC
         """)
         
         result = await self.db.execute(query, {
-            "id": match_id,
             "client_id": client_id,
-            "source_txn_id": source_txn['id'],
             "source_type": source_type.value,
-            "target_txn_id": match.target_id,
+            "target_type": target_type.value,
+            "source_transaction_ids": source_transaction_ids
+        })
+        
+        return {
+            str(row[1]): {
+                "id": str(row[0]),
+                "target_transaction_id": row[2],
+                "match_status": row[3],
+                "confidence_score": float(row[4]) if row[4] else 0,
+                "target_fingerprint": row[5]
+            }
+            for row in result.fetchall()
+        }
+    
+    def _build_match_row(
+        self,
+        client_id: str,
+        source_txn: Dict[str, Any],
+        match: MatchCandidate,
+        source_type: ReconciliationSource,
+        status: MatchStatus,
+        auto_matched: bool,
+        target_fingerprint: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a reconciliation_matches row for a match.
+        
+        The target's fingerprint is kept in scoring_breakdown so an
+        incremental run can tell whether the target changed since.
+        """
+        return {
+            "id": str(uuid.uuid4()),
+            "client_id": client_id,
+            "source_transaction_id": source_txn['id'],
+            "source_type": source_type.value,
+            "target_transaction_id": match.target_id,
             "target_type": match.target_type.value,
             "target_reference": match.target_reference,
-            "status": status.value,
+            "match_status": status.value,
             "confidence_score": match.confidence_score,
             "match_type": match.match_type.value,
-            "scoring_breakdown": json.dumps(match.scoring_breakdown),
+            "scoring_breakdown": json.dumps({
+                **match.scoring_breakdown,
+                "target_fingerprint": target_fingerprint
+            }),
             "auto_matched": auto_matched
-        })
-        
-        row = result.fetchone()
-        
-        # Log match creation
-        log_reconciliation_event(
-            ReconciliationAuditEvent.MATCH_CREATED,
-            client_id,
-            {
-                "source_transaction_id": source_txn['id'],
-                "target_id": match.target_id,
-                "confidence_score": match.confidence_score,
-                "status": status.value,
-                "auto_matched": auto_matched
-            },
-            match_id=match_id
-        )
-        
-        return str(row[0]) if row else match_id
+        }
     
-    async def _store_no_match(
+    def _build_no_match_row(
         self,
         client_id: str,
         source_txn: Dict[str, Any],
         source_type: ReconciliationSource,
+        target_type: TargetType,
         candidates: List[MatchCandidate]
-    ) -> str:
-        """Store a no-match record for audit purposes."""
-        match_id = str(uuid.uuid4())
+    ) -> Dict[str, Any]:
+        """
+        Build a no-match reconciliation_matches row for audit purposes.
         
+        The row records the target type that was searched, so incremental
+        runs only reuse it for that target type.
+        """
         # Store summary of candidates that were considered
         candidates_summary = [
             {
@@ -914,36 +1257,74 @@ class ReconciliationService:
             for c in candidates[:5]  # Top 5 candidates
         ]
         
-        query = text("""
-            INSERT INTO public.reconciliation_matches (
-                id, client_id, source_transaction_id, source_type,
-                target_transaction_id, target_type, target_reference,
-                match_status, confidence_score, match_type,
-                scoring_breakdown, auto_matched, user_confirmed,
-                created_at, updated_at
-            ) VALUES (
-                :id, :client_id, :source_txn_id, :source_type,
-                NULL, 'UNKNOWN', NULL,
-                'NO_MATCH', 0, NULL,
-                :scoring_breakdown, false, false,
-                NOW(), NOW()
-            )
-            RETURNING id
-        """)
-        
-        result = await self.db.execute(query, {
-            "id": match_id,
+        return {
+            "id": str(uuid.uuid4()),
             "client_id": client_id,
-            "source_txn_id": source_txn['id'],
+            "source_transaction_id": source_txn['id'],
             "source_type": source_type.value,
+            "target_transaction_id": None,
+            "target_type": target_type.value,
+            "target_reference": None,
+            "match_status": MatchStatus.NO_MATCH.value,
+            "confidence_score": 0,
+            "match_type": None,
             "scoring_breakdown": json.dumps({
                 "candidates_considered": len(candidates),
                 "top_candidates": candidates_summary
-            })
-        })
+            }),
+            "auto_matched": False
+        }
+    
+    async def _store_match_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert reconciliation_matches rows with chunked multi-row INSERTs.
         
-        row = result.fetchone()
-        return str(row[0]) if row else match_id
+        One round-trip per store_chunk_size rows instead of one per row.
+        MATCH_CREATED is logged for a chunk's matches only once its INSERT
+        has executed. Does not commit; the caller owns the transaction.
+        
+        Returns:
+            Number of rows written
+        """
+        columns = ", ".join(MATCH_INSERT_COLUMNS)
+        
+        for start in range(0, len(rows), self.store_chunk_size):
+            chunk = rows[start:start + self.store_chunk_size]
+            values = []
+            params = {}
+            
+            for i, row in enumerate(chunk):
+                placeholders = []
+                for column in MATCH_INSERT_COLUMNS:
+                    params[f"{column}_{i}"] = row[column]
+                    placeholders.append(f":{column}_{i}")
+                values.append(f"({', '.join(placeholders)}, false, NOW(), NOW())")
+            
+            query = text(f"""
+                INSERT INTO public.reconciliation_matches (
+                    {columns}, user_confirmed, created_at, updated_at
+                ) VALUES {', '.join(values)}
+            """)
+            
+            await self.db.execute(query, params)
+            
+            for row in chunk:
+                if row["match_status"] == MatchStatus.NO_MATCH.value:
+                    continue
+                log_reconciliation_event(
+                    ReconciliationAuditEvent.MATCH_CREATED,
+                    row["client_id"],
+                    {
+                        "source_transaction_id": row["source_transaction_id"],
+                        "target_id": row["target_transaction_id"],
+                        "confidence_score": row["confidence_score"],
+                        "status": row["match_status"],
+                        "auto_matched": row["auto_matched"]
+                    },
+                    match_id=row["id"]
+                )
+        
+        return len(rows)
     
     async def _store_audit_log(
         self,
@@ -31,6 +31,7 @@ from database import get_db
 from middleware.auth import RoleChecker, AuthUser
 
 from bas.service import BASStatementService, BASChangeLogService, BASWorkflowService, BASHistoryService
+from bas.bas_calculator import BASCalculator, BASPeriod, load_period_columns
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +71,13 @@ class SaveBASRequest(BaseModel):
     status: str = Field("draft", description="Status: draft, completed")
 
 
+class CalculateBASRequest(BaseModel):
+    """Request to calculate BAS for one or more clients over a period"""
+    client_ids: List[str] = Field(..., min_length=1, max_length=5000, description="Client IDs")
+    period_from: date = Field(..., description="Period start date")
+    period_to: date = Field(..., description="Period end date")
+
+
 class SignOffRequest(BaseModel):
     """Request to sign off on BAS"""
     review_notes: Optional[str] = Field(None, description="Review notes")
@@ -108,7 +116,7 @@ async def get_bas_status():
             "sign_off": True,
             "pdf_generation": True,
             "change_log": True,
-            "calculate": False,  # Stub - Phase 1
+            "calculate": True,
             "validate": False,   # Stub - Phase 1
             "lodgeit_export": False  # Future
         }
@@ -135,19 +143,45 @@ async def validate_bas(
 
 @router.post("/calculate")
 async def calculate_bas(
-    current_user: AuthUser = Depends(require_bas_write)
+    request: CalculateBASRequest,
+    current_user: AuthUser = Depends(require_bas_write),
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Calculate BAS from transactions.
+    Calculate BAS from bookkeeper transactions.
     
-    **Phase 0 Status:** This endpoint is a stub and will return `not_implemented`.
-    Calculation logic will be added in Phase 1.
+    Computes G1, G2, G3, G10, G11, 1A and 1B for every requested client
+    over the period in one pass. EXCLUDED transactions are ignored.
+    Each result includes a `summary` ready for POST /api/bas/save.
     
     **Permissions:** staff, tax_agent, admin
     """
+    if request.period_from > request.period_to:
+        raise HTTPException(status_code=400, detail="period_from must not be after period_to")
+    
+    client_ids = list(dict.fromkeys(request.client_ids))
+    periods = [BASPeriod(client_id, request.period_from, request.period_to) for client_id in client_ids]
+    
+    try:
+        columns = await load_period_columns(db, periods)
+    except Exception as e:
+        logger.error(f"Failed to load BAS transactions: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    calculator = BASCalculator()
+    results = calculator.calculate_columns(columns)
+    
     return {
-        "status": "not_implemented",
-        "message": "BAS calculation is not implemented yet. This is Phase 0 scaffolding."
+        "period_from": request.period_from.isoformat(),
+        "period_to": request.period_to.isoformat(),
+        "results": [
+            {
+                "client_id": client_id,
+                "bas": calculator.generate_report(bas_fields),
+                "summary": calculator.generate_report(bas_fields, format="summary"),
+            }
+            for client_id, bas_fields in zip(client_ids, results)
+        ]
     }
 
 
@@ -595,6 +629,7 @@ async def get_grouped_history(
     group_by: str = Query("quarter", description="Group by: quarter, month, year"),
     year: Optional[int] = Query(None, description="Filter by year"),
     include_drafts: bool = Query(False, description="Include draft statements"),
+    include_versions: bool = Query(False, description="List every version, not just each period's latest"),
     current_user: AuthUser = Depends(require_bas_read),
     db: AsyncSession = Depends(get_db)
 ):
@@ -609,7 +644,8 @@ async def get_grouped_history(
         client_id=client_id,
         group_by=group_by,
         year=year,
-        include_drafts=include_drafts
+        include_drafts=include_drafts,
+        include_versions=include_versions
     )
 
 
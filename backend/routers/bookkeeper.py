@@ -48,7 +48,7 @@ from services.transaction_service import (
     TransactionCreate, TransactionUpdate, TransactionFilter,
     Transaction, TransactionHistory, PaginatedResult,
     BulkUpdateRequest, WorkpaperLockRequest,
-    PermissionError, LockingError,
+    PermissionError, LockingError, COUNT_EXACT,
     TransactionStatus, GSTCode, TransactionSource, ModuleRouting,
 )
 from services.audit import log_action, AuditAction, ResourceType
@@ -164,6 +164,11 @@ async def list_transactions(
     # Pagination
     cursor: Optional[str] = QueryParam(None, description="Pagination cursor"),
     limit: int = QueryParam(50, ge=1, le=200, description="Results per page"),
+    count_mode: str = QueryParam(
+        COUNT_EXACT,
+        pattern="^(exact|estimated|none)$",
+        description="Total count: exact, estimated (planner estimate) or none"
+    ),
     # Auth - staff, tax_agent, admin can read
     current_user: AuthUser = Depends(require_bookkeeper_read),
     db: AsyncSession = Depends(get_db)
@@ -182,7 +187,9 @@ async def list_transactions(
     - search: Search payee, description, notes
     - flags: Comma-separated (late, duplicate, high_risk)
     
-    Returns paginated results with cursor for next page.
+    Returns paginated results with cursor for next page. The cursor is a
+    keyset over (date, created_at, id), so every page costs the same.
+    Pass count_mode=estimated or none to skip the COUNT(*) when paging.
     
     RBAC: staff ✔️, tax_agent ✔️ (read-only), admin ✔️, client ❌
     """
@@ -210,7 +217,10 @@ async def list_transactions(
     )
     
     repo = TransactionRepository(db)
-    result = await repo.list_transactions(filters, cursor, limit)
+    try:
+        result = await repo.list_transactions(filters, cursor, limit, count_mode=count_mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return result
 
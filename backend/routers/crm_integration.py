@@ -605,6 +605,8 @@ async def ingest_myfdc_transactions(
             "total_count": result.total_count,
             "ingested_count": result.ingested_count,
             "error_count": result.error_count,
+            "inserted_count": result.inserted_count,
+            "updated_count": result.updated_count,
             "normalisation_queued": result.ingested_count > 0,
             "transactions": [
                 {
@@ -198,11 +198,12 @@ async def send_bulk_sms(
     
     **Limits:**
     - Maximum 100 messages per request
-    - Messages are processed in parallel batches of 10
+    - Messages are sent in a sliding window (AGENT5_SMS_BULK_CONCURRENCY),
+      rate limited to AGENT5_SMS_RATE_PER_SECOND
     
     **Security:**
     - Phone numbers and message content are NEVER logged
-    - Only aggregate counts and status are logged
+    - Only counts, status and metadata (phone hash, message ID) are logged
     """
     logger.info(f"Bulk SMS request from {x_internal_service} via {service.name}: {len(request.messages)} messages")
     
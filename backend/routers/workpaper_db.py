@@ -39,7 +39,7 @@ from services.workpaper import (
     WorkpaperJobRepository, ModuleInstanceRepository, TransactionRepository,
     TransactionOverrideRepository, OverrideRecordRepository, QueryRepository,
     QueryMessageRepository, TaskRepository, FreezeSnapshotRepository,
-    WorkpaperAuditLogRepository, EffectiveTransactionBuilder,
+    WorkpaperAuditLogRepository, JobDashboardRepository, EffectiveTransactionBuilder,
 )
 
 from services.audit import log_action, AuditAction, ResourceType
@@ -190,32 +190,11 @@ async def get_job_modules_dashboard(
     db: AsyncSession = Depends(get_db)
 ):
     """Dashboard data: Get all modules for a job with status and outputs."""
-    job_repo = WorkpaperJobRepository(db)
-    module_repo = ModuleInstanceRepository(db)
-    query_repo = QueryRepository(db)
-    
-    job = await job_repo.get_by_client_year(client_id, year)
-    if not job:
+    dashboard = await JobDashboardRepository(db).get_by_client_year(client_id, year)
+    if not dashboard:
         raise HTTPException(status_code=404, detail=f"No job found for {year}")
     
-    modules = await module_repo.list_by_job(job.id)
-    
-    summaries = []
-    for module in modules:
-        open_queries = await query_repo.count_open_by_module(module.id)
-        
-        summaries.append(ModuleSummary(
-            id=module.id,
-            module_type=module.module_type,
-            label=module.label,
-            status=module.status,
-            has_open_queries=open_queries > 0,
-            open_query_count=open_queries,
-            output_summary=module.output_summary or {},
-            frozen_at=module.frozen_at,
-        ))
-    
-    return summaries
+    return dashboard.modules
 
 
 @router.get("/clients/{client_id}/jobs/{year}/dashboard", response_model=JobDashboard)
@@ -225,52 +204,33 @@ async def get_full_dashboard(
     current_user: AuthUser = Depends(require_staff),
     db: AsyncSession = Depends(get_db)
 ):
-    """Full dashboard data: Job with all modules, totals, and query status."""
-    job_repo = WorkpaperJobRepository(db)
-    module_repo = ModuleInstanceRepository(db)
-    query_repo = QueryRepository(db)
-    task_repo = TaskRepository(db)
+    """
+    Full dashboard data: Job with all modules, totals, and query status.
     
-    job = await job_repo.get_by_client_year(client_id, year)
-    if not job:
+    Built in two queries and cached per job until a module, query or
+    task of the job changes.
+    """
+    dashboard = await JobDashboardRepository(db).get_by_client_year(client_id, year)
+    if not dashboard:
         raise HTTPException(status_code=404, detail=f"No job found for {year}")
     
-    modules = await module_repo.list_by_job(job.id)
-    
-    total_deduction = 0
-    total_income = 0
-    open_queries = 0
+    return dashboard
+
+
+@router.get("/dashboards", response_model=List[JobDashboard])
+async def get_dashboards(
+    job_ids: List[str] = QueryParam(..., max_length=200, description="Job IDs (repeat the parameter)"),
+    current_user: AuthUser = Depends(require_staff),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Dashboards for many jobs at once (staff overview).
     
-    module_summaries = []
-    for module in modules:
-        module_queries = await query_repo.count_open_by_module(module.id)
-        open_queries += module_queries
-        
-        if module.output_summary:
-            total_deduction += module.output_summary.get("deduction", 0)
-            total_income += module.output_summary.get("net_income", 0)
-        
-        module_summaries.append(ModuleSummary(
-            id=module.id,
-            module_type=module.module_type,
-            label=module.label,
-            status=module.status,
-            has_open_queries=module_queries > 0,
-            open_query_count=module_queries,
-            output_summary=module.output_summary or {},
-            frozen_at=module.frozen_at,
-        ))
-    
-    tasks = await task_repo.list_by_job(job.id)
-    
-    return JobDashboard(
-        job=job,
-        modules=module_summaries,
-        total_deduction=round(total_deduction, 2),
-        total_income=round(total_income, 2),
-        open_queries=open_queries,
-        has_tasks=len([t for t in tasks if t.status != "completed"]) > 0,
-    )
+    Cached dashboards are reused; the rest are loaded together in two
+    queries. Unknown job IDs are omitted.
+    """
+    dashboards = await JobDashboardRepository(db).get_many(job_ids)
+    return [dashboards[job_id] for job_id in dict.fromkeys(job_ids) if job_id in dashboards]
 
 
 # ==================== MODULES ====================
@@ -22,6 +22,8 @@ from sentry_integration import init_sentry, capture_exception, set_user, set_tag
 
 # Import database and routers
 from database import init_db, get_db
+from services.audit import shutdown_audit_logger
+from services.webhook_service import delivery_engine
 from routers import (
     user_router, admin_router, kb_router, recurring_router, 
     documents_router, auth_router, audit_router, luna_router,
@@ -84,6 +86,15 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down FDC Tax Core API...")
+    
+    # Write any buffered audit entries
+    shutdown_audit_logger()
+    
+    # Close the shared webhook delivery client
+    await delivery_engine.aclose()
+    
+    # Close the shared email client
+    await close_email_client()
 
 
 # Create the main app
@@ -364,7 +375,7 @@ from routers.sms import router as sms_router
 api_router.include_router(sms_router)  # SMS sending (stub in Phase 0)
 
 # Email Integration (Phase 0 - Stub)
-from email_integration.email_router import router as email_router
+from email_integration.email_router import router as email_router, close_email_client
 api_router.include_router(email_router)  # Email sending (stub in Phase 0)
 
 # Identity Spine Module
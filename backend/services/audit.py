@@ -10,10 +10,9 @@ Tracks all key actions for compliance and traceability:
 - Profile changes
 - CRM sync operations
 
-Storage: JSON file (can be migrated to database)
+Storage: daily JSON Lines segments with sidecar indexes (see services/audit_store.py)
 """
 
-import json
 import os
 import uuid
 from datetime import datetime, date, timedelta
@@ -23,16 +22,15 @@ import logging
 from enum import Enum
 from pydantic import BaseModel, Field
 from contextlib import contextmanager
-import threading
+
+from services.audit_store import AuditSegmentStore, BufferedAuditWriter
 
 logger = logging.getLogger(__name__)
 
 # Storage path
 DATA_DIR = Path(__file__).parent.parent / "data"
-AUDIT_LOG_FILE = DATA_DIR / "audit_log.jsonl"  # JSON Lines format for append efficiency
-
-# Thread lock for file writes
-_write_lock = threading.Lock()
+AUDIT_LOG_DIR = DATA_DIR / "audit_log"  # Daily segments + sidecar indexes
+AUDIT_LOG_FILE = DATA_DIR / "audit_log.jsonl"  # Legacy single-file log, migrated on startup
 
 
 # ==================== ENUMS ====================
@@ -227,16 +225,14 @@ class AuditLogger:
         if self._initialized:
             return
         
-        self.log_file = AUDIT_LOG_FILE
-        self._ensure_file_exists()
+        self.store = AuditSegmentStore(AUDIT_LOG_DIR)
+        try:
+            self.store.migrate_legacy(AUDIT_LOG_FILE)
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy audit log: {e}")
+        self.writer = BufferedAuditWriter(self.store)
         self._initialized = True
     
-    def _ensure_file_exists(self):
-        """Ensure the data directory and log file exist"""
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        if not self.log_file.exists():
-            self.log_file.touch()
-    
     def log(
         self,
         action: Union[AuditAction, str],
@@ -294,7 +290,7 @@ class AuditLogger:
             error_message=error_message
         )
         
-        # Write to file
+        # Queue for the background writer
         self._write_entry(entry)
         
         # Log to application logger as well
@@ -310,13 +306,11 @@ class AuditLogger:
         return entry
     
     def _write_entry(self, entry: AuditLogEntry):
-        """Write an entry to the log file (thread-safe)"""
-        with _write_lock:
-            try:
-                with open(self.log_file, 'a') as f:
-                    f.write(json.dumps(entry.model_dump()) + "\n")
-            except Exception as e:
-                logger.error(f"Failed to write audit log: {e}")
+        """Queue an entry for the buffered writer (thread-safe)"""
+        try:
+            self.writer.submit(entry.model_dump())
+        except Exception as e:
+            logger.error(f"Failed to write audit log: {e}")
     
     def _get_client_ip(self, request) -> Optional[str]:
         """Extract client IP from request"""
@@ -353,138 +347,46 @@ class AuditLogger:
         if filter_params is None:
             filter_params = AuditLogFilter()
         
-        logs = []
-        
-        try:
-            with open(self.log_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry_data = json.loads(line)
-                            entry = AuditLogEntry(**entry_data)
-                            
-                            # Apply filters
-                            if not self._matches_filter(entry, filter_params):
-                                continue
-                            
-                            logs.append(entry)
-                        except (json.JSONDecodeError, Exception) as e:
-                            logger.warning(f"Failed to parse audit log entry: {e}")
-        except FileNotFoundError:
-            return []
-        
-        # Sort by timestamp descending (most recent first)
-        logs.sort(key=lambda x: x.timestamp, reverse=True)
-        
-        # Apply pagination
-        start = filter_params.offset
-        end = start + filter_params.limit
-        
-        return logs[start:end]
-    
-    def _matches_filter(self, entry: AuditLogEntry, filter_params: AuditLogFilter) -> bool:
-        """Check if an entry matches the filter criteria"""
-        # Date range filter
-        if filter_params.start_date:
-            entry_date = entry.timestamp[:10]  # YYYY-MM-DD
-            if entry_date < filter_params.start_date:
-                return False
-        
-        if filter_params.end_date:
-            entry_date = entry.timestamp[:10]
-            if entry_date > filter_params.end_date:
-                return False
-        
-        # User filter
-        if filter_params.user_id and entry.user_id != filter_params.user_id:
-            return False
-        
-        # Action filter
-        if filter_params.action and entry.action != filter_params.action:
-            return False
-        
-        # Resource type filter
-        if filter_params.resource_type and entry.resource_type != filter_params.resource_type:
-            return False
-        
-        # Resource ID filter
-        if filter_params.resource_id and entry.resource_id != filter_params.resource_id:
-            return False
+        self.writer.flush()
+        rows = self.store.query(
+            start_date=filter_params.start_date,
+            end_date=filter_params.end_date,
+            user_id=filter_params.user_id,
+            action=filter_params.action,
+            resource_type=filter_params.resource_type,
+            resource_id=filter_params.resource_id,
+            success=filter_params.success,
+            offset=filter_params.offset,
+            limit=filter_params.limit
+        )
         
-        # Success filter
-        if filter_params.success is not None and entry.success != filter_params.success:
-            return False
+        logs = []
+        for entry_data in rows:
+            try:
+                logs.append(AuditLogEntry(**entry_data))
+            except Exception as e:
+                logger.warning(f"Failed to parse audit log entry: {e}")
         
-        return True
+        return logs
     
     def get_entry(self, entry_id: str) -> Optional[AuditLogEntry]:
         """Get a specific audit log entry by ID"""
+        self.writer.flush()
+        entry_data = self.store.get(entry_id)
+        if entry_data is None:
+            return None
         try:
-            with open(self.log_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry_data = json.loads(line)
-                            if entry_data.get('id') == entry_id:
-                                return AuditLogEntry(**entry_data)
-                        except (json.JSONDecodeError, Exception):
-                            continue
-        except FileNotFoundError:
-            pass
-        return None
+            return AuditLogEntry(**entry_data)
+        except Exception:
+            return None
     
     def get_stats(self) -> AuditLogStats:
-        """Get statistics about audit logs"""
+        """Get statistics about audit logs (from incrementally maintained counters)"""
         today = date.today().isoformat()
         week_ago = (date.today() - timedelta(days=7)).isoformat()
         
-        stats = {
-            "total_entries": 0,
-            "entries_today": 0,
-            "entries_this_week": 0,
-            "by_action": {},
-            "by_resource_type": {},
-            "by_user": {},
-            "recent_errors": 0
-        }
-        
-        try:
-            with open(self.log_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry = json.loads(line)
-                            stats["total_entries"] += 1
-                            
-                            entry_date = entry.get("timestamp", "")[:10]
-                            
-                            if entry_date == today:
-                                stats["entries_today"] += 1
-                            
-                            if entry_date >= week_ago:
-                                stats["entries_this_week"] += 1
-                                
-                                if not entry.get("success", True):
-                                    stats["recent_errors"] += 1
-                            
-                            # Count by action
-                            action = entry.get("action", "unknown")
-                            stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
-                            
-                            # Count by resource type
-                            resource_type = entry.get("resource_type", "unknown")
-                            stats["by_resource_type"][resource_type] = stats["by_resource_type"].get(resource_type, 0) + 1
-                            
-                            # Count by user
-                            user = entry.get("user_email") or entry.get("user_id") or "anonymous"
-                            stats["by_user"][user] = stats["by_user"].get(user, 0) + 1
-                            
-                        except (json.JSONDecodeError, Exception):
-                            continue
-        except FileNotFoundError:
-            pass
-        
-        return AuditLogStats(**stats)
+        self.writer.flush()
+        return AuditLogStats(**self.store.stats(today, week_ago))
     
     def get_user_activity(self, user_id: str, limit: int = 50) -> List[AuditLogEntry]:
         """Get recent activity for a specific user"""
@@ -509,42 +411,31 @@ class AuditLogger:
     
     def clear_old_logs(self, days_to_keep: int = 90) -> int:
         """
-        Clear logs older than specified days.
+        Clear logs older than specified days by dropping whole daily segments.
         Returns count of deleted entries.
         
         WARNING: This is destructive. Use with caution.
         """
         cutoff_date = (date.today() - timedelta(days=days_to_keep)).isoformat()
-        kept_entries = []
-        deleted_count = 0
         
-        with _write_lock:
-            try:
-                with open(self.log_file, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            try:
-                                entry = json.loads(line)
-                                entry_date = entry.get("timestamp", "")[:10]
-                                
-                                if entry_date >= cutoff_date:
-                                    kept_entries.append(line)
-                                else:
-                                    deleted_count += 1
-                            except (json.JSONDecodeError, Exception):
-                                kept_entries.append(line)  # Keep malformed entries
-                
-                # Rewrite file with kept entries
-                with open(self.log_file, 'w') as f:
-                    for line in kept_entries:
-                        f.write(line if line.endswith('\n') else line + '\n')
-                
-                logger.info(f"Cleared {deleted_count} old audit log entries")
-                
-            except Exception as e:
-                logger.error(f"Failed to clear old logs: {e}")
+        try:
+            self.writer.flush()
+            deleted_count = self.store.drop_before(cutoff_date)
+            logger.info(f"Cleared {deleted_count} old audit log entries")
+        except Exception as e:
+            logger.error(f"Failed to clear old logs: {e}")
+            deleted_count = 0
         
         return deleted_count
+    
+    def flush(self):
+        """Write queued entries and persist the store's counters and indexes"""
+        self.writer.flush()
+        self.store.persist()
+    
+    def close(self):
+        """Drain the buffered writer (call on application shutdown)"""
+        self.writer.close()
 
 
 # ==================== CONVENIENCE FUNCTIONS ====================
@@ -561,6 +452,12 @@ def get_audit_logger() -> AuditLogger:
     return _audit_logger
 
 
+def shutdown_audit_logger():
+    """Flush and close the audit logger if it was used (FastAPI lifespan shutdown)"""
+    if AuditLogger._instance is not None and AuditLogger._instance._initialized:
+        AuditLogger._instance.close()
+
+
 def log_action(
     action: Union[AuditAction, str],
     resource_type: Union[ResourceType, str],
@@ -0,0 +1,623 @@
+"""
+Segmented Audit Log Store
+
+Audit entries are stored as JSON lines in daily segment files:
+
+    data/audit_log/2025-03-10.jsonl      entries timestamped on that day
+    data/audit_log/2025-03-10.idx.json   sidecar index for the segment
+    data/audit_log/stats.json            per-segment counters
+
+- Sidecar index: byte offsets of each entry by id, user_id, action,
+  resource_type and resource (type + id), plus failures, so filtered
+  queries only read the lines they return
+- Counters: kept per segment and summed incrementally, so stats never
+  scan the log
+- Retention: whole segments are dropped
+- Writes: BufferedAuditWriter queues entries in memory and appends them
+  in batches from a background thread, off the request path
+
+Sidecars and counters are derived data. Each records how many bytes of
+its segment it covers; anything appended since (by this or another
+process, or lost in a crash before the sidecar was persisted) is indexed
+from the segment tail, and a missing or inconsistent sidecar is rebuilt.
+"""
+
+import os
+import re
+import json
+import logging
+import time
+import atexit
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx.json"
+STATS_FILE = "stats.json"
+
+# Entries appended between persisting counters and sidecars
+PERSIST_EVERY = 1000
+
+# Segment indexes held in memory at once (least recently used are unloaded)
+MAX_LOADED_INDEXES = 31
+
+# Buffered writer: flush after this many seconds or entries (interval 0 = write synchronously)
+FLUSH_INTERVAL = float(os.environ.get("AUDIT_FLUSH_INTERVAL", "0.5"))
+FLUSH_SIZE = int(os.environ.get("AUDIT_FLUSH_SIZE", "500"))
+FSYNC = os.environ.get("AUDIT_FSYNC", "true").lower() == "true"
+# Callers write inline once this many entries are queued (backpressure)
+MAX_PENDING = 10000
+
+_SEGMENT_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def segment_date(entry: Dict[str, Any]) -> Optional[str]:
+    """Segment (YYYY-MM-DD) an entry belongs to, from its timestamp."""
+    day = str(entry.get("timestamp") or "")[:10]
+    return day if _SEGMENT_DATE.match(day) else None
+
+
+def index_keys(entry: Dict[str, Any]) -> List[str]:
+    """Sidecar index keys for an entry."""
+    keys = [f"action:{entry.get('action')}", f"type:{entry.get('resource_type')}"]
+    if entry.get("user_id"):
+        keys.append(f"user:{entry['user_id']}")
+    if entry.get("resource_id"):
+        keys.append(f"resource:{entry.get('resource_type')}/{entry['resource_id']}")
+        keys.append(f"resource_id:{entry['resource_id']}")
+    if not entry.get("success", True):
+        keys.append("failed")
+    return keys
+
+
+def filter_keys(
+    user_id: Optional[str] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    success: Optional[bool] = None
+) -> List[str]:
+    """Index keys an entry must have to match a filter (success=True is handled separately)."""
+    keys = []
+    if user_id:
+        keys.append(f"user:{user_id}")
+    if action:
+        keys.append(f"action:{action}")
+    if resource_type and resource_id:
+        keys.append(f"resource:{resource_type}/{resource_id}")
+    elif resource_type:
+        keys.append(f"type:{resource_type}")
+    elif resource_id:
+        keys.append(f"resource_id:{resource_id}")
+    if success is False:
+        keys.append("failed")
+    return keys
+
+
+def _add_count(counts: Dict[str, int], key: str, amount: int = 1):
+    value = counts.get(key, 0) + amount
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+@dataclass
+class SegmentStats:
+    """Counters for one segment; size is the number of bytes counted."""
+    size: int = 0
+    count: int = 0
+    errors: int = 0
+    by_action: Dict[str, int] = field(default_factory=dict)
+    by_resource_type: Dict[str, int] = field(default_factory=dict)
+    by_user: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, entry: Dict[str, Any]):
+        self.count += 1
+        if not entry.get("success", True):
+            self.errors += 1
+        _add_count(self.by_action, entry.get("action") or "unknown")
+        _add_count(self.by_resource_type, entry.get("resource_type") or "unknown")
+        _add_count(self.by_user, entry.get("user_email") or entry.get("user_id") or "anonymous")
+
+    def merge(self, other: "SegmentStats", sign: int = 1):
+        self.count += sign * other.count
+        self.errors += sign * other.errors
+        for mine, theirs in (
+            (self.by_action, other.by_action),
+            (self.by_resource_type, other.by_resource_type),
+            (self.by_user, other.by_user),
+        ):
+            for key, value in theirs.items():
+                _add_count(mine, key, sign * value)
+
+
+@dataclass
+class SegmentIndex:
+    """Byte offsets of a segment's entries; size is the number of bytes indexed."""
+    size: int = 0
+    offsets: List[int] = field(default_factory=list)
+    ids: Dict[str, int] = field(default_factory=dict)
+    postings: Dict[str, List[int]] = field(default_factory=dict)
+
+    def add(self, offset: int, entry: Dict[str, Any]):
+        self.offsets.append(offset)
+        if entry.get("id"):
+            self.ids.setdefault(entry["id"], offset)
+        for key in index_keys(entry):
+            self.postings.setdefault(key, []).append(offset)
+
+    def match(self, keys: List[str], exclude_failed: bool = False) -> List[int]:
+        """Offsets (ascending) of entries having every key."""
+        if keys:
+            lists = sorted((self.postings.get(key, []) for key in keys), key=len)
+            others = [set(offsets) for offsets in lists[1:]]
+            candidates = [o for o in lists[0] if all(o in s for s in others)]
+        else:
+            candidates = self.offsets
+        if exclude_failed and self.postings.get("failed"):
+            failed = set(self.postings["failed"])
+            candidates = [o for o in candidates if o not in failed]
+        return candidates
+
+
+class _Segment:
+    def __init__(self, directory: Path, day: str):
+        self.date = day
+        self.path = directory / f"{day}{SEGMENT_SUFFIX}"
+        self.index_path = directory / f"{day}{INDEX_SUFFIX}"
+        self.stats = SegmentStats()
+        self.index: Optional[SegmentIndex] = None
+        self.index_dirty = False
+
+
+def _scan(path: Path, start: int) -> Iterator[Tuple[int, Optional[Dict[str, Any]], int]]:
+    """Yield (offset, entry or None if unparseable, end) for complete lines from start."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # partially written line
+            end = offset + len(line)
+            entry = None
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping malformed audit log line in {path.name} at {offset}")
+            yield offset, entry if isinstance(entry, dict) else None, end
+            offset = end
+
+
+def _write_json_atomic(path: Path, data: Any):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+class AuditSegmentStore:
+    """
+    Daily-segmented, indexed audit log store.
+
+    Thread-safe within a process. Several processes may append to the
+    same directory; each catches up on the others' appends from the
+    segment tails before answering a query.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        persist_every: int = PERSIST_EVERY,
+        max_loaded_indexes: int = MAX_LOADED_INDEXES
+    ):
+        self.directory = Path(directory)
+        self.persist_every = persist_every
+        self.max_loaded_indexes = max(1, max_loaded_indexes)
+        self._lock = threading.RLock()
+        self._segments: Dict[str, _Segment] = {}
+        self._loaded: "OrderedDict[str, None]" = OrderedDict()
+        self._totals = SegmentStats()
+        self._pending = 0
+        self._open()
+
+    # ---------- loading ----------
+
+    def _open(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        saved = {}
+        try:
+            with open(self.directory / STATS_FILE) as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Rebuilding audit log counters: {e}")
+
+        self._discover(saved)
+
+    def _discover(self, saved: Optional[Dict[str, Any]] = None):
+        """Pick up segment files not known yet (e.g. created by another process)."""
+        for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"):
+            day = path.name[:-len(SEGMENT_SUFFIX)]
+            if day in self._segments or not _SEGMENT_DATE.match(day):
+                continue
+            segment = _Segment(self.directory, day)
+            if saved and day in saved:
+                try:
+                    segment.stats = SegmentStats(**saved[day])
+                except TypeError:
+                    pass
+            self._segments[day] = segment
+            self._totals.merge(segment.stats)
+            self._catch_up(segment)
+
+    def _read_sidecar(self, segment: _Segment) -> SegmentIndex:
+        try:
+            with open(segment.index_path) as f:
+                return SegmentIndex(**json.load(f))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Rebuilding audit index for {segment.date}: {e}")
+        segment.index_dirty = True
+        return SegmentIndex()
+
+    def _load_index(self, segment: _Segment):
+        if segment.index is None:
+            segment.index = self._read_sidecar(segment)
+        self._loaded[segment.date] = None
+        self._loaded.move_to_end(segment.date)
+        while len(self._loaded) > self.max_loaded_indexes:
+            day, _ = self._loaded.popitem(last=False)
+            evicted = self._segments.get(day)
+            if evicted is not None:
+                self._persist_index(evicted)
+                evicted.index = None
+
+    def _catch_up(self, segment: _Segment, with_index: bool = False):
+        """Count (and index) whatever the segment file holds beyond what is covered."""
+        if with_index:
+            self._load_index(segment)
+        try:
+            size = segment.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+
+        if size < segment.stats.size:
+            # Segment was replaced or truncated: recount it
+            self._totals.merge(segment.stats, sign=-1)
+            segment.stats = SegmentStats()
+        if segment.index is not None and size < segment.index.size:
+            segment.index = SegmentIndex()
+            segment.index_dirty = True
+
+        start = segment.stats.size
+        if segment.index is not None:
+            start = min(start, segment.index.size)
+        if start >= size:
+            return
+
+        position = start
+        for offset, entry, end in _scan(segment.path, start):
+            if entry is not None:
+                if offset >= segment.stats.size:
+                    segment.stats.add(entry)
+                    self._totals.add(entry)
+                if segment.index is not None and offset >= segment.index.size:
+                    segment.index.add(offset, entry)
+            position = end
+
+        segment.stats.size = max(segment.stats.size, position)
+        if segment.index is not None and position > segment.index.size:
+            segment.index.size = position
+            segment.index_dirty = True
+
+    # ---------- writing ----------
+
+    def append(self, entries: List[Dict[str, Any]], fsync: bool = False):
+        """Append entries to their daily segments."""
+        lines_by_date: Dict[str, List[bytes]] = {}
+        fallback = None
+        for entry in entries:
+            day = segment_date(entry)
+            if day is None:
+                fallback = fallback or datetime.utcnow().date().isoformat()
+                day = fallback
+            lines_by_date.setdefault(day, []).append((json.dumps(entry) + "\n").encode())
+
+        with self._lock:
+            for day, lines in lines_by_date.items():
+                segment = self._segments.get(day)
+                if segment is None:
+                    segment = self._segments[day] = _Segment(self.directory, day)
+                with open(segment.path, "ab") as f:
+                    f.write(b"".join(lines))
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                self._catch_up(segment)
+                self._pending += len(lines)
+
+            if self._pending >= self.persist_every:
+                self.persist()
+
+    def migrate_legacy(self, legacy_file: Path) -> int:
+        """
+        Move entries from the old single-file log into segments.
+
+        The legacy file is renamed to *.migrated afterwards (malformed
+        lines stay there). Returns the number of entries migrated.
+        """
+        legacy_file = Path(legacy_file)
+        if not legacy_file.exists() or legacy_file.stat().st_size == 0:
+            return 0
+
+        migrated = 0
+        batch = []
+        with open(legacy_file) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict):
+                    batch.append(entry)
+                if len(batch) >= self.persist_every:
+                    self.append(batch)
+                    migrated += len(batch)
+                    batch = []
+        if batch:
+            self.append(batch)
+            migrated += len(batch)
+
+        self.persist()
+        legacy_file.rename(legacy_file.with_name(legacy_file.name + ".migrated"))
+        logger.info(f"Migrated {migrated} audit log entries into segments")
+        return migrated
+
+    def persist(self):
+        """Write counters and dirty sidecar indexes to disk."""
+        with self._lock:
+            try:
+                _write_json_atomic(self.directory / STATS_FILE, {
+                    day: asdict(segment.stats) for day, segment in self._segments.items()
+                })
+                for segment in self._segments.values():
+                    self._persist_index(segment)
+            except Exception as e:
+                logger.error(f"Failed to persist audit log index: {e}")
+            self._pending = 0
+
+    def _persist_index(self, segment: _Segment):
+        if segment.index is not None and segment.index_dirty:
+            _write_json_atomic(segment.index_path, asdict(segment.index))
+            segment.index_dirty = False
+
+    # ---------- reading ----------
+
+    def _read_entries(self, segment: _Segment, offsets: List[int]) -> List[Dict[str, Any]]:
+        entries = []
+        with open(segment.path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    entries.append(json.loads(f.readline()))
+                except ValueError:
+                    continue
+        return entries
+
+    def _dates_desc(self) -> List[str]:
+        self._discover()
+        return sorted(self._segments, reverse=True)
+
+    def query(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        user_id: Optional[str] = None,
+        action: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        success: Optional[bool] = None,
+        offset: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Matching entries, most recent first.
+
+        Date bounds select whole segments; every other filter is answered
+        from the sidecar index, so only the returned page is read.
+        """
+        keys = filter_keys(user_id, action, resource_type, resource_id, success)
+        skip = max(0, offset)
+        results: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return results
+
+        with self._lock:
+            for day in self._dates_desc():
+                if end_date and day > end_date:
+                    continue
+                if start_date and day < start_date:
+                    break
+                segment = self._segments[day]
+                self._catch_up(segment, with_index=True)
+                positions = segment.index.match(keys, exclude_failed=success is True)
+                if skip >= len(positions):
+                    skip -= len(positions)
+                    continue
+                newest_first = positions[::-1][skip:skip + limit - len(results)]
+                skip = 0
+                results.extend(self._read_entries(segment, newest_first))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Entry by id (newest segments are searched first)."""
+        with self._lock:
+            for day in self._dates_desc():
+                segment = self._segments[day]
+                self._catch_up(segment, with_index=True)
+                offset = segment.index.ids.get(entry_id)
+                if offset is not None:
+                    entries = self._read_entries(segment, [offset])
+                    return entries[0] if entries else None
+        return None
+
+    def stats(self, today: str, week_ago: str) -> Dict[str, Any]:
+        """Counters for AuditLogStats, from the incrementally maintained totals."""
+        with self._lock:
+            entries_this_week = 0
+            recent_errors = 0
+            for day in self._dates_desc():
+                if day < week_ago:
+                    break
+                segment = self._segments[day]
+                self._catch_up(segment)
+                entries_this_week += segment.stats.count
+                recent_errors += segment.stats.errors
+
+            today_segment = self._segments.get(today)
+            return {
+                "total_entries": self._totals.count,
+                "entries_today": today_segment.stats.count if today_segment else 0,
+                "entries_this_week": entries_this_week,
+                "by_action": dict(self._totals.by_action),
+                "by_resource_type": dict(self._totals.by_resource_type),
+                "by_user": dict(self._totals.by_user),
+                "recent_errors": recent_errors,
+            }
+
+    # ---------- retention ----------
+
+    def drop_before(self, cutoff_date: str) -> int:
+        """Delete every segment dated before cutoff_date. Returns entries removed."""
+        removed = 0
+        with self._lock:
+            for day in [d for d in self._segments if d < cutoff_date]:
+                segment = self._segments.pop(day)
+                self._catch_up(segment)
+                self._totals.merge(segment.stats, sign=-1)
+                removed += segment.stats.count
+                self._loaded.pop(day, None)
+                for path in (segment.path, segment.index_path):
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+            self.persist()
+        return removed
+
+
+class BufferedAuditWriter:
+    """
+    Queues audit entries in memory and appends them to the store in batches.
+
+    A daemon thread flushes whenever flush_size entries are queued or
+    flush_interval seconds have passed, fsyncing each batch when fsync is
+    set. A batch the store rejects stays queued and is retried after
+    flush_interval. If the writer falls max_pending entries behind, callers
+    write the backlog themselves rather than growing the queue. close() drains
+    the queue; it runs on application shutdown and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        store: AuditSegmentStore,
+        flush_interval: float = FLUSH_INTERVAL,
+        flush_size: int = FLUSH_SIZE,
+        fsync: bool = FSYNC,
+        max_pending: int = MAX_PENDING
+    ):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.flush_size = max(1, flush_size)
+        self.fsync = fsync
+        self.max_pending = max(self.flush_size, max_pending)
+        self._buffer: List[Dict[str, Any]] = []
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        atexit.register(self.close)
+
+    def submit(self, entry: Dict[str, Any]):
+        """Queue an entry (written immediately when buffering is disabled or closed)."""
+        if self.flush_interval <= 0 or self._closed:
+            self.store.append([entry], fsync=self.fsync)
+            return
+
+        with self._condition:
+            self._buffer.append(entry)
+            pending = len(self._buffer)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-writer", daemon=True
+                )
+                self._thread.start()
+            if pending == 1 or pending >= self.flush_size:
+                self._condition.notify()
+
+        if pending >= self.max_pending:
+            self.flush()
+
+    def _run(self):
+        failed = False
+        while True:
+            with self._condition:
+                if failed and not self._closed:
+                    # Back off before retrying a batch the store rejected
+                    self._condition.wait(self.flush_interval)
+                if not self._buffer and not self._closed:
+                    self._condition.wait()
+                if len(self._buffer) < self.flush_size and not self._closed:
+                    self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+            failed = not self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write every queued entry now.
+
+        Returns False if the store rejected the batch; the entries are put
+        back at the front of the queue, in order, for the next flush.
+        """
+        with self._flush_lock:
+            with self._condition:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return True
+            started = time.monotonic()
+            try:
+                self.store.append(batch, fsync=self.fsync)
+            except Exception as e:
+                with self._condition:
+                    self._buffer[:0] = batch
+                logger.error(f"Failed to write {len(batch)} audit log entries, keeping them queued: {e}")
+                return False
+            logger.debug(f"Flushed {len(batch)} audit entries in {time.monotonic() - started:.3f}s")
+            return True
+
+    def close(self, timeout: float = 5.0):
+        """Stop the background thread, drain the queue and persist indexes."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+        self.store.persist()
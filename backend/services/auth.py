@@ -15,7 +15,10 @@ Roles:
 
 import os
 import json
+import time
 import uuid
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from pathlib import Path
@@ -43,6 +46,10 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 DATA_DIR = Path(__file__).parent.parent / "data"
 AUTH_DATA_FILE = DATA_DIR / "auth_roles.json"
 
+# Role/token caching for the auth dependencies
+ROLE_CACHE_CHECK_INTERVAL = float(os.environ.get("AUTH_ROLE_CHECK_INTERVAL", "1.0"))  # seconds between file stats
+TOKEN_CACHE_SIZE = int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", "1024"))  # 0 disables the decoded JWT cache
+
 
 # ==================== ENUMS ====================
 
@@ -117,6 +124,15 @@ class AuthUser(BaseModel):
 
 # ==================== AUTH ROLE STORAGE ====================
 
+def _read_roles_file(file_path: Path) -> Dict:
+    try:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"Error loading roles: {e}")
+        return {"users": {}}
+
+
 class AuthRoleStorage:
     """
     File-based storage for user roles.
@@ -139,36 +155,16 @@ class AuthRoleStorage:
             })
     
     def _load_roles(self) -> Dict:
-        try:
-            with open(self.file_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading roles: {e}")
-            return {"users": {}}
+        return _read_roles_file(self.file_path)
     
     def _save_roles(self, data: Dict):
         with open(self.file_path, 'w') as f:
             json.dump(data, f, indent=2)
+        get_role_resolver(self.file_path).invalidate()
     
     def get_user_role(self, user_id: str, email: str) -> str:
         """Get role for a user"""
-        data = self._load_roles()
-        
-        # Check explicit role assignment
-        if user_id in data.get("users", {}):
-            return data["users"][user_id]
-        
-        # Check email-based role assignment
-        email_lower = email.lower()
-        if email_lower in data.get("_admin_emails", []):
-            return UserRole.admin.value
-        if email_lower in data.get("_staff_emails", []):
-            return UserRole.staff.value
-        if email_lower in data.get("_tax_agent_emails", []):
-            return UserRole.tax_agent.value
-        
-        # Default role
-        return data.get("_default_role", UserRole.client.value)
+        return get_role_resolver(self.file_path).get_user_role(user_id, email)
     
     def set_user_role(self, user_id: str, role: str):
         """Set role for a user"""
@@ -214,6 +210,106 @@ class AuthRoleStorage:
         return data.get("_staff_emails", [])
 
 
+class RoleResolver:
+    """
+    Process-wide, in-memory view of the roles file.
+    
+    The file is parsed once into a user map and email sets, and is
+    re-read only when its mtime/size/inode change. The file is stat'ed at
+    most every check_interval seconds; writes through AuthRoleStorage
+    invalidate the cache immediately.
+    """
+    
+    def __init__(self, file_path: Path = AUTH_DATA_FILE, check_interval: float = ROLE_CACHE_CHECK_INTERVAL):
+        self.file_path = file_path
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._stat = None
+        self._next_check = 0.0
+        self._users: Dict[str, str] = {}
+        self._admin_emails: frozenset = frozenset()
+        self._staff_emails: frozenset = frozenset()
+        self._tax_agent_emails: frozenset = frozenset()
+        self._default_role = UserRole.client.value
+    
+    def invalidate(self):
+        """Force the next lookup to re-check the file"""
+        with self._lock:
+            self._stat = None
+            self._next_check = 0.0
+    
+    def _file_stat(self):
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def _refresh(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            current = self._file_stat()
+            if current is None:
+                # Creates the file with the default roles
+                AuthRoleStorage(self.file_path)
+                current = self._file_stat()
+            if current is None or current != self._stat:
+                self._load(_read_roles_file(self.file_path))
+                self._stat = current
+            self._next_check = now + self.check_interval
+    
+    def _load(self, data: Dict):
+        self._users = dict(data.get("users", {}))
+        self._admin_emails = frozenset(e.lower() for e in data.get("_admin_emails", []))
+        self._staff_emails = frozenset(e.lower() for e in data.get("_staff_emails", []))
+        self._tax_agent_emails = frozenset(e.lower() for e in data.get("_tax_agent_emails", []))
+        self._default_role = data.get("_default_role", UserRole.client.value)
+    
+    def get_user_role(self, user_id: str, email: str) -> str:
+        """Get role for a user"""
+        self._refresh()
+        
+        # Check explicit role assignment
+        role = self._users.get(user_id)
+        if role is not None:
+            return role
+        
+        # Check email-based role assignment
+        email_lower = email.lower()
+        if email_lower in self._admin_emails:
+            return UserRole.admin.value
+        if email_lower in self._staff_emails:
+            return UserRole.staff.value
+        if email_lower in self._tax_agent_emails:
+            return UserRole.tax_agent.value
+        
+        # Default role
+        return self._default_role
+
+
+_role_resolvers: Dict[Path, RoleResolver] = {}
+_role_resolvers_lock = threading.Lock()
+
+
+def get_role_resolver(file_path: Path = AUTH_DATA_FILE) -> RoleResolver:
+    """Get the shared RoleResolver for a roles file"""
+    key = Path(file_path).resolve()
+    resolver = _role_resolvers.get(key)
+    if resolver is None:
+        with _role_resolvers_lock:
+            resolver = _role_resolvers.setdefault(key, RoleResolver(Path(file_path)))
+    return resolver
+
+
+def resolve_user_role(user_id: str, email: str) -> str:
+    """Resolve a user's current role from the shared roles cache"""
+    return get_role_resolver().get_user_role(user_id, email)
+
+
 # ==================== PASSWORD UTILITIES ====================
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -305,6 +401,63 @@ def decode_token(token: str) -> Optional[TokenData]:
         return None
 
 
+class TokenCache:
+    """
+    LRU cache of decoded tokens, each valid until its exp claim.
+    
+    Only successfully decoded tokens with an expiry are cached, so an
+    expired token is always re-validated (and rejected) by decode_token.
+    """
+    
+    def __init__(self, max_entries: int = TOKEN_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, token: str) -> Optional[TokenData]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            token_data, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return token_data
+    
+    def set(self, token: str, token_data: TokenData):
+        if self.max_entries <= 0 or token_data.exp is None:
+            return
+        with self._lock:
+            self._entries[token] = (token_data, token_data.exp.timestamp())
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = TokenCache()
+
+
+def decode_token_cached(token: str) -> Optional[TokenData]:
+    """decode_token with a per-token cache that is valid until exp"""
+    if token_cache.max_entries <= 0:
+        return decode_token(token)
+    token_data = token_cache.get(token)
+    if token_data is None:
+        token_data = decode_token(token)
+        if token_data is not None:
+            token_cache.set(token, token_data)
+    return token_data
+
+
 # ==================== AUTH SERVICE ====================
 
 class AuthService:
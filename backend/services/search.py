@@ -0,0 +1,175 @@
+"""
+Full-Text Search
+
+Shared search engine for the bookkeeper transaction list, bookkeeping-ready
+ingested transactions and client profiles.
+
+Each searchable table has a generated, GIN-indexed tsvector column
+(search_vector) and, for identifier columns (codes, ABNs, receipt numbers),
+pg_trgm GIN indexes so substring matches stay index-served
+(migrations/search_setup.sql).
+
+Query syntax:
+- Bare words match as prefixes: rent -> rent, rental, rentals
+- "Quoted phrases" match adjacent words exactly
+- A trailing * is accepted on bare words (rent*)
+- Terms are ANDed
+- Operators (& | ! <->) are not interpreted
+
+Usage:
+    clause = CLIENT_PROFILES_SEARCH.build(query_str)
+    if clause:
+        conditions.append(clause.condition)
+        params.update(clause.params)
+        order_by = f"{clause.rank} DESC"
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# "quoted phrase" | bare word
+_TOKEN = re.compile(r'"([^"]*)"?|(\S+)')
+
+# A term needs at least one letter or digit to produce a lexeme
+_WORD = re.compile(r"[^\W_]")
+
+# Query syntax characters dropped from substring (ILIKE) matches
+_SYNTAX = re.compile(r'["*]')
+
+
+# ==================== QUERY PARSER ====================
+
+@dataclass(frozen=True)
+class SearchTerm:
+    """One parsed search term: a bare word (prefix match) or a quoted phrase."""
+    text: str
+    phrase: bool = False
+
+    def tsquery_sql(self, config: str, param: str) -> str:
+        """tsquery expression for this term, reading its text from :param."""
+        function = "phraseto_tsquery" if self.phrase else "to_tsquery"
+        return f"{function}('{config}', :{param})"
+
+    def tsquery_param(self) -> str:
+        """
+        Bound value for tsquery_sql.
+
+        Phrases are passed as plain text. Bare words are passed to
+        to_tsquery as one quoted operand with a prefix marker, so the
+        parser still splits them but cannot see operators in them.
+        """
+        if self.phrase:
+            return self.text
+        quoted = self.text.replace("\\", "\\\\").replace("'", "''")
+        return f"'{quoted}':*"
+
+
+def parse_search_query(query: Optional[str]) -> List[SearchTerm]:
+    """
+    Split user search text into terms.
+
+    Only whitespace and quotes are interpreted here. Each term is
+    tokenised by Postgres with the index's text search configuration,
+    so emails, hosts, decimals and paths (john@x.com, netflix.com,
+    12.50) produce the same lexemes as the indexed text.
+    """
+    terms = []
+    for match in _TOKEN.finditer(query or ""):
+        phrase, word = match.groups()
+        text = phrase.strip() if phrase is not None else word.rstrip("*")
+        if not _WORD.search(text):
+            continue
+        terms.append(SearchTerm(text=text, phrase=phrase is not None))
+    return terms
+
+
+def _substring_text(query: str) -> str:
+    """Search text for substring matches, without query syntax."""
+    return " ".join(_SYNTAX.sub(" ", query).split())
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# ==================== SEARCH INDEXES ====================
+
+@dataclass
+class SearchClause:
+    """SQL fragments for one search, to merge into a text() query."""
+    condition: str
+    rank: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """
+    Searchable columns of one table.
+
+    Args:
+        table: Table name used to qualify columns
+        vector_column: Generated tsvector column (GIN-indexed)
+        trigram_columns: pg_trgm GIN-indexed columns matched as substrings
+        config: Text search configuration used by the generated column
+    """
+    table: str
+    vector_column: str = "search_vector"
+    trigram_columns: Tuple[str, ...] = ()
+    config: str = "simple"
+
+    def build(self, query: Optional[str], param: str = "search") -> Optional[SearchClause]:
+        """
+        Build the match condition and rank expression for a search.
+
+        Returns None if the query has no searchable terms.
+        """
+        terms = parse_search_query(query)
+        if not terms:
+            return None
+
+        # One tsquery per term, ANDed; Postgres tokenises each term's text
+        params: Dict[str, Any] = {}
+        queries = []
+        for i, term in enumerate(terms):
+            name = f"{param}_term_{i}"
+            queries.append(term.tsquery_sql(self.config, name))
+            params[name] = term.tsquery_param()
+        tsquery = " && ".join(queries)
+        if len(queries) > 1:
+            tsquery = f"({tsquery})"
+
+        vector = f"{self.table}.{self.vector_column}"
+        matches = [f"{vector} @@ {tsquery}"]
+        rank = f"ts_rank_cd({vector}, {tsquery})"
+
+        if self.trigram_columns:
+            # Identifier substrings (ABN, codes); pg_trgm needs 3+ characters to use the index
+            text = _substring_text(query)
+            similarities = []
+            for column in self.trigram_columns:
+                qualified = f"{self.table}.{column}"
+                matches.append(f"{qualified} ILIKE :{param}_like")
+                similarities.append(f"similarity(COALESCE({qualified}, ''), :{param}_text)")
+            rank = f"({rank} + GREATEST({', '.join(similarities)}))"
+            params[f"{param}_like"] = f"%{_escape_like(text)}%"
+            params[f"{param}_text"] = text
+
+        return SearchClause(condition=f"({' OR '.join(matches)})", rank=rank, params=params)
+
+
+# Bookkeeper ledger: payee, description and notes
+TRANSACTIONS_SEARCH = SearchIndex(table="transactions")
+
+# Ingestion pipeline: vendor, description, notes, categories; receipt numbers as substrings
+INGESTED_TRANSACTIONS_SEARCH = SearchIndex(
+    table="ingested_transactions",
+    trigram_columns=("receipt_number",),
+)
+
+# Client profiles: names; client codes and ABNs as substrings
+CLIENT_PROFILES_SEARCH = SearchIndex(
+    table="client_profiles",
+    trigram_columns=("client_code", "abn"),
+)
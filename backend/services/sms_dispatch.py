@@ -0,0 +1,176 @@
+"""
+Bulk SMS Dispatcher
+
+Shared engine for bulk SMS sends, used by SMSSender.send_bulk (Twilio)
+and SMSProxyService.send_bulk_sms (Agent 5).
+
+Features:
+- Sliding window: up to max_concurrency sends in flight, and a new send
+  starts as soon as any finishes (no waiting on the slowest of a batch)
+- Token-bucket rate limiting matched to the provider's send rate
+- Results streamed as they complete
+- Completed outcomes handed to an optional callback in batches, so audit
+  rows are written with one round trip per batch
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== CONFIGURATION ====================
+
+# Max sends in flight per bulk dispatch
+SMS_BULK_CONCURRENCY = int(os.environ.get('SMS_BULK_CONCURRENCY', '10'))
+
+# Completed outcomes per audit batch
+SMS_BULK_AUDIT_BATCH_SIZE = int(os.environ.get('SMS_BULK_AUDIT_BATCH_SIZE', '100'))
+
+
+# ==================== RATE LIMITING ====================
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Tokens refill continuously at rate_per_second up to burst; each
+    acquire takes one token, waiting for a refill when the bucket is
+    empty. A rate of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate_per_second: float, burst: Optional[float] = None):
+        self.rate = rate_per_second
+        self.capacity = max(1.0, burst if burst is not None else rate_per_second)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Take one token, waiting until one is available."""
+        if self.rate <= 0:
+            return
+
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+# ==================== DISPATCHER ====================
+
+@dataclass
+class DispatchOutcome:
+    """Outcome of one send in a bulk dispatch."""
+    index: int
+    item: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+
+class BulkSMSDispatcher:
+    """
+    Sliding-window, rate-limited bulk sender.
+
+    Usage:
+        dispatcher = BulkSMSDispatcher(max_concurrency=10, rate_per_second=20)
+        async for outcome in dispatcher.stream(messages, lambda i, message: sender.send(message)):
+            ...
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = SMS_BULK_CONCURRENCY,
+        rate_per_second: float = 0,
+        burst: Optional[float] = None,
+        audit_batch_size: int = SMS_BULK_AUDIT_BATCH_SIZE
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self.audit_batch_size = max(1, audit_batch_size)
+
+    async def _send_one(
+        self,
+        index: int,
+        item: Any,
+        send: Callable[[int, Any], Awaitable[Any]]
+    ) -> DispatchOutcome:
+        await self.bucket.acquire()
+        try:
+            return DispatchOutcome(index=index, item=item, result=await send(index, item))
+        except Exception as e:
+            logger.warning(f"Bulk SMS send {index} raised: {e}")
+            return DispatchOutcome(index=index, item=item, error=e)
+
+    async def stream(
+        self,
+        items: Iterable[Any],
+        send: Callable[[int, Any], Awaitable[Any]],
+        on_batch: Optional[Callable[[List[DispatchOutcome]], Awaitable[None]]] = None
+    ) -> AsyncIterator[DispatchOutcome]:
+        """
+        Send every item, yielding outcomes in completion order.
+
+        Args:
+            items: Messages to send
+            send: Coroutine function sending one message, called with (index, item)
+            on_batch: Optional coroutine called with every audit_batch_size
+                completed outcomes (and once more with the remainder)
+        """
+        queue = enumerate(items)
+        pending = set()
+        buffer: List[DispatchOutcome] = []
+
+        def fill():
+            while len(pending) < self.max_concurrency:
+                try:
+                    index, item = next(queue)
+                except StopIteration:
+                    return
+                pending.add(asyncio.ensure_future(self._send_one(index, item, send)))
+
+        fill()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+                fill()
+
+                outcomes = sorted((task.result() for task in done), key=lambda o: o.index)
+                if on_batch is not None:
+                    buffer.extend(outcomes)
+                    if len(buffer) >= self.audit_batch_size:
+                        await on_batch(buffer)
+                        buffer = []
+
+                for outcome in outcomes:
+                    yield outcome
+
+            if on_batch is not None and buffer:
+                await on_batch(buffer)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run(
+        self,
+        items: Iterable[Any],
+        send: Callable[[int, Any], Awaitable[Any]],
+        on_batch: Optional[Callable[[List[DispatchOutcome]], Awaitable[None]]] = None
+    ) -> List[DispatchOutcome]:
+        """Send every item and return outcomes in input order."""
+        outcomes = [outcome async for outcome in self.stream(items, send, on_batch)]
+        outcomes.sort(key=lambda o: o.index)
+        return outcomes
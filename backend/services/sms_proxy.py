@@ -11,6 +11,8 @@ Features:
 - 503 fallback handling
 - Audit logging (no sensitive data)
 - Rate limiting support
+- Bulk sends via the shared sliding-window dispatcher, with results
+  streamed as they complete and per-message audit rows written in batches
 
 Security:
 - All requests must include x-internal-service and x-internal-token headers
@@ -24,8 +26,9 @@ import json
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -33,6 +36,8 @@ import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from services.sms_dispatch import BulkSMSDispatcher, DispatchOutcome
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,7 +49,9 @@ def get_agent5_config() -> Dict[str, Any]:
         'url': os.environ.get('AGENT5_SMS_URL', 'https://agent5-sms.internal.fdccore.com/api/sms'),
         'token': os.environ.get('AGENT5_SMS_TOKEN', ''),
         'timeout': int(os.environ.get('AGENT5_SMS_TIMEOUT', '30')),
-        'max_retries': int(os.environ.get('AGENT5_SMS_MAX_RETRIES', '3'))
+        'max_retries': int(os.environ.get('AGENT5_SMS_MAX_RETRIES', '3')),
+        'rate_per_second': float(os.environ.get('AGENT5_SMS_RATE_PER_SECOND', '20')),
+        'bulk_concurrency': int(os.environ.get('AGENT5_SMS_BULK_CONCURRENCY', '10'))
     }
 
 
@@ -180,6 +187,49 @@ async def log_sms_audit(
         logger.warning(f"SMS Proxy FAILED: {event_type.value}", extra=log_entry)
 
 
+async def log_sms_audit_many(
+    db: AsyncSession,
+    events: List[Tuple[AuditEventType, str, str, Dict[str, Any], bool]],
+):
+    """
+    Log many (event_type, request_id, service_name, metadata, success)
+    SMS proxy audit events with one multi-row INSERT and one commit.
+    
+    SECURITY: Never log phone numbers or message content.
+    """
+    if not events:
+        return
+    
+    now = datetime.now(timezone.utc)
+    params = {'performed_by': 'sms_proxy', 'created_at': now}
+    rows = []
+    for i, (event_type, request_id, service_name, metadata, success) in enumerate(events):
+        safe_metadata = {k: v for k, v in metadata.items()
+                        if k not in ['to', 'phone', 'message', 'content', 'body']}
+        rows.append(f"(:id_{i}, :event_type_{i}, NULL, :service_name_{i}, :details_{i}, :performed_by, :created_at)")
+        params[f'id_{i}'] = str(uuid.uuid4())
+        params[f'event_type_{i}'] = event_type.value
+        params[f'service_name_{i}'] = service_name
+        params[f'details_{i}'] = json.dumps({
+            'request_id': request_id,
+            'success': success,
+            **safe_metadata
+        })
+    
+    separator = ",\n"
+    query = text(f"""
+        INSERT INTO public.webhook_audit_log 
+        (id, event_type, webhook_id, service_name, details, performed_by, created_at)
+        VALUES {separator.join(rows)}
+    """)
+    
+    try:
+        await db.execute(query, params)
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to log {len(events)} SMS audit events: {e}")
+
+
 # ==================== SMS PROXY SERVICE ====================
 
 class SMSProxyService:
@@ -279,7 +329,33 @@ class SMSProxyService:
         """
         Send multiple SMS messages via Agent 5.
         
-        Processes in parallel with concurrency limit.
+        Runs through stream_bulk_sms; results are returned in input order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        
+        async for index, result in self.stream_bulk_sms(requests, service_name):
+            results[index] = result
+        
+        sent = sum(1 for result in results if result['success'])
+        return BulkSMSResult(
+            total=len(requests),
+            sent=sent,
+            failed=len(requests) - sent,
+            results=results
+        )
+    
+    async def stream_bulk_sms(
+        self,
+        requests: List[SMSSendRequest],
+        service_name: str
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Send multiple SMS messages via Agent 5, yielding (index, result)
+        as each completes.
+        
+        Sends run in a sliding window of AGENT5_SMS_BULK_CONCURRENCY,
+        paced to AGENT5_SMS_RATE_PER_SECOND, over one shared HTTP client.
+        Per-message audit rows are written in batches.
         """
         request_id = str(uuid.uuid4())
         
@@ -289,39 +365,40 @@ class SMSProxyService:
             {'count': len(requests), 'source': requests[0].source if requests else 'unknown'}
         )
         
-        results = []
+        dispatcher = BulkSMSDispatcher(
+            max_concurrency=self.config['bulk_concurrency'],
+            rate_per_second=self.config['rate_per_second']
+        )
+        
+        async def audit_batch(outcomes: List[DispatchOutcome]):
+            events = []
+            for outcome in outcomes:
+                result = self._bulk_result(outcome)
+                metadata = outcome.item.get_safe_metadata()
+                if result['success']:
+                    event_type = AuditEventType.SMS_PROXY_SUCCESS
+                    metadata['message_id'] = result['message_id']
+                else:
+                    event_type = AuditEventType.SMS_PROXY_FAILURE
+                    metadata['error'] = (result['error'] or 'Unknown')[:100]
+                events.append((event_type, f"{request_id}-{outcome.index}", service_name, metadata, result['success']))
+            await log_sms_audit_many(self.db, events)
+        
         sent = 0
         failed = 0
         
-        # Process in batches of 10 for concurrency control
-        batch_size = 10
-        for i in range(0, len(requests), batch_size):
-            batch = requests[i:i + batch_size]
-            tasks = [self._forward_to_agent5(req, f"{request_id}-{j}") for j, req in enumerate(batch, i)]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        limits = httpx.Limits(max_connections=self.config['bulk_concurrency'])
+        async with httpx.AsyncClient(timeout=self.config['timeout'], limits=limits) as client:
+            async def send(index: int, req: SMSSendRequest) -> SMSProxyResponse:
+                return await self._forward_to_agent5(req, f"{request_id}-{index}", client)
             
-            for req, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    results.append({
-                        'success': False,
-                        'error': str(result),
-                        'phone_hash': hashlib.sha256(req.to.encode()).hexdigest()[:12]
-                    })
-                    failed += 1
-                elif result.success:
-                    results.append({
-                        'success': True,
-                        'message_id': result.message_id,
-                        'phone_hash': hashlib.sha256(req.to.encode()).hexdigest()[:12]
-                    })
+            async for outcome in dispatcher.stream(requests, send, on_batch=audit_batch):
+                result = self._bulk_result(outcome)
+                if result['success']:
                     sent += 1
                 else:
-                    results.append({
-                        'success': False,
-                        'error': result.error,
-                        'phone_hash': hashlib.sha256(req.to.encode()).hexdigest()[:12]
-                    })
                     failed += 1
+                yield outcome.index, result
         
         # Log bulk result
         await log_sms_audit(
@@ -331,26 +408,31 @@ class SMSProxyService:
             {'total': len(requests), 'sent': sent, 'failed': failed},
             success=(failed == 0)
         )
-        
-        return BulkSMSResult(
-            total=len(requests),
-            sent=sent,
-            failed=failed,
-            results=results
-        )
+    
+    @staticmethod
+    def _bulk_result(outcome: DispatchOutcome) -> Dict[str, Any]:
+        """Per-message bulk result (no phone number or content)."""
+        phone_hash = hashlib.sha256(outcome.item.to.encode()).hexdigest()[:12]
+        if outcome.error is not None:
+            return {'success': False, 'error': str(outcome.error), 'phone_hash': phone_hash}
+        if outcome.result.success:
+            return {'success': True, 'message_id': outcome.result.message_id, 'phone_hash': phone_hash}
+        return {'success': False, 'error': outcome.result.error, 'phone_hash': phone_hash}
     
     async def _forward_to_agent5(
         self,
         request: SMSSendRequest,
-        request_id: str
+        request_id: str,
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> SMSProxyResponse:
         """
         Forward SMS request to Agent 5.
         
-        Internal method - handles the actual HTTP call.
+        Internal method - handles the actual HTTP call. Bulk sends pass a
+        shared http_client; single sends open their own.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.config['timeout']) as client:
+            async with self._client_scope(http_client) as client:
                 response = await client.post(
                     f"{self.config['url']}/send",
                     json={
@@ -409,6 +491,15 @@ class SMSProxyService:
                 error=f"Unexpected error: {str(e)[:100]}"
             )
     
+    @asynccontextmanager
+    async def _client_scope(self, http_client: Optional[httpx.AsyncClient]):
+        """Yield the shared client, or a short-lived one when none is given."""
+        if http_client is not None:
+            yield http_client
+        else:
+            async with httpx.AsyncClient(timeout=self.config['timeout']) as client:
+                yield client
+    
     async def check_health(self) -> Dict[str, Any]:
         """
         Check Agent 5 SMS service health.
@@ -13,9 +13,14 @@ Business logic for:
 from datetime import datetime, date, timezone
 from typing import List, Optional, Dict, Any, Tuple
 from decimal import Decimal
+import json
 import logging
 
-from sqlalchemy import select, update, delete, and_, or_, func, cast, String, Boolean
+from sqlalchemy import (
+    select, update, delete, and_, func, cast, String, Boolean,
+    text, bindparam, tuple_
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
@@ -25,6 +30,7 @@ from database.transaction_models import (
     TransactionStatus, GSTCode, TransactionSource, ModuleRouting,
     HistoryActionType, STATUS_HIERARCHY
 )
+from services.search import TRANSACTIONS_SEARCH
 
 logger = logging.getLogger(__name__)
 
@@ -129,10 +135,18 @@ class WorkpaperLockRequest(BaseModel):
     period: str
 
 
+# Total count strategies for list_transactions
+COUNT_EXACT = "exact"          # COUNT(*) over the filtered set
+COUNT_ESTIMATED = "estimated"  # Planner row estimate (EXPLAIN), no scan
+COUNT_NONE = "none"            # No count (total is None)
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATED, COUNT_NONE)
+
+
 class PaginatedResult(BaseModel):
     """Paginated result with cursor"""
     items: List[Transaction]
-    total: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
     cursor: Optional[str] = None
     has_more: bool = False
 
@@ -163,6 +177,19 @@ def _format_datetime(dt: Optional[datetime]) -> Optional[str]:
     return dt.isoformat()
 
 
+def _encode_cursor(db_obj: "BookkeeperTransactionDB") -> str:
+    """Keyset cursor over the full list sort tuple: "date|created_at|id" """
+    return f"{db_obj.date.isoformat()}|{db_obj.created_at.isoformat()}|{db_obj.id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[date, datetime, str]:
+    """Parse a keyset cursor; raises ValueError if malformed"""
+    parts = cursor.split("|")
+    if len(parts) != 3:
+        raise ValueError("Invalid cursor")
+    return date.fromisoformat(parts[0]), datetime.fromisoformat(parts[1]), parts[2]
+
+
 def _db_to_transaction(db_obj: "BookkeeperTransactionDB", attachment_count: int = 0) -> Transaction:
     """Convert database model to Pydantic model"""
     return Transaction(
@@ -352,11 +379,26 @@ class TransactionRepository:
         filters: TransactionFilter,
         cursor: Optional[str] = None,
         limit: int = 50,
+        count_mode: str = COUNT_EXACT,
     ) -> PaginatedResult:
-        """List transactions with filters and cursor-based pagination"""
+        """
+        List transactions with filters and keyset pagination.
+        
+        Rows are ordered by (date, created_at, id) descending and the
+        cursor encodes that whole tuple, so each page is a row-value
+        comparison served by ix_bk_transactions_client_date rather than
+        an offset re-scan.
+        
+        count_mode: "exact" (COUNT(*)), "estimated" (planner estimate,
+        total_is_estimate=True) or "none" (total is None).
+        
+        Raises:
+            ValueError: Malformed cursor or unknown count_mode
+        """
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Invalid count_mode: {count_mode}")
         
         query = select(BookkeeperTransactionDB)
-        count_query = select(func.count(BookkeeperTransactionDB.id))
         
         # Build filter conditions
         conditions = []
@@ -403,43 +445,37 @@ class TransactionRepository:
             else:
                 conditions.append(~BookkeeperTransactionDB.id.in_(subq))
         
-        # Search (payee, description, notes)
+        # Search (payee, description, notes) via the search_vector GIN index
         if filters.search:
-            search_term = f"%{filters.search}%"
-            conditions.append(
-                or_(
-                    BookkeeperTransactionDB.payee_raw.ilike(search_term),
-                    BookkeeperTransactionDB.description_raw.ilike(search_term),
-                    BookkeeperTransactionDB.notes_client.ilike(search_term),
-                    BookkeeperTransactionDB.notes_bookkeeper.ilike(search_term),
-                )
-            )
+            search = TRANSACTIONS_SEARCH.build(filters.search)
+            if search:
+                conditions.append(text(search.condition).bindparams(**search.params))
         
         # Apply conditions
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
         
         # Get total count
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-        
-        # Cursor-based pagination (using created_at + id)
+        total = None
+        if count_mode == COUNT_EXACT:
+            count_query = select(func.count(BookkeeperTransactionDB.id))
+            if conditions:
+                count_query = count_query.where(and_(*conditions))
+            total_result = await self.session.execute(count_query)
+            total = total_result.scalar() or 0
+        elif count_mode == COUNT_ESTIMATED:
+            total = await self._estimate_rows(query.with_only_columns(BookkeeperTransactionDB.id))
+        
+        # Keyset pagination on the full sort tuple
         if cursor:
-            # Cursor format: "created_at|id"
-            cursor_parts = cursor.split("|")
-            if len(cursor_parts) == 2:
-                cursor_time = datetime.fromisoformat(cursor_parts[0])
-                cursor_id = cursor_parts[1]
-                query = query.where(
-                    or_(
-                        BookkeeperTransactionDB.created_at < cursor_time,
-                        and_(
-                            BookkeeperTransactionDB.created_at == cursor_time,
-                            BookkeeperTransactionDB.id < cursor_id
-                        )
-                    )
-                )
+            cursor_date, cursor_time, cursor_id = _decode_cursor(cursor)
+            query = query.where(
+                tuple_(
+                    BookkeeperTransactionDB.date,
+                    BookkeeperTransactionDB.created_at,
+                    BookkeeperTransactionDB.id
+                ) < tuple_(cursor_date, cursor_time, cursor_id)
+            )
         
         # Order and limit
         query = query.order_by(
@@ -480,16 +516,31 @@ class TransactionRepository:
         # Generate next cursor
         next_cursor = None
         if has_more and db_items:
-            last = db_items[-1]
-            next_cursor = f"{last.created_at.isoformat()}|{last.id}"
+            next_cursor = _encode_cursor(db_items[-1])
         
         return PaginatedResult(
             items=items,
             total=total,
+            total_is_estimate=count_mode == COUNT_ESTIMATED,
             cursor=next_cursor,
             has_more=has_more,
         )
     
+    async def _estimate_rows(self, query) -> int:
+        """Planner row estimate for a query (EXPLAIN, no execution)"""
+        compiled = query.compile(dialect=postgresql.dialect(paramstyle="named"))
+        explain = text(f"EXPLAIN (FORMAT JSON) {compiled}").bindparams(
+            *(
+                bindparam(key, value, type_=compiled.binds[key].type)
+                for key, value in compiled.params.items()
+            )
+        )
+        result = await self.session.execute(explain)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    
     # ==================== UPDATE ====================
     
     async def update(
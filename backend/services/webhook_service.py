@@ -10,6 +10,12 @@ Features:
 - Retry queue with exponential backoff
 - Dead-letter queue for persistent failures
 - Audit logging for all webhook operations
+- Concurrent delivery: batches claimed with FOR UPDATE SKIP LOCKED,
+  delivered over a shared keep-alive client with a per-URL in-flight cap,
+  and results written back in batched statements
+- Batched fan-out: dispatch_events queues every subscriber of many events
+  with one multi-row INSERT and one commit; active subscriptions per
+  event type are cached and invalidated on registration changes
 
 Event Types:
 - myfdc.profile.updated
@@ -20,15 +26,17 @@ Event Types:
 - myfdc.attendance.logged
 """
 
+import os
 import asyncio
 import hashlib
 import hmac
 import json
 import logging
 import secrets
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -75,6 +83,15 @@ MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAYS = [60, 300, 900]  # 1 min, 5 min, 15 min (exponential backoff)
 DELIVERY_TIMEOUT = 10  # seconds
 
+# Delivery engine configuration
+DELIVERY_CONCURRENCY = int(os.environ.get("WEBHOOK_DELIVERY_CONCURRENCY", "20"))  # requests in flight per process
+MAX_IN_FLIGHT_PER_URL = int(os.environ.get("WEBHOOK_MAX_IN_FLIGHT_PER_URL", "4"))
+CLAIM_LEASE_SECONDS = int(os.environ.get("WEBHOOK_CLAIM_LEASE_SECONDS", "120"))  # claimed items hidden from other workers
+
+# Fan-out configuration
+SUBSCRIPTION_CACHE_TTL = float(os.environ.get("WEBHOOK_SUBSCRIPTION_CACHE_TTL", "60"))  # seconds; bounds staleness across processes
+QUEUE_INSERT_CHUNK_SIZE = 1000  # rows per multi-row INSERT (8 bind parameters each)
+
 
 # ==================== DATA CLASSES ====================
 
@@ -149,6 +166,142 @@ async def log_webhook_audit(
                 extra={'webhook_id': webhook_id, 'details': safe_details})
 
 
+async def log_webhook_audit_many(
+    db: AsyncSession,
+    events: List[Dict[str, Any]]
+):
+    """
+    Log many webhook audit events in one multi-row INSERT.
+    
+    Each event has event_type, webhook_id, service_name, details and
+    performed_by. Does not commit; the caller owns the transaction.
+    """
+    if not events:
+        return
+    
+    now = datetime.now(timezone.utc)
+    params = {}
+    rows = []
+    for i, event in enumerate(events):
+        rows.append(
+            f"(:id_{i}, :event_type_{i}, :webhook_id_{i}, :service_name_{i}, "
+            f":details_{i}, :performed_by_{i}, :created_at_{i})"
+        )
+        safe_details = {k: v for k, v in event['details'].items()
+                        if k not in ['secret_key', 'signature', 'payload']}
+        params.update({
+            f'id_{i}': str(uuid.uuid4()),
+            f'event_type_{i}': event['event_type'].value,
+            f'webhook_id_{i}': event['webhook_id'],
+            f'service_name_{i}': event['service_name'],
+            f'details_{i}': json.dumps(safe_details),
+            f'performed_by_{i}': event['performed_by'],
+            f'created_at_{i}': now
+        })
+    
+    separator = ",\n"
+    query = text(f"""
+        INSERT INTO public.webhook_audit_log 
+        (id, event_type, webhook_id, service_name, details, performed_by, created_at)
+        VALUES {separator.join(rows)}
+    """)
+    await db.execute(query, params)
+
+
+# ==================== DELIVERY ENGINE ====================
+
+class WebhookDeliveryEngine:
+    """
+    Process-wide delivery resources shared by every WebhookService.
+    
+    Holds one pooled keep-alive httpx client, a global in-flight limit
+    and a per-URL semaphore so one slow subscriber can only occupy
+    max_in_flight_per_url delivery slots.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int = DELIVERY_CONCURRENCY,
+        max_in_flight_per_url: int = MAX_IN_FLIGHT_PER_URL,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_in_flight_per_url = max(1, max_in_flight_per_url)
+        self._client = client
+        self._owns_client = client is None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._url_slots: Dict[str, asyncio.Semaphore] = {}
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=DELIVERY_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+            self._owns_client = True
+        return self._client
+    
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        return self._slots
+    
+    def url_slots(self, url: str) -> asyncio.Semaphore:
+        semaphore = self._url_slots.get(url)
+        if semaphore is None:
+            semaphore = self._url_slots[url] = asyncio.Semaphore(self.max_in_flight_per_url)
+        return semaphore
+    
+    async def aclose(self):
+        """Close the shared client (FastAPI lifespan shutdown)."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+        self._slots = None
+        self._url_slots.clear()
+
+
+delivery_engine = WebhookDeliveryEngine()
+
+
+class SubscriptionCache:
+    """
+    Active webhook subscriptions per event type.
+    
+    Entries expire after ttl_seconds; registration changes made through
+    WebhookService clear the cache immediately in this process.
+    """
+    
+    def __init__(self, ttl_seconds: float = SUBSCRIPTION_CACHE_TTL):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, List[Tuple[str, str, str]]]] = {}
+    
+    def get(self, event_type: str) -> Optional[List[Tuple[str, str, str]]]:
+        entry = self._entries.get(event_type)
+        if entry is None:
+            return None
+        expires_at, webhooks = entry
+        if expires_at <= time.monotonic():
+            del self._entries[event_type]
+            return None
+        return webhooks
+    
+    def set(self, event_type: str, webhooks: List[Tuple[str, str, str]]):
+        if self.ttl_seconds > 0:
+            self._entries[event_type] = (time.monotonic() + self.ttl_seconds, webhooks)
+    
+    def invalidate(self):
+        self._entries.clear()
+
+
+subscription_cache = SubscriptionCache()
+
+
 # ==================== WEBHOOK SERVICE ====================
 
 class WebhookService:
@@ -159,8 +312,15 @@ class WebhookService:
     when MyFDC data is submitted to Core.
     """
     
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        engine: Optional[WebhookDeliveryEngine] = None,
+        subscriptions: Optional[SubscriptionCache] = None
+    ):
         self.db = db
+        self.engine = engine or delivery_engine
+        self.subscriptions = subscriptions or subscription_cache
     
     # ==================== REGISTRATION ====================
     
@@ -203,6 +363,7 @@ class WebhookService:
             'created_by': registered_by
         })
         await self.db.commit()
+        self.subscriptions.invalidate()
         
         # Audit log
         await log_webhook_audit(
@@ -293,6 +454,7 @@ class WebhookService:
         """)
         await self.db.execute(query, {'id': webhook_id})
         await self.db.commit()
+        self.subscriptions.invalidate()
         
         # Audit log
         await log_webhook_audit(
@@ -326,6 +488,7 @@ class WebhookService:
             'updated_at': datetime.now(timezone.utc)
         })
         await self.db.commit()
+        self.subscriptions.invalidate()
         
         # Audit log
         await log_webhook_audit(
@@ -351,37 +514,65 @@ class WebhookService:
         Queues the event for delivery with retry support.
         Does NOT include sensitive data in payload.
         """
-        # Find all active webhooks subscribed to this event
-        query = text("""
-            SELECT id, service_name, url, secret_key
-            FROM public.webhook_registrations
-            WHERE is_active = TRUE
-            AND :event_type = ANY(events)
-        """)
-        result = await self.db.execute(query, {'event_type': event_type.value})
-        webhooks = result.fetchall()
+        await self.dispatch_events([(event_type, client_id, data_id)])
+    
+    async def dispatch_events(
+        self,
+        events: List[Tuple[WebhookEventType, str, str]]
+    ) -> int:
+        """
+        Dispatch many (event_type, client_id, data_id) events.
         
-        if not webhooks:
-            logger.debug(f"No webhooks registered for event {event_type.value}")
-            return
+        Every subscriber of every event is queued with one multi-row
+        INSERT and a single commit. Returns the number of deliveries queued.
+        """
+        subscribers = await self._get_subscribers({event_type.value for event_type, _, _ in events})
         
-        # Create payload (no sensitive data)
-        payload = WebhookPayload(
-            event=event_type.value,
-            client_id=client_id,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            data_id=data_id
-        )
+        deliveries = []
+        for event_type, client_id, data_id in events:
+            webhooks = subscribers.get(event_type.value, [])
+            if not webhooks:
+                logger.debug(f"No webhooks registered for event {event_type.value}")
+                continue
+            
+            # Create payload (no sensitive data)
+            payload = WebhookPayload(
+                event=event_type.value,
+                client_id=client_id,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                data_id=data_id
+            ).to_dict()
+            
+            for webhook_id, _, _ in webhooks:
+                deliveries.append((webhook_id, event_type.value, payload))
         
-        # Queue delivery for each webhook
-        for webhook in webhooks:
-            await self._queue_delivery(
-                webhook_id=str(webhook.id),
-                event_type=event_type.value,
-                payload=payload.to_dict()
-            )
+        if not deliveries:
+            return 0
+        
+        await self._queue_deliveries(deliveries)
+        await self.db.commit()
         
-        logger.info(f"Queued {event_type.value} event for {len(webhooks)} webhook(s)")
+        logger.info(f"Queued {len(deliveries)} webhook deliveries for {len(events)} event(s)")
+        return len(deliveries)
+    
+    async def _get_subscribers(self, event_types: set) -> Dict[str, List[Tuple[str, str, str]]]:
+        """Active (id, service_name, url) subscribers per event type, via the cache."""
+        subscribers = {}
+        for event_type in sorted(event_types):
+            webhooks = self.subscriptions.get(event_type)
+            if webhooks is None:
+                # Find all active webhooks subscribed to this event
+                query = text("""
+                    SELECT id, service_name, url
+                    FROM public.webhook_registrations
+                    WHERE is_active = TRUE
+                    AND :event_type = ANY(events)
+                """)
+                result = await self.db.execute(query, {'event_type': event_type})
+                webhooks = [(str(row.id), row.service_name, row.url) for row in result.fetchall()]
+                self.subscriptions.set(event_type, webhooks)
+            subscribers[event_type] = webhooks
+        return subscribers
     
     async def _queue_delivery(
         self,
@@ -390,80 +581,161 @@ class WebhookService:
         payload: Dict[str, Any]
     ):
         """Queue a webhook delivery."""
-        query = text("""
-            INSERT INTO public.webhook_delivery_queue
-            (id, webhook_id, event_type, payload, status, attempts, max_attempts, next_retry_at, created_at)
-            VALUES (:id, :webhook_id, :event_type, :payload, 'pending', 0, :max_attempts, :next_retry_at, :created_at)
-        """)
-        
-        await self.db.execute(query, {
-            'id': str(uuid.uuid4()),
-            'webhook_id': webhook_id,
-            'event_type': event_type,
-            'payload': json.dumps(payload),
-            'max_attempts': MAX_RETRY_ATTEMPTS,
-            'next_retry_at': datetime.now(timezone.utc),  # Immediate delivery
-            'created_at': datetime.now(timezone.utc)
-        })
+        await self._queue_deliveries([(webhook_id, event_type, payload)])
         await self.db.commit()
     
+    async def _queue_deliveries(self, deliveries: List[Tuple[str, str, Dict[str, Any]]]):
+        """Queue (webhook_id, event_type, payload) deliveries with multi-row INSERTs (no commit)."""
+        now = datetime.now(timezone.utc)
+        
+        for start in range(0, len(deliveries), QUEUE_INSERT_CHUNK_SIZE):
+            chunk = deliveries[start:start + QUEUE_INSERT_CHUNK_SIZE]
+            params = {'max_attempts': MAX_RETRY_ATTEMPTS, 'now': now}
+            rows = []
+            for i, (webhook_id, event_type, payload) in enumerate(chunk):
+                # next_retry_at = now: immediate delivery
+                rows.append(
+                    f"(:id_{i}, :webhook_id_{i}, :event_type_{i}, :payload_{i}, "
+                    f"'pending', 0, :max_attempts, :now, :now)"
+                )
+                params.update({
+                    f'id_{i}': str(uuid.uuid4()),
+                    f'webhook_id_{i}': webhook_id,
+                    f'event_type_{i}': event_type,
+                    f'payload_{i}': json.dumps(payload)
+                })
+            
+            separator = ",\n"
+            query = text(f"""
+                INSERT INTO public.webhook_delivery_queue
+                (id, webhook_id, event_type, payload, status, attempts, max_attempts, next_retry_at, created_at)
+                VALUES {separator.join(rows)}
+            """)
+            await self.db.execute(query, params)
+    
     # ==================== DELIVERY ====================
     
     async def process_delivery_queue(self, batch_size: int = 10) -> Dict[str, int]:
         """
         Process pending webhook deliveries.
         
+        Claims up to batch_size items (skipping rows other workers hold),
+        delivers them concurrently and writes all outcomes back in
+        batched statements with one commit.
+        
         Returns counts of delivered, failed, and dead-lettered items.
         """
-        # Get pending deliveries ready for retry
+        items = await self._claim_deliveries(batch_size)
+        
+        stats = {'delivered': 0, 'failed': 0, 'dead_letter': 0}
+        if not items:
+            return stats
+        
+        results = await asyncio.gather(*(self._deliver_claimed(item) for item in items))
+        
+        delivered, retries, dead_letters = [], [], []
+        for item, delivery_result in zip(items, results):
+            if delivery_result.success:
+                delivered.append({
+                    'queue_id': str(item.id),
+                    'webhook_id': str(item.webhook_id),
+                    'service_name': item.service_name
+                })
+                continue
+            new_attempts = item.attempts + 1
+            outcome = {
+                'queue_id': str(item.id),
+                'webhook_id': str(item.webhook_id),
+                'event_type': item.event_type,
+                'payload': item.payload,
+                'attempts': new_attempts,
+                'error': delivery_result.error or 'Delivery failed',
+                'service_name': item.service_name
+            }
+            if new_attempts >= MAX_RETRY_ATTEMPTS:
+                dead_letters.append(outcome)
+            else:
+                retries.append(outcome)
+        
+        await self._mark_delivered_many(delivered)
+        await self._schedule_retries(retries)
+        await self._move_to_dead_letter_many(dead_letters)
+        await self.db.commit()
+        
+        stats['delivered'] = len(delivered)
+        stats['failed'] = len(retries)
+        stats['dead_letter'] = len(dead_letters)
+        return stats
+    
+    async def _claim_deliveries(self, batch_size: int) -> List[Any]:
+        """
+        Claim a batch of due deliveries.
+        
+        Rows are locked with FOR UPDATE SKIP LOCKED, so concurrent workers
+        never claim the same item, and leased by pushing next_retry_at
+        forward; if this worker dies the items become due again when the
+        lease expires. At most max_in_flight_per_url items per URL are
+        claimed so a slow subscriber cannot fill the batch.
+        
+        The per-URL cap is applied before the batch limit: each active
+        webhook contributes only its oldest per_url due rows (a LATERAL
+        scan of idx_webhook_queue_pending_due), so a subscriber with a
+        large backlog cannot crowd other subscribers out of the batch.
+        """
+        now = datetime.now(timezone.utc)
         query = text("""
-            SELECT q.id, q.webhook_id, q.event_type, q.payload, q.attempts,
-                   w.url, w.secret_key, w.service_name
-            FROM public.webhook_delivery_queue q
-            JOIN public.webhook_registrations w ON q.webhook_id = w.id
-            WHERE q.status = 'pending'
-            AND q.next_retry_at <= :now
-            AND w.is_active = TRUE
-            ORDER BY q.next_retry_at
-            LIMIT :limit
+            WITH candidates AS (
+                SELECT d.id, d.next_retry_at, w.url
+                FROM public.webhook_registrations w
+                CROSS JOIN LATERAL (
+                    SELECT q.id, q.next_retry_at
+                    FROM public.webhook_delivery_queue q
+                    WHERE q.webhook_id = w.id
+                    AND q.status = 'pending'
+                    AND q.next_retry_at <= :now
+                    ORDER BY q.next_retry_at
+                    LIMIT :per_url
+                    FOR UPDATE OF q SKIP LOCKED
+                ) d
+                WHERE w.is_active = TRUE
+            ),
+            claimed AS (
+                SELECT id FROM (
+                    SELECT id, next_retry_at,
+                           ROW_NUMBER() OVER (PARTITION BY url ORDER BY next_retry_at) AS url_rank
+                    FROM candidates
+                ) ranked
+                WHERE url_rank <= :per_url
+                ORDER BY next_retry_at
+                LIMIT :limit
+            )
+            UPDATE public.webhook_delivery_queue q
+            SET next_retry_at = :lease_until
+            FROM claimed, public.webhook_registrations w
+            WHERE q.id = claimed.id AND w.id = q.webhook_id
+            RETURNING q.id, q.webhook_id, q.event_type, q.payload, q.attempts,
+                      w.url, w.secret_key, w.service_name
         """)
         
         result = await self.db.execute(query, {
-            'now': datetime.now(timezone.utc),
-            'limit': batch_size
+            'now': now,
+            'per_url': self.engine.max_in_flight_per_url,
+            'limit': batch_size,
+            'lease_until': now + timedelta(seconds=CLAIM_LEASE_SECONDS)
         })
         items = result.fetchall()
-        
-        stats = {'delivered': 0, 'failed': 0, 'dead_letter': 0}
-        
-        for item in items:
-            delivery_result = await self._deliver_webhook(
+        await self.db.commit()
+        return items
+    
+    async def _deliver_claimed(self, item: Any) -> DeliveryResult:
+        """Deliver one claimed item within the global and per-URL limits."""
+        async with self.engine.slots, self.engine.url_slots(item.url):
+            return await self._deliver_webhook(
                 url=item.url,
                 payload=json.loads(item.payload) if isinstance(item.payload, str) else item.payload,
                 secret_key=item.secret_key,
                 event_type=item.event_type
             )
-            
-            if delivery_result.success:
-                await self._mark_delivered(str(item.id), item.webhook_id, item.service_name)
-                stats['delivered'] += 1
-            else:
-                new_attempts = item.attempts + 1
-                if new_attempts >= MAX_RETRY_ATTEMPTS:
-                    await self._move_to_dead_letter(
-                        str(item.id), str(item.webhook_id), item.event_type,
-                        item.payload, new_attempts, delivery_result.error,
-                        item.service_name
-                    )
-                    stats['dead_letter'] += 1
-                else:
-                    await self._schedule_retry(
-                        str(item.id), new_attempts, delivery_result.error,
-                        item.service_name
-                    )
-                    stats['failed'] += 1
-        
-        return stats
     
     async def _deliver_webhook(
         self,
@@ -495,9 +767,8 @@ class WebhookService:
                 'X-Webhook-Timestamp': payload.get('timestamp', '')
             }
             
-            async with httpx.AsyncClient(timeout=DELIVERY_TIMEOUT) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                
+            response = await self.engine.client.post(url, json=payload, headers=headers)
+            
             duration = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
             
             if 200 <= response.status_code < 300:
@@ -528,21 +799,37 @@ class WebhookService:
         service_name: str
     ):
         """Mark a delivery as successful."""
+        await self._mark_delivered_many([
+            {'queue_id': queue_id, 'webhook_id': webhook_id, 'service_name': service_name}
+        ])
+        await self.db.commit()
+    
+    async def _mark_delivered_many(self, items: List[Dict[str, Any]]):
+        """Mark deliveries as successful (one UPDATE, one audit INSERT; no commit)."""
+        if not items:
+            return
+        
         query = text("""
             UPDATE public.webhook_delivery_queue
             SET status = 'delivered', delivered_at = :now, attempts = attempts + 1
-            WHERE id = :id
+            WHERE id = ANY(CAST(:ids AS uuid[]))
         """)
-        await self.db.execute(query, {'id': queue_id, 'now': datetime.now(timezone.utc)})
-        await self.db.commit()
+        await self.db.execute(query, {
+            'ids': [item['queue_id'] for item in items],
+            'now': datetime.now(timezone.utc)
+        })
         
         # Audit log
-        await log_webhook_audit(
-            self.db, AuditEventType.WEBHOOK_DELIVERED,
-            webhook_id, service_name,
-            {'queue_id': queue_id},
-            'system'
-        )
+        await log_webhook_audit_many(self.db, [
+            {
+                'event_type': AuditEventType.WEBHOOK_DELIVERED,
+                'webhook_id': item['webhook_id'],
+                'service_name': item['service_name'],
+                'details': {'queue_id': item['queue_id']},
+                'performed_by': 'system'
+            }
+            for item in items
+        ])
     
     async def _schedule_retry(
         self,
@@ -552,24 +839,45 @@ class WebhookService:
         service_name: str
     ):
         """Schedule a retry with exponential backoff."""
-        delay_index = min(attempts - 1, len(RETRY_DELAYS) - 1)
-        delay_seconds = RETRY_DELAYS[delay_index]
-        next_retry = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+        await self._schedule_retries([{
+            'queue_id': queue_id,
+            'attempts': attempts,
+            'error': error,
+            'service_name': service_name
+        }])
+        await self.db.commit()
+    
+    async def _schedule_retries(self, items: List[Dict[str, Any]]):
+        """Schedule retries with exponential backoff (one UPDATE; no commit)."""
+        if not items:
+            return
+        
+        now = datetime.now(timezone.utc)
+        next_retries = []
+        for item in items:
+            delay_index = min(item['attempts'] - 1, len(RETRY_DELAYS) - 1)
+            delay_seconds = RETRY_DELAYS[delay_index]
+            next_retries.append(now + timedelta(seconds=delay_seconds))
+            logger.warning(
+                f"Webhook delivery failed (attempt {item['attempts']}), "
+                f"retry in {delay_seconds}s: {item['error']}"
+            )
         
         query = text("""
-            UPDATE public.webhook_delivery_queue
-            SET attempts = :attempts, last_error = :error, next_retry_at = :next_retry
-            WHERE id = :id
+            UPDATE public.webhook_delivery_queue q
+            SET attempts = r.attempts, last_error = r.error, next_retry_at = r.next_retry
+            FROM unnest(
+                CAST(:ids AS uuid[]), CAST(:attempts AS integer[]),
+                CAST(:errors AS text[]), CAST(:next_retries AS timestamptz[])
+            ) AS r(id, attempts, error, next_retry)
+            WHERE q.id = r.id
         """)
         await self.db.execute(query, {
-            'id': queue_id,
-            'attempts': attempts,
-            'error': error,
-            'next_retry': next_retry
+            'ids': [item['queue_id'] for item in items],
+            'attempts': [item['attempts'] for item in items],
+            'errors': [item['error'] for item in items],
+            'next_retries': next_retries
         })
-        await self.db.commit()
-        
-        logger.warning(f"Webhook delivery failed (attempt {attempts}), retry in {delay_seconds}s: {error}")
     
     async def _move_to_dead_letter(
         self,
@@ -582,46 +890,86 @@ class WebhookService:
         service_name: str
     ):
         """Move failed delivery to dead letter queue."""
-        # Insert into dead letter
-        query = text("""
-            INSERT INTO public.webhook_dead_letter
-            (id, original_queue_id, webhook_id, event_type, payload, attempts, last_error, failed_at)
-            VALUES (:id, :original_id, :webhook_id, :event_type, :payload, :attempts, :error, :now)
-        """)
-        await self.db.execute(query, {
-            'id': str(uuid.uuid4()),
-            'original_id': queue_id,
+        await self._move_to_dead_letter_many([{
+            'queue_id': queue_id,
             'webhook_id': webhook_id,
             'event_type': event_type,
-            'payload': json.dumps(payload) if isinstance(payload, dict) else payload,
+            'payload': payload,
             'attempts': attempts,
             'error': error,
-            'now': datetime.now(timezone.utc)
-        })
+            'service_name': service_name
+        }])
+        await self.db.commit()
+    
+    async def _move_to_dead_letter_many(self, items: List[Dict[str, Any]]):
+        """Move failed deliveries to the dead letter queue (batched; no commit)."""
+        if not items:
+            return
+        
+        now = datetime.now(timezone.utc)
+        
+        # Insert into dead letter
+        params = {'now': now}
+        rows = []
+        for i, item in enumerate(items):
+            rows.append(
+                f"(:id_{i}, :original_id_{i}, :webhook_id_{i}, :event_type_{i}, "
+                f":payload_{i}, :attempts_{i}, :error_{i}, :now)"
+            )
+            payload = item['payload']
+            params.update({
+                f'id_{i}': str(uuid.uuid4()),
+                f'original_id_{i}': item['queue_id'],
+                f'webhook_id_{i}': item['webhook_id'],
+                f'event_type_{i}': item['event_type'],
+                f'payload_{i}': json.dumps(payload) if isinstance(payload, dict) else payload,
+                f'attempts_{i}': item['attempts'],
+                f'error_{i}': item['error']
+            })
+        separator = ",\n"
+        query = text(f"""
+            INSERT INTO public.webhook_dead_letter
+            (id, original_queue_id, webhook_id, event_type, payload, attempts, last_error, failed_at)
+            VALUES {separator.join(rows)}
+        """)
+        await self.db.execute(query, params)
         
         # Update queue status
         update_query = text("""
-            UPDATE public.webhook_delivery_queue
-            SET status = 'dead_letter', failed_at = :now, last_error = :error, attempts = :attempts
-            WHERE id = :id
+            UPDATE public.webhook_delivery_queue q
+            SET status = 'dead_letter', failed_at = :now, last_error = d.error, attempts = d.attempts
+            FROM unnest(
+                CAST(:ids AS uuid[]), CAST(:attempts AS integer[]), CAST(:errors AS text[])
+            ) AS d(id, attempts, error)
+            WHERE q.id = d.id
         """)
         await self.db.execute(update_query, {
-            'id': queue_id,
-            'now': datetime.now(timezone.utc),
-            'error': error,
-            'attempts': attempts
+            'ids': [item['queue_id'] for item in items],
+            'attempts': [item['attempts'] for item in items],
+            'errors': [item['error'] for item in items],
+            'now': now
         })
-        await self.db.commit()
         
         # Audit log
-        await log_webhook_audit(
-            self.db, AuditEventType.WEBHOOK_DEAD_LETTER,
-            webhook_id, service_name,
-            {'queue_id': queue_id, 'attempts': attempts, 'error': error[:100]},
-            'system'
-        )
+        await log_webhook_audit_many(self.db, [
+            {
+                'event_type': AuditEventType.WEBHOOK_DEAD_LETTER,
+                'webhook_id': item['webhook_id'],
+                'service_name': item['service_name'],
+                'details': {
+                    'queue_id': item['queue_id'],
+                    'attempts': item['attempts'],
+                    'error': item['error'][:100]
+                },
+                'performed_by': 'system'
+            }
+            for item in items
+        ])
         
-        logger.error(f"Webhook moved to dead letter after {attempts} attempts: {error}")
+        for item in items:
+            logger.error(
+                f"Webhook moved to dead letter after {item['attempts']} attempts: {item['error']}"
+            )
     
     # ==================== QUEUE STATS ====================
     
@@ -697,12 +1045,12 @@ class WebhookService:
         if not row:
             return False
         
-        # Re-queue
-        await self._queue_delivery(
-            webhook_id=str(row.webhook_id),
-            event_type=row.event_type,
-            payload=json.loads(row.payload) if isinstance(row.payload, str) else row.payload
-        )
+        # Re-queue (committed together with the dead letter removal)
+        await self._queue_deliveries([(
+            str(row.webhook_id),
+            row.event_type,
+            json.loads(row.payload) if isinstance(row.payload, str) else row.payload
+        )])
         
         # Remove from dead letter
         delete_query = text("DELETE FROM public.webhook_dead_letter WHERE id = :id")
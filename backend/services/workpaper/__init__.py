@@ -65,6 +65,7 @@ from services.workpaper.db_storage import (
     TaskRepository,
     FreezeSnapshotRepository,
     WorkpaperAuditLogRepository,
+    JobDashboardRepository,
     EffectiveTransactionBuilder,
 )
 
@@ -156,6 +157,7 @@ __all__ = [
     'TaskRepository',
     'FreezeSnapshotRepository',
     'WorkpaperAuditLogRepository',
+    'JobDashboardRepository',
     'EffectiveTransactionBuilder',
     
     # Legacy Storage (deprecated)
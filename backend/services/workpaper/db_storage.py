@@ -3,13 +3,20 @@ FDC Core Workpaper Platform - Database Storage Layer
 
 PostgreSQL-backed storage replacing file-based JSON storage.
 Uses SQLAlchemy async sessions for all database operations.
+
+Job dashboards are assembled in two queries and cached per job; module,
+query, task and job mutations made through these repositories invalidate
+the cached dashboard.
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, TypeVar, Generic, Type
+from typing import List, Optional, Dict, Any, TypeVar, Generic, Type, Tuple
 import logging
+import os
+import time
 
-from sqlalchemy import select, update, delete, and_, or_
+from sqlalchemy import select, update, delete, and_, or_, any_, bindparam, String, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.workpaper_models import (
@@ -20,11 +27,21 @@ from database.workpaper_models import (
 from services.workpaper.models import (
     WorkpaperJob, ModuleInstance, Transaction, TransactionOverride,
     OverrideRecord, Query, QueryMessage, Task, FreezeSnapshot,
-    EffectiveTransaction, JobStatus, QueryStatus, TaskStatus, TaskType
+    EffectiveTransaction, JobStatus, QueryStatus, TaskStatus, TaskType,
+    ModuleSummary, JobDashboard
 )
 
 logger = logging.getLogger(__name__)
 
+# Seconds an assembled job dashboard is cached (0 disables caching)
+DASHBOARD_CACHE_TTL = float(os.environ.get('WORKPAPER_DASHBOARD_CACHE_TTL', '30'))
+
+OPEN_QUERY_STATUSES = [
+    QueryStatus.SENT_TO_CLIENT.value,
+    QueryStatus.AWAITING_CLIENT.value,
+    QueryStatus.CLIENT_RESPONDED.value
+]
+
 T = TypeVar('T')
 DBT = TypeVar('DBT')
 
@@ -187,6 +204,63 @@ def db_to_pydantic_snapshot(db_obj: FreezeSnapshotDB) -> FreezeSnapshot:
     )
 
 
+# ==================== DASHBOARD CACHE ====================
+
+class JobDashboardCache:
+    """
+    Assembled JobDashboard per job id.
+    
+    Entries expire after ttl_seconds; mutations made through the
+    repositories below invalidate a job's entry immediately in this
+    process. A dashboard loaded before an invalidation is not stored.
+    """
+    
+    def __init__(self, ttl_seconds: float = DASHBOARD_CACHE_TTL):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, JobDashboard]] = {}
+        self._jobs_by_client_year: Dict[Tuple[str, str], str] = {}
+        self._generation = 0
+    
+    @property
+    def generation(self) -> int:
+        """Changes on every invalidation; pass to set() from before the load"""
+        return self._generation
+    
+    def get(self, job_id: str) -> Optional[JobDashboard]:
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return None
+        expires_at, dashboard = entry
+        if expires_at <= time.monotonic():
+            del self._entries[job_id]
+            return None
+        return dashboard.model_copy(deep=True)
+    
+    def get_by_client_year(self, client_id: str, year: str) -> Optional[JobDashboard]:
+        job_id = self._jobs_by_client_year.get((client_id, year))
+        return self.get(job_id) if job_id else None
+    
+    def set(self, dashboard: JobDashboard, generation: int):
+        if self.ttl_seconds <= 0 or generation != self._generation:
+            return
+        job = dashboard.job
+        self._entries[job.id] = (time.monotonic() + self.ttl_seconds, dashboard.model_copy(deep=True))
+        self._jobs_by_client_year[(job.client_id, job.year)] = job.id
+    
+    def invalidate(self, job_id: Optional[str]):
+        self._generation += 1
+        if job_id:
+            self._entries.pop(job_id, None)
+    
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+        self._jobs_by_client_year.clear()
+
+
+dashboard_cache = JobDashboardCache()
+
+
 # ==================== REPOSITORY CLASSES ====================
 
 class WorkpaperJobRepository:
@@ -253,6 +327,7 @@ class WorkpaperJobRepository:
             .values(**updates)
         )
         await self.session.commit()
+        dashboard_cache.invalidate(job_id)
         return await self.get(job_id)
     
     async def delete(self, job_id: str) -> bool:
@@ -261,6 +336,7 @@ class WorkpaperJobRepository:
             delete(WorkpaperJobDB).where(WorkpaperJobDB.id == job_id)
         )
         await self.session.commit()
+        dashboard_cache.invalidate(job_id)
         return result.rowcount > 0
 
 
@@ -285,6 +361,7 @@ class ModuleInstanceRepository:
         self.session.add(db_module)
         await self.session.commit()
         await self.session.refresh(db_module)
+        dashboard_cache.invalidate(db_module.job_id)
         return db_to_pydantic_module(db_module)
     
     async def get(self, module_id: str) -> Optional[ModuleInstance]:
@@ -337,15 +414,23 @@ class ModuleInstanceRepository:
             .values(**updates)
         )
         await self.session.commit()
-        return await self.get(module_id)
+        module = await self.get(module_id)
+        if module:
+            dashboard_cache.invalidate(module.job_id)
+        return module
     
     async def delete(self, module_id: str) -> bool:
         """Delete a module"""
         result = await self.session.execute(
-            delete(ModuleInstanceDB).where(ModuleInstanceDB.id == module_id)
+            delete(ModuleInstanceDB)
+            .where(ModuleInstanceDB.id == module_id)
+            .returning(ModuleInstanceDB.job_id)
         )
+        deleted = result.all()
         await self.session.commit()
-        return result.rowcount > 0
+        for (job_id,) in deleted:
+            dashboard_cache.invalidate(job_id)
+        return len(deleted) > 0
 
 
 class TransactionRepository:
@@ -492,6 +577,32 @@ class TransactionOverrideRepository:
         )
         return [db_to_pydantic_tx_override(db_o) for db_o in result.scalars().all()]
     
+    async def map_by_transactions(
+        self, job_id: str, transaction_ids: List[str]
+    ) -> Dict[str, TransactionOverride]:
+        """
+        Get overrides for many transactions in a job, keyed by transaction_id.
+        
+        Ids are sent as a single array parameter, so large jobs stay within
+        the driver's bind parameter limit.
+        """
+        if not transaction_ids:
+            return {}
+        result = await self.session.execute(
+            select(TransactionOverrideDB).where(
+                and_(
+                    TransactionOverrideDB.job_id == job_id,
+                    TransactionOverrideDB.transaction_id == any_(
+                        bindparam('transaction_ids', transaction_ids, type_=ARRAY(String))
+                    )
+                )
+            )
+        )
+        overrides = {}
+        for db_o in result.scalars().all():
+            overrides.setdefault(db_o.transaction_id, db_to_pydantic_tx_override(db_o))
+        return overrides
+    
     async def update(self, override_id: str, updates: Dict[str, Any]) -> Optional[TransactionOverride]:
         """Update an override"""
         updates['updated_at'] = datetime.now(timezone.utc)
@@ -610,6 +721,7 @@ class QueryRepository:
         self.session.add(db_query)
         await self.session.commit()
         await self.session.refresh(db_query)
+        dashboard_cache.invalidate(db_query.job_id)
         return db_to_pydantic_query(db_query)
     
     async def get(self, query_id: str) -> Optional[Query]:
@@ -650,17 +762,12 @@ class QueryRepository:
     
     async def list_open_by_job(self, job_id: str) -> List[Query]:
         """List open queries for a job"""
-        open_statuses = [
-            QueryStatus.SENT_TO_CLIENT.value,
-            QueryStatus.AWAITING_CLIENT.value,
-            QueryStatus.CLIENT_RESPONDED.value
-        ]
         result = await self.session.execute(
             select(QueryDB)
             .where(
                 and_(
                     QueryDB.job_id == job_id,
-                    QueryDB.status.in_(open_statuses)
+                    QueryDB.status.in_(OPEN_QUERY_STATUSES)
                 )
             )
             .order_by(QueryDB.created_at.desc())
@@ -673,21 +780,16 @@ class QueryRepository:
     
     async def count_open_by_module(self, module_instance_id: str) -> int:
         """Count open queries for a module"""
-        open_statuses = [
-            QueryStatus.SENT_TO_CLIENT.value,
-            QueryStatus.AWAITING_CLIENT.value,
-            QueryStatus.CLIENT_RESPONDED.value
-        ]
         result = await self.session.execute(
-            select(QueryDB)
+            select(func.count(QueryDB.id))
             .where(
                 and_(
                     QueryDB.module_instance_id == module_instance_id,
-                    QueryDB.status.in_(open_statuses)
+                    QueryDB.status.in_(OPEN_QUERY_STATUSES)
                 )
             )
         )
-        return len(result.scalars().all())
+        return result.scalar() or 0
     
     async def update(self, query_id: str, updates: Dict[str, Any]) -> Optional[Query]:
         """Update a query"""
@@ -703,15 +805,23 @@ class QueryRepository:
             .values(**updates)
         )
         await self.session.commit()
-        return await self.get(query_id)
+        query = await self.get(query_id)
+        if query:
+            dashboard_cache.invalidate(query.job_id)
+        return query
     
     async def delete(self, query_id: str) -> bool:
         """Delete a query"""
         result = await self.session.execute(
-            delete(QueryDB).where(QueryDB.id == query_id)
+            delete(QueryDB)
+            .where(QueryDB.id == query_id)
+            .returning(QueryDB.job_id)
         )
+        deleted = result.all()
         await self.session.commit()
-        return result.rowcount > 0
+        for (job_id,) in deleted:
+            dashboard_cache.invalidate(job_id)
+        return len(deleted) > 0
 
 
 class QueryMessageRepository:
@@ -768,6 +878,7 @@ class TaskRepository:
         self.session.add(db_task)
         await self.session.commit()
         await self.session.refresh(db_task)
+        dashboard_cache.invalidate(db_task.job_id)
         return db_to_pydantic_task(db_task)
     
     async def get(self, task_id: str) -> Optional[Task]:
@@ -829,15 +940,23 @@ class TaskRepository:
             .values(**updates)
         )
         await self.session.commit()
-        return await self.get(task_id)
+        task = await self.get(task_id)
+        if task:
+            dashboard_cache.invalidate(task.job_id)
+        return task
     
     async def delete(self, task_id: str) -> bool:
         """Delete a task"""
         result = await self.session.execute(
-            delete(TaskDB).where(TaskDB.id == task_id)
+            delete(TaskDB)
+            .where(TaskDB.id == task_id)
+            .returning(TaskDB.job_id)
         )
+        deleted = result.all()
         await self.session.commit()
-        return result.rowcount > 0
+        for (job_id,) in deleted:
+            dashboard_cache.invalidate(job_id)
+        return len(deleted) > 0
 
 
 class FreezeSnapshotRepository:
@@ -972,6 +1091,151 @@ class WorkpaperAuditLogRepository:
         return list(result.scalars().all())
 
 
+# ==================== JOB DASHBOARD ====================
+
+class JobDashboardRepository:
+    """
+    Assembles JobDashboard views.
+    
+    One query loads the jobs with their modules and per-module open-query
+    counts (GROUP BY); a second loads task counts by status. Dashboards
+    are served from dashboard_cache when present.
+    """
+    
+    def __init__(self, session: AsyncSession, cache: Optional[JobDashboardCache] = None):
+        self.session = session
+        self.cache = cache or dashboard_cache
+    
+    async def get(self, job_id: str) -> Optional[JobDashboard]:
+        """Dashboard for a job"""
+        return (await self.get_many([job_id])).get(job_id)
+    
+    async def get_by_client_year(self, client_id: str, year: str) -> Optional[JobDashboard]:
+        """Dashboard for a client's job in a year"""
+        cached = self.cache.get_by_client_year(client_id, year)
+        if cached:
+            return cached
+        
+        dashboards = await self._load(
+            and_(WorkpaperJobDB.client_id == client_id, WorkpaperJobDB.year == year)
+        )
+        return dashboards[0] if dashboards else None
+    
+    async def get_many(self, job_ids: List[str]) -> Dict[str, JobDashboard]:
+        """Dashboards for many jobs; cache misses are loaded together"""
+        dashboards = {}
+        missing = []
+        for job_id in dict.fromkeys(job_ids):
+            cached = self.cache.get(job_id)
+            if cached:
+                dashboards[job_id] = cached
+            else:
+                missing.append(job_id)
+        
+        if missing:
+            for dashboard in await self._load(WorkpaperJobDB.id.in_(missing)):
+                dashboards[dashboard.job.id] = dashboard
+        return dashboards
+    
+    async def _load(self, job_condition) -> List[JobDashboard]:
+        """Load and cache dashboards for the jobs matching job_condition"""
+        generation = self.cache.generation
+        
+        open_queries = (
+            select(
+                QueryDB.module_instance_id,
+                func.count(QueryDB.id).label("open_query_count")
+            )
+            .join(ModuleInstanceDB, ModuleInstanceDB.id == QueryDB.module_instance_id)
+            .join(WorkpaperJobDB, WorkpaperJobDB.id == ModuleInstanceDB.job_id)
+            .where(and_(job_condition, QueryDB.status.in_(OPEN_QUERY_STATUSES)))
+            .group_by(QueryDB.module_instance_id)
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(
+                WorkpaperJobDB,
+                ModuleInstanceDB,
+                func.coalesce(open_queries.c.open_query_count, 0)
+            )
+            .outerjoin(ModuleInstanceDB, ModuleInstanceDB.job_id == WorkpaperJobDB.id)
+            .outerjoin(open_queries, open_queries.c.module_instance_id == ModuleInstanceDB.id)
+            .where(job_condition)
+            .order_by(WorkpaperJobDB.id, ModuleInstanceDB.module_type)
+        )
+        
+        jobs: Dict[str, WorkpaperJob] = {}
+        modules: Dict[str, List[Tuple[ModuleInstanceDB, int]]] = {}
+        for db_job, db_module, open_count in result.all():
+            if db_job.id not in jobs:
+                jobs[db_job.id] = db_to_pydantic_job(db_job)
+                modules[db_job.id] = []
+            if db_module is not None:
+                modules[db_job.id].append((db_module, open_count))
+        
+        if not jobs:
+            return []
+        
+        task_result = await self.session.execute(
+            select(TaskDB.job_id, TaskDB.status, func.count(TaskDB.id))
+            .where(TaskDB.job_id.in_(list(jobs)))
+            .group_by(TaskDB.job_id, TaskDB.status)
+        )
+        task_counts: Dict[str, Dict[str, int]] = {job_id: {} for job_id in jobs}
+        for job_id, status, count in task_result.all():
+            task_counts[job_id][status] = count
+        
+        dashboards = []
+        for job_id, job in jobs.items():
+            dashboard = self._assemble(job, modules[job_id], task_counts[job_id])
+            self.cache.set(dashboard, generation)
+            dashboards.append(dashboard)
+        return dashboards
+    
+    @staticmethod
+    def _assemble(
+        job: WorkpaperJob,
+        modules: List[Tuple[ModuleInstanceDB, int]],
+        task_counts: Dict[str, int]
+    ) -> JobDashboard:
+        total_deduction = 0
+        total_income = 0
+        open_queries = 0
+        
+        module_summaries = []
+        for db_module, open_count in modules:
+            module = db_to_pydantic_module(db_module)
+            open_queries += open_count
+            
+            if module.output_summary:
+                total_deduction += module.output_summary.get("deduction", 0)
+                total_income += module.output_summary.get("net_income", 0)
+            
+            module_summaries.append(ModuleSummary(
+                id=module.id,
+                module_type=module.module_type,
+                label=module.label,
+                status=module.status,
+                has_open_queries=open_count > 0,
+                open_query_count=open_count,
+                output_summary=module.output_summary or {},
+                frozen_at=module.frozen_at,
+            ))
+        
+        return JobDashboard(
+            job=job,
+            modules=module_summaries,
+            total_deduction=round(total_deduction, 2),
+            total_income=round(total_income, 2),
+            open_queries=open_queries,
+            has_tasks=any(
+                count > 0 for status, count in task_counts.items()
+                if status != TaskStatus.COMPLETED.value
+            ),
+            task_counts=task_counts,
+        )
+
+
 # ==================== EFFECTIVE TRANSACTION BUILDER ====================
 
 class EffectiveTransactionBuilder:
@@ -988,7 +1252,24 @@ class EffectiveTransactionBuilder:
     async def build(self, transaction: Transaction, job_id: str) -> EffectiveTransaction:
         """Build effective transaction for a specific job"""
         override = await self.override_repo.get_by_transaction_job(transaction.id, job_id)
-        
+        return self.apply_override(transaction, job_id, override)
+    
+    async def build_many(
+        self, transactions: List[Transaction], job_id: str
+    ) -> List[EffectiveTransaction]:
+        """Build effective transactions with one override query for the batch"""
+        if not transactions:
+            return []
+        overrides = await self.override_repo.map_by_transactions(
+            job_id, list(dict.fromkeys(t.id for t in transactions))
+        )
+        return [self.apply_override(t, job_id, overrides.get(t.id)) for t in transactions]
+    
+    @staticmethod
+    def apply_override(
+        transaction: Transaction, job_id: str, override: Optional[TransactionOverride]
+    ) -> EffectiveTransaction:
+        """Combine a transaction with its (optional) override"""
         # Determine effective values
         effective_amount = override.overridden_amount if override and override.overridden_amount is not None else transaction.amount
         effective_gst = override.overridden_gst_amount if override and override.overridden_gst_amount is not None else transaction.gst_amount
@@ -1030,30 +1311,18 @@ class EffectiveTransactionBuilder:
         transactions = await self.transaction_repo.list_by_job(job_id)
         if category:
             transactions = [t for t in transactions if t.category == category]
-        
-        result = []
-        for t in transactions:
-            result.append(await self.build(t, job_id))
-        return result
+        return await self.build_many(transactions, job_id)
     
     async def build_for_module(
         self, module_instance_id: str, job_id: str
     ) -> List[EffectiveTransaction]:
         """Build effective transactions for a module"""
         transactions = await self.transaction_repo.list_by_module(module_instance_id)
-        
-        result = []
-        for t in transactions:
-            result.append(await self.build(t, job_id))
-        return result
+        return await self.build_many(transactions, job_id)
     
     async def build_for_categories(
         self, job_id: str, categories: List[str]
     ) -> List[EffectiveTransaction]:
         """Build effective transactions for multiple categories"""
         transactions = await self.transaction_repo.list_by_categories(job_id, categories)
-        
-        result = []
-        for t in transactions:
-            result.append(await self.build(t, job_id))
-        return result
+        return await self.build_many(transactions, job_id)
@@ -680,6 +680,7 @@ class JobDashboard(BaseModel):
     total_income: float = 0.0
     open_queries: int = 0
     has_tasks: bool = False
+    task_counts: Dict[str, int] = Field(default_factory=dict)  # task status -> count
 
 
 class ModuleDetail(BaseModel):
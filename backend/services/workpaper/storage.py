@@ -3,11 +3,20 @@ FDC Core Workpaper Platform - Storage Layer
 
 File-based storage for workpaper entities.
 Can be migrated to PostgreSQL when permissions are available.
+
+Each collection is held in memory with secondary indexes (id, job_id,
+client_id, module_instance_id), so lookups do not re-read the file:
+- <name>.json is the snapshot (same JSON array format as before)
+- <name>.journal is an append-only JSON Lines log of puts and deletes
+- The in-memory state is refreshed when either file changes on disk
+  (mtime/size), replaying only the new journal tail when possible
+- The journal is compacted into the snapshot once it outgrows it
 """
 
 import json
+import os
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, TypeVar, Generic
+from typing import List, Optional, Dict, Any, TypeVar, Generic, Tuple
 from pathlib import Path
 import logging
 import threading
@@ -24,18 +33,208 @@ logger = logging.getLogger(__name__)
 # Storage directory
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "workpaper"
 
-# Thread lock for file writes
-_write_lock = threading.Lock()
+# Fields with a secondary index in every collection
+INDEXED_FIELDS = ("job_id", "client_id", "module_instance_id")
+
+# Journal entries written before compaction is considered; compaction
+# runs once the journal also holds at least as many entries as the snapshot
+JOURNAL_COMPACT_THRESHOLD = 500
 
 T = TypeVar('T')
 
 
+class IndexedCollection:
+    """
+    In-memory view of one storage file with secondary indexes.
+    
+    Shared by every BaseStorage instance for the same file (see
+    get_collection), guarded by a per-collection lock.
+    """
+    
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        self.journal_path = file_path.with_suffix('.journal')
+        self.lock = threading.RLock()
+        self.items: Dict[str, Dict] = {}
+        self.indexes: Dict[str, Dict[Any, Dict[str, None]]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_seq = 0
+        self._snapshot_stat: Optional[Tuple[int, int, int]] = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+    
+    # ---------- Disk state ----------
+    
+    def _stat(self, path: Path) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+    
+    def refresh(self):
+        """Bring the in-memory state up to date with the files on disk."""
+        snapshot_stat = self._stat(self.file_path)
+        journal_stat = self._stat(self.journal_path)
+        journal_size = journal_stat[1] if journal_stat else 0
+        
+        if snapshot_stat != self._snapshot_stat or journal_size < self._journal_offset:
+            self._reload(snapshot_stat)
+        elif journal_size > self._journal_offset:
+            self._replay_journal()
+    
+    def _reload(self, snapshot_stat: Optional[Tuple[int, int, int]]):
+        self.items = {}
+        self.indexes = {field: {} for field in INDEXED_FIELDS}
+        self._order = {}
+        self._next_seq = 0
+        self._journal_offset = 0
+        self._journal_entries = 0
+        
+        if snapshot_stat is not None:
+            try:
+                with open(self.file_path, 'r') as f:
+                    for item in json.load(f):
+                        self._put(item)
+            except Exception as e:
+                logger.error(f"Error loading {self.file_path}: {e}")
+        self._snapshot_stat = snapshot_stat
+        self._replay_journal()
+    
+    def _replay_journal(self):
+        try:
+            with open(self.journal_path, 'rb') as f:
+                f.seek(self._journal_offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # Partially written entry; picked up on next refresh
+                    self._journal_offset += len(line)
+                    self._journal_entries += 1
+                    try:
+                        self._apply(json.loads(line))
+                    except Exception as e:
+                        logger.error(f"Skipping bad journal entry in {self.journal_path}: {e}")
+        except FileNotFoundError:
+            pass
+    
+    def _apply(self, entry: Dict[str, Any]):
+        if entry.get('op') == 'put':
+            self._put(entry['item'])
+        elif entry.get('op') == 'delete':
+            self._remove(entry['id'])
+    
+    # ---------- Indexes ----------
+    
+    def _put(self, item: Dict):
+        item_id = item.get('id')
+        if item_id is None:
+            # Internal key only; the stored item is left without an id
+            item_id = f"__row_{self._next_seq}"
+        if item_id in self.items:
+            self._unindex(item_id, self.items[item_id])
+        else:
+            self._order[item_id] = self._next_seq
+            self._next_seq += 1
+        self.items[item_id] = item
+        for field in INDEXED_FIELDS:
+            self.indexes[field].setdefault(item.get(field), {})[item_id] = None
+    
+    def _remove(self, item_id: str) -> bool:
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return False
+        self._unindex(item_id, item)
+        del self._order[item_id]
+        return True
+    
+    def _unindex(self, item_id: str, item: Dict):
+        for field in INDEXED_FIELDS:
+            bucket = self.indexes[field].get(item.get(field))
+            if bucket is not None:
+                bucket.pop(item_id, None)
+                if not bucket:
+                    del self.indexes[field][item.get(field)]
+    
+    def find(self, criteria: Dict[str, Any]) -> List[Dict]:
+        """Copies of the items matching all criteria, in insertion order."""
+        if 'id' in criteria:
+            item = self.items.get(criteria['id'])
+            candidates = [item] if item is not None else []
+        else:
+            buckets = [
+                self.indexes[field].get(value, {})
+                for field, value in criteria.items()
+                if field in self.indexes and _hashable(value)
+            ]
+            if buckets:
+                ids = sorted(min(buckets, key=len), key=self._order.__getitem__)
+                candidates = [self.items[item_id] for item_id in ids]
+            else:
+                candidates = list(self.items.values())
+        
+        return [
+            dict(item) for item in candidates
+            if all(item.get(key) == value for key, value in criteria.items())
+        ]
+    
+    # ---------- Writes ----------
+    
+    def write(self, entry: Dict[str, Any]):
+        """Append an entry to the journal and apply it (and any newer entries)."""
+        with open(self.journal_path, 'a') as f:
+            f.write(json.dumps(entry, default=str) + '\n')
+        self._replay_journal()
+        
+        if (self._journal_entries >= JOURNAL_COMPACT_THRESHOLD
+                and self._journal_entries >= len(self.items)):
+            self.compact()
+    
+    def compact(self):
+        """Rewrite the snapshot from memory and drop the journal."""
+        self.save(list(self.items.values()))
+    
+    def save(self, items: List[Dict]):
+        """Atomically replace the snapshot with items and drop the journal."""
+        tmp_path = self.file_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(items, f, indent=2, default=str)
+        os.replace(tmp_path, self.file_path)
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        self._reload(self._stat(self.file_path))
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+# One collection per storage file, shared across storage instances
+_collections: Dict[Path, IndexedCollection] = {}
+_collections_lock = threading.Lock()
+
+
+def get_collection(file_path: Path) -> IndexedCollection:
+    """Get the shared in-memory collection for a storage file."""
+    with _collections_lock:
+        collection = _collections.get(file_path)
+        if collection is None:
+            collection = _collections[file_path] = IndexedCollection(file_path)
+        return collection
+
+
 class BaseStorage(Generic[T]):
     """Base class for file-based storage"""
     
     def __init__(self, file_name: str, model_class: type):
         self.file_path = DATA_DIR / file_name
         self.model_class = model_class
+        self._collection = get_collection(self.file_path)
         self._ensure_file_exists()
     
     def _ensure_file_exists(self):
@@ -44,53 +243,59 @@ class BaseStorage(Generic[T]):
             self._save_all([])
     
     def _load_all(self) -> List[Dict]:
-        try:
-            with open(self.file_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading {self.file_path}: {e}")
-            return []
+        with self._collection.lock:
+            self._collection.refresh()
+            return [dict(item) for item in self._collection.items.values()]
     
     def _save_all(self, items: List[Dict]):
-        with _write_lock:
-            with open(self.file_path, 'w') as f:
-                json.dump(items, f, indent=2, default=str)
+        with self._collection.lock:
+            self._collection.save(items)
+    
+    def _find(self, **criteria) -> List[Dict]:
+        """Copies of stored items matching all field values, using indexes where possible"""
+        with self._collection.lock:
+            self._collection.refresh()
+            return self._collection.find(criteria)
+    
+    def _find_first(self, **criteria) -> Optional[T]:
+        items = self._find(**criteria)
+        return self.model_class(**items[0]) if items else None
+    
+    def _put(self, item: Dict) -> Dict:
+        """Journal a full item and return it as stored (JSON round-tripped)"""
+        with self._collection.lock:
+            self._collection.refresh()
+            self._collection.write({"op": "put", "item": item})
+            return dict(self._collection.items[item['id']])
     
     def create(self, item: T) -> T:
         """Create a new item"""
-        items = self._load_all()
-        items.append(item.model_dump())
-        self._save_all(items)
+        self._put(item.model_dump())
         return item
     
     def get(self, item_id: str) -> Optional[T]:
         """Get item by ID"""
-        items = self._load_all()
-        for item in items:
-            if item.get('id') == item_id:
-                return self.model_class(**item)
-        return None
+        return self._find_first(id=item_id)
     
     def update(self, item_id: str, updates: Dict[str, Any]) -> Optional[T]:
         """Update an item"""
-        items = self._load_all()
-        for i, item in enumerate(items):
-            if item.get('id') == item_id:
-                updates['updated_at'] = datetime.now(timezone.utc).isoformat()
-                items[i].update(updates)
-                self._save_all(items)
-                return self.model_class(**items[i])
-        return None
+        with self._collection.lock:
+            self._collection.refresh()
+            existing = self._collection.items.get(item_id)
+            if existing is None:
+                return None
+            updates['updated_at'] = datetime.now(timezone.utc).isoformat()
+            stored = self._put({**existing, **updates})
+            return self.model_class(**stored)
     
     def delete(self, item_id: str) -> bool:
         """Delete an item"""
-        items = self._load_all()
-        original_len = len(items)
-        items = [item for item in items if item.get('id') != item_id]
-        if len(items) < original_len:
-            self._save_all(items)
+        with self._collection.lock:
+            self._collection.refresh()
+            if item_id not in self._collection.items:
+                return False
+            self._collection.write({"op": "delete", "id": item_id})
             return True
-        return False
     
     def list_all(self) -> List[T]:
         """List all items"""
@@ -99,11 +304,7 @@ class BaseStorage(Generic[T]):
     
     def filter(self, **kwargs) -> List[T]:
         """Filter items by field values"""
-        items = self._load_all()
-        filtered = items
-        for key, value in kwargs.items():
-            filtered = [item for item in filtered if item.get(key) == value]
-        return [self.model_class(**item) for item in filtered]
+        return [self.model_class(**item) for item in self._find(**kwargs)]
 
 
 # ==================== SPECIFIC STORAGE CLASSES ====================
@@ -114,11 +315,7 @@ class WorkpaperJobStorage(BaseStorage[WorkpaperJob]):
     
     def get_by_client_year(self, client_id: str, year: str) -> Optional[WorkpaperJob]:
         """Get job by client and year"""
-        items = self._load_all()
-        for item in items:
-            if item.get('client_id') == client_id and item.get('year') == year:
-                return WorkpaperJob(**item)
-        return None
+        return self._find_first(client_id=client_id, year=year)
     
     def list_by_client(self, client_id: str) -> List[WorkpaperJob]:
         """List all jobs for a client"""
@@ -135,12 +332,9 @@ class ModuleInstanceStorage(BaseStorage[ModuleInstance]):
     
     def get_by_job_and_type(self, job_id: str, module_type: str, label: Optional[str] = None) -> Optional[ModuleInstance]:
         """Get module by job and type (and optionally label)"""
-        items = self._load_all()
-        for item in items:
-            if item.get('job_id') == job_id and item.get('module_type') == module_type:
-                if label is None or item.get('label') == label:
-                    return ModuleInstance(**item)
-        return None
+        if label is None:
+            return self._find_first(job_id=job_id, module_type=module_type)
+        return self._find_first(job_id=job_id, module_type=module_type, label=label)
 
 
 class TransactionStorage(BaseStorage[Transaction]):
@@ -161,12 +355,7 @@ class TransactionStorage(BaseStorage[Transaction]):
     
     def list_by_category(self, client_id: str, category: str) -> List[Transaction]:
         """List transactions by category"""
-        items = self._load_all()
-        filtered = [
-            item for item in items 
-            if item.get('client_id') == client_id and item.get('category') == category
-        ]
-        return [Transaction(**item) for item in filtered]
+        return self.filter(client_id=client_id, category=category)
 
 
 class TransactionOverrideStorage(BaseStorage[TransactionOverride]):
@@ -175,15 +364,18 @@ class TransactionOverrideStorage(BaseStorage[TransactionOverride]):
     
     def get_by_transaction_job(self, transaction_id: str, job_id: str) -> Optional[TransactionOverride]:
         """Get override for a transaction in a specific job"""
-        items = self._load_all()
-        for item in items:
-            if item.get('transaction_id') == transaction_id and item.get('job_id') == job_id:
-                return TransactionOverride(**item)
-        return None
+        return self._find_first(job_id=job_id, transaction_id=transaction_id)
     
     def list_by_job(self, job_id: str) -> List[TransactionOverride]:
         """List all overrides for a job"""
         return self.filter(job_id=job_id)
+    
+    def map_by_job(self, job_id: str) -> Dict[str, TransactionOverride]:
+        """Get all overrides for a job keyed by transaction_id (first one wins)"""
+        overrides = {}
+        for item in self._find(job_id=job_id):
+            overrides.setdefault(item.get('transaction_id'), TransactionOverride(**item))
+        return overrides
 
 
 class OverrideRecordStorage(BaseStorage[OverrideRecord]):
@@ -196,11 +388,7 @@ class OverrideRecordStorage(BaseStorage[OverrideRecord]):
     
     def get_by_field(self, module_instance_id: str, field_key: str) -> Optional[OverrideRecord]:
         """Get override for a specific field"""
-        items = self._load_all()
-        for item in items:
-            if item.get('module_instance_id') == module_instance_id and item.get('field_key') == field_key:
-                return OverrideRecord(**item)
-        return None
+        return self._find_first(module_instance_id=module_instance_id, field_key=field_key)
 
 
 class QueryStorage(BaseStorage[Query]):
@@ -209,11 +397,9 @@ class QueryStorage(BaseStorage[Query]):
     
     def list_by_job(self, job_id: str, status: Optional[str] = None) -> List[Query]:
         """List queries for a job, optionally filtered by status"""
-        items = self._load_all()
-        filtered = [item for item in items if item.get('job_id') == job_id]
         if status:
-            filtered = [item for item in filtered if item.get('status') == status]
-        return [Query(**item) for item in filtered]
+            return self.filter(job_id=job_id, status=status)
+        return self.filter(job_id=job_id)
     
     def list_by_module(self, module_instance_id: str) -> List[Query]:
         """List queries for a module"""
@@ -225,25 +411,21 @@ class QueryStorage(BaseStorage[Query]):
     
     def list_open_by_job(self, job_id: str) -> List[Query]:
         """List open queries for a job"""
-        items = self._load_all()
         open_statuses = [QueryStatus.SENT_TO_CLIENT.value, QueryStatus.AWAITING_CLIENT.value, QueryStatus.CLIENT_RESPONDED.value]
-        filtered = [
-            item for item in items 
-            if item.get('job_id') == job_id and item.get('status') in open_statuses
-        ]
+        filtered = [item for item in self._find(job_id=job_id) if item.get('status') in open_statuses]
         return [Query(**item) for item in filtered]
     
     def count_open_by_job(self, job_id: str) -> int:
         """Count open queries for a job"""
-        return len(self.list_open_by_job(job_id))
+        open_statuses = [QueryStatus.SENT_TO_CLIENT.value, QueryStatus.AWAITING_CLIENT.value, QueryStatus.CLIENT_RESPONDED.value]
+        return len([item for item in self._find(job_id=job_id) if item.get('status') in open_statuses])
     
     def count_open_by_module(self, module_instance_id: str) -> int:
         """Count open queries for a module"""
-        items = self._load_all()
         open_statuses = [QueryStatus.SENT_TO_CLIENT.value, QueryStatus.AWAITING_CLIENT.value, QueryStatus.CLIENT_RESPONDED.value]
         return len([
-            item for item in items 
-            if item.get('module_instance_id') == module_instance_id and item.get('status') in open_statuses
+            item for item in self._find(module_instance_id=module_instance_id)
+            if item.get('status') in open_statuses
         ])
 
 
@@ -264,21 +446,13 @@ class TaskStorage(BaseStorage[Task]):
     
     def get_queries_task(self, client_id: str, job_id: str) -> Optional[Task]:
         """Get the QUERIES task for a job"""
-        items = self._load_all()
-        for item in items:
-            if (item.get('client_id') == client_id and 
-                item.get('job_id') == job_id and 
-                item.get('task_type') == TaskType.QUERIES.value):
-                return Task(**item)
-        return None
+        return self._find_first(client_id=client_id, job_id=job_id, task_type=TaskType.QUERIES.value)
     
     def list_by_client(self, client_id: str, status: Optional[str] = None) -> List[Task]:
         """List tasks for a client"""
-        items = self._load_all()
-        filtered = [item for item in items if item.get('client_id') == client_id]
         if status:
-            filtered = [item for item in filtered if item.get('status') == status]
-        return [Task(**item) for item in filtered]
+            return self.filter(client_id=client_id, status=status)
+        return self.filter(client_id=client_id)
     
     def list_by_job(self, job_id: str) -> List[Task]:
         """List tasks for a job"""
@@ -322,7 +496,20 @@ class EffectiveTransactionBuilder:
     def build(self, transaction: Transaction, job_id: str) -> EffectiveTransaction:
         """Build effective transaction for a specific job"""
         override = self.override_storage.get_by_transaction_job(transaction.id, job_id)
-        
+        return self.apply_override(transaction, job_id, override)
+    
+    def build_many(self, transactions: List[Transaction], job_id: str) -> List[EffectiveTransaction]:
+        """Build effective transactions, loading the job's overrides once"""
+        if not transactions:
+            return []
+        overrides = self.override_storage.map_by_job(job_id)
+        return [self.apply_override(t, job_id, overrides.get(t.id)) for t in transactions]
+    
+    @staticmethod
+    def apply_override(
+        transaction: Transaction, job_id: str, override: Optional[TransactionOverride]
+    ) -> EffectiveTransaction:
+        """Combine a transaction with its (optional) override"""
         # Determine effective values
         effective_amount = override.overridden_amount if override and override.overridden_amount is not None else transaction.amount
         effective_gst = override.overridden_gst_amount if override and override.overridden_gst_amount is not None else transaction.gst_amount
@@ -362,21 +549,20 @@ class EffectiveTransactionBuilder:
         transactions = self.transaction_storage.list_by_job(job_id)
         if category:
             transactions = [t for t in transactions if t.category == category]
-        return [self.build(t, job_id) for t in transactions]
+        return self.build_many(transactions, job_id)
     
     def build_for_module(self, module_instance_id: str, job_id: str) -> List[EffectiveTransaction]:
         """Build effective transactions for a module"""
         transactions = self.transaction_storage.list_by_module(module_instance_id)
-        return [self.build(t, job_id) for t in transactions]
+        return self.build_many(transactions, job_id)
     
     def build_for_categories(self, job_id: str, categories: List[str]) -> List[EffectiveTransaction]:
         """Build effective transactions for multiple categories"""
-        items = self.transaction_storage._load_all()
         transactions = [
-            Transaction(**item) for item in items 
-            if item.get('job_id') == job_id and item.get('category') in categories
+            Transaction(**item) for item in self.transaction_storage._find(job_id=job_id)
+            if item.get('category') in categories
         ]
-        return [self.build(t, job_id) for t in transactions]
+        return self.build_many(transactions, job_id)
 
 
 # ==================== SINGLETON INSTANCES ====================
@@ -10,6 +10,7 @@ Usage:
 
 import os
 import re
+import asyncio
 import logging
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -148,8 +149,10 @@ class SMSClient:
         try:
             logger.info(f"Sending SMS to {normalized_to[:6]}***")
             
-            # Send via Twilio (sync call - Twilio SDK is synchronous)
-            twilio_message = self._client.messages.create(
+            # Send via Twilio (the SDK is synchronous - run it in a worker
+            # thread so concurrent sends don't block the event loop)
+            twilio_message = await asyncio.to_thread(
+                self._client.messages.create,
                 body=message,
                 from_=sender,
                 to=normalized_to
@@ -9,19 +9,26 @@ Features:
 - Phone number validation and normalization
 - Audit logging (when database available)
 - Pre-defined templates for common use cases
+- Concurrent, rate-limited bulk sends via the shared bulk dispatcher
 """
 
+import os
 import logging
 import uuid
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 
 from .sms_client import SMSClient, SMSResult
+from services.sms_dispatch import BulkSMSDispatcher, SMS_BULK_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
+# Twilio send rate (messages per second) for bulk sends; depends on the
+# sender type (long code, short code, messaging service)
+SMS_RATE_PER_SECOND = float(os.environ.get('SMS_RATE_PER_SECOND', '10'))
+
 
 class SMSMessageType(str, Enum):
     """Types of SMS messages"""
@@ -169,14 +176,39 @@ class SMSSender:
             messages: List of SMSMessage to send
             
         Returns:
-            List of SendResult for each message
+            List of SendResult for each message, in input order
         """
-        results = []
-        for msg in messages:
-            result = await self.send(msg)
-            results.append(result)
+        results: List[Optional[SendResult]] = [None] * len(messages)
+        async for index, result in self.stream_bulk(messages):
+            results[index] = result
         return results
     
+    async def stream_bulk(
+        self,
+        messages: List[SMSMessage],
+        max_concurrency: int = SMS_BULK_CONCURRENCY,
+        rate_per_second: float = SMS_RATE_PER_SECOND
+    ) -> AsyncIterator[Tuple[int, SendResult]]:
+        """
+        Send multiple SMS messages, yielding (index, SendResult) as each
+        completes.
+        
+        Sends run in a sliding window of max_concurrency, paced by a token
+        bucket at rate_per_second.
+        """
+        dispatcher = BulkSMSDispatcher(max_concurrency=max_concurrency, rate_per_second=rate_per_second)
+        
+        async for outcome in dispatcher.stream(messages, lambda index, msg: self.send(msg)):
+            if outcome.error is not None:
+                yield outcome.index, SendResult(
+                    success=False,
+                    error=str(outcome.error),
+                    error_code=500,
+                    recipient=outcome.item.to
+                )
+            else:
+                yield outcome.index, outcome.result
+    
     async def send_from_template(
         self,
         to: str,
@@ -0,0 +1,240 @@
+"""
+Unit Tests for the Segmented Audit Log Store
+
+Tests the audit store behind AuditLogger:
+- Daily segments and indexed, paginated queries
+- Incremental counters for stats
+- Sidecar persistence and tail catch-up
+- Retention by dropping segments and legacy log migration
+- Buffered background writer
+
+Run with: pytest tests/test_audit_store.py -v
+"""
+
+import json
+import time
+
+import pytest
+
+from services.audit import AuditLogger, AuditLogFilter
+from services.audit_store import AuditSegmentStore, BufferedAuditWriter
+
+
+def _entry(index: int, day: str = "2025-03-10", **kwargs) -> dict:
+    entry = {
+        "id": f"entry-{index}",
+        "timestamp": f"{day}T10:00:{index % 60:02d}",
+        "user_id": "user-1",
+        "user_email": None,
+        "action": "task.create",
+        "resource_type": "task",
+        "resource_id": f"task-{index % 3}",
+        "details": {},
+        "success": True,
+    }
+    entry.update(kwargs)
+    return entry
+
+
+class TestAuditSegmentStore:
+    """Test the segmented store against a temporary directory."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return AuditSegmentStore(tmp_path / "audit_log")
+
+    def test_entries_written_to_daily_segments(self, store):
+        store.append([_entry(0, "2025-03-09"), _entry(1), _entry(2)])
+
+        assert sorted(p.name for p in store.directory.glob("*.jsonl")) == [
+            "2025-03-09.jsonl", "2025-03-10.jsonl"
+        ]
+        assert [e["id"] for e in store.query()] == ["entry-2", "entry-1", "entry-0"]
+
+    def test_filtered_query_matches_scan(self, store):
+        entries = [
+            _entry(i, f"2025-03-{10 + i % 4:02d}",
+                   user_id=f"user-{i % 2}",
+                   action="task.update" if i % 5 == 0 else "task.create",
+                   success=i % 7 != 0)
+            for i in range(40)
+        ]
+        store.append(entries)
+
+        def scan(user_id=None, action=None, resource_id=None, success=None, start_date=None):
+            matching = [
+                e for e in entries
+                if (not user_id or e["user_id"] == user_id)
+                and (not action or e["action"] == action)
+                and (not resource_id or e["resource_id"] == resource_id)
+                and (success is None or e["success"] == success)
+                and (not start_date or e["timestamp"][:10] >= start_date)
+            ]
+            matching.sort(key=lambda e: (e["timestamp"][:10], entries.index(e)), reverse=True)
+            return [e["id"] for e in matching]
+
+        cases = [
+            {"user_id": "user-1"},
+            {"action": "task.update", "user_id": "user-0"},
+            {"resource_id": "task-2", "success": False},
+            {"success": True, "start_date": "2025-03-12"},
+        ]
+        for case in cases:
+            expected = scan(**case)
+            assert [e["id"] for e in store.query(limit=100, **case)] == expected
+            assert [e["id"] for e in store.query(offset=3, limit=4, **case)] == expected[3:7]
+
+    def test_stats_from_counters(self, store):
+        store.append([_entry(0, "2025-03-01"), _entry(1, success=False), _entry(2, user_email="a@x.com")])
+
+        stats = store.stats(today="2025-03-10", week_ago="2025-03-03")
+
+        assert stats["total_entries"] == 3
+        assert stats["entries_today"] == 2
+        assert stats["entries_this_week"] == 2
+        assert stats["recent_errors"] == 1
+        assert stats["by_user"] == {"user-1": 2, "a@x.com": 1}
+        assert stats["by_action"] == {"task.create": 3}
+
+    def test_reopen_uses_persisted_index_and_catches_up_tail(self, store, tmp_path):
+        store.append([_entry(0), _entry(1)])
+        store.query()  # load the index so it is persisted
+        store.persist()
+
+        # Another writer appends directly to the segment
+        with open(store.directory / "2025-03-10.jsonl", "a") as f:
+            f.write(json.dumps(_entry(2, user_id="user-9")) + "\n")
+
+        reopened = AuditSegmentStore(store.directory)
+
+        assert reopened.stats("2025-03-10", "2025-03-03")["total_entries"] == 3
+        assert [e["id"] for e in reopened.query(user_id="user-9")] == ["entry-2"]
+        assert reopened.get("entry-0")["id"] == "entry-0"
+        assert store.get("entry-2")["user_id"] == "user-9"
+
+    def test_partial_line_is_not_indexed(self, store):
+        store.append([_entry(0)])
+        with open(store.directory / "2025-03-10.jsonl", "a") as f:
+            f.write('{"id": "half')
+
+        assert [e["id"] for e in store.query()] == ["entry-0"]
+        assert store.stats("2025-03-10", "2025-03-03")["total_entries"] == 1
+
+    def test_retention_drops_whole_segments(self, store):
+        store.append([_entry(0, "2025-01-01"), _entry(1, "2025-01-02"), _entry(2)])
+        store.query()
+
+        removed = store.drop_before("2025-03-01")
+
+        assert removed == 2
+        assert sorted(p.name for p in store.directory.glob("*.jsonl")) == ["2025-03-10.jsonl"]
+        assert not (store.directory / "2025-01-01.idx.json").exists()
+        assert store.stats("2025-03-10", "2025-03-03")["total_entries"] == 1
+
+    def test_index_eviction_persists_sidecar(self, tmp_path):
+        store = AuditSegmentStore(tmp_path / "audit_log", max_loaded_indexes=1)
+        store.append([_entry(0, "2025-03-09"), _entry(1)])
+
+        assert store.get("entry-0")["id"] == "entry-0"
+        assert (store.directory / "2025-03-10.idx.json").exists()
+
+    def test_legacy_log_migrated(self, tmp_path):
+        legacy = tmp_path / "audit_log.jsonl"
+        legacy.write_text(
+            "\n".join(json.dumps(e) for e in [_entry(0, "2025-03-09"), _entry(1)]) + "\nnot json\n"
+        )
+        store = AuditSegmentStore(tmp_path / "audit_log")
+
+        assert store.migrate_legacy(legacy) == 2
+        assert not legacy.exists()
+        assert (tmp_path / "audit_log.jsonl.migrated").exists()
+        assert [e["id"] for e in store.query()] == ["entry-1", "entry-0"]
+
+
+class TestAuditLoggerStore:
+    """Test AuditLogger on top of the segmented store."""
+
+    def test_log_and_query(self, tmp_path, monkeypatch):
+        audit_logger = AuditLogger()
+        store = AuditSegmentStore(tmp_path / "audit_log")
+        monkeypatch.setattr(audit_logger, "store", store)
+        monkeypatch.setattr(audit_logger, "writer", BufferedAuditWriter(store, flush_interval=60))
+
+        logged = audit_logger.log(action="task.create", resource_type="task", resource_id="t-1", user_id="u-1")
+        audit_logger.log(action="task.delete", resource_type="task", resource_id="t-1", user_id="u-2", success=False)
+
+        history = audit_logger.get_resource_history("task", "t-1")
+        assert [e.action for e in history] == ["task.delete", "task.create"]
+        assert [e.action for e in audit_logger.get_user_activity("u-1")] == ["task.create"]
+        assert [e.action for e in audit_logger.get_failed_actions()] == ["task.delete"]
+        assert audit_logger.get_entry(logged.id).id == logged.id
+        assert audit_logger.get_stats().total_entries == 2
+        assert audit_logger.get_logs(AuditLogFilter(offset=1, limit=1))[0].id == logged.id
+
+
+class TestBufferedAuditWriter:
+    """Test batching in the background audit writer."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return AuditSegmentStore(tmp_path / "audit_log")
+
+    def test_entries_buffered_until_flush(self, store):
+        writer = BufferedAuditWriter(store, flush_interval=60, flush_size=100, fsync=False)
+
+        for i in range(3):
+            writer.submit(_entry(i))
+
+        assert store.query() == []
+        writer.flush()
+        assert [e["id"] for e in store.query()] == ["entry-2", "entry-1", "entry-0"]
+        writer.close()
+
+    def test_background_thread_flushes_on_interval(self, store):
+        writer = BufferedAuditWriter(store, flush_interval=0.05, flush_size=100, fsync=False)
+
+        writer.submit(_entry(0))
+        deadline = time.monotonic() + 2
+        while not store.query() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert [e["id"] for e in store.query()] == ["entry-0"]
+        writer.close()
+
+    def test_close_drains_and_persists(self, store):
+        writer = BufferedAuditWriter(store, flush_interval=60, flush_size=100, fsync=True)
+        for i in range(5):
+            writer.submit(_entry(i))
+
+        writer.close()
+        writer.submit(_entry(5))  # after close: written synchronously
+
+        assert (store.directory / "stats.json").exists()
+        assert store.stats("2025-03-10", "2025-03-03")["total_entries"] == 6
+
+    def test_backpressure_writes_inline(self, store):
+        writer = BufferedAuditWriter(store, flush_interval=60, flush_size=2, max_pending=2, fsync=False)
+
+        writer.submit(_entry(0))
+        writer.submit(_entry(1))
+
+        assert len(store.query()) == 2
+        writer.close()
+
+    def test_failed_batch_is_requeued_in_order(self, store, monkeypatch):
+        writer = BufferedAuditWriter(store, flush_interval=60, flush_size=100, fsync=False)
+        writer.submit(_entry(0))
+        writer.submit(_entry(1))
+        append = store.append
+
+        def fail(entries, fsync=False):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store, "append", fail)
+        assert writer.flush() is False
+        writer.submit(_entry(2))
+
+        monkeypatch.setattr(store, "append", append)
+        assert writer.flush() is True
+        assert [e["id"] for e in store.query()] == ["entry-2", "entry-1", "entry-0"]
+        writer.close()
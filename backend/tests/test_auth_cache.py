@@ -0,0 +1,118 @@
+"""
+Unit Tests for Auth Role and Token Caching
+
+Tests the caches behind the JWT auth dependencies:
+- Role resolution from the parsed roles file
+- Reload only when the roles file changes
+- Decoded token cache valid until exp
+
+Run with: pytest tests/test_auth_cache.py -v
+"""
+
+import json
+import os
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from services import auth as auth_module
+from services.auth import (
+    AuthRoleStorage,
+    RoleResolver,
+    TokenCache,
+    create_access_token,
+    decode_token_cached,
+)
+
+
+class TestRoleResolver:
+    """Test the cached, mtime-aware role resolver."""
+
+    @pytest.fixture
+    def roles_file(self, tmp_path):
+        path = tmp_path / "auth_roles.json"
+        path.write_text(json.dumps({
+            "_default_role": "client",
+            "_admin_emails": ["Admin@Example.com"],
+            "_staff_emails": ["staff@example.com"],
+            "_tax_agent_emails": ["agent@example.com"],
+            "users": {"user-1": "staff"},
+        }))
+        return path
+
+    def test_resolves_roles(self, roles_file):
+        resolver = RoleResolver(roles_file, check_interval=0)
+
+        assert resolver.get_user_role("user-1", "someone@example.com") == "staff"
+        assert resolver.get_user_role("u", "ADMIN@example.com") == "admin"
+        assert resolver.get_user_role("u", "staff@example.com") == "staff"
+        assert resolver.get_user_role("u", "agent@example.com") == "tax_agent"
+        assert resolver.get_user_role("u", "other@example.com") == "client"
+
+    def test_file_parsed_once_until_it_changes(self, roles_file):
+        resolver = RoleResolver(roles_file, check_interval=0)
+
+        with patch.object(auth_module, "_read_roles_file", wraps=auth_module._read_roles_file) as reads:
+            for _ in range(5):
+                resolver.get_user_role("u", "other@example.com")
+            assert reads.call_count == 1
+
+            data = json.loads(roles_file.read_text())
+            data["_default_role"] = "staff"
+            roles_file.write_text(json.dumps(data))
+            os.utime(roles_file, ns=(1, 1))
+
+            assert resolver.get_user_role("u", "other@example.com") == "staff"
+            assert reads.call_count == 2
+
+    def test_storage_writes_invalidate_shared_resolver(self, roles_file):
+        storage = AuthRoleStorage(roles_file)
+        assert storage.get_user_role("user-2", "other@example.com") == "client"
+
+        storage.set_user_role("user-2", "admin")
+
+        assert storage.get_user_role("user-2", "other@example.com") == "admin"
+
+
+class TestTokenCache:
+    """Test the decoded JWT cache."""
+
+    def test_cached_until_exp(self):
+        cache = TokenCache(max_entries=10)
+        token = create_access_token("user-1", "a@example.com", "client")
+
+        with patch.object(auth_module, "token_cache", cache), \
+                patch.object(auth_module, "decode_token", wraps=auth_module.decode_token) as decodes:
+            first = decode_token_cached(token)
+            second = decode_token_cached(token)
+
+        assert first is second
+        assert decodes.call_count == 1
+
+    def test_expired_entry_is_dropped(self):
+        cache = TokenCache(max_entries=10)
+        token = create_access_token("user-1", "a@example.com", "client", expires_delta=timedelta(minutes=5))
+        token_data = auth_module.decode_token(token)
+        cache.set(token, token_data)
+
+        with patch.object(auth_module.time, "time", return_value=token_data.exp.timestamp() + 1):
+            assert cache.get(token) is None
+        assert len(cache) == 0
+
+    def test_invalid_tokens_are_not_cached(self):
+        cache = TokenCache(max_entries=10)
+
+        with patch.object(auth_module, "token_cache", cache):
+            assert decode_token_cached("not-a-jwt") is None
+
+        assert len(cache) == 0
+
+    def test_lru_bound(self):
+        cache = TokenCache(max_entries=2)
+        tokens = [create_access_token(f"user-{i}", "a@example.com", "client") for i in range(3)]
+        for token in tokens:
+            cache.set(token, auth_module.decode_token(token))
+
+        assert len(cache) == 2
+        assert cache.get(tokens[0]) is None
@@ -0,0 +1,248 @@
+"""
+Unit Tests for the BAS Calculator
+
+Tests the vectorized BAS calculation engine:
+- G1/G2/G3/G10/G11/1A/1B aggregation by GST code
+- Bookkeeper GST code mapping and period filtering
+- Equivalence with a row-by-row Decimal reference
+- Many periods per pass and the batched transactions loader
+- Validation, reconciliation and reports
+
+Run with: pytest tests/test_bas_calculator.py -v
+"""
+
+import random
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bas.bas_calculator import (
+    BASCalculator,
+    BASFields,
+    BASPeriod,
+    FIELD_CONTRIBUTIONS,
+    GSTCode,
+    TransactionColumns,
+    extract_gst,
+    load_period_columns,
+    normalise_gst_code,
+    round_currency,
+)
+
+Q1_FROM = date(2025, 7, 1)
+Q1_TO = date(2025, 9, 30)
+
+
+def _reference(transactions) -> BASFields:
+    """Row-by-row Decimal reference for the vectorized engine."""
+    gross = {
+        name: Decimal("0")
+        for name in ("g1_total_sales", "g2_export_sales", "g3_gst_free_sales", "g10_capital_purchases",
+                     "g11_non_capital_purchases", "taxable_sales", "taxable_purchases")
+    }
+    for txn in transactions:
+        code = normalise_gst_code(txn["gst_code"])
+        if code is None:
+            continue
+        amount = Decimal(str(txn["amount"]))
+        sale_fields, purchase_fields = FIELD_CONTRIBUTIONS[code]
+        for name in (sale_fields if amount > 0 else purchase_fields):
+            gross[name] += abs(amount)
+
+    one_a = extract_gst(gross["taxable_sales"])
+    one_b = extract_gst(gross["taxable_purchases"])
+    return BASFields(
+        g1_total_sales=round_currency(gross["g1_total_sales"]),
+        g2_export_sales=round_currency(gross["g2_export_sales"]),
+        g3_gst_free_sales=round_currency(gross["g3_gst_free_sales"]),
+        g10_capital_purchases=round_currency(gross["g10_capital_purchases"]),
+        g11_non_capital_purchases=round_currency(gross["g11_non_capital_purchases"]),
+        gst_on_sales_1a=one_a,
+        gst_on_purchases_1b=one_b,
+        net_gst=one_a - one_b,
+        total_payable=one_a - one_b,
+    )
+
+
+def _random_transactions(rng: random.Random, count: int) -> list:
+    codes = [code.value for code in GSTCode] + ["GST_FREE", "INPUT_TAXED", "OUT_OF_SCOPE", "PRIVATE", None]
+    return [
+        {
+            "amount": str(Decimal(rng.randint(-500000, 500000)).scaleb(-2)),
+            "gst_code": rng.choice(codes),
+            "date": "2025-08-15",
+        }
+        for _ in range(count)
+    ]
+
+
+class TestCalculate:
+    """Test BAS field aggregation."""
+
+    @pytest.fixture
+    def calculator(self):
+        return BASCalculator()
+
+    def test_fields_by_gst_code(self, calculator):
+        transactions = [
+            {"amount": "1100.00", "gst_code": "GST"},          # taxable sale
+            {"amount": "500.00", "gst_code": "EXP"},           # export sale
+            {"amount": "200.00", "gst_code": "GST_FREE"},      # GST-free sale (bookkeeper code)
+            {"amount": "-330.00", "gst_code": "GST"},          # taxable purchase
+            {"amount": "-100.00", "gst_code": "INPUT_TAXED"},  # non-capital, no credit
+            {"amount": "-2200.00", "gst_code": "CAP"},         # capital purchase with GST
+            {"amount": "-999.00", "gst_code": "PRIVATE"},      # not reported
+        ]
+
+        fields = calculator.calculate(transactions, Q1_FROM, Q1_TO)
+
+        assert fields.g1_total_sales == Decimal("1800.00")
+        assert fields.g2_export_sales == Decimal("500.00")
+        assert fields.g3_gst_free_sales == Decimal("200.00")
+        assert fields.g10_capital_purchases == Decimal("2200.00")
+        assert fields.g11_non_capital_purchases == Decimal("430.00")
+        assert fields.gst_on_sales_1a == Decimal("100.00")
+        assert fields.gst_on_purchases_1b == Decimal("230.00")
+        assert fields.net_gst == Decimal("-130.00")
+
+    def test_period_status_and_uncoded_rows_are_excluded(self, calculator):
+        transactions = [
+            {"amount": "110.00", "gst_code": "GST", "date": "2025-08-01"},
+            {"amount": "110.00", "gst_code": "GST", "date": "2025-10-01"},
+            {"amount": "110.00", "gst_code": "GST", "date": date(2025, 6, 30)},
+            {"amount": "110.00", "gst_code": "GST", "status_bookkeeper": "EXCLUDED"},
+            {"amount": "110.00", "gst_code": None},
+            {"amount": "110.00", "gst_code_bookkeeper": "GST", "date": "2025-09-30"},
+        ]
+
+        fields = calculator.calculate(transactions, Q1_FROM, Q1_TO)
+
+        assert fields.g1_total_sales == Decimal("220.00")
+        assert fields.gst_on_sales_1a == Decimal("20.00")
+
+    def test_gst_rounded_once_at_the_boundary(self, calculator):
+        # 3 x $0.05 taxable sales: GST on the total (0.15 / 11 = 0.0136) rounds to 0.01,
+        # where rounding each row would give 0.00
+        transactions = [{"amount": "0.05", "gst_code": "GST"}] * 3
+
+        fields = calculator.calculate(transactions, Q1_FROM, Q1_TO)
+
+        assert fields.gst_on_sales_1a == Decimal("0.01")
+
+    def test_sub_cent_amounts_stay_exact(self, calculator):
+        transactions = [
+            {"amount": "0.005", "gst_code": "GST_FREE"},
+            {"amount": "0.005", "gst_code": "GST_FREE"},
+            {"amount": "10.00", "gst_code": "GST_FREE"},
+        ]
+
+        fields = calculator.calculate(transactions, Q1_FROM, Q1_TO)
+
+        assert fields.g3_gst_free_sales == Decimal("10.01")
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_decimal_reference(self, calculator, seed):
+        transactions = _random_transactions(random.Random(seed), 2000)
+
+        assert calculator.calculate(transactions, Q1_FROM, Q1_TO) == _reference(transactions)
+
+    def test_many_periods_in_one_pass(self, calculator):
+        rng = random.Random(7)
+        per_period = [_random_transactions(rng, rng.randint(0, 300)) for _ in range(25)]
+        rows = [
+            (position, txn["amount"], txn["gst_code"])
+            for position, transactions in enumerate(per_period)
+            for txn in transactions
+        ]
+
+        results = calculator.calculate_columns(TransactionColumns.from_rows(rows, len(per_period)))
+
+        assert results == [_reference(transactions) for transactions in per_period]
+
+
+class TestLoadPeriodColumns:
+    """Test the batched bookkeeper transactions loader."""
+
+    @pytest.mark.asyncio
+    async def test_one_query_for_all_periods(self):
+        db = AsyncMock()
+        result = MagicMock()
+        result.fetchall.return_value = [
+            MagicMock(period_index=0, amount=Decimal("110.00"), gst_code_bookkeeper="GST"),
+            MagicMock(period_index=1, amount=Decimal("-55.00"), gst_code_bookkeeper="GST_FREE"),
+            MagicMock(period_index=1, amount=Decimal("22.00"), gst_code_bookkeeper=None),
+        ]
+        db.execute = AsyncMock(return_value=result)
+        periods = [BASPeriod("client-1", Q1_FROM, Q1_TO), BASPeriod("client-2", Q1_FROM, Q1_TO)]
+
+        columns = await load_period_columns(db, periods)
+        results = BASCalculator().calculate_columns(columns)
+
+        db.execute.assert_awaited_once()
+        params = db.execute.call_args.args[1]
+        assert params["client_ids"] == ["client-1", "client-2"]
+        assert "EXCLUDED" in str(db.execute.call_args.args[0])
+        assert results[0].gst_on_sales_1a == Decimal("10.00")
+        assert results[1].g11_non_capital_purchases == Decimal("55.00")
+        assert results[1].g1_total_sales == Decimal("0.00")
+
+    @pytest.mark.asyncio
+    async def test_no_periods_skips_query(self):
+        db = AsyncMock()
+
+        columns = await load_period_columns(db, [])
+
+        assert BASCalculator().calculate_columns(columns) == []
+        db.execute.assert_not_awaited()
+
+
+class TestValidationAndReports:
+    """Test validation, GST helpers, reconciliation and reports."""
+
+    @pytest.fixture
+    def calculator(self):
+        return BASCalculator()
+
+    def test_calculate_gst(self, calculator):
+        assert calculator.calculate_gst(Decimal("110.00"), GSTCode.GST) == Decimal("10.00")
+        assert calculator.calculate_gst(Decimal("100.00"), GSTCode.CAP, is_inclusive=False) == Decimal("10.00")
+        assert calculator.calculate_gst(Decimal("110.00"), GSTCode.GST_FREE) == Decimal("0.00")
+
+    def test_validate_transactions(self, calculator):
+        result = calculator.validate_transactions([
+            {"id": "t1", "amount": "10.00", "gst_code": "GST", "date": "2025-07-01"},
+            {"id": "t2", "amount": "abc", "gst_code": "GST", "date": "2025-07-02"},
+            {"id": "t3", "amount": "10.00", "gst_code": "ZZZ", "date": "2025-07-03"},
+            {"id": "t4", "amount": "10.001", "gst_code": "FRE", "date": "not-a-date"},
+        ])
+
+        assert not result["valid"]
+        assert {(e["transaction_id"], e["field"]) for e in result["errors"]} == {
+            ("t2", "amount"), ("t3", "gst_code"), ("t4", "date")
+        }
+        assert result["warnings"][0]["transaction_id"] == "t4"
+        assert result["date_from"] == "2025-07-01"
+        assert result["date_to"] == "2025-07-03"
+
+    def test_reconcile(self, calculator):
+        calculated = BASFields(g1_total_sales=Decimal("100.00"), gst_on_sales_1a=Decimal("9.09"))
+        expected = BASFields(g1_total_sales=Decimal("100.00"), gst_on_sales_1a=Decimal("9.10"))
+
+        strict = calculator.reconcile(calculated, expected)
+        tolerant = calculator.reconcile(calculated, expected, tolerance=Decimal("0.01"))
+
+        assert strict["variances"] == ["gst_on_sales_1a"]
+        assert strict["fields"]["gst_on_sales_1a"]["variance"] == "-0.01"
+        assert tolerant["reconciled"]
+
+    def test_reports(self, calculator):
+        fields = calculator.calculate([{"amount": "110.00", "gst_code": "GST"}], Q1_FROM, Q1_TO)
+
+        assert calculator.generate_report(fields)["gst"]["1A"] == "10.00"
+        summary = calculator.generate_report(fields, format="summary")
+        assert summary["g1_total_income"] == 110.0
+        assert summary["net_gst"] == 10.0
+        with pytest.raises(ValueError):
+            calculator.generate_report(fields, format="ato_xml")
@@ -0,0 +1,217 @@
+"""
+Unit Tests for BAS Period Rollups
+
+Tests the per-client/period rollup and the history reads built on it:
+- Rollup refresh (latest and latest non-draft version) as one upsert
+- Refreshes of a period serialised by an advisory lock
+- Refresh inside the save transaction
+- Grouped history from one rollup query
+- Period comparison from one rollup lookup
+
+Run with: pytest tests/test_bas_rollups.py -v
+"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from bas.models import BASStatementDB
+from bas.service import BASHistoryService, BASStatementService, refresh_period_rollup
+
+Q1_FROM = date(2025, 7, 1)
+Q1_TO = date(2025, 9, 30)
+Q2_FROM = date(2025, 10, 1)
+Q2_TO = date(2025, 12, 31)
+
+
+def _statement(period_from, period_to, version=1, status="completed", net_gst="100.00", **kwargs) -> BASStatementDB:
+    return BASStatementDB(
+        id=uuid.uuid4(),
+        client_id="client-1",
+        period_from=period_from,
+        period_to=period_to,
+        version=version,
+        status=status,
+        net_gst=Decimal(net_gst),
+        payg_instalment=Decimal(kwargs.pop("payg_instalment", "0")),
+        total_payable=Decimal(kwargs.pop("total_payable", net_gst)),
+        g1_total_income=Decimal(kwargs.pop("g1_total_income", "1000.00")),
+        **kwargs
+    )
+
+
+def _result(rows=None, scalars=None) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows or []
+    result.scalars.return_value.all.return_value = scalars or []
+    return result
+
+
+def _upsert_params(db) -> dict:
+    compiled = db.execute.call_args_list[-1].args[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT" in str(compiled)
+    return compiled.params
+
+
+class TestRefreshPeriodRollup:
+    """Test recomputing one period's rollup row."""
+
+    @pytest.mark.asyncio
+    async def test_latest_and_submitted_versions(self):
+        versions = [
+            _statement(Q1_FROM, Q1_TO, version=3, status="draft", net_gst="300.00"),
+            _statement(Q1_FROM, Q1_TO, version=2, status="completed", net_gst="200.00"),
+            _statement(Q1_FROM, Q1_TO, version=1, status="completed", net_gst="100.00"),
+        ]
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[MagicMock(), _result(rows=versions), MagicMock()])
+
+        await refresh_period_rollup(db, "client-1", Q1_FROM, Q1_TO)
+
+        params = _upsert_params(db)
+        assert params["statement_count"] == 3
+        assert params["submitted_count"] == 2
+        assert params["latest_version"] == 3
+        assert params["latest_net_gst"] == Decimal("300.00")
+        assert params["submitted_statement_id"] == versions[1].id
+        assert params["submitted_net_gst"] == Decimal("200.00")
+        db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_drafts_only_has_no_submitted_version(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[
+            MagicMock(), _result(rows=[_statement(Q1_FROM, Q1_TO, status="draft")]), MagicMock()
+        ])
+
+        await refresh_period_rollup(db, "client-1", Q1_FROM, Q1_TO)
+
+        params = _upsert_params(db)
+        assert params["submitted_count"] == 0
+        assert params["submitted_statement_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_no_versions_skips_upsert(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result())
+
+        await refresh_period_rollup(db, "client-1", Q1_FROM, Q1_TO)
+
+        assert db.execute.await_count == 2
+        assert "ON CONFLICT" not in str(db.execute.call_args_list[-1].args[0])
+
+    @pytest.mark.asyncio
+    async def test_period_locked_before_versions_are_read(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result())
+
+        await refresh_period_rollup(db, "client-1", Q1_FROM, Q1_TO)
+
+        lock_sql, lock_params = db.execute.call_args_list[0].args
+        assert "pg_advisory_xact_lock(hashtext(:period_key))" in str(lock_sql)
+        assert lock_params == {"period_key": "bas_rollup:client-1:2025-07-01:2025-09-30"}
+        assert "FROM bas_statements" in str(db.execute.call_args_list[1].args[0])
+
+    @pytest.mark.asyncio
+    async def test_save_refreshes_before_commit(self):
+        order = []
+        db = AsyncMock()
+        db.add = MagicMock()
+        latest = MagicMock()
+        latest.scalar_one_or_none.return_value = None
+
+        async def execute(statement, *args):
+            sql = str(statement)
+            order.append("upsert" if "bas_period_rollups" in sql and "INSERT" in sql else "execute")
+            if "bas_period_rollups" in sql:
+                return MagicMock()
+            if "version" in sql and "FROM bas_statements" in sql and "LIMIT" not in sql:
+                return _result(rows=[_statement(Q1_FROM, Q1_TO)])
+            return latest
+
+        db.execute = AsyncMock(side_effect=execute)
+        db.flush = AsyncMock(side_effect=lambda: order.append("flush"))
+        db.commit = AsyncMock(side_effect=lambda: order.append("commit"))
+
+        service = BASStatementService(db)
+        await service.save_bas(
+            client_id="client-1",
+            period_from=Q1_FROM,
+            period_to=Q1_TO,
+            summary={"net_gst": 100},
+            user_id="user-1",
+        )
+
+        assert order.index("flush") < order.index("upsert") < order.index("commit")
+
+
+class TestRollupHistory:
+    """Test history and comparison reads over the rollup."""
+
+    @pytest.mark.asyncio
+    async def test_grouped_history_one_query(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result(rows=[
+            (_statement(Q2_FROM, Q2_TO, version=2, net_gst="50.00"), 2),
+            (_statement(date(2025, 8, 1), date(2025, 8, 31), net_gst="30.00"), 1),
+            (_statement(date(2025, 7, 1), date(2025, 7, 31), net_gst="20.00"), 3),
+        ]))
+
+        history = await BASHistoryService(db).get_grouped_history("client-1", group_by="quarter")
+
+        db.execute.assert_awaited_once()
+        sql = str(db.execute.call_args.args[0])
+        assert "bas_period_rollups" in sql
+        assert "submitted_statement_id" in sql
+        assert [p["period_key"] for p in history["periods"]] == ["2025-Q4", "2025-Q3"]
+        q3 = history["periods"][1]
+        assert q3["summary"]["total_gst_payable"] == 50.0
+        assert q3["summary"]["statement_count"] == 4
+        assert len(q3["statements"]) == 2
+        assert history["summary"]["total_statements"] == 6
+
+    @pytest.mark.asyncio
+    async def test_grouped_history_with_versions(self):
+        latest = _statement(Q1_FROM, Q1_TO, version=2, status="draft", net_gst="80.00")
+        older = _statement(Q1_FROM, Q1_TO, version=1, net_gst="60.00")
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[
+            _result(rows=[(latest, 2)]),
+            _result(scalars=[latest, older]),
+        ])
+
+        history = await BASHistoryService(db).get_grouped_history(
+            "client-1", include_drafts=True, include_versions=True
+        )
+
+        assert "latest_statement_id" in str(db.execute.call_args_list[0].args[0])
+        period = history["periods"][0]
+        assert [s["version"] for s in period["statements"]] == [2, 1]
+        assert period["summary"]["total_gst_payable"] == 80.0
+
+    @pytest.mark.asyncio
+    async def test_period_comparison_one_lookup(self):
+        current = _statement(Q2_FROM, Q2_TO, net_gst="150.00")
+        previous = _statement(Q1_FROM, Q1_TO, net_gst="100.00")
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result(scalars=[previous, current]))
+
+        comparison = await BASHistoryService(db).get_period_comparison("client-1", Q2_FROM, Q2_TO)
+
+        db.execute.assert_awaited_once()
+        assert comparison["comparison_period"]["from"] == Q1_FROM.isoformat()
+        assert comparison["comparison_period"]["bas"]["id"] == str(previous.id)
+        assert comparison["variances"]["net_gst"]["variance_percent"] == 50.0
+
+    @pytest.mark.asyncio
+    async def test_period_comparison_missing_current(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result(scalars=[_statement(Q1_FROM, Q1_TO)]))
+
+        comparison = await BASHistoryService(db).get_period_comparison("client-1", Q2_FROM, Q2_TO)
+
+        assert comparison == {"error": "No BAS found for the specified period"}
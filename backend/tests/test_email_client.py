@@ -0,0 +1,244 @@
+"""
+Unit Tests for the Async Email Client
+
+Tests the non-blocking Resend path with a mocked HTTP transport:
+- Batch API chunking and individual sends for attachments
+- Concurrency limit on in-flight requests
+- 429 handling with Retry-After
+- Idempotency keys reused across 5xx retries
+- EmailSender batch sending with one logging round trip
+
+Run with: pytest tests/test_email_client.py -v
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from email_integration.email_client import (
+    EmailClient,
+    EmailMessage,
+    EmailAttachment,
+    EmailStatus,
+    RESEND_BATCH_LIMIT,
+)
+from email_integration.email_sender import EmailSender
+
+
+def _message(index: int, **kwargs) -> EmailMessage:
+    return EmailMessage(to=f"educator{index}@example.com", subject="Reminder", body="<p>Hi</p>", **kwargs)
+
+
+def _client(handler, **kwargs) -> EmailClient:
+    http_client = httpx.AsyncClient(base_url="https://resend.test", transport=httpx.MockTransport(handler))
+    kwargs.setdefault("rate_limit_per_second", 0)
+    return EmailClient(
+        api_key="re_test",
+        from_address="no-reply@example.com",
+        http_client=http_client,
+        **kwargs
+    )
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    if request.url.path == "/emails/batch":
+        return httpx.Response(200, json={"data": [{"id": f"re-{item['to'][0]}"} for item in payload]})
+    return httpx.Response(200, json={"id": f"re-{payload['to'][0]}"})
+
+
+class TestAsyncSend:
+    """Test single async sends."""
+
+    @pytest.mark.asyncio
+    async def test_send_email_async(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return _ok(request)
+
+        client = _client(handler)
+        result = await client.send_email_async(_message(0))
+
+        assert result.success
+        assert result.status == EmailStatus.SENT
+        assert result.provider_message_id == "re-educator0@example.com"
+        assert seen[0].headers["authorization"] == "Bearer re_test"
+
+    @pytest.mark.asyncio
+    async def test_attachments_are_base64_encoded(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return _ok(request)
+
+        client = _client(handler)
+        await client.send_email_async(_message(0, attachments=[EmailAttachment("a.txt", b"hello")]))
+
+        assert bodies[0]["attachments"][0]["content"] == "aGVsbG8="
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(422, json={"message": "Invalid `to` field"})
+
+        client = _client(handler)
+        result = await client.send_email_async(_message(0))
+
+        assert not result.success
+        assert "Invalid `to` field" in result.error
+        assert "API" in result.error
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_retried_after_pause(self):
+        responses = [
+            httpx.Response(429, headers={"retry-after": "0"}, json={"message": "Too many requests"}),
+        ]
+
+        def handler(request):
+            return responses.pop(0) if responses else _ok(request)
+
+        client = _client(handler)
+        result = await client.send_email_async(_message(0))
+
+        assert result.success
+        assert responses == []
+
+    @pytest.mark.asyncio
+    async def test_server_error_retry_reuses_idempotency_key(self):
+        keys = []
+
+        def handler(request):
+            keys.append(request.headers["idempotency-key"])
+            return httpx.Response(502, json={"message": "Bad gateway"}) if len(keys) == 1 else _ok(request)
+
+        client = _client(handler)
+        with patch("email_integration.email_client.asyncio.sleep", AsyncMock()):
+            result = await client.send_email_async(_message(0))
+
+        assert result.success
+        assert keys == [result.message_id, result.message_id]
+
+    @pytest.mark.asyncio
+    async def test_not_configured(self):
+        client = EmailClient(api_key="", from_address="")
+        result = await client.send_email_async(_message(0))
+
+        assert not result.success
+        assert result.status == EmailStatus.FAILED
+
+
+class TestAsyncBatch:
+    """Test concurrent batch sending."""
+
+    @pytest.mark.asyncio
+    async def test_batch_api_chunks_and_individual_attachments(self):
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            return _ok(request)
+
+        client = _client(handler)
+        messages = [_message(i) for i in range(RESEND_BATCH_LIMIT + 5)]
+        messages.insert(3, _message(999, attachments=[EmailAttachment("a.pdf", b"%PDF")]))
+
+        results = await client.send_batch_async(messages)
+
+        assert sorted(paths) == ["/emails", "/emails/batch", "/emails/batch"]
+        assert all(result.success for result in results)
+        assert [r.provider_message_id for r in results] == [f"re-{m.to}" for m in messages]
+        assert len({r.message_id for r in results}) == len(messages)
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_fails_its_messages_only(self):
+        def handler(request):
+            payload = json.loads(request.content)
+            if request.url.path == "/emails/batch" and payload[0]["to"] == ["educator0@example.com"]:
+                return httpx.Response(400, json={"message": "Invalid from"})
+            return _ok(request)
+
+        client = _client(handler)
+        messages = [_message(i) for i in range(RESEND_BATCH_LIMIT + 1)]
+
+        results = await client.send_batch_async(messages)
+
+        assert not any(r.success for r in results[:RESEND_BATCH_LIMIT])
+        assert results[-1].success
+
+    @pytest.mark.asyncio
+    async def test_batch_retry_reuses_chunk_idempotency_key(self):
+        keys = []
+
+        def handler(request):
+            keys.append(request.headers["idempotency-key"])
+            return httpx.Response(500, json={"message": "Internal error"}) if len(keys) == 1 else _ok(request)
+
+        client = _client(handler)
+        with patch("email_integration.email_client.asyncio.sleep", AsyncMock()):
+            results = await client.send_batch_async([_message(i) for i in range(3)])
+
+        assert all(r.success for r in results)
+        assert len(keys) == 2
+        assert keys[0] == keys[1]
+        assert keys[0] not in {r.message_id for r in results}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _ok(request)
+
+        client = _client(handler, max_concurrency=2)
+        attachment = [EmailAttachment("a.txt", b"x")]
+        results = await client.send_batch_async([_message(i, attachments=attachment) for i in range(8)])
+
+        assert all(result.success for result in results)
+        assert peak == 2
+
+
+class TestSyncBatch:
+    """Test the blocking SDK batch path."""
+
+    def test_batch_chunks_send_idempotency_keys(self):
+        client = _client(_ok)
+        messages = [_message(i) for i in range(RESEND_BATCH_LIMIT + 1)]
+
+        with patch("email_integration.email_client.resend.Batch.send", return_value={"data": []}) as send:
+            client.send_batch(messages)
+
+        keys = [call.args[1]["idempotency_key"] for call in send.call_args_list]
+        assert len(keys) == 2
+        assert len(set(keys)) == 2
+
+
+class TestSenderBatch:
+    """Test EmailSender batch sending and logging."""
+
+    @pytest.mark.asyncio
+    async def test_send_batch_logs_in_one_round_trip(self):
+        db = AsyncMock()
+        sender = EmailSender(client=_client(_ok), db=db)
+
+        results = await sender.send_batch([_message(i) for i in range(5)])
+
+        assert all(result.success for result in results)
+        db.execute.assert_awaited_once()
+        assert len(db.execute.call_args.args[1]) == 5
+        db.commit.assert_awaited_once()
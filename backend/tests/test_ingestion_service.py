@@ -0,0 +1,232 @@
+"""
+Unit Tests for Bookkeeping Ingestion Service
+
+Tests the file parse and import pipeline with a mocked database:
+- Single-pass streaming parse of CSV and Excel files
+- Chunked import re-streamed from the stored file
+- Set-based duplicate detection and COPY insert per chunk
+
+Run with: pytest tests/test_ingestion_service.py -v
+"""
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ingestion import service as ingestion_service
+from ingestion.service import ParseService, ImportService
+
+
+def _write_csv(path, rows: int) -> str:
+    lines = ["Date,Amount,Description"]
+    lines += [f"2025-03-{(i % 28) + 1:02d},{i}.50,Purchase {i}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+class TestStreamingParse:
+    """Test that parsing streams the file instead of materialising rows."""
+
+    @pytest.fixture
+    def service(self):
+        return ParseService(AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_csv_summary_in_single_pass(self, service, tmp_path):
+        file_path = _write_csv(tmp_path / "bank.csv", 250)
+
+        result = await service._parse_csv(file_path)
+
+        assert result["columns"] == ["Date", "Amount", "Description"]
+        assert result["row_count"] == 250
+        assert len(result["preview"]) == ingestion_service.PREVIEW_ROWS
+        assert result["preview"][0] == {"Date": "2025-03-01", "Amount": "0.50", "Description": "Purchase 0"}
+        assert result["mapping_suggestions"]["amount"] == "Amount"
+        assert "all_rows" not in result
+
+    @pytest.mark.asyncio
+    async def test_excel_summary_in_single_pass(self, service, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        wb = openpyxl.Workbook()
+        sheet = wb.active
+        sheet.append(["Date", "Amount", None])
+        for i in range(30):
+            sheet.append(["2025-03-01", i, f"memo {i}"])
+        file_path = str(tmp_path / "bank.xlsx")
+        wb.save(file_path)
+
+        result = await service._parse_excel(file_path)
+
+        assert result["columns"] == ["Date", "Amount", "Column_2"]
+        assert result["row_count"] == 30
+        assert result["preview"][1] == {"Date": "2025-03-01", "Amount": 1, "Column_2": "memo 1"}
+
+    def test_iter_rows_is_lazy(self, service, tmp_path):
+        file_path = _write_csv(tmp_path / "bank.csv", 5)
+
+        rows = service.iter_rows(file_path, "csv")
+        first = next(rows)
+        rows.close()
+
+        assert first["Description"] == "Purchase 0"
+
+    def test_iter_rows_rejects_unknown_type(self, service, tmp_path):
+        with pytest.raises(ValueError):
+            list(service.iter_rows(str(tmp_path / "bank.pdf"), "pdf"))
+
+
+class TestChunkedImport:
+    """Test that import re-streams the stored file in chunks."""
+
+    @pytest.fixture
+    def batch(self, tmp_path):
+        batch = MagicMock()
+        batch.client_id = "client-1"
+        batch.job_id = None
+        batch.file_type = "csv"
+        batch.file_path = _write_csv(tmp_path / "bank.csv", 25)
+        return batch
+
+    @pytest.fixture
+    def mock_db(self, batch):
+        db = AsyncMock()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = batch
+        db.execute = AsyncMock(return_value=result)
+        db.add = MagicMock()
+        db.begin_nested = MagicMock(return_value=AsyncMock())
+        return db
+
+    @pytest.mark.asyncio
+    async def test_import_processes_every_chunk(self, mock_db, batch):
+        service = ImportService(mock_db)
+        service._find_duplicate_keys = AsyncMock(return_value=set())
+        service._copy_transactions = AsyncMock()
+        chunk_sizes = []
+        import_chunk = service._import_chunk
+
+        async def spy(batch, batch_id, chunk, *args):
+            chunk_sizes.append(len(chunk))
+            await import_chunk(batch, batch_id, chunk, *args)
+
+        service._import_chunk = spy
+
+        with patch.object(ingestion_service, "IMPORT_CHUNK_SIZE", 10):
+            result = await service.import_transactions(
+                batch_id=str(uuid.uuid4()),
+                column_mapping={"date": "Date", "amount": "Amount", "description": "Description"},
+                user_id="staff-1"
+            )
+
+        assert chunk_sizes == [10, 10, 5]
+        assert result["imported_count"] == 25
+        assert service._find_duplicate_keys.await_count == 3
+        assert [len(call.args[1]) for call in service._copy_transactions.await_args_list] == [10, 10, 5]
+
+    @pytest.mark.asyncio
+    async def test_error_rows_keep_file_row_numbers(self, mock_db, batch, tmp_path):
+        batch.file_path = str(tmp_path / "bad.csv")
+        (tmp_path / "bad.csv").write_text(
+            "Date,Amount\n2025-03-01,10\nnot-a-date,5\n2025-03-02,oops\n", encoding="utf-8"
+        )
+        service = ImportService(mock_db)
+        service._find_duplicate_keys = AsyncMock(return_value=set())
+        service._copy_transactions = AsyncMock()
+
+        with patch.object(ingestion_service, "IMPORT_CHUNK_SIZE", 2):
+            result = await service.import_transactions(
+                batch_id=str(uuid.uuid4()),
+                column_mapping={"date": "Date", "amount": "Amount"},
+                user_id="staff-1"
+            )
+
+        assert result["imported_count"] == 1
+        assert [error["row"] for error in result["errors"]] == [3, 4]
+        assert batch.error_count == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicates_checked_once_per_chunk(self, mock_db, batch, tmp_path):
+        batch.file_path = str(tmp_path / "dups.csv")
+        (tmp_path / "dups.csv").write_text(
+            "Date,Amount,Description\n"
+            "2025-03-01,10.50,Coffee\n"
+            "2025-03-01,10.5,  COFFEE \n"
+            "2025-03-02,20,Existing  fuel\n"
+            "2025-03-03,30,Lunch\n",
+            encoding="utf-8"
+        )
+        service = ImportService(mock_db)
+        existing = service._duplicate_key({
+            "date": date(2025, 3, 2), "amount": Decimal("20.00"), "description": "existing fuel"
+        })
+        service._find_duplicate_keys = AsyncMock(return_value={existing})
+        service._copy_transactions = AsyncMock()
+
+        result = await service.import_transactions(
+            batch_id=str(uuid.uuid4()),
+            column_mapping={"date": "Date", "amount": "Amount", "description": "Description"},
+            user_id="staff-1"
+        )
+
+        assert service._find_duplicate_keys.await_count == 1
+        assert len(service._find_duplicate_keys.await_args.args[1]) == 4
+        copied = service._copy_transactions.await_args.args[1]
+        assert [txn["description"] for txn in copied] == ["Coffee", "Lunch"]
+        assert result["imported_count"] == 2
+        assert result["skipped_duplicates"] == 2
+
+    @pytest.mark.asyncio
+    async def test_excel_datetime_cells_match_existing_rows(self, mock_db, batch, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        wb = openpyxl.Workbook()
+        sheet = wb.active
+        sheet.append(["Date", "Amount", "Description"])
+        sheet.append([datetime(2025, 3, 2), 20, "Existing fuel"])
+        sheet.append([datetime(2025, 3, 3), 30, "Lunch"])
+        batch.file_type = "xlsx"
+        batch.file_path = str(tmp_path / "bank.xlsx")
+        wb.save(batch.file_path)
+        service = ImportService(mock_db)
+        existing = service._duplicate_key({
+            "date": date(2025, 3, 2), "amount": Decimal("20"), "description": "existing fuel"
+        })
+        service._find_duplicate_keys = AsyncMock(return_value={existing})
+        service._copy_transactions = AsyncMock()
+
+        result = await service.import_transactions(
+            batch_id=str(uuid.uuid4()),
+            column_mapping={"date": "Date", "amount": "Amount", "description": "Description"},
+            user_id="staff-1"
+        )
+
+        copied = service._copy_transactions.await_args.args[1]
+        assert [txn["date"] for txn in copied] == [date(2025, 3, 3)]
+        assert type(copied[0]["date"]) is date
+        assert result["skipped_duplicates"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_reports_errors_per_row(self, mock_db, batch):
+        service = ImportService(mock_db)
+        service._find_duplicate_keys = AsyncMock(return_value=set())
+        service._copy_transactions = AsyncMock(side_effect=RuntimeError("copy failed"))
+        inserted = []
+
+        async def insert(batch_id, client_id, txn_data):
+            if txn_data["description"] == "Purchase 3":
+                raise RuntimeError("value too long")
+            inserted.append(txn_data)
+
+        service._insert_transaction = insert
+
+        result = await service.import_transactions(
+            batch_id=str(uuid.uuid4()),
+            column_mapping={"date": "Date", "amount": "Amount", "description": "Description"},
+            user_id="staff-1"
+        )
+
+        assert result["imported_count"] == 24
+        assert len(inserted) == 24
+        assert result["errors"] == [{"row": 5, "error": "value too long"}]
@@ -0,0 +1,124 @@
+"""
+Unit Tests for MyFDC Batch Ingestion (A3-INGEST-02)
+
+Tests IngestionService.ingest_myfdc_batch with a mocked database:
+- One multi-row INSERT ... ON CONFLICT per chunk
+- Inserted/updated counts from the RETURNING clause
+- Audit trail appended on update
+- Row-by-row fallback when a chunk fails
+
+Run with: pytest tests/test_ingestion_upsert.py -v
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ingestion.services import ingestion_service
+from ingestion.services.ingestion_service import IngestionService
+
+CLIENT_ID = str(uuid.uuid4())
+
+
+def _payload(index: int) -> dict:
+    return {
+        "id": f"exp-{index}",
+        "transaction_date": "2025-03-10",
+        "transaction_type": "expense",
+        "amount": 10 + index,
+        "description": f"Expense {index}",
+        "category": "Food",
+        "gst_included": True,
+        "business_percentage": 100,
+    }
+
+
+def _returning(params: dict, existing: set) -> MagicMock:
+    """Fake RETURNING rows: existing source ids are reported as updates."""
+    rows = []
+    i = 0
+    while f"id_{i}" in params:
+        source_id = params[f"source_transaction_id_{i}"]
+        stored_id = f"stored-{source_id}" if source_id in existing else params[f"id_{i}"]
+        rows.append((stored_id, source_id, source_id not in existing))
+        i += 1
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    return result
+
+
+class TestBatchUpsert:
+    """Test the chunked ON CONFLICT upsert path."""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.begin_nested = MagicMock(return_value=AsyncMock())
+        db.commit = AsyncMock()
+        return db
+
+    def _upsert_calls(self, mock_db) -> list:
+        return [
+            call for call in mock_db.execute.call_args_list
+            if "INSERT INTO public.ingested_transactions" in str(call.args[0])
+        ]
+
+    def _wire(self, mock_db, existing=frozenset(), fail_when=None):
+        async def execute(query, params=None):
+            if "INSERT INTO public.ingested_transactions" not in str(query):
+                return MagicMock()
+            if fail_when and fail_when(params):
+                raise RuntimeError("value too long for type character varying(255)")
+            return _returning(params, existing)
+
+        mock_db.execute = AsyncMock(side_effect=execute)
+
+    @pytest.mark.asyncio
+    async def test_batch_upserted_in_chunks(self, mock_db):
+        self._wire(mock_db, existing={"exp-1", "exp-4"})
+        service = IngestionService(mock_db)
+
+        with patch.object(ingestion_service, "UPSERT_CHUNK_SIZE", 2):
+            result = await service.ingest_myfdc_batch(
+                CLIENT_ID, [_payload(i) for i in range(5)], "user-1"
+            )
+
+        upserts = self._upsert_calls(mock_db)
+        assert len(upserts) == 3  # 2 + 2 + 1 rows
+        sql = str(upserts[0].args[0])
+        assert "ON CONFLICT (source, source_transaction_id, client_id) DO UPDATE" in sql
+        assert "audit = public.ingested_transactions.audit || EXCLUDED.audit" in sql
+
+        assert result.ingested_count == 5
+        assert result.inserted_count == 3
+        assert result.updated_count == 2
+        ids = {t.source_transaction_id: t.id for t in result.transactions}
+        assert ids["exp-1"] == "stored-exp-1"
+
+    @pytest.mark.asyncio
+    async def test_repeated_source_id_starts_new_statement(self, mock_db):
+        self._wire(mock_db)
+        service = IngestionService(mock_db)
+
+        await service.ingest_myfdc_batch(
+            CLIENT_ID, [_payload(0), _payload(1), _payload(0)], "user-1"
+        )
+
+        assert len(self._upsert_calls(mock_db)) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_retried_per_row(self, mock_db):
+        # Only statements containing exp-2 fail
+        self._wire(mock_db, fail_when=lambda params: "exp-2" in params.values())
+        service = IngestionService(mock_db)
+
+        result = await service.ingest_myfdc_batch(
+            CLIENT_ID, [_payload(i) for i in range(4)], "user-1"
+        )
+
+        assert len(self._upsert_calls(mock_db)) == 5  # 1 bulk + 4 single-row
+        assert result.ingested_count == 3
+        assert result.error_count == 1
+        assert result.errors[0]["source_transaction_id"] == "exp-2"
+        assert [t.source_transaction_id for t in result.transactions] == ["exp-0", "exp-1", "exp-3"]
@@ -0,0 +1,334 @@
+"""
+Unit Tests for Normalisation Service and Worker (A3-INGEST-03)
+
+Tests queue processing with a mocked database:
+- Bounded concurrent map_category fan-out per queue item
+- Batched mapping and error UPDATEs
+- Concurrent queue items across worker lanes
+- Immediate re-poll when a batch was full
+- Category mapping cache and the deduplicated Agent 8 batch call
+
+Run with: pytest tests/test_normalisation_worker.py -v
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from ingestion.services.mapping_cache import MappingCache, mapping_cache_key
+from ingestion.services.normalisation_service import (
+    Agent8MappingClient,
+    NormalisationService,
+    NormalisationResult,
+    MappingResult,
+)
+from ingestion.workers.normalisation_worker import NormalisationWorker
+
+
+def _row(txn_id: str, category: str, status: str = "INGESTED") -> tuple:
+    return (
+        txn_id, "MYFDC", f"src-{txn_id}", str(uuid.uuid4()),
+        None, "EXPENSE", 10, "desc", category, status, json.dumps([{"action": "ingested"}])
+    )
+
+
+class TestConcurrentQueueItem:
+    """Test fan-out and batched writes for a single queue item."""
+
+    @pytest.fixture
+    def txn_ids(self):
+        return [str(uuid.uuid4()) for _ in range(6)]
+
+    @pytest.fixture
+    def mock_db(self, txn_ids):
+        db = AsyncMock()
+        rows = [_row(txn_ids[0], "fuel", status="READY_FOR_BOOKKEEPING")]
+        rows += [_row(txn_id, "fuel") for txn_id in txn_ids[1:5]]  # txn_ids[5] is missing
+
+        async def execute(query, params=None):
+            result = MagicMock()
+            result.fetchall.return_value = rows if "ANY(CAST(:ids" in str(query) else []
+            return result
+
+        db.execute = AsyncMock(side_effect=execute)
+        db.commit = AsyncMock()
+        return db
+
+    def _statements(self, mock_db, marker: str) -> list:
+        return [call for call in mock_db.execute.call_args_list if marker in str(call.args[0])]
+
+    @pytest.mark.asyncio
+    async def test_mappings_fan_out_within_limit(self, mock_db, txn_ids):
+        service = NormalisationService(mock_db, max_concurrent_mappings=2, mapping_cache=MappingCache())
+        in_flight = 0
+        peak = 0
+
+        async def map_category(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MappingResult(success=True, category_normalised="Fuel", category_code="6520", confidence=0.7)
+
+        service.mapping_client.map_category = map_category
+
+        result = await service._process_queue_item({"id": "queue-1", "transaction_ids": txn_ids})
+
+        assert peak == 2
+        assert result.transactions_succeeded == 5  # 4 mapped + 1 already normalised
+        assert result.transactions_failed == 1
+        assert result.errors == [{"transaction_id": txn_ids[5], "error": "Not found"}]
+
+        mapping_updates = self._statements(mock_db, "SET category_normalised = m.category_normalised")
+        assert len(mapping_updates) == 1
+        params = mapping_updates[0].args[1]
+        assert params["ids"] == txn_ids[1:5]
+        audit = json.loads(params["audits"][0])
+        assert [entry["action"] for entry in audit] == ["ingested", "normalised"]
+
+    @pytest.mark.asyncio
+    async def test_failures_written_in_one_update(self, mock_db, txn_ids):
+        service = NormalisationService(mock_db, max_concurrent_mappings=4, mapping_cache=MappingCache())
+
+        async def map_category(**kwargs):
+            return MappingResult(success=False, error="Agent 8 returned 503")
+
+        service.mapping_client.map_category = map_category
+
+        result = await service._process_queue_item({"id": "queue-1", "transaction_ids": txn_ids[1:3]})
+
+        error_updates = self._statements(mock_db, "error_message = f.error_message")
+        assert len(error_updates) == 1
+        assert error_updates[0].args[1]["error_messages"] == ["Agent 8 returned 503"] * 2
+        assert result.transactions_failed == 2
+
+    @pytest.mark.asyncio
+    async def test_mapping_exception_isolated(self, mock_db, txn_ids):
+        service = NormalisationService(mock_db, max_concurrent_mappings=4, mapping_cache=MappingCache())
+
+        async def map_category(**kwargs):
+            if kwargs["raw_category"] == "fuel" and map_category.calls == 0:
+                map_category.calls += 1
+                raise RuntimeError("boom")
+            return MappingResult(success=True, category_normalised="Fuel", category_code="6520", confidence=0.7)
+
+        map_category.calls = 0
+        service.mapping_client.map_category = map_category
+
+        result = await service._process_queue_item({"id": "queue-1", "transaction_ids": txn_ids[1:4]})
+
+        assert result.transactions_succeeded == 2
+        assert result.errors == [{"transaction_id": txn_ids[1], "error": "boom"}]
+
+
+class TestConcurrentWorker:
+    """Test worker lanes and re-polling."""
+
+    def _session_factory(self):
+        @asynccontextmanager
+        async def factory():
+            yield AsyncMock()
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_lanes_process_items_concurrently(self, monkeypatch):
+        queue = [f"queue-{i}" for i in range(5)]
+        in_flight = 0
+        peak = 0
+
+        async def process_queue(self, batch_size=10):
+            nonlocal in_flight, peak
+            if not queue:
+                return []
+            item = queue.pop(0)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [NormalisationResult(item, 2, 2, 0, [])]
+
+        monkeypatch.setattr(NormalisationService, "process_queue", process_queue)
+        worker = NormalisationWorker(self._session_factory(), batch_size=4, max_concurrent_items=3)
+
+        stats = await worker.process_once()
+
+        assert stats["queue_items_processed"] == 4
+        assert stats["transactions_succeeded"] == 8
+        assert peak == 3
+        assert queue == ["queue-4"]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_repolls_without_sleeping(self, monkeypatch):
+        worker = NormalisationWorker(self._session_factory(), batch_size=2, poll_interval=60)
+        polls = []
+
+        async def process_once():
+            polls.append(1)
+            if len(polls) == 3:
+                worker.stop()
+            return {
+                "queue_items_processed": 2,
+                "transactions_processed": 2,
+                "transactions_succeeded": 2,
+                "transactions_failed": 0,
+            }
+
+        worker.process_once = process_once
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+
+        await worker.run_continuous()
+
+        assert len(polls) == 3
+        sleep.assert_not_called()
+
+
+class TestMappingCache:
+    """Test the TTL + LRU mapping cache."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = MappingCache(max_entries=2)
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        await cache.get("a")  # a is now most recently used
+        await cache.set("c", {"v": 3})
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"v": 1}
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("ingestion.services.mapping_cache.time.monotonic", lambda: clock[0])
+        cache = MappingCache(ttl_seconds=60)
+        await cache.set("a", {"v": 1})
+
+        clock[0] += 61
+
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_fills_local_misses(self):
+        store = AsyncMock()
+        store.get_many = AsyncMock(return_value={
+            "EXPENSE|fuel": ({"success": True}, datetime.now(timezone.utc) + timedelta(minutes=5))
+        })
+        cache = MappingCache(store=store)
+
+        found = await cache.get_many(["EXPENSE|fuel", "EXPENSE|toys"])
+        again = await cache.get("EXPENSE|fuel")
+
+        assert found == {"EXPENSE|fuel": {"success": True}}
+        assert again == {"success": True}
+        store.get_many.assert_awaited_once_with(["EXPENSE|fuel", "EXPENSE|toys"])
+
+    def test_key_normalises_category(self):
+        assert mapping_cache_key("  Fuel   BP ", "expense") == mapping_cache_key("fuel bp", "EXPENSE")
+
+
+class TestMappingClientBatching:
+    """Test cached and batched Agent 8 mapping."""
+
+    def _client(self, handler) -> Agent8MappingClient:
+        return Agent8MappingClient(
+            base_url="http://agent8",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            cache=MappingCache()
+        )
+
+    def _requests(self, categories) -> list:
+        return [
+            {"raw_category": c, "description": None, "amount": 10.0, "transaction_type": "EXPENSE"}
+            for c in categories
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_dedupes_and_caches(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            items = json.loads(request.content)["items"]
+            return httpx.Response(200, json={"results": [
+                {"category_normalised": item["raw_category"].title(), "category_code": "6000"}
+                for item in items
+            ]})
+
+        client = self._client(handler)
+        categories = ["Fuel", "fuel ", "Toys", "Fuel", "Toys"]
+
+        results = await client.map_categories(self._requests(categories))
+        again = await client.map_categories(self._requests(categories))
+
+        assert calls == ["/api/mapping/categories"]
+        assert [r.category_normalised for r in results] == ["Fuel", "Fuel", "Toys", "Fuel", "Toys"]
+        assert [r.category_normalised for r in again] == [r.category_normalised for r in results]
+
+    @pytest.mark.asyncio
+    async def test_blank_categories_mapped_individually_and_not_cached(self):
+        sent = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            if request.url.path == "/api/mapping/category":
+                return httpx.Response(200, json={"category_normalised": body["description"], "category_code": "6000"})
+            sent.append(body["items"])
+            return httpx.Response(200, json={"results": [
+                {"category_normalised": item["description"] or item["raw_category"], "category_code": "6000"}
+                for item in body["items"]
+            ]})
+
+        client = self._client(handler)
+        requests = [
+            {"raw_category": "", "description": "Petrol", "amount": 60.0, "transaction_type": "EXPENSE"},
+            {"raw_category": None, "description": "Nappies", "amount": 25.0, "transaction_type": "EXPENSE"},
+            {"raw_category": "Fuel", "description": None, "amount": 10.0, "transaction_type": "EXPENSE"},
+        ]
+
+        results = await client.map_categories(requests)
+        again = await client.map_category("  ", description="Crayons", transaction_type="EXPENSE")
+
+        assert [item["description"] for item in sent[0]] == [None, "Petrol", "Nappies"]
+        assert [r.category_normalised for r in results] == ["Petrol", "Nappies", "Fuel"]
+        assert mapping_cache_key("", "EXPENSE") is None
+        assert again.category_normalised == "Crayons"
+        assert len(client.cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_endpoint_falls_back_per_category(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path.endswith("/categories"):
+                return httpx.Response(404)
+            body = json.loads(request.content)
+            return httpx.Response(200, json={"category_normalised": body["raw_category"], "category_code": "6000"})
+
+        client = self._client(handler)
+
+        results = await client.map_categories(self._requests(["Fuel", "Toys", "Fuel"]), max_concurrency=2)
+
+        assert calls.count("/api/mapping/category") == 2
+        assert [r.category_normalised for r in results] == ["Fuel", "Toys", "Fuel"]
+        assert client._batch_supported is False
+
+    @pytest.mark.asyncio
+    async def test_description_based_mapping_not_cached(self):
+        client = Agent8MappingClient(cache=MappingCache())
+
+        direct = await client.map_category("fuel", transaction_type="EXPENSE")
+        hinted = await client.map_category("misc", description="petrol", transaction_type="EXPENSE")
+
+        assert direct.raw_response["source"] == "preliminary_direct"
+        assert hinted.raw_response["source"] == "preliminary_description"
+        assert len(client.cache) == 1
@@ -0,0 +1,217 @@
+"""
+Unit Tests for Reconciliation Matching Rules (A3-RECON-01)
+
+Tests the MyFDC matching engine:
+- Step scoring for amount and date
+- Candidate generation via TargetIndex
+- Equivalence of blocked and full-scan matching
+- Columnar batch scoring via TargetColumns
+- Pluggable description similarity backends
+
+Run with: pytest tests/test_reconciliation_matching.py -v
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from reconciliation.matching_rules.myfdc_rules import MyFDCMatchingRules
+from reconciliation.matching_rules.similarity import (
+    SequenceMatcherSimilarity,
+    TrigramSimilarity,
+    get_similarity_backend,
+)
+from reconciliation.source_registry import TargetType
+
+
+def _random_transaction(rng: random.Random, prefix: str, index: int) -> dict:
+    """Build a random transaction dict shaped like the service's rows."""
+    base_date = date(2025, 1, 1)
+    txn_date = (base_date + timedelta(days=rng.randint(0, 90))).isoformat()
+    return {
+        "id": f"{prefix}-{index}",
+        "amount": str(rng.choice([0, rng.randint(1, 400), rng.randint(1, 40000) / 100])),
+        "transaction_date": rng.choice([txn_date, txn_date, txn_date, None]),
+        "date": txn_date if rng.random() > 0.1 else None,
+        "category_code": rng.choice(["", "6100", "6110", "6200", "7100"]),
+        "description": rng.choice(["Woolworths", "Fuel BP", "Kmart toys", "", None]),
+        "gst_included": rng.choice([True, False]),
+        "attachments": rng.choice([[], ["receipt.jpg"]]),
+        "reference": None,
+    }
+
+
+def _summarise(result) -> list:
+    return [
+        (c.target_id, c.confidence_score, c.match_type, c.scoring_breakdown)
+        for c in result.candidates
+    ]
+
+
+class TestScoringSteps:
+    """Test the amount and date step functions."""
+
+    @pytest.fixture
+    def rules(self):
+        return MyFDCMatchingRules()
+
+    def test_amount_steps(self, rules):
+        source = {"amount": "100.00"}
+        assert rules._score_amount(source, {"amount": "100.00"}) == 1.0
+        assert rules._score_amount(source, {"amount": "100.50"}) == 0.95
+        assert rules._score_amount(source, {"amount": "104.00"}) == 0.8
+        assert rules._score_amount(source, {"amount": "109.00"}) == 0.6
+        assert rules._score_amount(source, {"amount": "119.00"}) == 0.3
+        assert rules._score_amount(source, {"amount": "130.00"}) == 0.0
+
+    def test_date_steps(self, rules):
+        source = {"transaction_date": "2025-03-10"}
+        assert rules._score_date(source, {"date": "2025-03-10"}) == 1.0
+        assert rules._score_date(source, {"date": "2025-03-11"}) == 0.9
+        assert rules._score_date(source, {"date": "2025-03-13"}) == 0.7
+        assert rules._score_date(source, {"date": "2025-03-17"}) == 0.4
+        assert rules._score_date(source, {"date": "2025-03-24"}) == 0.2
+        assert rules._score_date(source, {"date": "2025-04-10"}) == 0.0
+        assert rules._score_date(source, {"date": None}) == 0.5
+        assert rules._score_date(source, {"date": "not-a-date"}) == 0.5
+
+
+class TestCandidateGeneration:
+    """Test blocking candidate generation for reconciliation runs."""
+
+    @pytest.fixture
+    def rules(self):
+        return MyFDCMatchingRules()
+
+    def test_far_targets_are_pruned(self, rules):
+        source = {"id": "s", "amount": "100.00", "transaction_date": "2025-03-10"}
+        targets = [
+            {"id": "near", "amount": "100.00", "date": "2025-03-10"},
+            {"id": "amount-only", "amount": "101.00", "date": "2025-06-01"},
+            {"id": "date-only", "amount": "900.00", "date": "2025-03-11"},
+            {"id": "far", "amount": "900.00", "date": "2025-06-01"},
+        ]
+
+        index = rules.build_target_index(targets)
+        candidate_ids = [t["id"] for t in rules.candidate_targets(source, index)]
+
+        assert candidate_ids == ["near", "amount-only", "date-only"]
+
+    def test_unparseable_targets_are_always_scored(self, rules):
+        source = {"id": "s", "amount": "100.00", "transaction_date": "2025-03-10"}
+        targets = [{"id": "odd", "amount": "900.00", "date": "10/03/2025"}]
+
+        index = rules.build_target_index(targets)
+
+        assert rules.candidate_targets(source, index) == targets
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_blocked_matches_equal_full_scan(self, rules, seed):
+        rng = random.Random(seed)
+        sources = [_random_transaction(rng, "src", i) for i in range(60)]
+        targets = [_random_transaction(rng, "tgt", i) for i in range(300)]
+
+        index = rules.build_target_index(targets)
+
+        for source in sources:
+            full = rules.find_matches(source, targets, TargetType.BANK)
+            blocked = rules.find_matches(
+                source,
+                rules.candidate_targets(source, index),
+                TargetType.BANK
+            )
+            assert _summarise(blocked) == _summarise(full)
+            assert blocked.auto_matched == full.auto_matched
+            assert blocked.suggested_match == full.suggested_match
+
+
+class TestBatchScoring:
+    """Test columnar batch scoring against the scalar rules."""
+
+    @pytest.fixture
+    def rules(self):
+        return MyFDCMatchingRules()
+
+    def test_non_vectorizable_rows_fall_back_to_scalar(self, rules):
+        source = {"id": "s", "amount": "100.00", "transaction_date": "2025-03-10"}
+        targets = [
+            {"id": "fractional", "amount": "100.004", "date": "2025-03-10"},
+            {"id": "odd-date", "amount": "100.00", "date": "10/03/2025"},
+        ]
+
+        columns = rules.build_target_columns(targets)
+
+        assert not columns.vectorizable.any()
+        assert _summarise(rules.find_matches_batch(source, columns, TargetType.BANK)) == \
+            _summarise(rules.find_matches(source, targets, TargetType.BANK))
+
+    @pytest.mark.parametrize("seed", [4, 5, 6])
+    def test_batch_matches_equal_scalar(self, rules, seed):
+        rng = random.Random(seed)
+        sources = [_random_transaction(rng, "src", i) for i in range(60)]
+        targets = [_random_transaction(rng, "tgt", i) for i in range(300)]
+
+        index = rules.build_target_index(targets)
+        columns = rules.build_target_columns(targets)
+
+        for source in sources:
+            full = rules.find_matches(source, targets, TargetType.BANK)
+            batch = rules.find_matches_batch(
+                source,
+                columns,
+                TargetType.BANK,
+                rules.candidate_positions(source, index)
+            )
+            assert _summarise(batch) == _summarise(full)
+            assert batch.auto_matched == full.auto_matched
+            assert batch.suggested_match == full.suggested_match
+
+
+class TestDescriptionSimilarity:
+    """Test the description similarity backends."""
+
+    DESCRIPTIONS = ["woolworths metro", "woolworths 1234 sydney", "bp fuel", "kmart toys", ""]
+
+    def test_sequence_matcher_backend_is_exact(self):
+        backend = SequenceMatcherSimilarity()
+        index = backend.build_index(list(self.DESCRIPTIONS))
+        rules = MyFDCMatchingRules()
+
+        scores = backend.score_many("woolworths", index, range(len(self.DESCRIPTIONS)))
+
+        expected = [
+            rules._score_description({"description": "Woolworths"}, {"description": text})
+            for text in self.DESCRIPTIONS
+        ]
+        assert scores == expected
+        assert scores[-1] == 0.5
+
+    def test_trigram_backend_rescores_top_k_exactly(self):
+        backend = TrigramSimilarity(top_k=1)
+        index = backend.build_index(list(self.DESCRIPTIONS))
+        exact = SequenceMatcherSimilarity().score_many(
+            "woolworths", SequenceMatcherSimilarity().build_index(list(self.DESCRIPTIONS)), range(5)
+        )
+
+        scores = backend.score_many("woolworths", index, range(len(self.DESCRIPTIONS)))
+
+        assert scores[0] == exact[0]  # best overlap rescored exactly
+        assert scores[0] > scores[2] and scores[1] > scores[3]
+        assert scores[-1] == 0.5
+
+    def test_trigram_rules_keep_best_match(self):
+        rules = MyFDCMatchingRules(description_similarity=TrigramSimilarity(top_k=3))
+        source = {"id": "s", "amount": "50.00", "transaction_date": "2025-03-10", "description": "Kmart toys"}
+        targets = [
+            {"id": "t0", "amount": "50.00", "date": "2025-03-10", "description": "BP fuel"},
+            {"id": "t1", "amount": "50.00", "date": "2025-03-10", "description": "KMART TOYS 042"},
+        ]
+
+        result = rules.find_matches_batch(source, rules.build_target_columns(targets), TargetType.BANK)
+
+        assert result.best_match.target_id == "t1"
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            get_similarity_backend("soundex")
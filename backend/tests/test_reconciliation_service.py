@@ -0,0 +1,316 @@
+"""
+Unit Tests for Reconciliation Service (A3-RECON-01)
+
+Tests the reconciliation run pipeline with a mocked database:
+- Bulk persistence of match and no-match rows
+- Incremental runs driven by the client watermark
+- Process-pool scoring and the multi-client batch scheduler
+
+Run with: pytest tests/test_reconciliation_service.py -v
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from reconciliation.matching_rules.myfdc_rules import myfdc_rules
+from reconciliation.services.batch_scheduler import ReconciliationBatchScheduler
+from reconciliation.services import reconciliation_service
+from reconciliation.services.reconciliation_service import (
+    ReconciliationAuditEvent,
+    ReconciliationService,
+    ReconciliationWatermark,
+    MATCH_INSERT_COLUMNS,
+    _target_fingerprint,
+    score_reconciliation,
+)
+from reconciliation.source_registry import MatchStatus, ReconciliationSource, TargetType
+
+WATERMARK = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+def _source(index: int, amount: str, txn_date: str = "2025-03-10") -> dict:
+    return {
+        "id": f"src-{index}",
+        "client_id": "client-1",
+        "transaction_date": txn_date,
+        "amount": amount,
+        "description": "Woolworths",
+        "category_code": "6100",
+        "gst_included": True,
+        "attachments": [],
+    }
+
+
+def _target(index: int, amount: str) -> dict:
+    return {
+        "id": f"tgt-{index}",
+        "date": "2025-03-10",
+        "transaction_date": "2025-03-10",
+        "amount": amount,
+        "description": "Woolworths",
+        "category_code": "6100",
+        "gst_included": True,
+        "attachments": [],
+        "reference": None,
+    }
+
+
+class TestBulkPersistence:
+    """Test that run results are written with chunked multi-row inserts."""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock())
+        db.commit = AsyncMock()
+        return db
+
+    def _insert_calls(self, mock_db) -> list:
+        return [
+            call for call in mock_db.execute.call_args_list
+            if "INSERT INTO public.reconciliation_matches" in str(call.args[0])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_writes_rows_in_chunks(self, mock_db):
+        service = ReconciliationService(mock_db, store_chunk_size=4)
+        # Even sources match a target exactly, odd sources match nothing
+        sources = [
+            _source(i, "100.00") if i % 2 == 0 else _source(i, "5000.00", "2025-06-01")
+            for i in range(10)
+        ]
+        service._get_unreconciled_transactions = AsyncMock(return_value=sources)
+        service._get_all_target_transactions = AsyncMock(return_value=[_target(0, "100.00")])
+
+        result = await service.run_reconciliation("client-1")
+
+        insert_calls = self._insert_calls(mock_db)
+        assert len(insert_calls) == 3  # 4 + 4 + 2 rows
+        assert result.total_transactions == 10
+        assert result.auto_matched == 5
+        assert result.no_match == 5
+
+        written = {}
+        for call in insert_calls:
+            params = call.args[1]
+            rows = len(params) // len(MATCH_INSERT_COLUMNS)
+            for i in range(rows):
+                written[params[f"id_{i}"]] = params
+                if params[f"match_status_{i}"] == "NO_MATCH":
+                    assert params[f"target_transaction_id_{i}"] is None
+                    assert "candidates_considered" in json.loads(params[f"scoring_breakdown_{i}"])
+
+        assert set(written) == {match["match_id"] for match in result.matches}
+
+    @pytest.mark.asyncio
+    async def test_match_created_logged_only_after_chunk_insert(self, mock_db, monkeypatch):
+        events = []
+        monkeypatch.setattr(
+            reconciliation_service, "log_reconciliation_event",
+            lambda event, client_id, details, match_id=None: events.append((event, match_id))
+        )
+        mock_db.execute = AsyncMock(side_effect=[MagicMock(), RuntimeError("insert failed")])
+        service = ReconciliationService(mock_db, store_chunk_size=2)
+        match = myfdc_rules.find_matches(_source(0, "100.00"), [_target(0, "100.00")], TargetType.BANK).best_match
+        rows = [
+            service._build_match_row(
+                "client-1", _source(i, "100.00"), match, ReconciliationSource.MYFDC, MatchStatus.SUGGESTED, False
+            )
+            for i in range(4)
+        ]
+        rows[1] = service._build_no_match_row("client-1", _source(1, "1.00"), ReconciliationSource.MYFDC, TargetType.BANK, [])
+
+        with pytest.raises(RuntimeError):
+            await service._store_match_rows(rows)
+
+        assert events == [(ReconciliationAuditEvent.MATCH_CREATED, rows[0]["id"])]
+
+    @pytest.mark.asyncio
+    async def test_chunk_size_respects_bind_parameter_limit(self, mock_db):
+        service = ReconciliationService(mock_db, store_chunk_size=1_000_000)
+
+        assert service.store_chunk_size * len(MATCH_INSERT_COLUMNS) <= 32767
+
+
+class TestIncrementalReconciliation:
+    """Test watermark-driven incremental runs."""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock())
+        db.commit = AsyncMock()
+        return db
+
+    @pytest.fixture
+    def service(self, mock_db):
+        service = ReconciliationService(mock_db)
+        service._get_watermark = AsyncMock(return_value=ReconciliationWatermark(
+            client_id="client-1",
+            source_type="MYFDC",
+            target_type="BANK",
+            source_watermark=WATERMARK,
+            target_watermark=WATERMARK
+        ))
+        service._advance_watermark = AsyncMock()
+        service._store_match_rows = AsyncMock()
+        return service
+
+    def _stamp(self, txn: dict, key: str, offset_days: int) -> dict:
+        txn[key] = WATERMARK + timedelta(days=offset_days)
+        return txn
+
+    @pytest.mark.asyncio
+    async def test_unchanged_suggestion_is_reused(self, service):
+        source = self._stamp(_source(0, "100.00"), "updated_at", -10)
+        target = self._stamp(_target(0, "100.00"), "created_at", -10)
+        service._get_unreconciled_transactions = AsyncMock(return_value=[source])
+        service._get_all_target_transactions = AsyncMock(return_value=[target])
+        service._get_prior_results = AsyncMock(return_value={
+            "src-0": {
+                "id": "prior-match",
+                "target_transaction_id": "tgt-0",
+                "match_status": "SUGGESTED",
+                "confidence_score": 0.7,
+                "target_fingerprint": _target_fingerprint(target)
+            }
+        })
+
+        result = await service.run_reconciliation("client-1", incremental=True)
+
+        assert result.incremental is True
+        assert result.reused == 1
+        assert result.suggested == 1
+        assert result.matches[0]["match_id"] == "prior-match"
+        assert service._store_match_rows.call_args.args[0] == []
+
+    @pytest.mark.asyncio
+    async def test_suggestion_to_changed_target_is_rescored(self, service):
+        source = self._stamp(_source(0, "100.00"), "updated_at", -10)
+        target = self._stamp(_target(0, "100.00"), "created_at", -10)
+        scored = _target_fingerprint({**target, "amount": "95.00"})
+        service._get_unreconciled_transactions = AsyncMock(return_value=[source])
+        service._get_all_target_transactions = AsyncMock(return_value=[target])
+        service._get_prior_results = AsyncMock(return_value={
+            "src-0": {
+                "id": "prior-match",
+                "target_transaction_id": "tgt-0",
+                "match_status": "SUGGESTED",
+                "confidence_score": 0.7,
+                "target_fingerprint": scored
+            }
+        })
+
+        result = await service.run_reconciliation("client-1", incremental=True)
+
+        assert result.reused == 0
+        assert result.auto_matched == 1
+        row = service._store_match_rows.call_args.args[0][0]
+        assert json.loads(row["scoring_breakdown"])["target_fingerprint"] == _target_fingerprint(target)
+
+    @pytest.mark.asyncio
+    async def test_prior_results_limited_to_target_type(self, service, mock_db):
+        await service._get_prior_results("client-1", ReconciliationSource.MYFDC, TargetType.RECEIPT, ["src-0"])
+
+        sql, params = mock_db.execute.call_args.args
+        assert "target_type = :target_type" in str(sql)
+        assert "UNKNOWN" not in str(sql)
+        assert params["target_type"] == "RECEIPT"
+
+    def test_no_match_row_records_target_type(self, service):
+        row = service._build_no_match_row("client-1", _source(0, "1.00"), ReconciliationSource.MYFDC, TargetType.BANK, [])
+
+        assert row["target_type"] == "BANK"
+
+    @pytest.mark.asyncio
+    async def test_changed_source_is_rescored(self, service):
+        source = self._stamp(_source(0, "100.00"), "updated_at", 1)
+        target = self._stamp(_target(0, "100.00"), "created_at", -10)
+        service._get_unreconciled_transactions = AsyncMock(return_value=[source])
+        service._get_all_target_transactions = AsyncMock(return_value=[target])
+        service._get_prior_results = AsyncMock(return_value={
+            "src-0": {
+                "id": "prior-match",
+                "target_transaction_id": None,
+                "match_status": "NO_MATCH",
+                "confidence_score": 0
+            }
+        })
+
+        result = await service.run_reconciliation("client-1", incremental=True)
+
+        assert result.reused == 0
+        assert result.auto_matched == 1
+        assert len(service._store_match_rows.call_args.args[0]) == 1
+
+    @pytest.mark.asyncio
+    async def test_new_target_beats_prior_no_match(self, service):
+        source = self._stamp(_source(0, "100.00"), "updated_at", -10)
+        old_target = self._stamp(_target(0, "900.00"), "created_at", -10)
+        old_target["date"] = old_target["transaction_date"] = "2025-01-01"
+        new_target = self._stamp(_target(1, "100.00"), "created_at", 1)
+        service._get_unreconciled_transactions = AsyncMock(return_value=[source])
+        service._get_all_target_transactions = AsyncMock(return_value=[old_target, new_target])
+        service._get_prior_results = AsyncMock(return_value={
+            "src-0": {
+                "id": "prior-match",
+                "target_transaction_id": None,
+                "match_status": "NO_MATCH",
+                "confidence_score": 0
+            }
+        })
+
+        result = await service.run_reconciliation("client-1", incremental=True)
+
+        assert result.reused == 0
+        assert result.matches[0]["target_id"] == "tgt-1"
+
+
+class TestParallelReconciliation:
+    """Test process-pool scoring and the batch scheduler."""
+
+    def test_scoring_in_process_pool_matches_inline(self):
+        sources = [_source(i, f"{100 + i}.00") for i in range(20)]
+        targets = [_target(i, f"{100 + i}.00") for i in range(20)]
+
+        inline = score_reconciliation(myfdc_rules, sources, targets, TargetType.BANK)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            pooled = executor.submit(
+                score_reconciliation, myfdc_rules, sources, targets, TargetType.BANK
+            ).result()
+
+        assert [r.best_match.target_id for r in pooled] == [r.best_match.target_id for r in inline]
+
+    @pytest.mark.asyncio
+    async def test_scheduler_streams_each_client(self, monkeypatch):
+        async def fake_sources(self, client_id, source_type, transaction_ids=None):
+            if client_id == "broken":
+                raise RuntimeError("database unavailable")
+            return [_source(0, "100.00")]
+
+        monkeypatch.setattr(ReconciliationService, "_get_unreconciled_transactions", fake_sources)
+        monkeypatch.setattr(
+            ReconciliationService, "_get_all_target_transactions",
+            AsyncMock(return_value=[_target(0, "100.00")])
+        )
+
+        @asynccontextmanager
+        async def session_factory():
+            db = AsyncMock()
+            db.execute = AsyncMock(return_value=MagicMock())
+            yield db
+
+        scheduler = ReconciliationBatchScheduler(session_factory, max_concurrent_clients=2, max_workers=1)
+        items = [item async for item in scheduler.run(["client-1", "broken", "client-2", "client-1"])]
+
+        by_client = {item.client_id: item for item in items}
+        assert len(items) == 3
+        assert by_client["client-1"].success and by_client["client-1"].result.auto_matched == 1
+        assert by_client["client-2"].success
+        assert not by_client["broken"].success
+        assert "database unavailable" in by_client["broken"].error
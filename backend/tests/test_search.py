@@ -0,0 +1,144 @@
+"""
+Unit Tests for Full-Text Search
+
+Tests the shared search engine and its consumers:
+- Query parser (prefix words, "quoted phrases", operator safety)
+- Terms tokenised server-side, one bound tsquery per term
+- Search clause building (tsvector match, trigram substrings, rank)
+- Bookkeeper transaction list, bookkeeping-ready API and client profiles
+
+Run with: pytest tests/test_search.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.client_profiles import ClientProfileService
+from ingestion.endpoints.bookkeeping_ready import BookkeepingReadyService
+from services.search import (
+    CLIENT_PROFILES_SEARCH,
+    SearchIndex,
+    SearchTerm,
+    TRANSACTIONS_SEARCH,
+    parse_search_query,
+)
+from services.transaction_service import TransactionFilter, TransactionRepository
+
+
+def _result(rows=None, scalar=0) -> MagicMock:
+    result = MagicMock()
+    result.fetchall.return_value = rows or []
+    result.scalars.return_value.all.return_value = rows or []
+    result.scalar.return_value = scalar
+    return result
+
+
+class TestQueryParser:
+    """Test search text parsing."""
+
+    def test_words_are_prefixes_and_quotes_are_phrases(self):
+        terms = parse_search_query('Rent "Home Office" bunnings*')
+
+        assert terms == [
+            SearchTerm(text="Rent"),
+            SearchTerm(text="Home Office", phrase=True),
+            SearchTerm(text="bunnings"),
+        ]
+        assert [term.tsquery_param() for term in terms] == ["'Rent':*", "Home Office", "'bunnings':*"]
+
+    @pytest.mark.parametrize("word", ["netflix.com", "john@x.com", "12.50", "K-Mart", "/var/log"])
+    def test_words_are_passed_whole_for_postgres_to_tokenise(self, word):
+        assert parse_search_query(word) == [SearchTerm(text=word)]
+
+    @pytest.mark.parametrize("query", ["", None, '"" * -- ()', "%%"])
+    def test_no_searchable_terms(self, query):
+        assert parse_search_query(query) == []
+        assert TRANSACTIONS_SEARCH.build(query) is None
+
+    def test_tsquery_operators_stay_inside_the_quoted_operand(self):
+        terms = parse_search_query("rent & !fuel | y:* o'brien\\")
+
+        assert [term.tsquery_param() for term in terms] == [
+            "'rent':*", "'!fuel':*", "'y:':*", "'o''brien\\\\':*",
+        ]
+
+
+class TestSearchIndex:
+    """Test search clause building."""
+
+    def test_vector_only(self):
+        clause = TRANSACTIONS_SEARCH.build("rent")
+
+        assert clause.condition == "(transactions.search_vector @@ to_tsquery('simple', :search_term_0))"
+        assert clause.rank.startswith("ts_rank_cd(transactions.search_vector")
+        assert clause.params == {"search_term_0": "'rent':*"}
+
+    def test_one_tsquery_per_term(self):
+        clause = TRANSACTIONS_SEARCH.build('netflix.com "12.50 AUD"')
+
+        tsquery = "(to_tsquery('simple', :search_term_0) && phraseto_tsquery('simple', :search_term_1))"
+        assert clause.condition == f"(transactions.search_vector @@ {tsquery})"
+        assert clause.rank == f"ts_rank_cd(transactions.search_vector, {tsquery})"
+        assert clause.params == {"search_term_0": "'netflix.com':*", "search_term_1": "12.50 AUD"}
+
+    def test_trigram_columns_and_escaping(self):
+        clause = CLIENT_PROFILES_SEARCH.build('51 824 "100%"', param="q")
+
+        assert "client_profiles.abn ILIKE :q_like" in clause.condition
+        assert "client_profiles.client_code ILIKE :q_like" in clause.condition
+        assert "GREATEST(similarity(" in clause.rank
+        assert clause.params["q_like"] == "%51 824 100\\%%"
+        assert clause.params["q_text"] == "51 824 100%"
+        assert clause.params["q_term_2"] == "100%"
+
+    def test_custom_index(self):
+        clause = SearchIndex(table="kb_entries", vector_column="fts", config="english").build("gst")
+
+        assert "kb_entries.fts @@ to_tsquery('english'" in clause.condition
+
+
+class TestSearchConsumers:
+    """Test the engine's use by list endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_transaction_list_uses_search_vector(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[_result(scalar=0), _result()])
+        repo = TransactionRepository(session)
+
+        await repo.list_transactions(TransactionFilter(client_id="client-1", search="fuel"))
+
+        compiled = session.execute.call_args_list[1].args[0].compile(dialect=postgresql.dialect())
+        assert "transactions.search_vector @@ to_tsquery" in str(compiled)
+        assert "ILIKE" not in str(compiled)
+        assert compiled.params["search_term_0"] == "'fuel':*"
+
+    @pytest.mark.asyncio
+    async def test_bookkeeping_ready_ranks_results(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result(scalar=0), _result()])
+
+        await BookkeepingReadyService(db).get_transactions("client-1", search='"office chair"')
+
+        count_sql, count_params = db.execute.call_args_list[0].args
+        data_sql, data_params = db.execute.call_args_list[1].args
+        assert "ingested_transactions.search_vector @@" in str(count_sql)
+        assert "ORDER BY (ts_rank_cd(" in str(data_sql)
+        assert "phraseto_tsquery('simple', :search_term_0)" in str(data_sql)
+        assert data_params["search_term_0"] == "office chair"
+        assert count_params["search_like"] == "%office chair%"
+
+    @pytest.mark.asyncio
+    async def test_client_profile_search_ranks_results(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result())
+
+        await ClientProfileService(db).search(query_str="smith", client_status="active")
+
+        sql, params = db.execute.call_args.args
+        assert "client_profiles.search_vector @@" in str(sql)
+        assert "DESC, display_name ASC" in str(sql)
+        assert params["search_term_0"] == "'smith':*"
+        assert params["client_status"] == "active"
@@ -0,0 +1,165 @@
+"""
+Unit Tests for the Bulk SMS Dispatcher
+
+Tests the shared bulk send engine and its use by the Agent 5 proxy:
+- Sliding-window concurrency (no fixed batches)
+- Token-bucket rate limiting
+- Streaming results in completion order
+- Batched per-message audit writes
+
+Run with: pytest tests/test_sms_dispatch.py -v
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.sms_dispatch import BulkSMSDispatcher, TokenBucket
+from services.sms_proxy import SMSProxyService, SMSProxyResponse, SMSSendRequest
+
+
+class TestTokenBucket:
+    """Test the async token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        bucket = TokenBucket(rate_per_second=50, burst=5)
+
+        start = time.monotonic()
+        for _ in range(10):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # 5 immediate tokens, then 5 more at 50/s
+        assert elapsed >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket(rate_per_second=0)
+
+        start = time.monotonic()
+        for _ in range(1000):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.5
+
+
+class TestBulkSMSDispatcher:
+    """Test sliding-window dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_sliding_window_does_not_wait_for_slowest(self):
+        started = []
+        in_flight = 0
+        peak = 0
+
+        async def send(index, item):
+            nonlocal in_flight, peak
+            started.append(index)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.2 if index == 0 else 0.01)
+            in_flight -= 1
+            return item
+
+        dispatcher = BulkSMSDispatcher(max_concurrency=3)
+        completed = [outcome.index async for outcome in dispatcher.stream(list(range(10)), send)]
+
+        assert peak == 3
+        assert sorted(completed) == list(range(10))
+        # Everything else finished while the slow first send was in flight
+        assert completed[-1] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_captured_per_item(self):
+        async def send(index, item):
+            if item == "bad":
+                raise RuntimeError("provider exploded")
+            return item.upper()
+
+        dispatcher = BulkSMSDispatcher(max_concurrency=2)
+        outcomes = await dispatcher.run(["a", "bad", "c"], send)
+
+        assert [o.result for o in outcomes] == ["A", None, "C"]
+        assert isinstance(outcomes[1].error, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_on_batch_receives_every_outcome_in_batches(self):
+        batches = []
+
+        async def send(index, item):
+            return item
+
+        async def on_batch(outcomes):
+            batches.append(len(outcomes))
+
+        dispatcher = BulkSMSDispatcher(max_concurrency=4, audit_batch_size=10)
+        await dispatcher.run(list(range(25)), send, on_batch=on_batch)
+
+        assert sum(batches) == 25
+        assert len(batches) <= 4
+
+
+class TestProxyBulkSMS:
+    """Test SMSProxyService bulk sends through the dispatcher."""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock())
+        db.commit = AsyncMock()
+        return db
+
+    def _requests(self, count: int):
+        return [
+            SMSSendRequest(to=f"+6140000{i:04d}", message="BAS reminder", source="myfdc", client_id=f"c-{i}")
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_results_in_input_order_with_batched_audit(self, mock_db):
+        service = SMSProxyService(mock_db)
+        service.config['rate_per_second'] = 0
+
+        async def forward(request, request_id, http_client=None):
+            if request.client_id == "c-3":
+                return SMSProxyResponse(success=False, status='failed', error="HTTP 400: bad number")
+            return SMSProxyResponse(success=True, message_id=f"msg-{request.client_id}", status='sent')
+
+        service._forward_to_agent5 = forward
+
+        result = await service.send_bulk_sms(self._requests(12), "myfdc")
+
+        assert result.total == 12
+        assert result.sent == 11
+        assert result.failed == 1
+        assert result.results[0]['message_id'] == "msg-c-0"
+        assert result.results[3]['success'] is False
+
+        audit_inserts = [
+            call for call in mock_db.execute.call_args_list
+            if "INSERT INTO public.webhook_audit_log" in str(call.args[0])
+        ]
+        # bulk request + one batch of 12 per-message rows + bulk result
+        assert len(audit_inserts) == 3
+        batch_params = audit_inserts[1].args[1]
+        assert len([k for k in batch_params if k.startswith('details_')]) == 12
+        assert not any("+6140000" in str(value) for value in batch_params.values())
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_as_completed(self, mock_db):
+        service = SMSProxyService(mock_db)
+        service.config['rate_per_second'] = 0
+
+        async def forward(request, request_id, http_client=None):
+            await asyncio.sleep(0.1 if request.client_id == "c-0" else 0)
+            return SMSProxyResponse(success=True, message_id=request.client_id, status='sent')
+
+        service._forward_to_agent5 = forward
+
+        order = [index async for index, _ in service.stream_bulk_sms(self._requests(5), "crm")]
+
+        assert sorted(order) == list(range(5))
+        assert order[-1] == 0
@@ -0,0 +1,128 @@
+"""
+Unit Tests for Transaction List Pagination
+
+Tests TransactionRepository.list_transactions keyset paging:
+- Cursor encodes the full (date, created_at, id) sort tuple
+- Row-value comparison instead of the created_at-only predicate
+- count_mode: exact, estimated (EXPLAIN) and none
+
+Run with: pytest tests/test_transaction_pagination.py -v
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from database.transaction_models import BookkeeperTransactionDB, TransactionSource, TransactionStatus
+from services.transaction_service import (
+    TransactionFilter,
+    TransactionRepository,
+    _decode_cursor,
+    _encode_cursor,
+)
+
+
+def _txn(index: int) -> BookkeeperTransactionDB:
+    return BookkeeperTransactionDB(
+        id=f"txn-{index:04d}",
+        client_id="client-1",
+        date=date(2025, 8, 1),
+        created_at=datetime(2025, 8, 1, 9, 0, index, tzinfo=timezone.utc),
+        amount=10,
+        source=TransactionSource.BANK,
+        status_bookkeeper=TransactionStatus.NEW,
+    )
+
+
+def _result(items=None, scalar=None) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = items or []
+    result.scalar.return_value = scalar
+    result.__iter__.return_value = iter([])
+    return result
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestCursor:
+    """Test keyset cursor encoding."""
+
+    def test_round_trip(self):
+        txn = _txn(3)
+
+        assert _decode_cursor(_encode_cursor(txn)) == (txn.date, txn.created_at, txn.id)
+
+    @pytest.mark.parametrize("cursor", ["2025-08-01T09:00:00+00:00|txn-1", "not-a-date|x|y", ""])
+    def test_malformed_cursor_raises(self, cursor):
+        with pytest.raises(ValueError):
+            _decode_cursor(cursor)
+
+
+class TestListTransactions:
+    """Test keyset paging and count modes."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_uses_row_value_comparison(self):
+        items = [_txn(i) for i in range(3)]
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[_result(items=items), _result()])
+        repo = TransactionRepository(session)
+
+        page = await repo.list_transactions(
+            TransactionFilter(client_id="client-1"),
+            cursor=_encode_cursor(_txn(9)),
+            limit=2,
+            count_mode="none",
+        )
+
+        sql = _sql(session.execute.call_args_list[0].args[0])
+        assert "(transactions.date, transactions.created_at, transactions.id) <" in sql
+        assert "ORDER BY transactions.date DESC, transactions.created_at DESC, transactions.id DESC" in sql
+        assert page.total is None
+        assert page.has_more
+        assert [t.id for t in page.items] == ["txn-0000", "txn-0001"]
+        assert page.cursor == _encode_cursor(items[1])
+
+    @pytest.mark.asyncio
+    async def test_exact_count(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[_result(scalar=42), _result(items=[_txn(0)]), _result()])
+        repo = TransactionRepository(session)
+
+        page = await repo.list_transactions(TransactionFilter(client_id="client-1", search="rent"))
+
+        assert "count(" in _sql(session.execute.call_args_list[0].args[0])
+        assert page.total == 42
+        assert not page.total_is_estimate
+        assert page.cursor is None
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_uses_explain(self):
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[
+            _result(scalar='[{"Plan": {"Node Type": "Index Scan", "Plan Rows": 1234}}]'),
+            _result(items=[]),
+        ])
+        repo = TransactionRepository(session)
+
+        page = await repo.list_transactions(
+            TransactionFilter(client_id="client-1", status="NEW"),
+            count_mode="estimated",
+        )
+
+        explain = session.execute.call_args_list[0].args[0]
+        assert str(explain).startswith("EXPLAIN (FORMAT JSON) SELECT transactions.id")
+        assert explain.compile().params["client_id_1"] == "client-1"
+        assert page.total == 1234
+        assert page.total_is_estimate
+
+    @pytest.mark.asyncio
+    async def test_invalid_count_mode(self):
+        repo = TransactionRepository(AsyncMock())
+
+        with pytest.raises(ValueError):
+            await repo.list_transactions(TransactionFilter(), count_mode="approximate")
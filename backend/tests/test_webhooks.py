@@ -8,10 +8,13 @@ Tests all webhook functionality:
 - Retry logic with exponential backoff
 - Dead-letter queue
 - Audit logging
+- Concurrent delivery engine (SKIP LOCKED claims, per-URL limits, batched updates)
+- Batched fan-out and the subscription cache
 
 Run with: pytest tests/test_webhooks.py -v
 """
 
+import asyncio
 import pytest
 import uuid
 import json
@@ -20,8 +23,12 @@ import hashlib
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+
 from services.webhook_service import (
     WebhookService,
+    WebhookDeliveryEngine,
+    SubscriptionCache,
     WebhookEventType,
     DeliveryStatus,
     AuditEventType,
@@ -528,5 +535,224 @@ class TestAuditLogging:
             assert event in actual_events
 
 
+class TestConcurrentDelivery:
+    """Test the concurrent delivery engine."""
+    
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=MagicMock())
+        db.commit = AsyncMock()
+        return db
+    
+    def _item(self, url: str, attempts: int = 0):
+        return MagicMock(
+            id=uuid.uuid4(),
+            webhook_id=uuid.uuid4(),
+            event_type='myfdc.hours.logged',
+            payload='{"event": "myfdc.hours.logged", "timestamp": "t"}',
+            attempts=attempts,
+            url=url,
+            secret_key='secret',
+            service_name='crm'
+        )
+    
+    def _sql(self, mock_db) -> list:
+        return [str(call.args[0]) for call in mock_db.execute.call_args_list]
+    
+    @pytest.mark.asyncio
+    async def test_claim_uses_skip_locked(self, mock_db):
+        service = WebhookService(mock_db, engine=WebhookDeliveryEngine(max_in_flight_per_url=2))
+        
+        stats = await service.process_delivery_queue(batch_size=5)
+        
+        claim_sql = self._sql(mock_db)[0]
+        assert "FOR UPDATE OF q SKIP LOCKED" in claim_sql
+        assert "url_rank <= :per_url" in claim_sql
+        assert mock_db.execute.call_args_list[0].args[1]['per_url'] == 2
+        assert stats == {'delivered': 0, 'failed': 0, 'dead_letter': 0}
+    
+    @pytest.mark.asyncio
+    async def test_per_url_cap_applies_before_batch_limit(self, mock_db):
+        # A backlog larger than any scan window must not hide other subscribers'
+        # due rows: each webhook contributes at most per_url rows before LIMIT
+        service = WebhookService(mock_db, engine=WebhookDeliveryEngine(max_in_flight_per_url=2))
+        
+        await service._claim_deliveries(batch_size=5)
+        
+        claim_sql, params = mock_db.execute.call_args.args
+        sql = claim_sql.text
+        per_webhook = sql[sql.index("CROSS JOIN LATERAL"):sql.index("claimed AS")]
+        assert "WHERE q.webhook_id = w.id" in per_webhook
+        assert "LIMIT :per_url" in per_webhook
+        assert "FOR UPDATE OF q SKIP LOCKED" in per_webhook
+        assert sql.index("LIMIT :limit") > sql.index("claimed AS")
+        assert "scan_limit" not in params
+        assert params['per_url'] == 2 and params['limit'] == 5
+    
+    @pytest.mark.asyncio
+    async def test_outcomes_written_in_batches(self, mock_db):
+        items = [
+            self._item('https://a.example.com'),
+            self._item('https://a.example.com'),
+            self._item('https://b.example.com', attempts=0),
+            self._item('https://c.example.com', attempts=MAX_RETRY_ATTEMPTS - 1),
+        ]
+        service = WebhookService(mock_db, engine=WebhookDeliveryEngine())
+        service._claim_deliveries = AsyncMock(return_value=items)
+        outcomes = {
+            'https://a.example.com': DeliveryResult(success=True, status_code=200),
+            'https://b.example.com': DeliveryResult(success=False, error="HTTP 500"),
+            'https://c.example.com': DeliveryResult(success=False, error="Connection timeout"),
+        }
+        service._deliver_webhook = AsyncMock(side_effect=lambda url, **kwargs: outcomes[url])
+        
+        stats = await service.process_delivery_queue(batch_size=10)
+        
+        assert stats == {'delivered': 2, 'failed': 1, 'dead_letter': 1}
+        sql = self._sql(mock_db)
+        assert len([q for q in sql if "SET status = 'delivered'" in q]) == 1
+        assert len([q for q in sql if "INSERT INTO public.webhook_audit_log" in q]) == 2
+        assert len([q for q in sql if "INSERT INTO public.webhook_dead_letter" in q]) == 1
+        mock_db.commit.assert_awaited_once()
+        delivered_call = next(
+            c for c in mock_db.execute.call_args_list if "SET status = 'delivered'" in str(c.args[0])
+        )
+        assert delivered_call.args[1]['ids'] == [str(items[0].id), str(items[1].id)]
+    
+    @pytest.mark.asyncio
+    async def test_per_url_in_flight_cap(self, mock_db):
+        items = [self._item('https://slow.example.com') for _ in range(4)] + \
+            [self._item('https://fast.example.com') for _ in range(4)]
+        service = WebhookService(mock_db, engine=WebhookDeliveryEngine(max_in_flight_per_url=1))
+        service._claim_deliveries = AsyncMock(return_value=items)
+        
+        in_flight = {'https://slow.example.com': 0, 'https://fast.example.com': 0}
+        peak = dict(in_flight)
+        
+        async def deliver(url, **kwargs):
+            in_flight[url] += 1
+            peak[url] = max(peak[url], in_flight[url])
+            await asyncio.sleep(0.01)
+            in_flight[url] -= 1
+            return DeliveryResult(success=True, status_code=200)
+        
+        service._deliver_webhook = deliver
+        
+        stats = await service.process_delivery_queue(batch_size=10)
+        
+        assert stats['delivered'] == 8
+        assert peak == {'https://slow.example.com': 1, 'https://fast.example.com': 1}
+    
+    @pytest.mark.asyncio
+    async def test_deliveries_share_one_client(self, mock_db):
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        engine = WebhookDeliveryEngine(client=client)
+        
+        for _ in range(2):
+            result = await WebhookService(mock_db, engine=engine)._deliver_webhook(
+                url='https://crm.example.com/hook',
+                payload={'event': 'myfdc.hours.logged', 'timestamp': 't'},
+                secret_key='secret',
+                event_type='myfdc.hours.logged'
+            )
+            assert result.success is True
+        
+        assert engine.client is client
+        assert len(requests_seen) == 2
+        assert requests_seen[0].headers['X-Webhook-Signature'].startswith('sha256=')
+        await client.aclose()
+
+
+class TestBatchedDispatch:
+    """Test batched fan-out and subscription caching."""
+    
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.execute = AsyncMock()
+        db.commit = AsyncMock()
+        return db
+    
+    @pytest.fixture
+    def service(self, mock_db):
+        return WebhookService(mock_db, subscriptions=SubscriptionCache(ttl_seconds=60))
+    
+    def _subscribers(self, count: int) -> MagicMock:
+        result = MagicMock()
+        result.fetchall.return_value = [
+            MagicMock(id=uuid.uuid4(), service_name=f'svc-{i}', url=f'https://{i}.example.com')
+            for i in range(count)
+        ]
+        return result
+    
+    def _inserts(self, mock_db) -> list:
+        return [
+            call for call in mock_db.execute.call_args_list
+            if "INSERT INTO public.webhook_delivery_queue" in str(call.args[0])
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_fan_out_is_one_insert_and_one_commit(self, service, mock_db):
+        mock_db.execute.side_effect = [self._subscribers(5), MagicMock()]
+        
+        await service.dispatch_event(WebhookEventType.HOURS_LOGGED, 'client-1', 'record-1')
+        
+        inserts = self._inserts(mock_db)
+        assert len(inserts) == 1
+        assert len([k for k in inserts[0].args[1] if k.startswith('webhook_id_')]) == 5
+        mock_db.commit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_events_batches_many_events(self, service, mock_db):
+        # Lookups run in sorted event type order: expense_logged, then hours_logged
+        mock_db.execute.side_effect = [self._subscribers(3), self._subscribers(2), MagicMock()]
+        
+        queued = await service.dispatch_events([
+            (WebhookEventType.HOURS_LOGGED, 'client-1', 'r-1'),
+            (WebhookEventType.EXPENSE_LOGGED, 'client-1', 'r-2'),
+            (WebhookEventType.HOURS_LOGGED, 'client-2', 'r-3'),
+        ])
+        
+        assert queued == 2 + 3 + 2
+        assert len(self._inserts(mock_db)) == 1
+        assert mock_db.execute.await_count == 3  # two subscription lookups + one insert
+        mock_db.commit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_subscriptions_cached_until_registration_changes(self, service, mock_db):
+        mock_db.execute.side_effect = [self._subscribers(1), MagicMock(), MagicMock()]
+        await service.dispatch_event(WebhookEventType.HOURS_LOGGED, 'client-1', 'r-1')
+        await service.dispatch_event(WebhookEventType.HOURS_LOGGED, 'client-1', 'r-2')
+        
+        lookups = [c for c in mock_db.execute.call_args_list if "FROM public.webhook_registrations" in str(c.args[0])]
+        assert len(lookups) == 1
+        
+        mock_db.execute.side_effect = None
+        mock_db.execute.return_value = MagicMock(fetchone=MagicMock(return_value=MagicMock(
+            id='w-1', service_name='svc', url='https://x', events=[], is_active=True,
+            created_at=datetime.now(timezone.utc), created_by='admin'
+        )))
+        await service.update_webhook_status('w-1', False, 'admin')
+        
+        assert service.subscriptions.get(WebhookEventType.HOURS_LOGGED.value) is None
+    
+    @pytest.mark.asyncio
+    async def test_no_subscribers_skips_insert(self, service, mock_db):
+        mock_db.execute.return_value = self._subscribers(0)
+        
+        queued = await service.dispatch_events([(WebhookEventType.DIARY_CREATED, 'client-1', 'r-1')])
+        
+        assert queued == 0
+        assert self._inserts(mock_db) == []
+        mock_db.commit.assert_not_awaited()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
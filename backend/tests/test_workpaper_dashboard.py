@@ -0,0 +1,202 @@
+"""
+Unit Tests for the Workpaper Job Dashboard
+
+Tests JobDashboardRepository and its cache:
+- Dashboard assembled in two queries (GROUP BY open-query and task counts)
+- Per-job caching, lookups by client/year and batched loads
+- Invalidation by module, query and task mutations
+
+Run with: pytest tests/test_workpaper_dashboard.py -v
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from database.workpaper_models import ModuleInstanceDB, WorkpaperJobDB
+from services.workpaper import db_storage
+from services.workpaper.models import Task
+from services.workpaper.db_storage import (
+    JobDashboardCache,
+    JobDashboardRepository,
+    ModuleInstanceRepository,
+    QueryRepository,
+    TaskRepository,
+)
+
+CREATED_AT = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+
+def _job(job_id: str = "job-1", year: str = "2024-25") -> WorkpaperJobDB:
+    return WorkpaperJobDB(id=job_id, client_id="client-1", year=year, status="in_progress", created_at=CREATED_AT)
+
+
+def _module(module_id: str, job_id: str = "job-1", **summary) -> ModuleInstanceDB:
+    return ModuleInstanceDB(
+        id=module_id,
+        job_id=job_id,
+        module_type=module_id.split("-")[0],
+        label=module_id,
+        status="in_progress",
+        output_summary=summary,
+        created_at=CREATED_AT,
+    )
+
+
+def _result(rows) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _session(*results) -> AsyncMock:
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=list(results))
+    return session
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    db_storage.dashboard_cache.clear()
+    yield
+    db_storage.dashboard_cache.clear()
+
+
+class TestDashboardLoad:
+    """Test dashboard assembly."""
+
+    @pytest.mark.asyncio
+    async def test_two_queries(self):
+        job = _job()
+        session = _session(
+            _result([
+                (job, _module("motor_vehicle-1", deduction=1200.555), 2),
+                (job, _module("internet-1", deduction=100, net_income=50), 0),
+            ]),
+            _result([("job-1", "completed", 3), ("job-1", "open", 1)]),
+        )
+
+        dashboard = await JobDashboardRepository(session).get_by_client_year("client-1", "2024-25")
+
+        assert session.execute.await_count == 2
+        modules_sql = str(session.execute.call_args_list[0].args[0])
+        assert "GROUP BY workpaper_queries.module_instance_id" in modules_sql
+        assert "LEFT OUTER JOIN" in modules_sql
+        assert "GROUP BY workpaper_tasks.job_id, workpaper_tasks.status" in str(session.execute.call_args_list[1].args[0])
+        assert dashboard.job.id == "job-1"
+        assert [m.open_query_count for m in dashboard.modules] == [2, 0]
+        assert dashboard.modules[0].has_open_queries
+        assert dashboard.open_queries == 2
+        assert dashboard.total_deduction == 1300.56
+        assert dashboard.total_income == 50
+        assert dashboard.has_tasks
+        assert dashboard.task_counts == {"completed": 3, "open": 1}
+
+    @pytest.mark.asyncio
+    async def test_job_without_modules_or_open_tasks(self):
+        session = _session(_result([(_job(), None, 0)]), _result([("job-1", "completed", 2)]))
+
+        dashboard = await JobDashboardRepository(session, JobDashboardCache()).get("job-1")
+
+        assert dashboard.modules == []
+        assert not dashboard.has_tasks
+
+    @pytest.mark.asyncio
+    async def test_missing_job(self):
+        session = _session(_result([]))
+
+        assert await JobDashboardRepository(session).get_by_client_year("client-1", "2030-31") is None
+        session.execute.assert_awaited_once()
+
+
+class TestDashboardCache:
+    """Test caching and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_cached_by_job_and_client_year(self):
+        session = _session(_result([(_job(), _module("internet-1"), 1)]), _result([]))
+        repo = JobDashboardRepository(session)
+
+        first = await repo.get_by_client_year("client-1", "2024-25")
+        again = await repo.get_by_client_year("client-1", "2024-25")
+        by_id = await repo.get("job-1")
+
+        assert session.execute.await_count == 2
+        assert again == first
+        assert by_id == first
+        # Cached copies are independent of the caller's object
+        first.modules.clear()
+        assert len((await repo.get("job-1")).modules) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_loads_misses_together(self):
+        session = _session(
+            _result([(_job("job-1"), None, 0)]), _result([]),
+            _result([(_job("job-2"), None, 0), (_job("job-3", year="2023-24"), None, 0)]), _result([]),
+        )
+        repo = JobDashboardRepository(session)
+        await repo.get("job-1")
+
+        dashboards = await repo.get_many(["job-1", "job-2", "job-3", "job-404"])
+
+        assert sorted(dashboards) == ["job-1", "job-2", "job-3"]
+        assert session.execute.await_count == 4
+        assert "IN (" in str(session.execute.call_args_list[2].args[0])
+
+    @pytest.mark.asyncio
+    async def test_ttl_zero_disables_cache(self):
+        session = _session(_result([(_job(), None, 0)]), _result([]), _result([(_job(), None, 0)]), _result([]))
+        repo = JobDashboardRepository(session, JobDashboardCache(ttl_seconds=0))
+
+        await repo.get("job-1")
+        await repo.get("job-1")
+
+        assert session.execute.await_count == 4
+
+    def test_load_racing_an_invalidation_is_not_cached(self):
+        cache = JobDashboardCache()
+        generation = cache.generation
+        dashboard = JobDashboardRepository._assemble(db_storage.db_to_pydantic_job(_job()), [], {})
+
+        cache.invalidate("job-1")
+        cache.set(dashboard, generation)
+
+        assert cache.get("job-1") is None
+
+    @pytest.mark.asyncio
+    async def test_module_update_invalidates(self):
+        cache = db_storage.dashboard_cache
+        dashboard = JobDashboardRepository._assemble(db_storage.db_to_pydantic_job(_job()), [], {})
+        cache.set(dashboard, cache.generation)
+
+        module_result = MagicMock()
+        module_result.scalar_one_or_none.return_value = _module("internet-1")
+        session = _session(MagicMock(), module_result)
+        await ModuleInstanceRepository(session).update("internet-1", {"status": "completed"})
+
+        assert cache.get("job-1") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("repository", [ModuleInstanceRepository, QueryRepository, TaskRepository])
+    async def test_delete_invalidates_owning_job(self, repository):
+        cache = db_storage.dashboard_cache
+        cache.set(JobDashboardRepository._assemble(db_storage.db_to_pydantic_job(_job()), [], {}), cache.generation)
+        session = _session(_result([("job-1",)]))
+
+        assert await repository(session).delete("row-1")
+
+        assert "RETURNING" in str(session.execute.call_args.args[0])
+        assert cache.get("job-1") is None
+
+    @pytest.mark.asyncio
+    async def test_task_create_invalidates(self):
+        cache = db_storage.dashboard_cache
+        cache.set(JobDashboardRepository._assemble(db_storage.db_to_pydantic_job(_job()), [], {}), cache.generation)
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.refresh = AsyncMock(side_effect=lambda db_task: setattr(db_task, "created_at", CREATED_AT))
+
+        await TaskRepository(session).create(Task(client_id="client-1", job_id="job-1", task_type="queries", title="Queries"))
+
+        assert cache.get("job-1") is None
@@ -0,0 +1,197 @@
+"""
+Unit Tests for Workpaper File Storage
+
+Tests the indexed in-memory storage engine:
+- Indexed lookups by id, job_id, client_id and module_instance_id
+- Append-only journal and compaction into the snapshot
+- Invalidation when the files change on disk
+- Lookups return copies, never the shared indexed items
+- Batch override resolution in the file and database effective builders
+
+Run with: pytest tests/test_workpaper_storage.py -v
+"""
+
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.workpaper import storage as storage_module
+from services.workpaper import db_storage
+from services.workpaper.models import Transaction, TransactionOverride
+from services.workpaper.storage import (
+    EffectiveTransactionBuilder,
+    TransactionStorage,
+    get_collection,
+)
+
+
+def _txn(index: int, job_id: str = "job-1", client_id: str = "client-1", **kwargs) -> Transaction:
+    return Transaction(
+        id=f"txn-{index}",
+        client_id=client_id,
+        job_id=job_id,
+        date="2025-03-10",
+        amount=10.0 + index,
+        **kwargs
+    )
+
+
+class TestIndexedStorage:
+    """Test the indexed storage engine against a temporary data directory."""
+
+    @pytest.fixture
+    def storage(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(storage_module, "DATA_DIR", tmp_path)
+        return TransactionStorage()
+
+    def test_lookups_use_indexes(self, storage):
+        for i in range(6):
+            storage.create(_txn(i, job_id=f"job-{i % 2}", module_instance_id=f"mod-{i % 3}"))
+
+        assert storage.get("txn-4").amount == 14.0
+        assert [t.id for t in storage.list_by_job("job-1")] == ["txn-1", "txn-3", "txn-5"]
+        assert [t.id for t in storage.list_by_module("mod-0")] == ["txn-0", "txn-3"]
+        assert [t.id for t in storage.filter(job_id="job-0", module_instance_id="mod-1")] == ["txn-4"]
+        assert storage.get("missing") is None
+
+    def test_update_moves_item_between_index_buckets(self, storage):
+        storage.create(_txn(0))
+        storage.create(_txn(1))
+
+        updated = storage.update("txn-0", {"job_id": "job-2"})
+
+        assert updated.job_id == "job-2"
+        assert [t.id for t in storage.list_by_job("job-1")] == ["txn-1"]
+        assert [t.id for t in storage.list_by_job("job-2")] == ["txn-0"]
+        # Insertion order is kept across updates
+        assert [t.id for t in storage.list_all()] == ["txn-0", "txn-1"]
+
+    def test_writes_are_journaled_not_rewritten(self, storage):
+        storage.create(_txn(0))
+        snapshot = storage.file_path.read_text()
+
+        storage.create(_txn(1))
+        storage.delete("txn-0")
+
+        assert storage.file_path.read_text() == snapshot
+        journal = storage.file_path.with_suffix(".journal").read_text().splitlines()
+        assert [json.loads(line)["op"] for line in journal] == ["put", "put", "delete"]
+
+    def test_new_instance_sees_state_from_snapshot_and_journal(self, storage, tmp_path):
+        storage.create(_txn(0))
+        storage.create(_txn(1))
+        storage.delete("txn-0")
+
+        # Drop the shared collection so state is rebuilt from disk
+        storage_module._collections.clear()
+        reopened = TransactionStorage()
+
+        assert [t.id for t in reopened.list_all()] == ["txn-1"]
+
+    def test_journal_compacted_into_snapshot(self, storage, monkeypatch):
+        monkeypatch.setattr(storage_module, "JOURNAL_COMPACT_THRESHOLD", 4)
+
+        for i in range(4):
+            storage.create(_txn(i))
+
+        assert not storage.file_path.with_suffix(".journal").exists()
+        snapshot = json.loads(storage.file_path.read_text())
+        assert [item["id"] for item in snapshot] == ["txn-0", "txn-1", "txn-2", "txn-3"]
+        assert storage.get("txn-2") is not None
+
+    def test_external_file_change_invalidates_cache(self, storage):
+        storage.create(_txn(0))
+        storage._collection.compact()
+
+        replacement = [_txn(9, client_id="client-9").model_dump()]
+        storage.file_path.write_text(json.dumps(replacement))
+        os.utime(storage.file_path, ns=(1, 1))
+
+        assert [t.id for t in storage.list_by_client("client-9")] == ["txn-9"]
+        assert storage.get("txn-0") is None
+
+    def test_results_are_copies_of_the_index(self, storage):
+        storage.create(_txn(0))
+
+        storage._find(id="txn-0")[0]["amount"] = 99.0
+        storage._load_all()[0]["job_id"] = "job-9"
+        storage._put(_txn(1).model_dump())["amount"] = 99.0
+
+        assert storage.get("txn-0").amount == 10.0
+        assert storage.get("txn-1").amount == 11.0
+        assert [t.id for t in storage.list_by_job("job-1")] == ["txn-0", "txn-1"]
+
+    def test_items_without_id_keep_no_synthetic_id(self, storage):
+        storage.file_path.write_text(json.dumps([{"job_id": "job-1", "note": "legacy"}]))
+        os.utime(storage.file_path, ns=(1, 1))
+        storage.create(_txn(0))
+
+        storage._collection.compact()
+
+        snapshot = json.loads(storage.file_path.read_text())
+        assert snapshot[0] == {"job_id": "job-1", "note": "legacy"}
+        assert storage._find(job_id="job-1")[0] == {"job_id": "job-1", "note": "legacy"}
+
+    def test_instances_share_one_collection(self, storage):
+        other = TransactionStorage()
+
+        storage.create(_txn(0))
+
+        assert other._collection is storage._collection
+        assert other.get("txn-0") is not None
+        assert get_collection(storage.file_path) is storage._collection
+
+
+def _override(transaction_id: str, job_id: str = "job-1", **kwargs) -> TransactionOverride:
+    return TransactionOverride(
+        transaction_id=transaction_id,
+        job_id=job_id,
+        reason="Adjusted",
+        admin_user_id="admin-1",
+        **kwargs
+    )
+
+
+class TestEffectiveTransactionBuilder:
+    """Test that overrides are resolved once per batch."""
+
+    @pytest.fixture
+    def builder(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(storage_module, "DATA_DIR", tmp_path)
+        return EffectiveTransactionBuilder()
+
+    def test_build_for_job_loads_overrides_once(self, builder, monkeypatch):
+        for i in range(4):
+            builder.transaction_storage.create(_txn(i, category="fuel"))
+        builder.override_storage.create(_override("txn-1", overridden_business_pct=50.0))
+        builder.override_storage.create(_override("txn-2", job_id="job-2", overridden_amount=99.0))
+        lookups = MagicMock(side_effect=builder.override_storage.get_by_transaction_job)
+        monkeypatch.setattr(builder.override_storage, "get_by_transaction_job", lookups)
+
+        batch = builder.build_for_job("job-1")
+
+        lookups.assert_not_called()
+        assert [e.transaction_id for e in batch] == ["txn-0", "txn-1", "txn-2", "txn-3"]
+        assert [e.has_override for e in batch] == [False, True, False, False]
+        assert batch[1].business_amount == 5.5
+        assert batch == [builder.build(t, "job-1") for t in builder.transaction_storage.list_by_job("job-1")]
+
+    @pytest.mark.asyncio
+    async def test_db_builder_uses_one_override_query(self):
+        transactions = [_txn(i, module_instance_id="mod-1") for i in range(3)]
+        override = _override("txn-2", overridden_category="phone", overridden_amount=5.0)
+        builder = db_storage.EffectiveTransactionBuilder(AsyncMock())
+        builder.transaction_repo.list_by_module = AsyncMock(return_value=transactions)
+        builder.override_repo.map_by_transactions = AsyncMock(return_value={"txn-2": override})
+        builder.override_repo.get_by_transaction_job = AsyncMock()
+
+        batch = await builder.build_for_module("mod-1", "job-1")
+
+        builder.override_repo.map_by_transactions.assert_awaited_once_with(
+            "job-1", ["txn-0", "txn-1", "txn-2"]
+        )
+        builder.override_repo.get_by_transaction_job.assert_not_called()
+        assert [e.effective_category for e in batch] == ["uncategorized", "uncategorized", "phone"]
+        assert batch[2].effective_amount == 5.0 and batch[2].override_id == override.id